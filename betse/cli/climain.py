@@ -296,6 +296,14 @@ from input files defined by this configuration.
         simulation configuration file passed by the user at the CLI.
         '''
 
+        # Avoid circular import dependencies.
+        from betse.util.app.meta import appmetaone
+
+        # Initialize all mandatory runtime dependencies deferred by the
+        # _init_app_libs() method *BEFORE* importing simulation modules, all
+        # of which require these dependencies.
+        appmetaone.get_app_meta().init_libs_if_needed()
+
         # Defer heavyweight imports.
         from betse.science.parameters import Parameters
         from betse.science.simrunner import SimRunner
@@ -20,6 +20,7 @@ any such dependencies.
 # packages).
 #!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!
 
+import hashlib, os, sys
 from betse.exceptions import BetseLibException
 # from betse.util.io.log import logs
 from betse.util.app.meta import appmetaone
@@ -45,6 +46,13 @@ def die_unless_runtime_mandatory_all() -> None:
     function additionally validates the versions of these dependencies to
     satisfy all application requirements.
 
+    Since validating a dependency requires importing that dependency, this
+    validation is cached to minimize application startup time. Specifically,
+    this function skips this validation if these dependencies were previously
+    validated under the same Python environment (as fingerprinted by the
+    :func:`_get_requirements_env_key` function) *or* validates these
+    dependencies and caches the successful result otherwise.
+
     Raises
     ----------
     BetseLibException
@@ -54,9 +62,20 @@ def die_unless_runtime_mandatory_all() -> None:
     # Application-wide dependency metadata submodule.
     metadeps = appmetaone.get_app_meta().module_metadeps
 
+    # Fingerprint of these dependencies under the active Python environment.
+    env_key = _get_requirements_env_key(metadeps.RUNTIME_MANDATORY)
+
+    # If these dependencies were previously validated under this environment,
+    # silently reduce to a noop.
+    if _is_requirements_env_key_cached(env_key):
+        return
+
     # If at least one passed dependency is unsatisfied, raise an exception.
     die_unless_requirements_dict(metadeps.RUNTIME_MANDATORY)
 
+    # Else, all passed dependencies are satisfied. Cache this result.
+    _cache_requirements_env_key(env_key)
+
 
 @type_check
 def die_unless_runtime_optional(*requirement_names: str) -> None:
@@ -423,6 +442,164 @@ def import_requirements_dict_keys(
     return setuptool.import_requirements_dict_keys(
         requirements_dict, *requirements_name)
 
+# ....................{ PRIVATE ~ cache                   }....................
+_REQUIREMENTS_CACHE_BASENAME = 'libs_validated.txt'
+'''
+Basename of the plaintext file in this application's dot directory listing the
+fingerprints of all Python environments under which all mandatory runtime
+dependencies of this application were previously validated.
+'''
+
+
+_REQUIREMENTS_CACHE_KEYS_MAX = 16
+'''
+Maximum number of fingerprints listed by the :data:`_REQUIREMENTS_CACHE_BASENAME`
+file, retaining only the most recently validated fingerprints.
+'''
+
+
+def _get_requirements_cache_filename() -> str:
+    '''
+    Absolute filename of the plaintext file listing the fingerprints of all
+    Python environments under which all mandatory runtime dependencies of this
+    application were previously validated.
+    '''
+
+    return os.path.join(
+        appmetaone.get_app_meta().dot_dirname, _REQUIREMENTS_CACHE_BASENAME)
+
+
+@type_check
+def _get_requirements_env_key(requirements_dict: MappingType) -> str:
+    '''
+    Fingerprint of the passed dependencies under the active Python environment.
+
+    This fingerprint is the SHA-256 hash of:
+
+    * The absolute filename and version of the active Python interpreter.
+    * The version of this application.
+    * The passed dictionary of requirements strings.
+    * The current ``${PATH}``, governing the external commands required by
+      these dependencies.
+    * The modification time of each directory on the current import path
+      (i.e., :data:`sys.path`) *except* the current working directory. Since
+      installing, upgrading, or uninstalling any package adds or removes
+      subdirectories of the directory containing that package (e.g., the
+      ``.dist-info/``-suffixed subdirectory for that package), this time
+      changes on any such change to these dependencies.
+
+    Parameters
+    ----------
+    requirements_dict : MappingType
+        Dictionary mapping from the names of all :mod:`setuptools`-specific
+        projects implementing these dependencies to the requirements strings
+        constraining these dependencies.
+
+    Returns
+    ----------
+    str
+        Hexadecimal SHA-256 hash fingerprinting these dependencies.
+    '''
+
+    # Absolute dirname of the current working directory, which is ignorable.
+    cwd_dirname = os.getcwd()
+
+    # List of 2-tuples "(dirname, mtime)" of each directory on the import path.
+    import_dirnames_mtime = []
+    for import_dirname in sys.path:
+        # If this is the current working directory, ignore this directory.
+        if not import_dirname or (
+            os.path.abspath(import_dirname) == cwd_dirname):
+            continue
+
+        # Modification time of this directory if found *OR* "None" otherwise.
+        try:
+            import_dirname_mtime = os.stat(import_dirname).st_mtime_ns
+        except OSError:
+            import_dirname_mtime = None
+        import_dirnames_mtime.append((import_dirname, import_dirname_mtime))
+
+    # Human-readable string describing this environment.
+    env_str = repr((
+        sys.executable,
+        sys.version,
+        appmetaone.get_app_meta().module_metadata.VERSION,
+        sorted(requirements_dict.items()),
+        os.environ.get('PATH'),
+        import_dirnames_mtime,
+    ))
+
+    # Return the hash of this string.
+    return hashlib.sha256(env_str.encode('utf-8')).hexdigest()
+
+
+@type_check
+def _is_requirements_env_key_cached(env_key: str) -> bool:
+    '''
+    ``True`` only if the passed fingerprint is listed by the file returned by
+    the :func:`_get_requirements_cache_filename` function.
+
+    Parameters
+    ----------
+    env_key : str
+        Fingerprint returned by the :func:`_get_requirements_env_key` function.
+    '''
+
+    # Attempt to search this file for this fingerprint.
+    try:
+        with open(_get_requirements_cache_filename()) as cache_file:
+            return env_key in cache_file.read().split()
+    # If this file is unreadable (e.g., due to *NOT* existing), this
+    # fingerprint is necessarily uncached.
+    except OSError:
+        return False
+
+
+@type_check
+def _cache_requirements_env_key(env_key: str) -> None:
+    '''
+    Append the passed fingerprint to the file returned by the
+    :func:`_get_requirements_cache_filename` function, retaining at most the
+    :data:`_REQUIREMENTS_CACHE_KEYS_MAX` most recent such fingerprints.
+
+    Since this cache is merely an optimization, failing to write this file
+    (e.g., due to a read-only home directory) is logged and ignored.
+
+    Parameters
+    ----------
+    env_key : str
+        Fingerprint returned by the :func:`_get_requirements_env_key` function.
+    '''
+
+    # Avoid circular import dependencies.
+    from betse.util.io.log import logs
+
+    # Absolute filename of this file.
+    cache_filename = _get_requirements_cache_filename()
+
+    # List of all previously cached fingerprints if any.
+    try:
+        with open(cache_filename) as cache_file:
+            env_keys = cache_file.read().split()
+    except OSError:
+        env_keys = []
+
+    # Append this fingerprint, retaining only the most recent fingerprints.
+    env_keys.append(env_key)
+    env_keys = env_keys[-_REQUIREMENTS_CACHE_KEYS_MAX:]
+
+    # Atomically replace this file, avoiding partial reads by concurrent
+    # processes validating dependencies at the same time.
+    cache_filename_temp = '{}.{}'.format(cache_filename, os.getpid())
+    try:
+        with open(cache_filename_temp, 'w') as cache_file:
+            cache_file.write('\n'.join(env_keys) + '\n')
+        os.replace(cache_filename_temp, cache_filename)
+    except OSError as exception:
+        logs.log_debug(
+            'Dependency validation cache "%s" unwritable: %s',
+            cache_filename, exception)
+
 # ....................{ PRIVATE ~ iterators               }....................
 @type_check
 def _iter_requirement_commands(requirement_name: str) -> SequenceTypes:
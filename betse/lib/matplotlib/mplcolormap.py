@@ -64,6 +64,13 @@ def get_colormap(name: str) -> Colormap:
         List of supported colormaps.
     '''
 
+    # Register all application-specific colormaps if needed. Since loading a
+    # simulation configuration retrieves colormaps by name, doing so here
+    # permits that configuration to be loaded *BEFORE* initializing matplotlib
+    # (e.g., by the "betse config" subcommand, which defers that
+    # initialization).
+    init()
+
     return colormaps[name]
 
 # ....................{ ITERATORS                          }....................
@@ -16,7 +16,8 @@ Low-level :mod:`matplotlib`-specific figure functionality.
 
 from betse.exceptions import BetseMatplotlibException
 from betse.util.io.log import logs
-from betse.util.type.types import type_check, MatplotlibFigureType
+from betse.util.type.types import type_check
+from matplotlib.figure import Figure
 
 # ....................{ EXCEPTIONS                        }....................
 def die_unless_figure() -> bool:
@@ -55,7 +56,7 @@ def is_figure() -> bool:
     return bool(pyplot.get_fignums())
 
 # ....................{ GETTERS                           }....................
-def get_figure_current() -> MatplotlibFigureType:
+def get_figure_current() -> Figure:
     '''
     Figure most recently opened with the :mod:`matplotlib.pyplot` GCF API.
 
@@ -74,7 +75,7 @@ def get_figure_current() -> MatplotlibFigureType:
 
 # ....................{ CLOSERS                           }....................
 @type_check
-def close_figure(figure: MatplotlibFigureType) -> None:
+def close_figure(figure: Figure) -> None:
     '''
     **Close** (i.e., clear, delete, remove, garbage collect) the passed figure,
     guaranteeing that all resources consumed by this figure will be
@@ -100,7 +101,7 @@ def close_figure(figure: MatplotlibFigureType) -> None:
 
     Parameters
     -----------
-    figure : MatplotlibFigureType
+    figure : Figure
         Figure to be closed.
 
     See Also
@@ -238,3 +238,21 @@ class ImageMovieWriter(NoopMovieWriter):
             dpi=self.dpi,
             **kwargs
         )
+
+    # ..................{ PROPERTIES                        }..................
+    @property
+    def frame_number(self) -> int:
+        '''
+        0-based index of the next frame to be written.
+
+        This property is settable, permitting callers writing frames out of
+        order (e.g., from multiple processes each writing a subset of all
+        frames) to explicitly number the next frame to be written.
+        '''
+
+        return self._frame_number
+
+
+    @frame_number.setter
+    def frame_number(self, frame_number: int) -> None:
+        self._frame_number = frame_number
@@ -15,6 +15,7 @@ from beartype.typing import (
     Dict,
     Iterable,
     Optional,
+    Sequence,
 )
 from betse.exceptions import BetseSequenceException, BetseStrException
 from betse.util.io.log import logs
@@ -165,29 +166,8 @@ def write_csv(
                 'length {} of prior columns.'.format(
                     column_name, column_len, columns_prior_len))
 
-        # If this column name contains one or more reserved characters, raise
-        # an exception. This includes:
-        #
-        # * Double quotes, reserved for use as the CSV quoting character.
-        # * Newlines, reserved for use as the CSV row delimiting character.
-        if '"' in column_name:
-            raise BetseStrException(
-                'Column name {} contains '
-                "one or more reserved '\"' characters.".format(column_name))
-        if '\n' in column_name:
-            raise BetseStrException(
-                'Column name {} contains '
-                'one or more newline characters.'.format(column_name))
-
-        # If this column name contains one or more commas (reserved for use as
-        # the CSV delimiter), double-quote this name. Since the prior logic
-        # guarantees this name to *NOT* contain double quotes, no further logic
-        # is required
-        if ',' in column_name:
-            column_name = '"{}"'.format(column_name)
-
         # Append this sanitized column name to this list of such names.
-        column_names.append(column_name)
+        column_names.append(_sanitize_column_name(column_name))
 
     # Comma-separated string listing all column names.
     columns_name = strjoin.join_on(column_names, delimiter=',')
@@ -235,3 +215,118 @@ def write_csv(
         # first line listing all column names.
         comments='',
     )
+
+
+@beartype
+def write_csv_chunks(
+    # Mandatory parameters.
+    filename: str,
+    column_names: Sequence[str],
+    rows_chunks: Iterable[np.ndarray],
+
+    # Optional parameters.
+    column_format: str = '%.18e',
+) -> None:
+    '''
+    Serialize each passed chunk of rows in comma-separated value (CSV) format
+    to the plaintext file with the passed filename, appending each chunk to
+    this file as soon as that chunk is produced.
+
+    Unlike the :func:`write_csv` function, this function never holds more than
+    one chunk in memory and hence is suitable for long-format files whose rows
+    span all sampled time steps of a simulation.
+
+    Parameters
+    ----------
+    filename : str
+        Absolute or relative path of the plaintext file to be written. If this
+        file already exists, this file is silently overwritten.
+    column_names : Sequence[str]
+        Sequence of the names of all columns of this file (in column order).
+    rows_chunks : Iterable[np.ndarray]
+        Iterable of two-dimensional Numpy arrays, each of whose rows is one row
+        of this file and each of whose columns is one column of this file.
+    column_format : str
+        ``%``-prefixed format string formatting all columns, as fully
+        documented by the ``fmt`` parameter accepted by the low-level
+        :func:`numpy.savetxt` function wrapped by this function. Defaults to
+        the same format string as accepted by that function.
+
+    Raises
+    ----------
+    BetseSequenceException
+        If the number of columns of any chunk differs from that of the passed
+        column names.
+    BetseStrException
+        If any column name contains one or more characters reserved for use by
+        the CSV non-standard. See the :func:`write_csv` function.
+    '''
+
+    # Avoid circular import dependencies.
+    from betse.util.type.text.string import strjoin
+
+    # Log this serialization.
+    logs.log_debug('Writing chunked CSV file: %s', filename)
+
+    # Comma-separated string listing all sanitized column names.
+    columns_name = strjoin.join_on(
+        (_sanitize_column_name(column_name) for column_name in column_names),
+        delimiter=',')
+
+    # Create the directory containing this file if needed.
+    dirs.make_parent_unless_dir(filename)
+
+    with open(filename, 'w') as csv_file:
+        csv_file.write(columns_name + '\n')
+
+        # For each chunk of rows...
+        for rows_chunk in rows_chunks:
+            # If this chunk has an unexpected number of columns, raise a
+            # human-readable exception.
+            if rows_chunk.ndim != 2 or rows_chunk.shape[1] != len(column_names):
+                raise BetseSequenceException(
+                    'Chunk shape {} not of {} columns.'.format(
+                        rows_chunk.shape, len(column_names)))
+
+            # Append this chunk to this file.
+            np.savetxt(
+                fname=csv_file,
+                X=rows_chunk,
+                fmt=column_format,
+                delimiter=',',
+            )
+
+# ....................{ PRIVATE ~ sanitizers              }....................
+def _sanitize_column_name(column_name: str) -> str:
+    '''
+    Passed column name double-quoted if this name contains one or more commas
+    *or* this name as is otherwise.
+
+    Raises
+    ----------
+    BetseStrException
+        If this column name contains one or more characters reserved for use by
+        the CSV non-standard, including:
+
+        * Double quotes, reserved for use as the CSV quoting character.
+        * Newlines, reserved for use as the CSV row delimiting character.
+    '''
+
+    # If this column name contains one or more reserved characters, raise
+    # an exception.
+    if '"' in column_name:
+        raise BetseStrException(
+            'Column name {} contains '
+            "one or more reserved '\"' characters.".format(column_name))
+    if '\n' in column_name:
+        raise BetseStrException(
+            'Column name {} contains '
+            'one or more newline characters.'.format(column_name))
+
+    # If this column name contains one or more commas (reserved for use as the
+    # CSV delimiter), double-quote this name. Since the prior logic guarantees
+    # this name to *NOT* contain double quotes, no further logic is required
+    if ',' in column_name:
+        column_name = '"{}"'.format(column_name)
+
+    return column_name
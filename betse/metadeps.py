@@ -238,6 +238,7 @@ RUNTIME_OPTIONAL = {
     'distro':   '>= 1.0.4',
     'pympler':  '>= 0.4.1',
     'ptpython': '>= 0.29',
+    'threadpoolctl': '>= 1.0.0',
 
     #FIXME: Uncomment once eventually used, which is probably inevitable now.
     # 'psutil':   '>= 5.3.0',
@@ -39,8 +39,10 @@ from betse.util.app.meta import appmetaone as _appmetaone
 _app_meta = _appmetaone.set_app_meta_betse_if_unset()
 
 # Initialize all mandatory third-party dependencies if the
-# _app_meta.init_libs() method has yet to be called elsewhere.
-_app_meta.init_libs_if_needed()
+# _app_meta.init_libs() method has yet to be called elsewhere *AND* the caller
+# has yet to defer doing so (e.g., the CLI, which initializes these
+# dependencies only for subcommands simulating or plotting).
+_app_meta.init_libs_if_undeferred()
 
 # ....................{ CLEANUP                           }....................
 # Delete *ALL* attributes (including callables) defined above, preventing the
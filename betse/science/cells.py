@@ -9,12 +9,16 @@ import numpy as np
 from numpy import ndarray
 from scipy import interpolate as interp
 from scipy.ndimage import gaussian_filter
+from scipy.sparse import csr_matrix
 from scipy.spatial import cKDTree  # Voronoi
 from betse.exceptions import BetseSequenceException, BetseSimConfException
 from betse.science import filehandling as fh
 from betse.science.enum.enumconf import CellLatticeType
 from betse.science.math import finitediff as fd
+from betse.science.math import gridinterp
 from betse.science.math import toolbox as tb
+from betse.science.math.sparsesolver import (
+    SparseDECPoissonSolver, make_dec_laplacian)
 # from betse.util.math.geometry.polygon.geopolyconvex import clip_counterclockwise
 # from betse.util.math.geometry.polygon.geopoly import orient_counterclockwise, is_convex
 from betse.science.phase.phasecls import SimPhase
@@ -160,17 +164,18 @@ class Cells(object):
     num_mems : ndarray
         One-dimensional Numpy array indexing each cell such that each item
         is the number of cell membranes contained by the current cell.
-    M_sum_mems : ndarray
-        Numpy matrix (i.e., two-dimensional array) of size ``m x n``, where:
+    M_sum_mems : scipy.sparse.csr_matrix
+        Sparse SciPy matrix in compressed sparse row (CSR) format of size
+        ``m x n``, where:
 
         * `m` is the total number of cells.
         * `n` is the total number of cell membranes.
 
         For each cell ``i`` and membrane ``j``, item ``M_sum_mems[i, j]`` is:
 
-        * 0 if this cell does *not* contain this membrane. Since most cells do
-          *not* contain most membranes, most entries of this matrix are zero,
-          implying this matrix to typically (but *not* necessarily) be sparse.
+        * 0 if this cell does *not* contain this membrane. Since each membrane
+          is contained by exactly one cell, each column of this matrix
+          contains exactly one nonzero entry.
         * 1 if this cell contains this membrane.
 
         The dot product of this matrix by a Numpy vector (i.e., one-dimensional
@@ -179,6 +184,21 @@ class Cells(object):
         totalized for each cell over all membranes this cell contains, where
         ``m`` and ``n`` are as defined above.
 
+        Since :func:`numpy.dot` does *not* support sparse matrices, callers
+        should reduce membrane data with the :meth:`csr_matrix.dot` method of
+        this matrix (e.g., ``cells.M_sum_mems.dot(mems_data)``) rather than
+        with :func:`numpy.dot`. For backward compatibility with older seed
+        pickles in which this matrix was a dense Numpy array, this method is
+        also supported by Numpy arrays.
+    gradTheta : scipy.sparse.csr_matrix
+        Sparse SciPy matrix in compressed sparse row (CSR) format of size
+        ``n x n``, where ``n`` is the total number of cell membranes. The dot
+        product of this matrix by a Numpy vector of size ``n`` containing cell
+        membrane-specific data yields the gradient of this data around the
+        circumference of each cell (i.e., the difference between this data at
+        each membrane and the preceding membrane of the same cell, divided by
+        the distance between the midpoints of these membranes).
+
     Attributes (Cell Membrane Vertices)
     ----------
     index_to_mem_verts : ndarray
@@ -548,112 +568,8 @@ class Cells(object):
 
         #---------------------------------------------------
 
-        #FIXME: Uh oh! We're in Don't Repeat Yourself (DRY) trouble here. All
-        #or most of the following code appears to be duplicated verbatim from
-        #the cellVerts() method. Since this code is non-trivial and hence
-        #fragile, this is bad... Would it be feasible to simply call
-        #cellVerts() here? If not, how can we unify this logic? Max axolotl!
-
         # calculate basic properties such as volume, surface area, normals, etc for the cell array
-        self.cell_verts = []
-
-        for centre, poly in zip(self.cell_centres, ecm_verts):
-            pt_scale = []
-            for vert in poly:
-                pt_zero = vert - centre
-                pt_scale.append(p.scale_cell * pt_zero + centre)
-            self.cell_verts.append(np.asarray(pt_scale))
-
-        self.cell_verts = np.asarray(self.cell_verts)
-
-        mem_edges = []  # storage for membrane edge points
-        mem_length = []  # storage for membrane surface area values
-        mem_mids = []  # storage for membrane midpoints
-
-        # storage for various vector properties of membrane
-        cv_x = []
-        cv_y = []
-        cv_nx = []
-        cv_ny = []
-        cv_tx = []
-        cv_ty = []
-
-        for polyc in self.cell_verts:
-
-            #FIXME: Wouldn't the "mps" list of membrane midpoints be more
-            #efficiently calculatable via a single
-            #"mps = np.mean(mps, axis=0)" assignment rather than iteratively
-            #constructed via looping?
-
-            # Calculate individual membrane domains, midpoints, and vectors:
-            edge = []
-            mps = []
-            surfa = []
-
-            for i in range(0, len(polyc)):
-                pt1 = polyc[i - 1]
-                pt2 = polyc[i]
-                pt1 = np.asarray(pt1)
-                pt2 = np.asarray(pt2)
-                edge.append([pt1, pt2])
-                mid = (pt1 + pt2) / 2  # midpoint calculation
-                mps.append(mid.tolist())
-
-                lgth = np.sqrt((pt2[0] - pt1[0]) ** 2 + (pt2[1] - pt1[1]) ** 2)  # length of membrane domain
-
-                # sa = lgth * p.cell_height  # surface area of membrane
-                surfa.append(lgth)
-
-                tang_a = pt2 - pt1  # tangent
-                tang = tang_a / np.linalg.norm(tang_a)
-                # normal = np.array([-tang[1],tang[0]])
-                normal = np.array([tang[1], -tang[0]])
-                cv_x.append(mid[0])
-                cv_y.append(mid[1])
-                cv_nx.append(normal[0])
-                cv_ny.append(normal[1])
-                cv_tx.append(tang[0])
-                cv_ty.append(tang[1])
-
-            mem_edges.append(edge)
-            mem_mids.append(mps)
-            mem_length.append(surfa)
-
-        self.mem_vects_flat = np.array([cv_x, cv_y, cv_nx, cv_ny, cv_tx, cv_ty]).T
-
-        # ---post processing and calculating peripheral structures-----------------------------------------------------
-
-        self.mem_mids_flat, indmap_mem, _ = tb.flatten(mem_mids)
-        self.mem_mids_flat = np.asarray(self.mem_mids_flat)  # convert the data structure to an array
-
-        # Finish up by creating indices vectors and converting to Numpy arrays
-        # where needed:
-        self.cell_i = [x for x in range(0, len(self.cell_centres))]
-        self.mem_i =  [x for x in range(0, len(self.mem_mids_flat))]
-
-        # convert mem_length into a flat vector
-        mem_length, _, _ = tb.flatten(mem_length)
-        mem_length = np.asarray(mem_length)
-
-        self.mem_sa = mem_length * p.cell_height
-
-        self.mem_edges_flat, _, _ = tb.flatten(mem_edges)
-        self.mem_edges_flat = np.asarray(self.mem_edges_flat)
-
-        # create a flattened version of cell_verts that will serve as membrane verts:
-        self.mem_verts, _, _ = tb.flatten(self.cell_verts)
-        self.mem_verts = np.asarray(self.mem_verts)
-
-        # structures for plotting interpolated data and streamlines:
-        self.plot_xy = np.vstack((self.mem_mids_flat, self.mem_verts))
-
-        # cell surface area:
-        self.cell_sa = []
-        for grp in self.cell_to_mems:
-            cell_sa = sum(self.mem_sa[grp])
-            self.cell_sa.append(cell_sa)
-
-        self.cell_sa = np.asarray(self.cell_sa)
+        self._calc_mems_geometry(p, ecm_verts)
 
         #------------------------------------------------------
         # next obtain the set of *unique* vertex points from the total ecm_verts arrangement:
@@ -947,7 +863,8 @@ class Cells(object):
                 self.mesh.clip_and_refine(image_mask, smoothing=None, refinement=phase.p.refine_mesh,
                                      max_steps=phase.p.maximum_voronoi_steps,
                                      convergence=phase.p.voronoi_convergence,
-                                     fix_bounds=True)
+                                     fix_bounds=True,
+                                     incremental=phase.p.refine_mesh_incremental)
 
 
         # Clip the Voronoi cluster to the shape of the clipping bitmap -------------------------------------------------
@@ -1004,167 +921,40 @@ class Cells(object):
         self.gj_len = p.cell_space      # distance between gap junction (as "pipe length")
 
         # calculate basic properties such as volume, surface area, normals, etc for the cell array
-        self.cell_verts = []
+        mems_count = self._calc_mems_geometry(p, self.ecm_verts)
 
-        for centre,poly in zip(self.cell_centres,self.ecm_verts):
-            pt_scale = []
-            for vert in poly:
-                pt_zero = vert - centre
-                pt_scale.append(p.scale_cell*pt_zero + centre)
-            self.cell_verts.append(np.asarray(pt_scale))
-
-        self.cell_verts = np.asarray(self.cell_verts, dtype=object)
-
-        # self.cell_vol = []   # storage for cell volumes
-        self.cell_sa = []    # whole cell surface areas
         self.cell_area = []
 
-        mem_edges = []  # storage for membrane edge points
-        mem_length = []   # storage for membrane surface area values
-        mem_mids = []   # storage for membrane midpoints
-
-        # storage for various vector properties of membrane
-        cv_x=[]
-        cv_y=[]
-        cv_nx=[]
-        cv_ny=[]
-        cv_tx=[]
-        cv_ty=[]
-
-        for polyc in self.cell_verts:
-            # # First calculate individual cell volumes from cell vertices:
-            # poly = [x for x in reversed(polyc)]
-            # self.cell_vol.append(p.cell_height*tb.area(poly))
-
-            # Next calculate individual membrane domains, midpoints, and vectors:
-            edge = []
-            mps = []
-            surfa = []
-
-            for i in range(0,len(polyc)):
-                pt1 = polyc[i-1]
-                pt2 = polyc[i]
-                pt1 = np.asarray(pt1)
-                pt2 = np.asarray(pt2)
-                edge.append([pt1,pt2])
-                mid = (pt1 + pt2)/2       # midpoint calculation
-                mps.append(mid.tolist())
-
-                lgth = np.sqrt((pt2[0] - pt1[0])**2 + (pt2[1]-pt1[1])**2)  # length of membrane domain
-                # sa = lgth*p.cell_height    # surface area of membrane
-                surfa.append(lgth)
-
-                tang_a = pt2 - pt1       # tangent
-                tang = tang_a/np.linalg.norm(tang_a)
-                # normal = np.array([-tang[1],tang[0]])
-                normal = np.array([tang[1],-tang[0]])
-                cv_x.append(mid[0])
-                cv_y.append(mid[1])
-                cv_nx.append(normal[0])
-                cv_ny.append(normal[1])
-                cv_tx.append(tang[0])
-                cv_ty.append(tang[1])
-
-            mem_edges.append(edge)
-            mem_mids.append(mps)
-            mem_length.append(surfa)
-
-        #FIXME: For readability, it would be great if we could extract the
-        #last four columns of this array into two new arrays with
-        #human-readable names resembling the "mem_mids_flat" array: e.g.,
-        #
-        #* "self.mem_norms_flat", providing the normal membrane unit vectors.
-        #* "self.mem_tangs_flat", providing the tangent membrane unit vectors.
-        #
-        #Currently, we reference these columns with non-human-readable magic
-        #numbers like "self.mem_vects_flat[:,3]", which is fairly hard to
-        #mentally parse when perusing the code. Calm qualms in an oceanic quay!
-        #FIXME: The first two columns of this array are exact duplicates of the
-        #first (and only) two columns of the "mem_mids_flat" array, defined
-        #below. Since the "mem_mids_flat" array is more human-readable than
-        #this array, that array should probably be preferred everywhere for
-        #obtaining the coordinates of membrane midpoints, in which case the
-        #first two columns of this array (i.e., "cv_x" and "cv_y") should
-        #probably be removed entirely from this array. Idle Ides of March!
-        self.mem_vects_flat = np.array([cv_x,cv_y,cv_nx,cv_ny,cv_tx,cv_ty]).T
-
         #---post processing and calculating peripheral structures-----------------------------------------------------
 
-        self.mem_mids = np.asarray(mem_mids, dtype=object)
-
-        self.mem_mids_flat, indmap_mem, _ = tb.flatten(mem_mids)
-        self.mem_mids_flat = np.asarray(self.mem_mids_flat)  # convert the data structure to an array
-
-        #FIXME: This logic has been duplicated in both deformWorld() and
-        #quickVerts() methods, which... isn't the best. Consider centralizing
-        #these duplicated variable assignments into a common private method.
+        # Offsets of the first membrane of each cell into all membranes, such
+        # that the membranes of cell "i" are "mems_start[i]:mems_start[i+1]".
+        mems_start = np.concatenate(([0], np.cumsum(mems_count)))
 
-        # Finish up by creating indices vectors and converting to Numpy arrays where needed:
-        self.cell_i = [x for x in range(0,len(self.cell_centres))]
-        self.mem_i  = [x for x in range(0,len(self.mem_mids_flat))]
-
-        # convert mem_length into a flat vector
-        mem_length,_,_ = tb.flatten(mem_length)
-        mem_length = np.asarray(mem_length)
-
-        self.mem_sa = mem_length*p.cell_height
-
-        self.mem_edges_flat, _, _ = tb.flatten(mem_edges)
-        self.mem_edges_flat = np.asarray(self.mem_edges_flat)
-
-        # create a flattened version of cell_verts that will serve as membrane verts:
-        self.mem_verts,_,_ = tb.flatten(self.cell_verts)
-        self.mem_verts = np.asarray(self.mem_verts)
-
-        # structures for plotting interpolated data and streamlines:
-        self.plot_xy = np.vstack((self.mem_mids_flat,self.mem_verts))
+        self.mem_mids = np.asarray([
+            mem_mids.tolist()
+            for mem_mids in np.split(self.mem_mids_flat, mems_start[1:-1])
+        ], dtype=object)
 
         # define map allowing a dispatch from cell index to each respective membrane -------------------------------
-        indmap_mem = np.asarray(indmap_mem)
-
-        #Indexing by "[self.mem_i]" is superfluous here. Lively jumping snakes!
-        self.mem_to_cells = indmap_mem[:,0]   # gives cell index for each mem_i index placeholder
+        self.mem_to_cells = np.repeat(
+            np.arange(len(self.cell_i)), mems_count)   # gives cell index for each mem_i index placeholder
 
         # construct a mapping giving membrane index for each cell_i------------------------------------------------
-        self.cell_to_mems = []
-
-        for cell_index in self.cell_i:
-            # One-dimensional Numpy array of the indices of all membranes of
-            # the current cell. Note that:
-            #
-            # * "self.mem_to_cells == cell_index" is a Numpy boolean array.
-            # * ndarray.nonzero() returns an n-tuple of the indices of all items
-            #   of this boolean array evaluating to True, where "n" is the
-            #   number of dimensions of the "mem_to_cells" array. Since this
-            #   array is one-dimensional, this is guaranteed to be a 1-tuple
-            #   whose first item providing this array is indexed at "[0]".
-            #
-            # It is confusing. It is Numpy.
-            mems_index = (self.mem_to_cells == cell_index).nonzero()[0]
-            self.cell_to_mems.append(mems_index)
-
-        self.cell_to_mems = np.asarray(self.cell_to_mems, dtype=object)
-
-        #----------------------------------------------------------
-        # cell surface area:
-        self.cell_sa = []
-        for grp in self.cell_to_mems:
-            cell_sa = sum(self.mem_sa[grp])
-            self.cell_sa.append(cell_sa)
-
-        self.cell_sa = np.asarray(self.cell_sa)
+        # Since the membranes of each cell are contiguous, the one-dimensional
+        # Numpy array of the indices of all membranes of each cell is simply
+        # a slice of the indices of all membranes.
+        self.cell_to_mems = np.asarray(
+            np.split(np.arange(len(self.mem_i)), mems_start[1:-1]),
+            dtype=object)
 
         #----------------------------------------------------------------------
         # Construct an array indexing vertices of the membrane vertices array.
         cellVertTree = cKDTree(self.mem_verts)
 
-        self.index_to_mem_verts = []
-        for cell_nest in mem_edges:
-            for mem_points in cell_nest:
-                _, pt_ind1 = cellVertTree.query(mem_points[0])
-                _, pt_ind2 = cellVertTree.query(mem_points[1])
-                self.index_to_mem_verts.append([pt_ind1, pt_ind2])
-        self.index_to_mem_verts = np.asarray(self.index_to_mem_verts)
+        _, pt_inds1 = cellVertTree.query(self.mem_edges_flat[:, 0])
+        _, pt_inds2 = cellVertTree.query(self.mem_edges_flat[:, 1])
+        self.index_to_mem_verts = np.column_stack((pt_inds1, pt_inds2))
 
         # create radial vectors for each cell, defined from their centre to each membrane midpoint
         self.rads = self.mem_mids_flat - self.cell_centres[self.mem_to_cells]
@@ -1177,101 +967,101 @@ class Cells(object):
     def quickVerts(self, p):
 
         # calculate basic properties such as volume, surface area, normals, etc for the cell array
-        self.cell_verts = []
-
-        for centre,poly in zip(self.cell_centres,self.ecm_verts):
-            pt_scale = []
-            for vert in poly:
-                pt_zero = vert - centre
-                pt_scale.append(p.scale_cell*pt_zero + centre)
-            self.cell_verts.append(np.asarray(pt_scale))
-
-        self.cell_verts = np.asarray(self.cell_verts)
-
-        mem_edges = []  # storage for membrane edge points
-        mem_length = []   # storage for membrane surface area values
-        mem_mids = []   # storage for membrane midpoints
-
-        # storage for various vector properties of membrane
-        cv_x=[]
-        cv_y=[]
-        cv_nx=[]
-        cv_ny=[]
-        cv_tx=[]
-        cv_ty=[]
-
-        for polyc in self.cell_verts:
-            # # First calculate individual cell volumes from cell vertices:
-            # poly = [x for x in reversed(polyc)]
-            # self.cell_vol.append(p.cell_height*tb.area(poly))
-
-            # Next calculate individual membrane domains, midpoints, and vectors:
-            edge = []
-            mps = []
-            surfa = []
-
-            for i in range(0,len(polyc)):
-                pt1 = polyc[i-1]
-                pt2 = polyc[i]
-                pt1 = np.asarray(pt1)
-                pt2 = np.asarray(pt2)
-                edge.append([pt1,pt2])
-                mid = (pt1 + pt2)/2       # midpoint calculation
-                mps.append(mid.tolist())
+        self._calc_mems_geometry(p, self.ecm_verts)
+
+    def _calc_mems_geometry(self, p, ecm_verts: SequenceTypes) -> ndarray:
+        '''
+        Scale the vertices of each passed Voronoi polygon in towards the centre
+        of the corresponding cell to define unique vertices for each cell, and
+        calculate the geometry of all cell membranes (i.e., the edges of these
+        cells) from these vertices.
+
+        All membranes are flattened into a single array ordered by cell, such
+        that the membranes of each cell are contiguous and the ``i``-th
+        membrane of a cell connects the ``(i-1)``-th and ``i``-th vertices of
+        that cell. All geometry is calculated for all membranes at once.
+
+        Parameters
+        ----------
+        p : betse.science.parameters.Parameters
+            Current simulation configuration.
+        ecm_verts : SequenceTypes
+            Sequence of the vertices of the Voronoi polygon of each cell.
 
-                lgth = np.sqrt((pt2[0] - pt1[0])**2 + (pt2[1]-pt1[1])**2)  # length of membrane domain
-                # sa = lgth*p.cell_height    # surface area of membrane
-                surfa.append(lgth)
+        Returns
+        ----------
+        ndarray
+            One-dimensional Numpy array of the number of membranes of each cell.
+        '''
 
-                tang_a = pt2 - pt1       # tangent
-                tang = tang_a/np.linalg.norm(tang_a)
-                # normal = np.array([-tang[1],tang[0]])
-                normal = np.array([tang[1],-tang[0]])
-                cv_x.append(mid[0])
-                cv_y.append(mid[1])
-                cv_nx.append(normal[0])
-                cv_ny.append(normal[1])
-                cv_tx.append(tang[0])
-                cv_ty.append(tang[1])
+        # Number of vertices (and hence membranes) of each cell.
+        mems_count = np.asarray([len(poly) for poly in ecm_verts])
+        mems_start = np.cumsum(mems_count) - mems_count
+        mem_to_cells = np.repeat(np.arange(len(self.cell_centres)), mems_count)
 
-            mem_edges.append(edge)
-            mem_mids.append(mps)
-            mem_length.append(surfa)
+        # Vertices of all cells, scaled in from the Voronoi polygons.
+        centres = self.cell_centres[mem_to_cells]
+        mem_verts = p.scale_cell*(np.vstack(ecm_verts) - centres) + centres
 
-        self.mem_vects_flat = np.array([cv_x,cv_y,cv_nx,cv_ny,cv_tx,cv_ty]).T
+        self.cell_verts = np.asarray(
+            np.split(mem_verts.copy(), mems_start[1:]), dtype=object)
 
-        #---post processing and calculating peripheral structures-----------------------------------------------------
+        # First and second vertices of each membrane, where the first vertex
+        # is the vertex preceding the second vertex of the same cell.
+        mem_pos = np.arange(len(mem_verts)) - mems_start[mem_to_cells]
+        pt1 = mem_verts[
+            mems_start[mem_to_cells] + (mem_pos - 1) % mems_count[mem_to_cells]]
+        pt2 = mem_verts
+
+        mids = (pt1 + pt2)/2       # midpoint calculation
+
+        # length of membrane domain
+        mem_length = np.sqrt((pt2[:, 0] - pt1[:, 0])**2 + (pt2[:, 1] - pt1[:, 1])**2)
+
+        tang_a = pt2 - pt1       # tangent
+        tang = tang_a/np.linalg.norm(tang_a, axis=1)[:, None]
+
+        #FIXME: For readability, it would be great if we could extract the
+        #last four columns of this array into two new arrays with
+        #human-readable names resembling the "mem_mids_flat" array: e.g.,
+        #
+        #* "self.mem_norms_flat", providing the normal membrane unit vectors.
+        #* "self.mem_tangs_flat", providing the tangent membrane unit vectors.
+        #
+        #Currently, we reference these columns with non-human-readable magic
+        #numbers like "self.mem_vects_flat[:,3]", which is fairly hard to
+        #mentally parse when perusing the code. Calm qualms in an oceanic quay!
+        #FIXME: The first two columns of this array are exact duplicates of the
+        #first (and only) two columns of the "mem_mids_flat" array, defined
+        #below. Since the "mem_mids_flat" array is more human-readable than
+        #this array, that array should probably be preferred everywhere for
+        #obtaining the coordinates of membrane midpoints, in which case the
+        #first two columns of this array (i.e., "cv_x" and "cv_y") should
+        #probably be removed entirely from this array. Idle Ides of March!
+        self.mem_vects_flat = np.column_stack((
+            mids[:, 0], mids[:, 1], tang[:, 1], -tang[:, 0], tang[:, 0], tang[:, 1]))
 
-        self.mem_mids_flat, indmap_mem, _ = tb.flatten(mem_mids)
-        self.mem_mids_flat = np.asarray(self.mem_mids_flat)  # convert the data structure to an array
+        self.mem_mids_flat = mids
 
         # Finish up by creating indices vectors and converting to Numpy arrays where needed:
         self.cell_i = [x for x in range(0,len(self.cell_centres))]
-        self.mem_i =  [x for x in range(0,len(self.mem_mids_flat))]
-
-        # convert mem_length into a flat vector
-        mem_length,_,_ = tb.flatten(mem_length)
-        mem_length = np.asarray(mem_length)
+        self.mem_i  = [x for x in range(0,len(self.mem_mids_flat))]
 
         self.mem_sa = mem_length*p.cell_height
 
-        self.mem_edges_flat, _, _ = tb.flatten(mem_edges)
-        self.mem_edges_flat = np.asarray(self.mem_edges_flat)
+        self.mem_edges_flat = np.stack((pt1, pt2), axis=1)
 
         # create a flattened version of cell_verts that will serve as membrane verts:
-        self.mem_verts,_,_ = tb.flatten(self.cell_verts)
-        self.mem_verts = np.asarray(self.mem_verts)
+        self.mem_verts = mem_verts
 
         # structures for plotting interpolated data and streamlines:
         self.plot_xy = np.vstack((self.mem_mids_flat,self.mem_verts))
 
         # cell surface area:
-        self.cell_sa = []
-        for grp in self.cell_to_mems:
-            cell_sa = sum(self.mem_sa[grp])
-            self.cell_sa.append(cell_sa)
+        self.cell_sa = np.bincount(
+            mem_to_cells, weights=self.mem_sa, minlength=len(self.cell_i))
 
-        self.cell_sa = np.asarray(self.cell_sa)
+        return mems_count
 
     def cellMatrices(self, p) -> None:
         '''
@@ -1294,66 +1084,85 @@ class Cells(object):
         #     self.matrixMap2Verts[i, indices[1]] = 1/2
 
         # matrix for summing property on membranes for each cell and a count of number of mems per cell:---------------
-        self.M_sum_mems = np.zeros((len(self.cell_i),len(self.mem_i)))
-        self.num_mems = []
-
-        for i, inds in enumerate(self.cell_to_mems):
-            n = 0
-            for j in inds:
-                self.M_sum_mems[i,j] = 1
-                n = n+1
+        self.num_mems = np.asarray(
+            [len(inds) for inds in self.cell_to_mems])  # number of membranes per cell
+
+        # Since each membrane belongs to exactly one cell, this matrix has
+        # exactly one nonzero per column and is stored in sparse CSR format.
+        mem_rows = np.repeat(np.arange(len(self.cell_i)), self.num_mems)
+        mem_cols = np.concatenate(
+            [np.asarray(inds, dtype=int) for inds in self.cell_to_mems])
+
+        self.M_sum_mems = csr_matrix(
+            (np.ones(len(mem_cols)), (mem_rows, mem_cols)),
+            shape=(len(self.cell_i), len(self.mem_i)))
+
+        # Pseudo-inverse of M_sum_mems for div-free cell calcs. Since the rows
+        # of M_sum_mems are orthogonal, this is exactly its transpose with each
+        # column scaled by the reciprocal number of membranes of that cell.
+        self.M_sum_mems_inv = csr_matrix(
+            (1/self.num_mems[mem_rows], (mem_cols, mem_rows)),
+            shape=(len(self.mem_i), len(self.cell_i)))
 
-            self.num_mems.append(n)
-
-        self.M_sum_mems_inv = np.linalg.pinv(self.M_sum_mems)  # matrix inverse of M_sum_mems for div-free cell calcs
-        self.num_mems = np.asarray(self.num_mems)  # number of membranes per cell
         self.mem_distance = p.cell_space + 2*p.tm # distance between two adjacent intracellluar spaces
         self.cell_number = self.cell_centres.shape[0]
 
-        # matrix for calculating gradients around the cell circumference:
-        self.gradTheta = np.zeros((len(self.mem_i), len(self.mem_i)))
+        # Index of the membrane preceding each membrane of the same cell.
+        mems_start = np.cumsum(self.num_mems) - self.num_mems
+        mem_pos = np.arange(len(self.mem_i)) - mems_start[self.mem_to_cells]
+        mem_io = mems_start[self.mem_to_cells] + (
+            (mem_pos - 1) % self.num_mems[self.mem_to_cells])
 
-        # matrix for averaging points from mem-mids to companion polygon midpoints:
-        # self.aveTheta = np.zeros((len(self.mem_i), len(self.mem_i)))
+        # distance between points:
+        li = self.mem_mids_flat - self.mem_mids_flat[mem_io]
+        lm = np.sqrt(li[:, 0] ** 2 + li[:, 1] ** 2)
 
         # matrix storing the radial length:
-        self.radial_len = np.zeros(len(self.mem_i))
-
-        for cell_i, mem_i in enumerate(self.cell_to_mems):
-
-            mem_io = np.roll(mem_i, 1)
+        self.radial_len = np.abs(lm)
 
-            # distance between points:
-            li = self.mem_mids_flat[mem_i] - self.mem_mids_flat[mem_io]
-            lm = np.sqrt(li[:, 0] ** 2 + li[:, 1] ** 2)
-
-            self.radial_len[mem_i] = np.abs(lm)
-
-            self.gradTheta[mem_i, mem_i] = 1 / lm
-            self.gradTheta[mem_i, mem_io] = -1 / lm
-            #
-            # self.aveTheta[mem_i, mem_i] = 1/2
-            # self.aveTheta[mem_i, mem_io] = 1/2
+        # Sparse matrix for calculating gradients around the cell
+        # circumference, with exactly two nonzero entries per row.
+        mem_rows = np.arange(len(self.mem_i))
+        self.gradTheta = csr_matrix(
+            (np.concatenate((1 / lm, -1 / lm)),
+             (np.concatenate((mem_rows, mem_rows)),
+              np.concatenate((mem_rows, mem_io)))),
+            shape=(len(self.mem_i), len(self.mem_i)))
 
     def memLaplacian(self):
 
-        # matrix for computing divergence of a property defined on a membrane of each cell patch:
-        lapGJmem = np.zeros((len(self.mem_i), len(self.mem_i)))
-
-        for cell_i, mem_i in enumerate(self.cell_to_mems):
-
-            num_mems = self.num_mems[cell_i]
-
-            for nj, j in enumerate(mem_i):
-
-                mem_j = np.roll(mem_i, -1 - nj)
-
-                memjj = mem_j[0:-1]
-
-                lapGJmem[j, j] = ((num_mems - 1)/num_mems)*(self.mem_sa[j]/self.mem_vol[j])
-                lapGJmem[j, memjj] = -(1/num_mems)*(self.mem_sa[memjj]/self.mem_vol[memjj])
-
-        self.lapGJmem_inv = np.linalg.pinv(lapGJmem)
+        # The matrix for computing divergence of a property defined on a
+        # membrane of each cell patch is block diagonal, with one block per
+        # cell. For a cell with "n" membranes, entry (j, k) of that block is
+        # "(delta_jk - 1/n)*(mem_sa[k]/mem_vol[k])". Since the pseudo-inverse
+        # of a block diagonal matrix is the block diagonal matrix of the
+        # pseudo-inverses of these blocks, these blocks are pseudo-inverted
+        # in batches of cells with the same number of membranes and stored
+        # as a sparse matrix.
+        mem_geom = self.mem_sa/self.mem_vol
+
+        lap_rows = []
+        lap_cols = []
+        lap_data = []
+
+        for num_mems in np.unique(self.num_mems):
+            # Two-dimensional Numpy array of the indices of the membranes of
+            # all cells with this number of membranes.
+            mems = np.vstack(
+                self.cell_to_mems[self.num_mems == num_mems]).astype(int)
+
+            # Three-dimensional Numpy array of the blocks of these cells.
+            lap_blocks = (
+                np.eye(num_mems) - 1/num_mems)*mem_geom[mems][:, None, :]
+
+            lap_rows.append(np.repeat(mems, num_mems, axis=1).ravel())
+            lap_cols.append(np.tile(mems, (1, num_mems)).ravel())
+            lap_data.append(np.linalg.pinv(lap_blocks).ravel())
+
+        self.lapGJmem_inv = csr_matrix(
+            (np.concatenate(lap_data),
+             (np.concatenate(lap_rows), np.concatenate(lap_cols))),
+            shape=(len(self.mem_i), len(self.mem_i)))
 
     def cell_vols(self, p) -> None:
         '''
@@ -1382,7 +1191,7 @@ class Cells(object):
         self.mem_vol = (1 / 2) * self.R_rads * self.mem_sa
 
         # calaculate cell volume by suming up the large pies:
-        self.cell_vol = np.dot(self.M_sum_mems, self.mem_vol)
+        self.cell_vol = self.M_sum_mems.dot(self.mem_vol)
 
         self.R = ((3 / 4) * (self.cell_vol / math.pi)) ** (1 / 3)  # effective radius of each cell
 
@@ -1495,82 +1304,47 @@ class Cells(object):
         Uses scipy spatial KDTree search algorithm
         """
 
-        self.nn_i = [] # gives the partnering membrane index at the vectors' index
-        self.cell_nn_i = [[] for x in self.mem_i] # stores the two connecting cell indices at a shared membrane
-
-        for i, (mem_i,mem_j) in enumerate(self.mem_nn):
-
-            if mem_i == mem_j:  # we're on a boundary cell
-
-                self.nn_i.append(i)
-                cell_i = self.mem_to_cells[i]
-                self.cell_nn_i[mem_i].append(cell_i)
-                self.cell_nn_i[mem_i].append(cell_i)
-
-            elif i == mem_i and i != mem_j:
-
-                self.nn_i.append(mem_j)
-                cell_i = self.mem_to_cells[mem_i]
-                cell_j = self.mem_to_cells[mem_j]
-
-                self.cell_nn_i[i].append(cell_i)
-                self.cell_nn_i[i].append(cell_j)
-
-            elif i == mem_j and i != mem_i:
-
-                self.nn_i.append(mem_i)
-                cell_i = self.mem_to_cells[mem_j]
-                cell_j = self.mem_to_cells[mem_i]
-
-                self.cell_nn_i[i].append(cell_i)
-                self.cell_nn_i[i].append(cell_j)
-
-            else:
-                logs.log_info("WARNING: entry not placed in seed nearest neighbour construction. "
-                                 "Results may not be accurate.")
-
-        self.nn_i = np.asarray(self.nn_i)
-        self.cell_nn_i = np.asarray(self.cell_nn_i)
-
-        # Next find the nearest neighbour set for each cell:
-        self.cell_nn = []
-        for cell_i, mem_i_set in enumerate(self.cell_to_mems):
-
-            cell_neigh_set = []
-
-            for mem_i in mem_i_set:
-
-                mem_j = self.nn_i[mem_i]  # find the partner to this membrane...
-
-                if mem_j == mem_i:  # if the indices are equal, we're on a neighborless boundary cell
-                    pass
-
-                else:
-
-                    cell_j = self.mem_to_cells[mem_j]
-
-                    if cell_i != cell_j:  # cross-check that values are not the same
-                        cell_neigh_set.append(cell_j)
-
-            self.cell_nn.append(cell_neigh_set)
-
-        self.num_nn = []  # initialize a list that will hold number of nns to a cell
-
-        for indices in self.cell_nn:
-            self.num_nn.append(len(indices))
-
-        self.average_nn = (sum(self.num_nn)/len(self.num_nn))
-        self.num_nn = np.asarray(self.num_nn)
-        self.cell_nn = np.asarray(self.cell_nn, dtype=object)
-
-        # Nearest neighbours to the boundary cells.
+        mem_i = np.arange(len(self.mem_i))
+
+        # Each pair of "mem_nn" contains the current membrane, such that the
+        # partnering membrane of each membrane is the other item of that pair
+        # (or the current membrane itself on a boundary cell).
+        is_placed = (self.mem_nn[:, 0] == mem_i) | (self.mem_nn[:, 1] == mem_i)
+
+        if not np.all(is_placed):
+            logs.log_info("WARNING: entry not placed in seed nearest neighbour construction. "
+                             "Results may not be accurate.")
+
+        # gives the partnering membrane index at the vectors' index
+        self.nn_i = np.where(
+            self.mem_nn[:, 0] == mem_i, self.mem_nn[:, 1], self.mem_nn[:, 0])
+
+        # stores the two connecting cell indices at a shared membrane
+        self.cell_nn_i = np.column_stack((
+            self.mem_to_cells, self.mem_to_cells[self.nn_i]))
+
+        # Next find the nearest neighbour set for each cell, ignoring
+        # membranes on a neighborless boundary cell and cross-checking that
+        # partnering cells are not the same:
+        nn_cells = self.mem_to_cells[self.nn_i]
+        is_nn = (self.nn_i != mem_i) & (nn_cells != self.mem_to_cells)
+
+        self.num_nn = np.bincount(
+            self.mem_to_cells[is_nn], minlength=len(self.cell_i))
+        self.average_nn = (np.sum(self.num_nn)/len(self.num_nn))
+        self.cell_nn = np.asarray([
+            cell_neigh_set.tolist()
+            for cell_neigh_set in np.split(
+                nn_cells[is_nn], np.cumsum(self.num_nn)[:-1])
+        ], dtype=object)
+
+        # Nearest neighbours to the boundary cells, taking out the shared
+        # values.
         nn_bound = self.cell_nn[self.bflags_cells]
-        nn_bound, _,_ = tb.flatten(nn_bound)
+        nn_bound = np.asarray(tb.flatten(nn_bound)[0], dtype=int)
 
-        self.nn_bound = []
-        for ind in nn_bound:  # take out the shared values:
-            if ind not in self.bflags_cells:
-                self.nn_bound.append(ind)
+        self.nn_bound = nn_bound[
+            np.isin(nn_bound, self.bflags_cells, invert=True)].tolist()
 
 
     def makeECM(self,p):
@@ -1854,7 +1628,9 @@ class Cells(object):
 
         Creates
         ----------
-        self.lapGJinv          Solver for Poisson equation with Neumann (zero gradient) boundary
+        self.lapGJinv          Sparse solver for Poisson equation with Neumann (zero gradient) boundary,
+                               whose solve() method applies the inverse Laplacian
+        self.lapGJ             Sparse Laplacian operator matrix
         '''
 
         # Log this action.
@@ -1863,35 +1639,20 @@ class Cells(object):
 
         #----DEC matrix creation
         # Hodge star for edge length ratios:
-        star_eij = np.diag(self.mesh.vor_edge_len/self.mesh.tri_edge_len)
-
-        # First term in the laplacian matrix:
-        L1 = np.dot(star_eij, self.mesh.delta_tri_0)
-
-        star_a = np.diag(1/self.mesh.vor_sa)
-
-        L2 = np.dot(star_a, -self.mesh.delta_tri_0.T)
-
-        # Inverse terms:
-        # Hodge star for edge length ratios:
-        star_eij_inv = np.diag(self.mesh.tri_edge_len/self.mesh.vor_edge_len)
+        star_eij = self.mesh.vor_edge_len/self.mesh.tri_edge_len
 
-        # First term in the laplacian matrix:
-        L1_inv = np.dot(self.mesh.delta_tri_0_inv, star_eij_inv)
-
-        star_a_inv = np.diag(self.mesh.vor_sa)
-
-        L2_inv = np.dot(-self.mesh.delta_tri_0_inv.T, star_a_inv)
-
-
-        self.lapGJinv = np.dot(L1_inv, L2_inv)
+        # Solver applying the product of the pseudo-inverses of the factors of
+        # the DEC Laplacian via a cached sparse factorization:
+        self.lapGJinv = SparseDECPoissonSolver(
+            self.mesh.delta_tri_0, star_eij, self.mesh.vor_sa)
 
         # if p.td_deform is True:
         #     # if time0dependent deformation is selected, also save the direct Laplacian operator:
-        self.lapGJ = np.dot(L2, L1)
+        self.lapGJ = make_dec_laplacian(
+            self.mesh.delta_tri_0, star_eij, self.mesh.vor_sa)
 
         # weighting function for the voronoi lattice:
-        self.geom_weight = np.dot(self.M_sum_mems, self.mem_sa / self.mem_vol) * p.cell_height
+        self.geom_weight = self.M_sum_mems.dot(self.mem_sa / self.mem_vol) * p.cell_height
 
     def cellDivM(self, p):
 
@@ -1916,26 +1677,22 @@ class Cells(object):
 
         """
 
-        # matrix for computing divergence of a property defined on a membrane of each cell patch:
-        divCell = np.zeros((len(self.cell_i), len(self.mem_i)))
-
-        for i, inds in enumerate(self.cell_to_mems):
-
-            # get the volume for the cell:
-            cell_vol = self.cell_vol[i]
-
-            for j in inds:
-                # self.M_sum_mems[i,j] = 1
-
-                # get the membrane surface area for this membrane patch:
-                mem_sa = self.mem_sa[j]
-
-                # set the divergence term:
-                divCell[i, j] = mem_sa/cell_vol
+        # Nonzero entries of the matrix for computing divergence of a property
+        # defined on a membrane of each cell patch, each the membrane surface
+        # area divided by the cell volume.
+        div_mems = self.mem_sa/self.cell_vol[self.mem_to_cells]
 
+        # Since each membrane belongs to exactly one cell, the rows of this
+        # matrix are orthogonal, and its pseudo-inverse is exactly its
+        # transpose with each column divided by the squared norm of the
+        # corresponding row. This inverse is stored as a sparse matrix.
+        div_norms = np.bincount(
+            self.mem_to_cells, weights=div_mems**2, minlength=len(self.cell_i))
 
-        # calculate the inverse of the divergence matrix:
-        self.divCell_inv = np.linalg.pinv(divCell)
+        self.divCell_inv = csr_matrix(
+            (div_mems/div_norms[self.mem_to_cells],
+             (np.arange(len(self.mem_i)), self.mem_to_cells)),
+            shape=(len(self.mem_i), len(self.cell_i)))
 
     @type_check
     def redo_gj(self, phase: SimPhase) -> None:
@@ -1953,63 +1710,60 @@ class Cells(object):
         dyna = phase.dyna
         p    = phase.p
 
-        flag_cell_nn = [ [] for x in range(0,len(self.cell_i))]
+        # Indices of each cell and each of its nearest neighbours, flattened
+        # over all cells in the same order as "self.cell_nn".
+        cells_count = len(self.cell_i)
+        nn_counts = np.asarray([len(inds) for inds in self.cell_nn], dtype=int)
+        nn_cell_a = np.repeat(np.arange(cells_count), nn_counts)
+        nn_cell_b = np.asarray(
+            [cell_j for inds in self.cell_nn for cell_j in inds], dtype=int)
+
+        # Boolean array flagging each such neighbour pair whose connection is
+        # split between cells in different tissues.
+        is_nn_split = np.zeros(len(nn_cell_b), dtype=bool)
 
         for tissue_name, tissue_profile in dyna.tissue_name_to_profile.items():
             # Step through gj's and find cases where connection is split between
             # cells in different tissues.
             if tissue_profile.is_gj_insular:
                 # Get the cell target inds for this tissue.
-                cell_targets = dyna.cell_target_inds[tissue_name]
-
-                for i, inds in enumerate(self.cell_nn):
-                    # see if the cell is in the tissue region:
-                    check_a = int(i in cell_targets)
-
-                    # check and see if the cell's neighbours are in the tissue region:
-                    for ind_b in inds:
-                        check_b = int(ind_b in cell_targets)
-
-                        if check_a != check_b: # if both cells are not in or out of the region:
-                            flag_cell_nn[i].append(ind_b)
-
-        new_cell_nn = [ [] for x in range(0,len(self.cell_i))]
-
-        for i, flags in enumerate(flag_cell_nn):
-            neighs = self.cell_nn[i]  # get a list of all current neighbours to this cell
-
-            for cell in neighs:
-                if cell not in flags:  # if the cell is not in the removal list
-                    new_cell_nn[i].append(cell)
-
-        self.cell_nn_connected = np.asarray(new_cell_nn, dtype=object)
+                cell_targets = np.asarray(
+                    dyna.cell_target_inds[tissue_name], dtype=int)
+
+                # see if each cell is in the tissue region:
+                is_cell_target = np.zeros(cells_count, dtype=bool)
+                is_cell_target[cell_targets] = True
+
+                # if both cells are not in or out of the region:
+                is_nn_split |= (
+                    is_cell_target[nn_cell_a] != is_cell_target[nn_cell_b])
+
+        # Retain only the neighbours of each cell whose connection is unsplit.
+        nn_counts_connected = np.bincount(
+            nn_cell_a[~is_nn_split], minlength=cells_count)
+        self.cell_nn_connected = np.asarray([
+            cell_neigh_set.tolist()
+            for cell_neigh_set in np.split(
+                nn_cell_b[~is_nn_split], np.cumsum(nn_counts_connected)[:-1])
+        ], dtype=object)
 
         # Redo the number and average nearest neighbours per cell:
-        self.num_nn = []  # initialize a list that will hold number of nns to a cell
-
-        for indices in self.cell_nn:
-            self.num_nn.append(len(indices))
-
+        self.num_nn = nn_counts
         self.average_nn = (sum(self.num_nn)/len(self.num_nn))
-        self.num_nn = np.asarray(self.num_nn)
         self.gj_default_weights = np.ones(len(self.mem_i))
 
-        for cell_i, nn_cell_i_set in enumerate(self.cell_nn_connected):
-            mem_i_set = self.cell_to_mems[cell_i]  # get all the membranes for this cell
-
-            for mem_i in mem_i_set:
-                mem_j = self.nn_i[mem_i]  # get the current neighbour mem and cell...
-
-                if mem_j != mem_i:  # if we're not on a boundary
-                    cell_j = self.mem_to_cells[mem_j]
-
-                    if cell_j not in nn_cell_i_set:  # if the partner cell is no longer listed as a nn...
-                        # ...then the gap junction weight to zero to fully inhibit coupling:
-                        self.gj_default_weights[mem_i] = 0.0
-
-                        #...then set both the membrane and cell neighbour spot to "self":
-                        # self.nn_i[mem_i] = mem_i
-                        # self.cell_nn_i[mem_i] = [cell_i,cell_i]
+        # Inhibit coupling across every non-boundary membrane whose partner
+        # cell is no longer listed as a connected neighbour, setting the gap
+        # junction weight to zero. Connected cell pairs are uniquely encoded as
+        # integers for vectorized lookup.
+        mem_cell_a = self.mem_to_cells
+        mem_cell_b = self.mem_to_cells[self.nn_i]
+        is_mem_nn = self.nn_i != np.arange(len(self.mem_i))
+        is_mem_connected = np.isin(
+            mem_cell_a*cells_count + mem_cell_b,
+            nn_cell_a[~is_nn_split]*cells_count + nn_cell_b[~is_nn_split],
+        )
+        self.gj_default_weights[is_mem_nn & ~is_mem_connected] = 0.0
 
         # calculate gap junction vectors
         self.calc_gj_vects(p)
@@ -2022,98 +1776,55 @@ class Cells(object):
         Used in deformation sequence.
         '''
 
-        self.nn_mids = []
-        self.nn_tx = []  # tangent vector to gap junction (through neighboring cell centres)
-        self.nn_ty = []
-        self.nn_len = []  # distance between neighbouring cell centres
-
-        self.nn_edges = [[] for x in self.mem_i]  # line segment between neighbouring cell centres
-
-        for mem_i, mem_j in enumerate(self.nn_i):
-            cell_i, cell_j = self.cell_nn_i[mem_i]
-
-            # calculate vectors for the pairing:
-            pt1_mem = self.mem_mids_flat[mem_i]
-            pt2_mem = self.mem_mids_flat[mem_j]
-
-            pt1_cell = self.cell_centres[cell_i]
-            pt2_cell = self.cell_centres[cell_j]
-
-            tang_o = pt2_mem - pt1_mem
-
-            tang_x_o = tang_o[0]
-            tang_y_o = tang_o[1]
-
-            tang_mag = np.sqrt(tang_x_o**2 + tang_y_o**2)
-
-            if tang_mag == 0.0:
-                tang_x = 0
-                tang_y = 0
-            else:
-                tang_x = tang_x_o/tang_mag
-                tang_y = tang_y_o/tang_mag
-
-            mid = (pt1_mem + pt2_mem)/2
-            self.nn_mids.append(mid)
-
-            # calculate length
-            len_o = pt2_cell - pt1_cell
-
-            len_xo  = len_o[0]
-            len_yo = len_o[1]
-
-            len_mag = np.sqrt(len_xo**2 + len_yo**2)
-
-            if len_mag == 0.0:
-                self.nn_len.append(-1) # FIXME -- this seems like a horrific idea...
-            else:
-                self.nn_len.append(len_mag)
-
-            self.nn_tx.append(tang_x)
-            self.nn_ty.append(tang_y)
-
-            self.nn_edges[mem_i].append(pt1_cell)
-            self.nn_edges[mem_i].append(pt2_cell)
-
-        self.nn_mids = np.asarray(self.nn_mids)
-
-        self.nn_tx = np.asarray(self.nn_tx)
-        self.nn_ty = np.asarray(self.nn_ty)
-        self.nn_len = np.asarray(self.nn_len)
-        self.nn_edges = np.asarray(self.nn_edges)
-
-        self.cell_nn_tx = []
-        self.cell_nn_ty = []
-
-        for cell_i, cell_j in self.cell_nn_i:
-            pt1 = self.cell_centres[cell_i]
-            pt2 = self.cell_centres[cell_j]
-
-            tang_o = pt2 - pt1
-            norm_tang = np.sqrt(tang_o[0]**2 + tang_o[1]**2)
-
-            if norm_tang != 0:
-                tang = tang_o/norm_tang
-            else:
-                norm_tang = 1
-                tang = tang_o/norm_tang
-                tang[0] = 0
-                tang[1] = 0
-
-            self.cell_nn_tx.append(tang[0])
-            self.cell_nn_ty.append(tang[1])
-
-        self.cell_nn_tx = np.asarray(self.cell_nn_tx)
-        self.cell_nn_ty = np.asarray(self.cell_nn_ty)
-
-        # Mapping between gap junction index and cell:
-        self.cell_to_nn_full = [[] for x in range(len(self.cell_i))]
-
-        for i, (cell_i, cell_j) in enumerate(self.cell_nn_i):
-            # If it's not a boundary membrane...
-            if cell_i != cell_j:
-                self.cell_to_nn_full[cell_i].append(i)
-                self.cell_to_nn_full[cell_j].append(i)
+        # Indices of the cells on either side of each gap junction.
+        cell_i, cell_j = self.cell_nn_i[:, 0], self.cell_nn_i[:, 1]
+
+        # Membrane midpoints and cell centres on either side of each gap
+        # junction.
+        pt1_mem = self.mem_mids_flat
+        pt2_mem = self.mem_mids_flat[self.nn_i]
+        pt1_cell = self.cell_centres[cell_i]
+        pt2_cell = self.cell_centres[cell_j]
+
+        # Unit tangent vector to each gap junction (from membrane midpoint to
+        # membrane midpoint), zeroed for boundary membranes paired to
+        # themselves.
+        tang_o = pt2_mem - pt1_mem
+        tang_mag = np.sqrt(tang_o[:, 0]**2 + tang_o[:, 1]**2)
+        tang_mag_nonzero = np.where(tang_mag == 0.0, 1.0, tang_mag)
+
+        self.nn_tx = np.where(tang_mag == 0.0, 0.0, tang_o[:, 0]/tang_mag_nonzero)
+        self.nn_ty = np.where(tang_mag == 0.0, 0.0, tang_o[:, 1]/tang_mag_nonzero)
+
+        self.nn_mids = (pt1_mem + pt2_mem)/2
+
+        # distance between neighbouring cell centres:
+        len_o = pt2_cell - pt1_cell
+        len_mag = np.sqrt(len_o[:, 0]**2 + len_o[:, 1]**2)
+        self.nn_len = np.where(len_mag == 0.0, -1, len_mag) # FIXME -- this seems like a horrific idea...
+
+        # line segment between neighbouring cell centres:
+        self.nn_edges = np.stack((pt1_cell, pt2_cell), axis=1)
+
+        # unit tangent vector between neighbouring cell centres, zeroed for
+        # boundary membranes:
+        len_mag_nonzero = np.where(len_mag == 0.0, 1.0, len_mag)
+        self.cell_nn_tx = np.where(len_mag == 0.0, 0.0, len_o[:, 0]/len_mag_nonzero)
+        self.cell_nn_ty = np.where(len_mag == 0.0, 0.0, len_o[:, 1]/len_mag_nonzero)
+
+        # Mapping between gap junction index and cell, listing the gap
+        # junctions of each cell in ascending order and excluding boundary
+        # membranes:
+        gj_inds = np.flatnonzero(cell_i != cell_j)
+        gj_cells = self.cell_nn_i[gj_inds].ravel()
+        gj_order = np.argsort(gj_cells, kind='stable')
+        gj_inds_sorted = np.repeat(gj_inds, 2)[gj_order]
+        gj_counts = np.bincount(gj_cells, minlength=len(self.cell_i))
+
+        self.cell_to_nn_full = [
+            gj_inds_cell.tolist()
+            for gj_inds_cell in np.split(gj_inds_sorted, np.cumsum(gj_counts)[:-1])
+        ]
 
         self.cell_to_nn_full = np.asarray(self.cell_to_nn_full, dtype=object)
 
@@ -2347,8 +2058,8 @@ class Cells(object):
         Takes vector quantity (Smx, Smy) defined at membranes and calculates the averaged
         single vector at the cell centre.
         """
-        Scx = np.dot(self.M_sum_mems, Smx * self.mem_sa) / self.cell_sa
-        Scy = np.dot(self.M_sum_mems, Smy * self.mem_sa) / self.cell_sa
+        Scx = self.M_sum_mems.dot(Smx * self.mem_sa) / self.cell_sa
+        Scy = self.M_sum_mems.dot(Smy * self.mem_sa) / self.cell_sa
 
         return Scx, Scy
 
@@ -2393,7 +2104,7 @@ class Cells(object):
         if cbound is True: # close the boundary (zero-flux boundary condition)
             gSn[self.bflags_mems] = 0.0
 
-        divS = np.dot(self.M_sum_mems, gSn * self.mem_sa) / self.cell_vol
+        divS = self.M_sum_mems.dot(gSn * self.mem_sa) / self.cell_vol
 
         return divS
 
@@ -2441,7 +2152,7 @@ class Cells(object):
         fmemi = (fmem[self.nn_i] + fmem[self.mem_i])/2
 
         # average the values at the cell centre point:
-        fcent = (1/2)*(f + (np.dot(self.M_sum_mems, fmemi)/self.num_mems))
+        fcent = (1/2)*(f + (self.M_sum_mems.dot(fmemi)/self.num_mems))
 
         return fcent, fmemi
 
@@ -2474,7 +2185,7 @@ class Cells(object):
 
             curlF_o = dFy_dx - dFx_dy
 
-            curl_z = np.dot(self.M_sum_mems,curlF_o)/self.num_mems
+            curl_z = self.M_sum_mems.dot(curlF_o)/self.num_mems
 
             curl_x = 0
             curl_y = 0
@@ -2489,8 +2200,8 @@ class Cells(object):
             curl_phi_x_o = dphi_dy_o
             curl_phi_y_o = -dphi_dx_o
 
-            curl_x = np.dot(self.M_sum_mems,curl_phi_x_o)/self.num_mems
-            curl_y = np.dot(self.M_sum_mems,curl_phi_y_o)/self.num_mems
+            curl_x = self.M_sum_mems.dot(curl_phi_x_o)/self.num_mems
+            curl_y = self.M_sum_mems.dot(curl_phi_y_o)/self.num_mems
 
             curl_z = 0
 
@@ -2522,12 +2233,12 @@ class Cells(object):
         """
 
         # calculate divergence as the sum of this vector x each surface area, divided by cell volume:
-        div_F = (np.dot(self.M_sum_mems, Fn * self.mem_sa) / self.cell_vol)
+        div_F = (self.M_sum_mems.dot(Fn * self.mem_sa) / self.cell_vol)
 
         fxo = Fn*self.nn_tx
         fyo = Fn*self.nn_ty
 
-        Phi = np.dot(self.lapGJinv, div_F + rho)
+        Phi = self.lapGJinv.solve(div_F + rho)
 
         gPhi = (Phi[self.cell_nn_i[:, 1]] - Phi[self.cell_nn_i[:, 0]]) / (self.nn_len)
 
@@ -2542,8 +2253,8 @@ class Cells(object):
 
 
         # calculate the net displacement of cell centres under the applied force under incompressible conditions:
-        F_cell_x = np.dot(self.M_sum_mems, Fx) / self.num_mems
-        F_cell_y = np.dot(self.M_sum_mems, Fy) / self.num_mems
+        F_cell_x = self.M_sum_mems.dot(Fx) / self.num_mems
+        F_cell_y = self.M_sum_mems.dot(Fy) / self.num_mems
 
         return Fn, F_cell_x, F_cell_y
 
@@ -2579,7 +2290,7 @@ class Cells(object):
 
         # if bounds_closed is True:
 
-        AA = np.dot(self.lapGJinv, -curlF)
+        AA = self.lapGJinv.solve(-curlF)
 
         Ax, Ay, _ = self.curl(0, 0, AA)
 
@@ -2592,17 +2303,17 @@ class Cells(object):
 
             Fn = Fxm * nx + Fym * ny
 
-            divF = np.dot(self.M_sum_mems, Fn * self.mem_sa) / self.cell_vol
+            divF = self.M_sum_mems.dot(Fn * self.mem_sa) / self.cell_vol
 
-            BB = np.dot(self.lapGJinv, divF)
+            BB = self.lapGJinv.solve(divF)
 
             gBB = (BB[self.cell_nn_i[:, 1]] - BB[self.cell_nn_i[:, 0]]) / (self.nn_len)
 
             Bxm = gBB * nx
             Bym = gBB * ny
 
-            Bx = np.dot(self.M_sum_mems, Bxm) / self.num_mems
-            By = np.dot(self.M_sum_mems, Bym) / self.num_mems
+            Bx = self.M_sum_mems.dot(Bxm) / self.num_mems
+            By = self.M_sum_mems.dot(Bym) / self.num_mems
 
         else:
             BB = 0
@@ -2614,7 +2325,7 @@ class Cells(object):
     def single_cell_div_free(self, uxo, uyo):
         # now, make the transport field divergence-free wrt individual cells (divergence-free is the way to be!
         divU = self.div(uxo, uyo, cbound=False)  # divergence of the field at each membrane
-        Pi = np.dot(self.M_sum_mems_inv, divU) * (
+        Pi = self.M_sum_mems_inv.dot(divU) * (
             self.cell_vol[self.mem_to_cells] / self.mem_sa)  # 'pressure" field to create div-free case
 
         ux = uxo - Pi * self.mem_vects_flat[:, 2]  # corrected vector at the membrane
@@ -2696,9 +2407,9 @@ class Cells(object):
     #replace "self.M_sum_mems" everywhere; after doing so, "self.M_sum_mems"
     #should be removed.
     @property_cached
-    def membranes_midpoint_to_cells_centre(self) -> ndarray:
+    def membranes_midpoint_to_cells_centre(self) -> csr_matrix:
         '''
-        Numpy matrix (i.e., two-dimensional array) of size ``m x n``, where:
+        Sparse SciPy matrix of size ``m x n``, where:
 
         * ``m`` is the total number of cell membranes.
         * ``n`` is the total number of cells.
@@ -2718,7 +2429,9 @@ class Cells(object):
         ``m`` containing arbitrary data spatially situated at cell membrane
         midpoints by this matrix by yields another Numpy vector of size ``n``
         containing the same data resituated at cell centres, where ``m`` and
-        ``n`` are as defined above.
+        ``n`` are as defined above. Since this matrix is sparse, this product
+        is computed as ``matrix.T.dot(data)`` rather than ``np.dot(data,
+        matrix)``; see :meth:`map_membranes_midpoint_to_cells_centre`.
 
         This matrix is cached *only* on the first access of this property.
         '''
@@ -2731,12 +2444,13 @@ class Cells(object):
         #   m. Each element of this transpose is either:
         #   * 0 if this cell does *NOT* contain this membrane.
         #   * 1 if this cell contains this membrane.
-        # * "... / self.num_mems", normalizing each cell membrane element of
+        # * ".multiply(1 / self.num_mems)", normalizing each cell membrane element of
         #   this matrix by the number of membranes in that cell. Since
         #   "num_mems" is a row vector of length m whose elements are the
         #   number of membranes in that cell, each column of this transpose is
         #   divided by the corresponding element of this row vector.
-        return self.M_sum_mems.T / self.num_mems
+        return csr_matrix(
+            csr_matrix(self.M_sum_mems).T.multiply(1 / self.num_mems))
 
     # ..........{ MAPPERS                                }.....................
     #FIXME: To reduce code duplication:
@@ -2817,9 +2531,10 @@ class Cells(object):
 
         # Map this array from cell membrane midpoints onto cell centres. By
         # design, this efficiently supports both one- and two-dimensional input
-        # arrays as is.
-        return np.dot(
-            membranes_midpoint_data, self.membranes_midpoint_to_cells_centre)
+        # arrays as is. Since this matrix is sparse, this dot product is
+        # computed as the transpose of the transposed product.
+        return self.membranes_midpoint_to_cells_centre.T.dot(
+            membranes_midpoint_data.T).T
 
     # ..........{ MAPPERS ~ cells centre                  }.....................
     def map_cells_centre_to_grids_centre(
@@ -2966,52 +2681,36 @@ class Cells(object):
                 '(i.e., first dimension length {} not 2).'.format(
                     len(target_points)))
 
-        # 2-tuple of the X and Y coordinates of all cell centres.
-        cell_centres = (self.cell_centres[:, 0], self.cell_centres[:, 1])
-
-        # Dictionary of all keyword arguments to pass to all calls to the
-        # griddata() function performed below.
-        griddate_kwargs = {
+        # Map this data from cell centres onto target points via a single
+        # interpolation reusing the interpolation plan previously cached for
+        # these points if any. Since this plan requires the first dimension of
+        # two-dimensional source data to index cell centres, this data and the
+        # interpolated data are transposed.
+        cells_centre_data_interpolated = gridinterp.griddata(
             # 2-tuple of all source X and Y coordinates to interpolate from.
-            'points': cell_centres,
+            points=(self.cell_centres[:, 0], self.cell_centres[:, 1]),
+
+            # Source data transposed such that cell centres are indexed first.
+            values=cells_centre_data.T,
 
             # 2-tuple of all target X and Y coordinates to interpolate onto.
-            'xi': target_points,
+            xi=target_points,
 
             # Machine-readable string specifying the interpolation type.
-            'method': interp_method,
+            method=interp_method,
 
             # Default data value to assign all output points residing outside
             # the convex hull of the cell centres being interpolated from, which
             # are thus non-interpolatable. For safety, this data is nullified.
             # The default "fill_value" is NaN, which is absurdly unsafe.
-            'fill_value': 0,
-        }
+            fill_value=0,
+        )
 
-        # If this source data is one-dimensional, map this data from cell
-        # centres onto target points via a single interpolation call.
-        if len(cells_centre_data.shape) == 1:
-            return data_factor * interp.griddata(
-                values=cells_centre_data, **griddate_kwargs)
-        # Else, this data is two-dimensional. Since SciPy requires the second
-        # parameter to the interp.griddata() function be one-dimensional, this
-        # is mappable from cell centres onto target points *ONLY* via multiple
-        # interpolation calls. While inefficient, SciPy offers no alternatives.
-        else:
-            # Two-dimensional output list aggregating all interpolation results.
-            cells_centre_data_interpolated = []
-
-            # For each one-dimensional input array of source data in this
-            # two-dimensional input array of such data...
-            for cells_centre_data_one in cells_centre_data:
-                # One-dimensional output array interpolated from this array.
-                cells_centre_data_one_interpolated = (
-                    data_factor * interp.griddata(
-                        values=cells_centre_data_one, **griddate_kwargs))
-
-                # Append this output array to this output list.
-                cells_centre_data_interpolated.append(
-                    cells_centre_data_one_interpolated)
-
-            # Return this output list converted back to an output array.
-            return nparray.from_iterable(cells_centre_data_interpolated)
+        # If this source data is two-dimensional, restore the first dimension
+        # of this output data to index the first dimension of this input data.
+        if len(cells_centre_data.shape) == 2:
+            cells_centre_data_interpolated = np.moveaxis(
+                cells_centre_data_interpolated, -1, 0)
+
+        # Return this output data multiplied by this factor.
+        return data_factor * cells_centre_data_interpolated
@@ -0,0 +1,309 @@
+#!/usr/bin/env python3
+# Copyright 2014-2023 by Alexis Pietak & Cecil Curry.
+# See "LICENSE" for further details.
+
+'''
+Banks of voltage-gated channels advanced together each time step.
+'''
+
+# ....................{ IMPORTS                            }....................
+import numpy as np
+from betse.science.channels.cation import CationABC
+from betse.science.channels.channelsabc import ChannelsABC
+from betse.science.channels.vg_morrislecar import VgKABC as VgMLABC
+from betse.util.type.types import type_check, SequenceTypes
+
+# ....................{ CLASSES                            }....................
+class ChannelBank(object):
+    '''
+    **Channel bank** (i.e., set of voltage-gated channels whose gating states
+    are grouped by channel class and advanced together each time step).
+
+    Each channel of the Hodgkin-Huxley formalism (i.e., defining ``m`` and
+    ``h`` gates raised to the ``_mpower`` and ``_hpower`` powers) or the
+    Morris-Lecar formalism (i.e., subclassing
+    :class:`betse.science.channels.vg_morrislecar.VgKABC`) is **banked.** The
+    gating states of all banked channels of the same class are concatenated
+    into one-dimensional arrays whose items are the targeted membranes of each
+    channel of that class. Each time step then evaluates the rate functions of
+    each channel class and advances the gating states of that class once over
+    these arrays rather than once for each channel, with the same
+    semi-implicit schemes as :meth:`ChannelsABC.update_mh` and
+    :meth:`ChannelsABC.update_ml`.
+
+    Each banked channel is then left in the same state as if its own ``run``
+    method had been called, including its ``m``, ``h``, and open probability
+    ``P`` attributes. All other channels are run individually.
+
+    Attributes
+    ----------
+    channels : tuple
+        Tuple of all channels of this bank, banked or not.
+    groups : tuple
+        Tuple of :class:`_ChannelGroup` instances advancing all banked channels
+        of the same class, in order of first appearance.
+    _channels_unbanked : tuple
+        Tuple of all channels of this bank run individually.
+    '''
+
+    # ..................{ INITIALIZERS                       }..................
+    @type_check
+    def __init__(self, channels: SequenceTypes, mems_count: int) -> None:
+        '''
+        Initialize this channel bank from the current states of the passed
+        channels.
+
+        Parameters
+        ----------
+        channels : SequenceTypes
+            Sequence of all previously initialized channels (i.e.,
+            :class:`ChannelsABC` instances) to be advanced by this bank.
+        mems_count : int
+            Number of cell membranes, defining the default targets of channels
+            whose ``targets`` attribute is ``None``.
+        '''
+
+        self.channels = tuple(channels)
+
+        # Dictionary mapping from the class of each group of banked channels to
+        # the list of all channels of that group, in order of first appearance.
+        channel_type_to_channels = {}
+        channels_unbanked = []
+        for channel in self.channels:
+            if _is_channel_bankable(channel):
+                channel_type_to_channels.setdefault(
+                    type(channel), []).append(channel)
+            else:
+                channels_unbanked.append(channel)
+
+        self._channels_unbanked = tuple(channels_unbanked)
+        self.groups = tuple(
+            _ChannelGroup(channels=group_channels, mems_count=mems_count)
+            for group_channels in channel_type_to_channels.values()
+        )
+
+    # ..................{ RUNNERS                            }..................
+    def run(self, vm: np.ndarray, p: 'betse.science.parameters.Parameters') -> (
+        None):
+        '''
+        Advance all channels of this bank by one time step at the passed
+        transmembrane voltages.
+
+        Parameters
+        ----------
+        vm : ndarray
+            One-dimensional Numpy array of all transmembrane voltages [V].
+        p : betse.science.parameters.Parameters
+            Current simulation configuration.
+        '''
+
+        # Run all unbanked channels individually.
+        for channel in self._channels_unbanked:
+            channel.run(vm, p)
+
+        # Run all banked channels of each class at once.
+        for group in self.groups:
+            group.run(vm, p)
+
+# ....................{ PRIVATE ~ classes                  }....................
+class _ChannelGroup(object):
+    '''
+    **Channel group** (i.e., set of all banked channels of the same class,
+    whose gating states are stored in contiguous arrays and advanced together).
+
+    Attributes
+    ----------
+    channel_type : type
+        Class of all channels of this group.
+    channel_slices : tuple
+        Tuple of 2-tuples ``(channel, channel_slice)`` of each channel of this
+        group and the slice of its gating states in the arrays of this group.
+    is_ml : bool
+        ``True`` only if the channels of this group are of the Morris-Lecar
+        formalism, in which case :attr:`_h` is ignored.
+    is_ml_kinetic : bool
+        ``True`` only if the channels of this group are time-dependent
+        Morris-Lecar channels. If :attr:`is_ml` is ``True`` and this is
+        ``False``, the ``m`` gates of this group are set to their steady states.
+    _targets : ndarray
+        One-dimensional Numpy array of the membrane index of each gating state.
+    _v_corr : ndarray
+        One-dimensional Numpy array of the voltage correction [mV] added to the
+        transmembrane voltage of each gating state.
+    _time_unit : ndarray
+        One-dimensional Numpy array of the time unit of the time constants of
+        each gating state.
+    _phi : ndarray
+        One-dimensional Numpy array of the Morris-Lecar time scale of each
+        gating state, ignored for Hodgkin-Huxley channels.
+    _m : ndarray
+        One-dimensional Numpy array of each ``m`` gating state.
+    _h : ndarray
+        One-dimensional Numpy array of each ``h`` gating state, ignored for
+        Morris-Lecar channels.
+    '''
+
+    # ..................{ INITIALIZERS                       }..................
+    def __init__(self, channels: list, mems_count: int) -> None:
+
+        # Whether a Morris-Lecar channel is time-dependent is defined by its
+        # class and hence shared by all channels of this group.
+        self.channel_type = type(channels[0])
+        self.is_ml = isinstance(channels[0], VgMLABC)
+        self.is_ml_kinetic = self.is_ml and bool(channels[0].kinetic_gate)
+
+        # Lists of the per-channel arrays to be concatenated below.
+        targets = []
+        v_corr = []
+        time_unit = []
+        phi = []
+        m = []
+        h = []
+
+        channel_slices = []
+        states_count = 0
+        for channel in channels:
+            # Membrane indices targeted by this channel.
+            channel_targets = (
+                np.arange(mems_count) if channel.targets is None else
+                np.asarray(channel.targets, dtype=np.intp))
+            channel_len = len(channel_targets)
+
+            targets.append(channel_targets)
+            v_corr.append(np.full(channel_len, _get_channel_v_corr(channel)))
+            time_unit.append(np.full(channel_len, channel.time_unit))
+            phi.append(np.full(channel_len, getattr(channel, 'Phi', 0.0)))
+            m.append(np.broadcast_to(
+                np.asarray(channel.m, dtype=np.float64), channel_len))
+
+            # Morris-Lecar channels have no "h" gates.
+            h.append(
+                np.ones(channel_len) if self.is_ml else
+                np.broadcast_to(
+                    np.asarray(channel.h, dtype=np.float64), channel_len))
+
+            channel_slices.append((channel, slice(
+                states_count, states_count + channel_len)))
+            states_count += channel_len
+
+        self.channel_slices = tuple(channel_slices)
+        self._targets = np.concatenate(targets)
+        self._v_corr = np.concatenate(v_corr)
+        self._time_unit = np.concatenate(time_unit)
+        self._phi = np.concatenate(phi)
+        self._m = np.concatenate(m)
+        self._h = np.concatenate(h)
+
+    # ..................{ RUNNERS                            }..................
+    def run(self, vm: np.ndarray, p: 'betse.science.parameters.Parameters') -> (
+        None):
+        '''
+        Advance all channels of this group by one time step at the passed
+        transmembrane voltages [V].
+        '''
+
+        # Corrected transmembrane voltages [mV] of all gating states.
+        V = vm[self._targets]*1000 + self._v_corr
+
+        # Evaluate the rate functions of this class over all gating states at
+        # once. Since these functions are elementwise, this is exactly
+        # equivalent to evaluating these functions for each channel.
+        rates = _ChannelRates()
+        self.channel_type._calculate_state(rates, V)
+        rates = vars(rates)
+        m_inf = rates.pop('_mInf')
+        m_tau = rates.pop('_mTau')
+        h_inf = rates.pop('_hInf', None)
+        h_tau = rates.pop('_hTau', None)
+
+        # Time step-size in the time unit of each gating state.
+        dt = p.dt*self._time_unit
+
+        # Advance all gating states with the same floating point operations in
+        # the same order as ChannelsABC.update_mh() and update_ml().
+        if not self.is_ml:
+            self._m = (m_tau*self._m + dt*m_inf)/(m_tau + dt)
+            self._h = (h_tau*self._h + dt*h_inf)/(h_tau + dt)
+        elif self.is_ml_kinetic:
+            self._m = (
+                (self._m + (dt*self._phi*m_inf/m_tau)) /
+                (1 + ((dt*self._phi)/m_tau)))
+        else:
+            self._m = np.full(len(self._m), m_inf)
+
+        # Store the resulting states, rates, and open probabilities of each
+        # channel of this group.
+        for channel, channel_slice in self.channel_slices:
+            channel.m = self._m[channel_slice]
+            channel._mInf = _get_channel_rate(m_inf, channel_slice)
+            channel._mTau = _get_channel_rate(m_tau, channel_slice)
+
+            if self.is_ml:
+                P = channel.m
+            else:
+                channel.h = self._h[channel_slice]
+                channel._hInf = _get_channel_rate(h_inf, channel_slice)
+                channel._hTau = _get_channel_rate(h_tau, channel_slice)
+                P = (
+                    (channel.m ** channel._mpower) *
+                    (channel.h ** channel._hpower))
+
+            if channel.targets is None:
+                channel.P = P
+            else:
+                channel.P = np.zeros(channel.mdl)
+                channel.P[channel.targets] = P
+
+            # Copy all other attributes set by these rate functions (e.g.,
+            # reversal voltages) to this channel.
+            for attr_name, attr_value in rates.items():
+                setattr(channel, attr_name, _get_channel_rate(
+                    attr_value, channel_slice))
+
+
+class _ChannelRates(object):
+    '''
+    Namespace to which the ``_calculate_state`` method of a channel class
+    writes the steady states and time constants of the gates of that class
+    when evaluated by a :class:`_ChannelGroup`.
+    '''
+
+    pass
+
+# ....................{ PRIVATE ~ getters                  }....................
+def _is_channel_bankable(channel: ChannelsABC) -> bool:
+    '''
+    ``True`` only if the passed channel is advanced by a :class:`ChannelBank`
+    (i.e., is a Hodgkin-Huxley or Morris-Lecar channel) rather than run
+    individually.
+    '''
+
+    return isinstance(channel, VgMLABC) or (
+        isinstance(channel, ChannelsABC) and
+        hasattr(channel, '_mpower') and
+        hasattr(channel, '_hpower') and
+        hasattr(channel, 'h')
+    )
+
+
+def _get_channel_v_corr(channel: ChannelsABC) -> float:
+    '''
+    Voltage correction [mV] added to the transmembrane voltages of the passed
+    banked channel by the ``run`` method of that channel.
+    '''
+
+    # Morris-Lecar and cation channels ignore voltage corrections.
+    if isinstance(channel, (VgMLABC, CationABC)):
+        return 0.0
+
+    return float(getattr(channel, 'v_corr', 0.0))
+
+
+def _get_channel_rate(rate: object, channel_slice: slice) -> object:
+    '''
+    Passed rate evaluated over all gating states of a channel group sliced to
+    the gating states of a single channel of that group if this rate is an
+    array *or* this rate as is if this rate is a scalar.
+    '''
+
+    return rate[channel_slice] if np.ndim(rate) == 1 else rate
@@ -52,6 +52,27 @@ class Gap_Junction(object):
 
     def run(self, sim, cells, p):
 
+        self.update_rates(sim, p)
+
+        # update GJ conductivity with incremental change of channel state (time is converted to be in ms):
+        # sim.gjopen = sim.gjopen + ((1.0 - sim.gjopen)*self.alpha - (sim.gjopen - p.gj_min)*self.beta)*p.dt*1e3
+        dt = p.dt*1e3 # transform the time-step to model's milisecond units
+
+        # advance the gap junction state using Implicit Euler:
+        sim.gjopen = (sim.gjopen + dt*(self.alpha + self.beta*p.gj_min))/(1 + self.alpha*dt + self.beta*dt)
+
+        # apply any blocking modulation:
+        sim.gjopen = sim.gj_block*sim.gjopen
+
+        # print(sim.gjopen.mean())
+
+
+    def update_rates(self, sim, p):
+
+        """
+        Update the opening and closing rates of the gap junctions from the current transjunctional voltage.
+
+        """
 
         # we use the absolute value of transjunctional voltage due to symmetric channels and convert to mV:
         V1 = 1.0e3 * np.abs(sim.vgj)
@@ -64,17 +85,21 @@ class Gap_Junction(object):
 
         self.beta = beta / (1 + 50 * beta)
 
-        # update GJ conductivity with incremental change of channel state (time is converted to be in ms):
-        # sim.gjopen = sim.gjopen + ((1.0 - sim.gjopen)*self.alpha - (sim.gjopen - p.gj_min)*self.beta)*p.dt*1e3
-        dt = p.dt*1e3 # transform the time-step to model's milisecond units
 
-        # advance the gap junction state using Implicit Euler:
-        sim.gjopen = (sim.gjopen + dt*(self.alpha + self.beta*p.gj_min))/(1 + self.alpha*dt + self.beta*dt)
+    def get_gjopen_steady(self, sim, p):
 
-        # apply any blocking modulation:
-        sim.gjopen = sim.gj_block*sim.gjopen
+        """
+        Return the gap junction open state left unchanged by run() at the current transjunctional voltage (i.e., the
+        steady state of the gap junctions at that voltage, including any blocking modulation).
 
-        # print(sim.gjopen.mean())
+        """
+
+        self.update_rates(sim, p)
+
+        dt = p.dt*1e3 # transform the time-step to model's milisecond units
+
+        # fixed point of the blocked Implicit Euler update of run():
+        return sim.gj_block*dt*(self.alpha + self.beta*p.gj_min)/(1 + self.alpha*dt + self.beta*dt - sim.gj_block)
 
 
 class Gap_Junction_i(object):
@@ -208,6 +208,10 @@ class MasterOfGenes(object):
             self.core.target_vmem = float(config_dic['optimization']['target Vmem'])
             self.core.opti_T = float(config_dic['optimization']['optimization T'])
             self.core.opti_step = float(config_dic['optimization']['optimization step'])
+            self.core.opti_batched = config_dic['optimization'].get('optimization batched', False)
+            self.core.opti_chains = int(config_dic['optimization'].get('optimization chains', 1))
+            self.core.opti_workers = int(config_dic['optimization'].get('optimization workers', 1))
+            self.core.opti_tolerance = float(config_dic['optimization'].get('optimization tolerance', 0.0))
             # self.core.opti_run = config_dic['optimization']['run from optimization']
 
             if opti:
@@ -276,6 +280,12 @@ class MasterOfGenes(object):
         self.core.clear_cache()
         self.time = []
 
+        # Sample the times of this network into a new list. Since the
+        # simulator preserves the times sampled by the unpickled phase (if
+        # any) as a Numpy array rather than list, these times *CANNOT* be
+        # appended to.
+        sim.time = []
+
         self.mod_after_cut = False # set this to false
 
         if self.recalc_fluid:  # If user requests the GRN recalculate/calculate fluid:
@@ -301,11 +311,20 @@ class MasterOfGenes(object):
         #             'Resetting microtubules for sim-grn simulation...')
         #         sim.mtubes = Mtubes(sim, cells, p)
 
+        # Stiff implicit method integrating reactions in cells if any *OR*
+        # "None" if stepping these reactions explicitly.
+        reaction_solver = None if p.grn_solver == 'explicit' else p.grn_solver
+        if reaction_solver is not None:
+            logs.log_info(
+                'Integrating reactions with stiff solver "%s"...',
+                reaction_solver)
+
         for t in tt:
             if self.transporters:
                 self.core.run_loop_transporters(t, sim, cells, p)
 
-            self.core.run_loop(phase=phase, t=t)
+            self.core.run_loop(
+                phase=phase, t=t, reaction_solver=reaction_solver)
 
             # if p.use_microtubules: # update the microtubules:
             #     sim.mtubes.update_mtubes(cells, sim, p)
@@ -0,0 +1,416 @@
+#!/usr/bin/env python3
+# ....................{ LICENSE                           }....................
+# Copyright 2014-2023 by Alexis Pietak & Cecil Curry.
+# See "LICENSE" for further details.
+
+'''
+Batched network optimization functionality, fitting the maximum rates of all
+reactions in a gene regulatory network (GRN) to steady state by running
+independent basin-hopping chains over a vectorized network residual.
+'''
+
+# ....................{ IMPORTS                           }....................
+import math, multiprocessing
+import numpy as np
+from betse.exceptions import BetseSimException
+from betse.util.io.log import logs
+from betse.util.os.process import prcfork
+from betse.util.type.types import type_check, CallableTypes
+from concurrent.futures import ProcessPoolExecutor
+from numpy import ndarray
+from scipy.optimize import OptimizeResult, basinhopping
+
+# ....................{ CLASSES                           }....................
+class NetworkResidual(object):
+    '''
+    **Network residual** (i.e., callable computing the chi-square deviation of
+    a gene regulatory network from steady state as a function of the vector of
+    factors scaling the maximum rate of each reaction in that network).
+
+    Given the vector ``v`` of these factors, this residual:
+
+    #. Computes the transmembrane voltage ``Vmem(v)`` given by the Goldman
+       equation, whose numerator and denominator are both linear in ``|v|``.
+    #. Computes the rate ``R(Vmem)`` of each reaction at these target
+       concentrations and this voltage. Since target concentrations are
+       constant, these rates depend *only* on this scalar voltage.
+    #. Returns the sum of the squares of the time derivatives ``M (|v| R)`` of
+       all concentrations and of the deviation of this voltage from the target
+       voltage in millivolts.
+
+    Unlike the legacy residual evaluated by the
+    :meth:`betse.science.chemistry.networks.MasterOfNetworks.optimizer` method,
+    which evaluates these rates at the voltage computed by the *prior* call,
+    this residual evaluates these rates at the voltage implied by the passed
+    factors and is hence a deterministic function of only these factors. This
+    permits both an analytic gradient and independent basin-hopping chains.
+
+    Attributes
+    ----------
+    network_matrix : ndarray
+        Two-dimensional Numpy array of shape ``(m, n)`` mapping the vector of
+        all ``n`` reaction rates onto the vector of the time derivatives of all
+        ``m - 1`` non-environmental concentrations and the transmembrane
+        current (i.e., the last row).
+    rates_getter : CallableTypes
+        Callable passed a scalar transmembrane voltage and returning the
+        one-dimensional Numpy array of the ``n`` reaction rates at this
+        voltage.
+    vm_numer : ndarray
+        One-dimensional Numpy array of the ``n`` coefficients of the numerator
+        of the Goldman equation (i.e., the membrane diffusion constant
+        scaled by the outward concentration of each permeant ion) with respect
+        to the absolute value of each factor.
+    vm_denom : ndarray
+        One-dimensional Numpy array of the ``n`` coefficients of the
+        denominator of the Goldman equation with respect to the absolute value
+        of each factor.
+    vm_factor : float
+        Thermal voltage ``RT/F`` scaling the logarithm in the Goldman equation.
+    vm_target : float
+        Target transmembrane voltage in volts.
+    vm_delta : float
+        Voltage step in volts with which the derivatives of reaction rates with
+        respect to voltage are approximated by central finite differences.
+    '''
+
+    # ..................{ INITIALIZERS                      }..................
+    @type_check
+    def __init__(
+        self,
+        network_matrix: ndarray,
+        rates_getter: CallableTypes,
+        vm_numer: ndarray,
+        vm_denom: ndarray,
+        vm_factor: float,
+        vm_target: float,
+        vm_delta: float = 1.0e-6,
+    ) -> None:
+        '''
+        Initialize this network residual.
+
+        Parameters
+        ----------
+        See the class docstring for all parameters, which are classified as
+        attributes of the same name.
+        '''
+
+        # Classify all passed parameters.
+        self.network_matrix = network_matrix
+        self.rates_getter = rates_getter
+        self.vm_numer = vm_numer
+        self.vm_denom = vm_denom
+        self.vm_factor = vm_factor
+        self.vm_target = vm_target
+        self.vm_delta = vm_delta
+
+        # 2-tuple "(vm, rates)" of the voltage last passed to the rates getter
+        # and the rates returned, avoiding redundant evaluations when the
+        # minimizer evaluates the residual and its gradient at the same point.
+        self._vm_rates_last = (None, None)
+
+    # ..................{ EVALUATORS                        }..................
+    def get_vm(self, factors: ndarray) -> float:
+        '''
+        Transmembrane voltage given by the Goldman equation for the passed
+        vector of reaction rate factors.
+        '''
+
+        factors_abs = np.abs(factors)
+        return self.vm_factor * float(np.log(
+            self.vm_numer.dot(factors_abs) / self.vm_denom.dot(factors_abs)))
+
+
+    def get_rates(self, vm: float) -> ndarray:
+        '''
+        One-dimensional Numpy array of all reaction rates at the passed
+        transmembrane voltage.
+        '''
+
+        if self._vm_rates_last[0] != vm:
+            self._vm_rates_last = (
+                vm, np.asarray(self.rates_getter(vm), dtype=np.float64))
+        return self._vm_rates_last[1]
+
+
+    def __call__(self, factors: ndarray) -> float:
+        '''
+        Chi-square deviation of this network from steady state for the passed
+        vector of reaction rate factors.
+        '''
+
+        vm = self.get_vm(factors)
+        outputs = self.network_matrix.dot(np.abs(factors)*self.get_rates(vm))
+        return float(
+            outputs.dot(outputs) + ((vm - self.vm_target)*1e3)**2)
+
+
+    def get_value_and_gradient(self, factors: ndarray) -> tuple:
+        '''
+        2-tuple ``(chi_sqr, gradient)`` of the chi-square deviation of this
+        network from steady state and the gradient of that deviation with
+        respect to the passed vector of reaction rate factors.
+
+        This gradient is analytic excepting the derivatives of reaction rates
+        with respect to voltage, which are approximated by central finite
+        differences. Each call thus evaluates all reaction rates at most thrice
+        (rather than once for each factor, as with forward differences of the
+        residual itself).
+        '''
+
+        factors_sign = np.sign(factors)
+        factors_abs = np.abs(factors)
+
+        # Goldman numerator and denominator, voltage, and derivatives of this
+        # voltage with respect to each factor.
+        vm_numer = self.vm_numer.dot(factors_abs)
+        vm_denom = self.vm_denom.dot(factors_abs)
+        vm = self.vm_factor * float(np.log(vm_numer / vm_denom))
+        vm_grad = self.vm_factor * factors_sign * (
+            self.vm_numer/vm_numer - self.vm_denom/vm_denom)
+
+        # Reaction rates and their derivatives with respect to voltage.
+        rates = self.get_rates(vm)
+        rates_dvm = (
+            np.asarray(self.rates_getter(vm + self.vm_delta)) -
+            np.asarray(self.rates_getter(vm - self.vm_delta))
+        ) / (2*self.vm_delta)
+
+        # Time derivatives of all concentrations and the transmembrane current.
+        outputs = self.network_matrix.dot(factors_abs*rates)
+        vm_error = (vm - self.vm_target)*1e3
+        chi_sqr = float(outputs.dot(outputs) + vm_error**2)
+
+        # Gradient of this deviation, summing the direct dependence of these
+        # outputs on each factor with the indirect dependence of these outputs
+        # and this voltage error on each factor through this voltage.
+        gradient = 2*factors_sign*rates*self.network_matrix.T.dot(outputs)
+        gradient += 2*vm_grad*(
+            outputs.dot(self.network_matrix.dot(factors_abs*rates_dvm)) +
+            vm_error*1e3)
+
+        return chi_sqr, gradient
+
+# ....................{ OPTIMIZERS                        }....................
+@type_check
+def basinhop_chains(
+    # Mandatory parameters.
+    residual: NetworkResidual,
+    factors_init: ndarray,
+    method: str,
+    niter: int,
+    T: float,
+    stepsize: float,
+
+    # Optional parameters.
+    chains: int = 1,
+    workers: int = 1,
+    tolerance: float = 0.0,
+    alt_tolerance: float = 0.015,
+    seed: int = 0,
+) -> tuple:
+    '''
+    Minimize the passed network residual by running the passed number of
+    independent basin-hopping chains across the passed number of forked worker
+    processes.
+
+    The first chain starts from the passed initial factors; each subsequent
+    chain starts from these factors randomly displaced by at most the passed
+    step size. After each hop, each chain logs its current minimum and the best
+    minimum found by *any* chain so far. As soon as any chain finds a minimum
+    no greater than the passed tolerance, all chains stop at their next hop.
+
+    Parameters
+    ----------
+    residual : NetworkResidual
+        Network residual to be minimized.
+    factors_init : ndarray
+        One-dimensional Numpy array of the initial reaction rate factors.
+    method : str
+        Name of the local minimization method (e.g., ``L-BFGS-B``). For all
+        methods except ``COBYLA`` and ``Nelder-Mead``, the analytic gradient of
+        this residual is also passed to this method.
+    niter : int
+        Maximum number of basin-hopping iterations of each chain.
+    T : float
+        Basin-hopping temperature.
+    stepsize : float
+        Basin-hopping step size.
+    chains : optional[int]
+        Number of independent chains. Defaults to 1.
+    workers : optional[int]
+        Maximum number of worker processes to run these chains in. If either
+        this number or the number of chains is 1 *or* the current platform
+        fails to safely support forking, these chains are run serially in the
+        current process. Defaults to 1.
+    tolerance : optional[float]
+        Residual value at or below which all chains stop early. Defaults to 0,
+        effectively disabling early stopping.
+    alt_tolerance : optional[float]
+        Residual value at or below which each minimum visited by any chain is
+        retained as an alternative solution. Defaults to 0.015.
+    seed : optional[int]
+        Seed of the random number generator of the first chain. Each
+        subsequent chain is seeded by the successive integer. Defaults to 0.
+
+    Returns
+    ----------
+    tuple
+        2-tuple ``(solution, alt_solutions)``, where:
+
+        * ``solution`` is the :class:`OptimizeResult` of the chain finding the
+          lowest minimum, whose ``chain`` key is the 0-based index of that
+          chain.
+        * ``alt_solutions`` is the list of the factors of all minima visited by
+          any chain whose residual is no greater than ``alt_tolerance``.
+
+    Raises
+    ----------
+    BetseSimException
+        If any chain fails.
+    '''
+
+    # Number of worker processes, ignoring excess workers.
+    workers = min(workers, chains)
+    if workers > 1 and not prcfork.is_forkable_else_warn(
+        'Optimization chains'):
+        workers = 1
+
+    logs.log_info(
+        'Running %d basin-hopping chains across %d processes...',
+        chains, workers)
+
+    # Parameters of these chains. Since the network residual references the
+    # simulation and hence is typically unpicklable, these parameters are
+    # inherited by forked worker processes rather than pickled to those
+    # processes. Since the best minimum found so far is shared between these
+    # chains, this minimum is stored in shared memory.
+    chain_kwargs = dict(
+        residual=residual,
+        factors_init=factors_init,
+        method=method,
+        niter=niter,
+        T=T,
+        stepsize=stepsize,
+        tolerance=tolerance,
+        alt_tolerance=alt_tolerance,
+        seed=seed,
+    )
+    chain_best = multiprocessing.get_context(
+        'fork' if workers > 1 else None).Value('d', math.inf)
+
+    # Expose these parameters to these chains *BEFORE* forking.
+    with prcfork.forking(
+        workers=workers, chain_kwargs=chain_kwargs, chain_best=chain_best):
+        # If running these chains serially, do so in the current process.
+        if workers == 1:
+            chain_results = [
+                _run_chain(chain_index) for chain_index in range(chains)]
+        # Else, run these chains concurrently in forked processes.
+        else:
+            with ProcessPoolExecutor(
+                max_workers=workers, mp_context=prcfork.get_fork_context(),
+            ) as executor:
+                chain_results = list(executor.map(_run_chain, range(chains)))
+
+    # Solution of the chain finding the lowest minimum.
+    solution = min(
+        (chain_solution for chain_solution, _ in chain_results),
+        key=lambda chain_solution: chain_solution.fun)
+
+    # Alternative solutions found by all chains, in chain order.
+    alt_solutions = [
+        alt_solution
+        for _, chain_alt_solutions in chain_results
+        for alt_solution in chain_alt_solutions
+    ]
+
+    logs.log_info(
+        'Chain %d found the lowest minimum %g.', solution.chain, solution.fun)
+
+    return solution, alt_solutions
+
+# ....................{ PRIVATE ~ runners                 }....................
+def _run_chain(chain_index: int) -> tuple:
+    '''
+    Run the basin-hopping chain with the passed 0-based index, parametrized by
+    the keyword arguments passed to the :func:`basinhop_chains` function.
+
+    Returns
+    ----------
+    tuple
+        2-tuple ``(solution, alt_solutions)`` of the :class:`OptimizeResult` of
+        this chain and the list of the factors of all minima visited by this
+        chain whose residual is no greater than the alternative tolerance.
+    '''
+
+    # Parameters of this chain.
+    kwargs = prcfork.get_forked_global('chain_kwargs')
+    chain_best = prcfork.get_forked_global('chain_best')
+    residual = kwargs['residual']
+    seed = kwargs['seed'] + chain_index
+
+    # Initial factors of this chain, randomly displaced for all but the first.
+    factors_init = kwargs['factors_init'].copy()
+    if chain_index:
+        factors_init += np.random.RandomState(seed).uniform(
+            -kwargs['stepsize'], kwargs['stepsize'], factors_init.shape)
+
+    # If this method accepts a gradient, minimize both the residual and its
+    # gradient. Else, minimize only the residual.
+    if kwargs['method'] in {'COBYLA', 'Nelder-Mead'}:
+        func = residual
+        minimizer_kwargs = {'method': kwargs['method']}
+    else:
+        func = residual.get_value_and_gradient
+        minimizer_kwargs = {'method': kwargs['method'], 'jac': True}
+
+    # Factors of all alternative solutions found by this chain.
+    alt_solutions = []
+
+    def hop_callback(factors: ndarray, fun: float, accepted: bool) -> bool:
+        '''
+        Record the minimum found by the last hop of this chain, returning
+        ``True`` only if any chain has found a sufficiently low minimum.
+        '''
+
+        with chain_best.get_lock():
+            chain_best.value = min(chain_best.value, fun)
+            best_so_far = chain_best.value
+
+        logs.log_info(
+            'Chain %d: minimum %g accepted %s (best so far %g)',
+            chain_index, fun, accepted, best_so_far)
+
+        if fun <= kwargs['alt_tolerance']:
+            alt_solutions.append(factors.copy())
+
+        return best_so_far <= kwargs['tolerance']
+
+    # Attempt to run this chain.
+    try:
+        solution = basinhopping(
+            func,
+            factors_init,
+            niter=kwargs['niter'],
+            T=kwargs['T'],
+            stepsize=kwargs['stepsize'],
+            minimizer_kwargs=minimizer_kwargs,
+            callback=hop_callback,
+            seed=seed,
+        )
+    # If this chain fails, raise an exception identifying this chain. Since
+    # this exception is picklable, this exception is also propagated from
+    # forked worker processes back to the parent process.
+    except Exception as exception:
+        raise BetseSimException(
+            'Optimization chain {} failed: {}'.format(
+                chain_index, exception)) from exception
+
+    # Return the picklable subset of this solution.
+    return OptimizeResult(
+        x=solution.x,
+        fun=float(solution.fun),
+        nit=solution.nit,
+        chain=chain_index,
+    ), alt_solutions
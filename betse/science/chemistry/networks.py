@@ -12,7 +12,7 @@ Gene regulatory network (GRN) functionality.
 #"MasterOfNetworks", "Molecule", "Channel") into separate files be feasible?
 
 # ....................{ IMPORTS                           }....................
-import csv, math
+import csv, math, re
 import matplotlib.pyplot as plt
 import numpy as np
 from betse.exceptions import BetseSimConfException, BetseSimUnstableException
@@ -25,6 +25,8 @@ from betse.science.channels import vg_funny as vgfun
 from betse.science.channels import vg_k as vgk
 from betse.science.channels import vg_na as vgna
 from betse.science.channels import vg_morrislecar as vgml
+from betse.science.channels.channelbank import ChannelBank
+from betse.science.chemistry import netopt
 from betse.science.chemistry.netplot import plot_master_network, set_net_opts
 from betse.science.config.export.visual.confexpvisabc import (
     SimConfVisualCellsNonYAML)
@@ -39,12 +41,38 @@ from betse.science.visual.anim.anim import (
 from betse.science.visual.plot import plotutil as viz
 from betse.util.io.log import logs
 from betse.util.path import dirs, pathnames
+from betse.util.py import pyeval
 from betse.util.type.iterable.mapping.mapcls import DynamicValue, DynamicValueDict
-from betse.util.type.types import type_check, SequenceTypes
+from betse.util.type.types import (
+    type_check, GeneratorType, SequenceTypes, StrOrNoneTypes)
 from collections import OrderedDict
 from matplotlib import cm
 from matplotlib import colors
+from scipy.integrate import solve_ivp
 from scipy.optimize import basinhopping
+from scipy.sparse import identity, kron
+
+# ....................{ CONSTANTS                         }....................
+_CELL_CONC_NAME_REGEX = re.compile(
+    r"cell_concs\['([^']+)'\]|molecules\['([^']+)'\]\.c_cells")
+'''
+Compiled regular expression matching each reference to the concentration of a
+substance in cells by a reaction expression, capturing the name of that
+substance in either the first or second group.
+'''
+
+
+_REACTION_SOLVER_RTOL = 1.0e-6
+'''
+Relative tolerance of the stiff implicit method integrating reactions in cells.
+'''
+
+
+_REACTION_SOLVER_ATOL = 1.0e-9
+'''
+Absolute tolerance in mmol/L of the stiff implicit method integrating reactions
+in cells.
+'''
 
 # ....................{ CLASSES                           }....................
 #FIXME: if moving to have unpacked membrane concs, update transporters...
@@ -116,6 +144,13 @@ class MasterOfNetworks(object):
         self.extra_Jenv_x = np.zeros(sim.edl)
         self.extra_Jenv_y = np.zeros(sim.edl)
 
+        # default batched optimizer settings, overridden by the optional
+        # "optimization" section of the network config file:
+        self.opti_batched = False
+        self.opti_chains = 1
+        self.opti_workers = 1
+        self.opti_tolerance = 0.0
+
 
     def read_substances(self, sim, cells, config_substances, p):
         """
@@ -2125,8 +2160,8 @@ class MasterOfNetworks(object):
 
                 vmem_tex = "V_{mem}"
 
-                in_delta_term_react = "(np.dot(cells.M_sum_mems, -self.transporters['{}'].flux*cells.mem_sa)/cells.cell_vol)".format(transp_name)
-                in_delta_term_prod = "(np.dot(cells.M_sum_mems, self.transporters['{}'].flux*cells.mem_sa)/cells.cell_vol)".format(transp_name)
+                in_delta_term_react = "(cells.M_sum_mems.dot(-self.transporters['{}'].flux*cells.mem_sa)/cells.cell_vol)".format(transp_name)
+                in_delta_term_prod = "(cells.M_sum_mems.dot(self.transporters['{}'].flux*cells.mem_sa)/cells.cell_vol)".format(transp_name)
 
                 if p.is_ecm is True:
 
@@ -2135,9 +2170,9 @@ class MasterOfNetworks(object):
                     out_delta_term_prod = "stb.div_env(self.transporters['{}'].flux, cells, p)".format(transp_name)
 
                 else:
-                    out_delta_term_react = "(np.dot(cells.M_sum_mems, -self.transporters['{}'].flux*cells.mem_sa)/cells.cell_vol)".format(transp_name)
+                    out_delta_term_react = "(cells.M_sum_mems.dot(-self.transporters['{}'].flux*cells.mem_sa)/cells.cell_vol)".format(transp_name)
 
-                    out_delta_term_prod = "(np.dot(cells.M_sum_mems, self.transporters['{}'].flux*cells.mem_sa)/cells.cell_vol)".format(transp_name)
+                    out_delta_term_prod = "(cells.M_sum_mems.dot(self.transporters['{}'].flux*cells.mem_sa)/cells.cell_vol)".format(transp_name)
 
                 all_alpha, alpha_tex, trans_tex_var_list = self.get_influencers(a_list, Km_a_list,
                                                                 n_a_list, i_list,
@@ -2768,6 +2803,31 @@ class MasterOfNetworks(object):
 
                 self.reaction_matrix_env[i, j] += coeff
 
+    #------iterators----------------------------------------------------------------------------------------------------
+    def iter_state_objs(self) -> GeneratorType:
+        '''
+        Generator yielding this network followed by each object of this network
+        whose attributes are advanced by each time step (e.g., molecules and
+        the cores of voltage-gated channels), as snapshotted by the
+        :class:`betse.science.math.simstate.SimStateSnapshot` class.
+        '''
+
+        yield self
+
+        if getattr(self, 'mit', None) is not None:
+            yield self.mit
+
+        yield from self.molecules.values()
+
+        for chan in self.channels.values():
+            yield chan
+            yield chan.channel_core
+
+        # Gating states of these channel cores banked by the current bank.
+        channel_bank = getattr(self, '_channel_bank', None)
+        if channel_bank is not None:
+            yield from channel_bank.groups
+
     #------runners------------------------------------------------------------------------------------------------------
     def clear_run_loop(self, sim):
 
@@ -2784,7 +2844,12 @@ class MasterOfNetworks(object):
 
 
     @type_check
-    def run_loop(self, phase: SimPhase, t: float) -> None:
+    def run_loop(
+        self,
+        phase: SimPhase,
+        t: float,
+        reaction_solver: StrOrNoneTypes = None,
+    ) -> None:
         '''
         Simulate this gene regulatory network (GRN) for the passed simulation
         phase at the passed time step for all simulated molecules.
@@ -2795,6 +2860,16 @@ class MasterOfNetworks(object):
             Current simulation phase.
         t : float
             Time step at which to simulate this GRN.
+        reaction_solver : StrOrNoneTypes
+            Either:
+            * ``None``, in which case chemical reactions in cells are stepped
+              explicitly (i.e., by forward Euler) over this time step.
+            * The name of a stiff implicit method supported by the
+              :func:`scipy.integrate.solve_ivp` function (e.g., ``BDF``), in
+              which case chemical reactions in cells are integrated over this
+              time step with this method. See
+              :meth:`get_delta_conc_implicit`.
+            Defaults to ``None``.
         '''
 
         # Localize high-level phase objects for convenience.
@@ -2819,7 +2894,7 @@ class MasterOfNetworks(object):
             obj.update_intra(sim, cells, p)
 
             # calculate rates of growth/decay:
-            gad_rates_o.append(eval(self.molecules[mol].gad_eval_string, globalo, localo))
+            gad_rates_o.append(pyeval.eval_expr(self.molecules[mol].gad_eval_string, globalo, localo))
             gad_targs.append(self.molecules[mol].growth_targets_cell)
             init_rates.append(np.zeros(sim.cdl))
 
@@ -2831,7 +2906,7 @@ class MasterOfNetworks(object):
 
         # ... and rates of chemical reactions in cell:
         self.reaction_rates = np.asarray(
-            [eval(self.reactions[rn].reaction_eval_string, globalo, localo) for rn in self.reactions])
+            [pyeval.eval_expr(self.reactions[rn].reaction_eval_string, globalo, localo) for rn in self.reactions])
 
         # stack into an integrated data structure:
         if len(self.reaction_rates) > 0:
@@ -2842,10 +2917,15 @@ class MasterOfNetworks(object):
         # calculate concentration rate of change using linear algebra:
         self.delta_conc = np.dot(self.reaction_matrix, all_rates)
 
+        # if integrating reactions implicitly, replace this explicit rate of change with the mean rate of change
+        # over this time step given by the stiff solver:
+        if reaction_solver is not None:
+            self.delta_conc = self.get_delta_conc_implicit(phase, reaction_solver, localo)
+
         if self.mit_enabled and len(self.reactions_mit)>0:
             # ... rates of chemical reactions in mitochondria:
             self.reaction_rates_mit = np.asarray(
-                [eval(self.reactions_mit[rn].reaction_eval_string, globalo, localo) for
+                [pyeval.eval_expr(self.reactions_mit[rn].reaction_eval_string, globalo, localo) for
                     rn in self.reactions_mit])
 
             # calculate concentration rate of change using linear algebra:
@@ -2855,7 +2935,7 @@ class MasterOfNetworks(object):
         if len(self.reactions_env)>0:
             # ... rates of chemical reactions in env:
             self.reaction_rates_env = np.asarray(
-                [eval(self.reactions_env[rn].reaction_eval_string, globalo, localo) for
+                [pyeval.eval_expr(self.reactions_env[rn].reaction_eval_string, globalo, localo) for
                     rn in self.reactions_env])
 
             # Calculate concentration rate of change using linear algebra.
@@ -2902,7 +2982,7 @@ class MasterOfNetworks(object):
 
                 # Use the substance as a gating ligand (if desired).
                 if obj.ion_channel_gating:
-                    obj.gating_mod = eval(
+                    obj.gating_mod = pyeval.eval_expr(
                         obj.gating_mod_eval_string, globalo, localo)
                     obj.gating(sim, cells, p)
 
@@ -2961,6 +3041,154 @@ class MasterOfNetworks(object):
             self.mit.update(sim, cells, p)
 
 
+    def get_delta_conc_cells(self, sim, localo):
+        '''
+        Two-dimensional Numpy array of the rate of change of the concentration
+        of each substance in each cell due to growth/decay and chemical
+        reactions at the current concentrations, as computed by the
+        :meth:`run_loop` method *without* first updating membrane
+        concentrations.
+
+        Parameters
+        ----------
+        sim : Simulator
+            Current simulation.
+        localo : dict
+            Dictionary of local variables accessible to all evaluated reaction
+            expressions, as defined by the :meth:`run_loop` method.
+        '''
+
+        globalo = globals()
+
+        gad_rates = np.zeros((len(self.molecules), sim.cdl))
+
+        for mat, obj in zip(gad_rates, self.molecules.values()):
+            trgs = obj.growth_targets_cell
+            mat[trgs] = pyeval.eval_expr(obj.gad_eval_string, globalo, localo)[trgs]
+
+        if len(self.reactions) > 0:
+            reaction_rates = np.asarray(
+                [pyeval.eval_expr(self.reactions[rn].reaction_eval_string, globalo, localo) for rn in self.reactions])
+            all_rates = np.vstack((gad_rates, reaction_rates))
+        else:
+            all_rates = gad_rates
+
+        return np.dot(self.reaction_matrix, all_rates)
+
+
+    def get_reaction_jac_sparsity(self, cells_count):
+        '''
+        Sparse boolean matrix of the structurally nonzero entries of the
+        Jacobian of the rates of change returned by the
+        :meth:`get_delta_conc_cells` method with respect to the flattened
+        two-dimensional array of all concentrations in all cells.
+
+        Since reactions couple only substances in the same cell, this matrix is
+        the Kronecker product of the substance coupling matrix with the
+        identity matrix over all cells. Substance ``i`` is coupled to substance
+        ``k`` if any reaction changing ``i`` (as given by the reaction matrix)
+        references the concentration of ``k`` in its expression.
+
+        Parameters
+        ----------
+        cells_count : int
+            Number of cells.
+        '''
+
+        conc_names = list(self.cell_concs.keys())
+
+        exprs = [obj.gad_eval_string for obj in self.molecules.values()] + [
+            self.reactions[rn].reaction_eval_string for rn in self.reactions]
+
+        # matrix of the substances referenced by each reaction expression:
+        expr_deps = np.zeros((len(exprs), len(conc_names)), dtype=int)
+
+        for j, expr in enumerate(exprs):
+            for names in _CELL_CONC_NAME_REGEX.findall(expr):
+                for name in names:
+                    if name in conc_names:
+                        expr_deps[j, conc_names.index(name)] = 1
+
+        conc_coupling = (np.dot((self.reaction_matrix != 0).astype(int), expr_deps) != 0)
+        conc_coupling |= np.eye(len(conc_names), dtype=bool)
+
+        return kron(conc_coupling, identity(cells_count), format='csr')
+
+
+    def get_delta_conc_implicit(self, phase, reaction_solver, localo):
+        '''
+        Two-dimensional Numpy array of the mean rate of change of the
+        concentration of each substance in each cell due to growth/decay and
+        chemical reactions over the current time step, integrated from the
+        current concentrations with the passed stiff implicit method.
+
+        The ordinary differential equation system of these reactions is
+        integrated by the :func:`scipy.integrate.solve_ivp` function, whose
+        finite difference Jacobian is estimated with the sparsity given by the
+        :meth:`get_reaction_jac_sparsity` method. All other processes (e.g.,
+        transport, pumping, membrane concentrations) are held constant over
+        this time step and then stepped explicitly by the :meth:`run_loop`
+        method as before (i.e., by first-order operator splitting).
+
+        Parameters
+        ----------
+        phase : SimPhase
+            Current simulation phase.
+        reaction_solver : str
+            Name of the stiff implicit method (e.g., ``BDF``).
+        localo : dict
+            Dictionary of local variables accessible to all evaluated reaction
+            expressions, as defined by the :meth:`run_loop` method.
+
+        Raises
+        ----------
+        BetseSimUnstableException
+            If this method fails to integrate these reactions.
+        '''
+
+        p = phase.p
+        sim = phase.sim
+
+        conc_names = list(self.cell_concs.keys())
+        conc_o = np.asarray([self.cell_concs[name] for name in conc_names], dtype=np.float64)
+
+        def get_delta_conc(t, conc_flat):
+
+            for name, conc in zip(conc_names, conc_flat.reshape(conc_o.shape)):
+                self.cell_concs[name] = conc.copy()
+
+            return self.get_delta_conc_cells(sim, localo).ravel()
+
+        solver_kwargs = {}
+
+        # only BDF and Radau accept a Jacobian sparsity structure:
+        if reaction_solver in {'BDF', 'Radau'}:
+            solver_kwargs['jac_sparsity'] = self.get_reaction_jac_sparsity(sim.cdl)
+
+        try:
+            solution = solve_ivp(
+                get_delta_conc,
+                (0.0, p.dt),
+                conc_o.ravel(),
+                method=reaction_solver,
+                t_eval=(p.dt,),
+                rtol=_REACTION_SOLVER_RTOL,
+                atol=_REACTION_SOLVER_ATOL,
+                **solver_kwargs
+            )
+
+        # restore the concentrations at the start of this time step, which the run_loop() method updates:
+        finally:
+            for name, conc in zip(conc_names, conc_o):
+                self.cell_concs[name] = conc.copy()
+
+        if not solution.success:
+            raise BetseSimUnstableException(
+                'Reaction solver "{}" failed: {}'.format(reaction_solver, solution.message))
+
+        return (solution.y[:, -1].reshape(conc_o.shape) - conc_o) / p.dt
+
+
     def run_loop_transporters(self, t, sim, cells, p):
 
         globalo = globals()
@@ -2975,7 +3203,7 @@ class MasterOfNetworks(object):
             targ_env = self.transporters[name].transporter_targets_env
 
             # calculate the flux
-            self.transporters[name].flux = sim.rho_pump*eval(self.transporters[name].transporter_eval_string,
+            self.transporters[name].flux = sim.rho_pump*pyeval.eval_expr(self.transporters[name].transporter_eval_string,
                 globalo, localo)
 
 
@@ -2989,7 +3217,7 @@ class MasterOfNetworks(object):
 
                 # obtain the change for the reactant
 
-                delta_react = coeff*eval(delc, globalo, localo)
+                delta_react = coeff*pyeval.eval_expr(delc, globalo, localo)
 
                 # finally, update the concentrations using the final eval statements:
                 if self.transporters[name].react_transport_tag[i] == 'mem_concs':
@@ -3039,7 +3267,7 @@ class MasterOfNetworks(object):
                 self.transporters[name].products_coeff)):
 
                 # obtain the change for the product
-                delta_prod = coeff*eval(delc, globalo, localo)
+                delta_prod = coeff*pyeval.eval_expr(delc, globalo, localo)
 
                 # finally, update the concentrations using the final eval statements:
                 if self.transporters[name].prod_transport_tag[i] == 'mem_concs':
@@ -3090,6 +3318,44 @@ class MasterOfNetworks(object):
         #     sim.extra_J_mem = self.extra_J_mem
 
 
+    @type_check
+    def _get_channel_bank(self, phase: SimPhase) -> ChannelBank:
+        '''
+        Channel bank advancing the gating states of all channels active for
+        the passed simulation phase together, created on the first call to
+        this method for these channels.
+
+        Parameters
+        ----------
+        phase : SimPhase
+            Current simulation phase.
+        '''
+
+        # Cores of all channels active for this phase.
+        channel_cores = tuple(
+            chan.channel_core for chan in self.channels.values()
+            if not (
+                phase.kind is SimPhaseKind.INIT and chan.init_active is False)
+        )
+
+        # If these channels differ from those of the current bank (e.g., as
+        # this is the first time step), bank these channels.
+        channel_bank = getattr(self, '_channel_bank', None)
+        if (
+            channel_bank is None or
+            len(channel_bank.channels) != len(channel_cores) or
+            any(
+                channel_core_banked is not channel_core
+                for channel_core_banked, channel_core in zip(
+                    channel_bank.channels, channel_cores)
+            )
+        ):
+            channel_bank = self._channel_bank = ChannelBank(
+                channels=channel_cores, mems_count=phase.sim.mdl)
+
+        return channel_bank
+
+
     @type_check
     def run_loop_channels(self, phase: SimPhase) -> None:
         '''
@@ -3109,6 +3375,9 @@ class MasterOfNetworks(object):
         globalo = globals()
         localo = locals()
 
+        # run all active channels at once to update their states:
+        self._get_channel_bank(phase).run(sim.vm, p)
+
         # get the object corresponding to the specific channel:
         for i, name in enumerate(self.channels):
 
@@ -3123,14 +3392,11 @@ class MasterOfNetworks(object):
 
                 # compute the channel activity
                 # calculate the value of the channel modulation constant:
-                moddy = eval(chan.alpha_eval_string, globalo, localo)
+                moddy = pyeval.eval_expr(chan.alpha_eval_string, globalo, localo)
 
                 # set the modulator state in the channel core
                 chan.channel_core.modulator = moddy
 
-                # run the channel to update its state:
-                chan.channel_core.run(sim.vm, p)
-
                 # update concentrations according to the channel state:
                 for ion, rel_perm in zip(chan.channel_core.ions, chan.channel_core.rel_perm):
 
@@ -3211,6 +3477,9 @@ class MasterOfNetworks(object):
         globalo = globals()
         localo = locals()
 
+        # run all active channels at once to update their states:
+        self._get_channel_bank(phase).run(sim.vm, p)
+
         # get the object corresponding to the specific channel:
         for i, name in enumerate(self.channels):
 
@@ -3226,14 +3495,11 @@ class MasterOfNetworks(object):
 
                 # compute the channel activity
                 # calculate the value of the channel modulation constant:
-                moddy = eval(chan.alpha_eval_string, globalo, localo)
+                moddy = pyeval.eval_expr(chan.alpha_eval_string, globalo, localo)
 
                 # set the modulator state in the channel core
                 chan.channel_core.modulator = moddy
 
-                # run the channel to update its state:
-                chan.channel_core.run(sim.vm, p)
-
                 # update concentrations according to the channel state:
                 for ion, rel_perm in zip(chan.channel_core.ions, chan.channel_core.rel_perm):
 
@@ -3269,7 +3535,7 @@ class MasterOfNetworks(object):
             obj = self.modulators[name]
 
             # calculate the value of the channel modulation constant:
-            modulator = obj.max_val*eval(obj.alpha_eval_string, globalo, localo)
+            modulator = obj.max_val*pyeval.eval_expr(obj.alpha_eval_string, globalo, localo)
 
             if obj.target_label == 'GJ':
                 sim.gj_block = modulator
@@ -3344,7 +3610,7 @@ class MasterOfNetworks(object):
 
         # Log this optimization.
         logs.log_info('Optimizing with %s in %s iterations...',
-            self.opti_method, self.opti_Nmssg)
+            self.opti_method, self.opti_N)
 
         # Set the Vmem to target value requested by user.
         sim.vm = self.target_vmem
@@ -3706,7 +3972,7 @@ class MasterOfNetworks(object):
 
         def opt_funk(v_base_o):
 
-            r_base = [eval(self.react_handler[rea], self.globals, self.locals).mean() for rea in self.react_handler]
+            r_base = [pyeval.eval_expr(self.react_handler[rea], self.globals, self.locals).mean() for rea in self.react_handler]
 
             outputs = np.dot(MM, np.abs(v_base_o) * r_base)
 
@@ -3807,9 +4073,15 @@ class MasterOfNetworks(object):
         if self.opti_method != 'COBYLA' and self.opti_method != 'Nelder-Mead':
             minimizer_opts['jac'] = opt_jac
 
-        # run the basin hopping algorithm
-        sol = basinhopping(opt_funk, vmax_o, T=self.opti_T, stepsize=self.opti_step, niter=self.opti_N,
-                           minimizer_kwargs=minimizer_opts, callback=print_fun)
+        # run the basin hopping algorithm, either as independent chains minimizing the vectorized network
+        # residual or as a single chain minimizing the legacy residual defined above:
+        if self.opti_batched:
+            sol, alt_sols_batched = self.optimizer_batched(sim, p, MM, iNa, iK, iCl, vmax_o)
+            alt_sols.extend(soli * origin_o for soli in alt_sols_batched)
+
+        else:
+            sol = basinhopping(opt_funk, vmax_o, T=self.opti_T, stepsize=self.opti_step, niter=self.opti_N,
+                               minimizer_kwargs=minimizer_opts, callback=print_fun)
 
         rkeys = list(self.react_handler.keys())
 
@@ -3889,6 +4161,91 @@ class MasterOfNetworks(object):
 
         logs.log_info("-----------------------------------------")
 
+    def optimizer_batched(self, sim, p, network_matrix, iNa, iK, iCl, vmax_o):
+        '''
+        Run independent basin-hopping chains minimizing the vectorized residual
+        of this network, as configured by the ``optimization batched``,
+        ``optimization chains``, ``optimization workers``, and ``optimization
+        tolerance`` settings of the network config file.
+
+        This method is called by the :meth:`optimizer` method, which defines
+        all passed parameters and writes the returned solutions to the same CSV
+        files as the legacy optimizer.
+
+        Parameters
+        ----------
+        network_matrix : ndarray
+            Two-dimensional Numpy array mapping all reaction rates onto the
+            time derivatives of all non-environmental concentrations and the
+            transmembrane current.
+        iNa, iK, iCl : int
+            Indices of the Na, K, and (if any, else ``None``) Cl membrane
+            diffusion reactions in the ``react_handler`` dictionary.
+        vmax_o : ndarray
+            Initial reaction rate factors.
+
+        Returns
+        ----------
+        tuple
+            2-tuple ``(sol, alt_sols)`` of the solution of the best chain and
+            the list of the factors of all alternative solutions found by all
+            chains; see :func:`betse.science.chemistry.netopt.basinhop_chains`.
+        '''
+
+        # compile all reaction rate expressions once, rather than on each evaluation:
+        rate_exprs = [pyeval.compile_expr(self.react_handler[rea]) for rea in self.react_handler]
+
+        def get_rates(vm):
+
+            sim.vm = vm
+
+            return [eval(rate_expr, self.globals, self.locals).mean() for rate_expr in rate_exprs]
+
+        # coefficients of the numerator and denominator of the Goldman equation with respect to each factor:
+        vm_numer = np.zeros(len(self.react_handler))
+        vm_denom = np.zeros(len(self.react_handler))
+
+        permeants = [('Na', iNa, 'Na_env', 'Na'), ('K', iK, 'K_env', 'K')]
+
+        if iCl is not None:
+            # chloride is an anion, so its inner and outer concentrations swap places:
+            permeants.append(('Cl', iCl, 'Cl', 'Cl_env'))
+
+        for ion, i_ed, numer_name, denom_name in permeants:
+
+            vm_numer[i_ed] += self.Dmem[ion] * self.conc_handler[numer_name]
+            vm_denom[i_ed] += self.Dmem[ion] * self.conc_handler[denom_name]
+
+            for dm, j in zip(self.Dm_extra[ion], self.channel_index[ion]):
+                vm_numer[j] += dm * self.conc_handler[numer_name]
+                vm_denom[j] += dm * self.conc_handler[denom_name]
+
+        residual = netopt.NetworkResidual(
+            network_matrix=np.asarray(network_matrix, dtype=np.float64),
+            rates_getter=get_rates,
+            vm_numer=vm_numer,
+            vm_denom=vm_denom,
+            vm_factor=float(p.R * sim.T / p.F),
+            vm_target=float(self.target_vmem),
+        )
+
+        sol, alt_sols = netopt.basinhop_chains(
+            residual=residual,
+            factors_init=np.asarray(vmax_o, dtype=np.float64),
+            method=self.opti_method,
+            niter=int(self.opti_N),
+            T=float(self.opti_T),
+            stepsize=float(self.opti_step),
+            chains=int(self.opti_chains),
+            workers=int(self.opti_workers),
+            tolerance=float(self.opti_tolerance),
+        )
+
+        # leave Vmem at the value implied by the best solution:
+        sim.vm = residual.get_vm(sol.x)
+
+        return sol, alt_sols
+
     # ------Utility Methods--------------------------------------------------------------------------------------------
     def bal_charge(self, Q, sim, tag, p):
 
@@ -3969,7 +4326,7 @@ class MasterOfNetworks(object):
         for ind, mol in self.molecules.items():
             self.rho_at_mem += mol.z*p.F*mol.cc_at_mem*cells.diviterm[cells.mem_to_cells]
 
-        self.rho_cells = np.dot(cells.M_sum_mems, self.rho_at_mem)/cells.num_mems
+        self.rho_cells = cells.M_sum_mems.dot(self.rho_at_mem)/cells.num_mems
 
 
     def energy_charge(self, sim):
@@ -4025,6 +4382,9 @@ class MasterOfNetworks(object):
 
         self.extra_J_mem = np.zeros(sim.mdl)
 
+        # Re-initialize all tissue profiles once for all substances.
+        phase.dyna.init_profiles(phase)
+
         # Get the name of the specific substance.
         for name in self.molecules:
             obj = self.molecules[name]
@@ -5959,8 +6319,9 @@ class Molecule(object):
             # if len(self.growth_mod_function_cells) == 0:
             #     self.growth_mod_function_cells = 1
 
-        # Re-initialize all tissue profiles.
-        phase.dyna.init_profiles(phase)
+        # Re-initialize growth targets from all tissue profiles, which the
+        # MasterOfNetworks.mod_after_cut_event() method has already
+        # re-initialized for the cut cell cluster.
         self.init_growth(phase)
 
         if not p.is_ecm:
@@ -6064,7 +6425,7 @@ class Molecule(object):
                 for obj_cenv in self.c_env_time]
         else:
             cenv = [
-                np.dot(cells.M_sum_mems, obj_cenv) / cells.num_mems
+                cells.M_sum_mems.dot(obj_cenv) / cells.num_mems
                 for obj_cenv in self.c_env_time]
 
         headr = headr + 'Env_Conc_' + self.name + '_mmol/L' + ','
@@ -10,11 +10,14 @@ functionality.
 '''
 
 # ....................{ IMPORTS                           }....................
+from betse.exceptions import BetseSimConfException
 from betse.lib.yaml.yamlalias import yaml_alias
 from betse.lib.yaml.abc.yamlabc import YamlABC
 from betse.lib.yaml.abc.yamllistabc import YamlList, YamlListItemABC
 from betse.science.config.export.confexpabc import SimConfExportABC
-from betse.util.type.types import type_check
+from betse.science.enum.enumconf import CsvLayoutType
+from betse.util.type import enums
+from betse.util.type.types import type_check, IntOrNoneTypes
 # from betse.util.type.types import type_check, MappingType, SequenceTypes
 
 # ....................{ SUBCLASSES                        }....................
@@ -37,6 +40,15 @@ class SimConfExportCSVs(YamlABC):
     csv_filetype : str
         Filetype of all CSV files saved by this configuration. Ignored if
         :attr:`is_after_sim_save` is ``False``.
+    layout : CsvLayoutType
+        Layout in which all CSV time series spatially situated at all cells
+        are saved by this configuration. Defaults to
+        :attr:`CsvLayoutType.PER_STEP` for configuration files predating this
+        option.
+    precision : IntOrNoneTypes
+        Number of significant digits of all floating-point data saved by this
+        configuration *or* ``None`` to save all such data at full precision.
+        Defaults to ``None`` for configuration files predating this option.
     '''
 
     # ..................{ ALIASES ~ after                   }..................
@@ -75,6 +87,59 @@ class SimConfExportCSVs(YamlABC):
         # Unload all subconfigurations of this configuration.
         self.csvs_after_sim.unload()
 
+    # ..................{ PROPERTIES ~ save                 }..................
+    @property
+    def layout(self) -> CsvLayoutType:
+
+        # Name of this layout, defaulting to the historical layout for older
+        # configuration files lacking this option.
+        layout_name = self._conf['results options']['save']['csvs'].get(
+            'layout', 'per_step')
+
+        # If this name is invalid, raise an exception.
+        if not (
+            isinstance(layout_name, str) and
+            enums.is_member_name(CsvLayoutType, layout_name.upper())
+        ):
+            raise BetseSimConfException(
+                'CSV layout {!r} not in {!r}.'.format(
+                    layout_name,
+                    enums.get_member_names_lowercase(CsvLayoutType)))
+
+        return enums.get_member_from_name_uppercased(
+            CsvLayoutType, layout_name)
+
+
+    @layout.setter
+    @type_check
+    def layout(self, layout: CsvLayoutType) -> None:
+        self._conf['results options']['save']['csvs']['layout'] = (
+            enums.get_member_name_lowercase(layout))
+
+
+    @property
+    def precision(self) -> IntOrNoneTypes:
+
+        # Number of significant digits, defaulting to full precision for older
+        # configuration files lacking this option.
+        precision = self._conf['results options']['save']['csvs'].get(
+            'precision', None)
+
+        # If this number is invalid, raise an exception.
+        if precision is not None and not (
+            isinstance(precision, int) and 1 <= precision <= 18):
+            raise BetseSimConfException(
+                'CSV precision {!r} neither "None" nor '
+                'an integer in [1, 18].'.format(precision))
+
+        return precision
+
+
+    @precision.setter
+    @type_check
+    def precision(self, precision: IntOrNoneTypes) -> None:
+        self._conf['results options']['save']['csvs']['precision'] = precision
+
 # ....................{ SUBCLASSES : item                 }....................
 class SimConfExportCSV(SimConfExportABC):
     '''
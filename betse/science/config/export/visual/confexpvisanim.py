@@ -8,6 +8,7 @@ YAML-backed simulation subconfigurations for exporting animations.
 '''
 
 # ....................{ IMPORTS                           }....................
+from betse.exceptions import BetseSimConfException
 from betse.lib.yaml.yamlalias import yaml_alias, yaml_alias_int_positive
 from betse.lib.yaml.abc.yamlabc import YamlABC
 from betse.lib.yaml.abc.yamllistabc import YamlList, YamlListItemABC
@@ -56,6 +57,15 @@ class SimConfExportAnims(YamlABC):
         YAML-backed list of all post-simulation animations to be animated.
         Ignored if :attr:`is_after_sim` is ``False``.
 
+    Attributes (Frames)
+    ----------
+    frame_workers : int
+        Number of processes concurrently rendering the frames of each
+        post-simulation animation saved but *not* displayed by this
+        configuration. If ``1``, these frames are rendered serially by the
+        current process. Defaults to ``1`` for configuration files predating
+        this option.
+
     Attributes (Images)
     ----------
     is_images_save : bool
@@ -224,6 +234,30 @@ class SimConfExportAnims(YamlABC):
         self.is_while_sim_save = is_while_sim
         self.is_while_sim_show = is_while_sim
 
+    # ..................{ PROPERTIES ~ frames               }..................
+    @property
+    def frame_workers(self) -> int:
+
+        # Number of worker processes, defaulting to rendering serially for
+        # older configuration files lacking this option.
+        frame_workers = self._conf['results options']['save']['animations'].get(
+            'workers', 1)
+
+        # If this number is invalid, raise an exception.
+        if not (isinstance(frame_workers, int) and frame_workers >= 1):
+            raise BetseSimConfException(
+                'Animation frame workers {!r} not a positive integer.'.format(
+                    frame_workers))
+
+        return frame_workers
+
+
+    @frame_workers.setter
+    @type_check
+    def frame_workers(self, frame_workers: int) -> None:
+        self._conf['results options']['save']['animations'][
+            'workers'] = frame_workers
+
     # ..................{ PROPERTIES ~ after                }..................
     @property
     def is_after_sim(self) -> bool:
@@ -54,6 +54,29 @@ PERCENT : enum
     Randomized cell picker, randomly matching a given percentage of all cells.
 ''')
 
+# ....................{ ENUMS ~ csv                       }....................
+CsvLayoutType = enums.make_enum(
+    class_name='CsvLayoutType',
+    member_names=('PER_STEP', 'LONG', 'NPZ',),
+    doc='''
+Enumeration of all supported **CSV time series layouts** (i.e., file layouts
+in which post-simulation exports of data spatially situated at all cells for
+all sampled time steps are saved).
+
+Attributes
+----------
+PER_STEP : enum
+    Per-time step layout, saving one plaintext file in comma-separated value
+    (CSV) format for each sampled time step. This is the historical layout.
+LONG : enum
+    Long-format layout, saving one plaintext file in CSV format whose rows are
+    all cells for all sampled time steps, streamed to disk in chunks of time
+    steps.
+NPZ : enum
+    Columnar binary layout, saving one uncompressed NumPy ``.npz`` archive
+    containing one array of all sampled time steps for each quantity.
+''')
+
 # ....................{ ENUMS ~ grn                       }....................
 GrnUnpicklePhaseType = enums.make_enum(
     class_name='GrnUnpicklePhaseType',
@@ -13,11 +13,30 @@ simulation objects.
 #* Rename this module to "simpickler.py".
 
 # ....................{ IMPORTS                            }....................
+import os
+import numpy as np
 from betse.lib.pickle import pickles
 from betse.science.compat import compatsim
+from betse.util.io.log import logs
+from betse.util.path import dirs, files
 from betse.util.type.types import type_check
 from collections.abc import Sequence
 
+# ....................{ CONSTANTS                          }....................
+_ARRAYS_DIRNAME_SUFFIX = '.arrays'
+'''
+Suffix of the basename of the directory containing the time series arrays
+saved alongside each pickled file, relative to the filename of that file.
+'''
+
+
+_ARRAYS_NAMES_VAR_NAME = '_betse_arrays_names'
+'''
+Name of the private instance variable temporarily added to the first pickled
+object, listing the names of all time series arrays of that object saved to
+that directory rather than pickled.
+'''
+
 # ....................{ SAVERS                             }....................
 #FIXME: Consider replacing all calls to this function with calls to the
 #pickles.save() function and then removing this function. It doesn't appear to
@@ -33,6 +52,14 @@ def saveSim(savePath: str, datadump: Sequence) -> None:
     For safety, any simulation object in this list should be pre-sanitized by
     calling the `safe_pickle()` function _before_ calling this function.
 
+    For efficiency, each time series array of the first object in this list
+    (e.g., the ``vm_time`` array of a simulation) is saved to a separate
+    ``.npy`` file in the directory whose pathname is this path suffixed by
+    :data:`_ARRAYS_DIRNAME_SUFFIX` rather than pickled into this file. The
+    :func:`loadSim` function then lazily memory-maps these arrays, paging in
+    only those arrays (and only those slices of those arrays) actually
+    accessed by the caller.
+
     Parameters
     ----------
     savePath : str
@@ -41,7 +68,32 @@ def saveSim(savePath: str, datadump: Sequence) -> None:
         List of all objects to be pickled.
     '''
 
-    pickles.save(datadump, filename=savePath, is_overwritable=True)
+    # First object in this list if any or "None" otherwise.
+    obj = datadump[0] if datadump else None
+
+    # Dictionary mapping from the name to value of each time series array of
+    # this object, temporarily removed from this object while pickling.
+    arrays = {
+        array_name: obj.__dict__.pop(array_name)
+        for array_name in _get_arrays_names(obj)
+    }
+
+    # Attempt to...
+    try:
+        # If this object has time series arrays, save these arrays and record
+        # their names on this object for subsequent loading.
+        if arrays:
+            _save_arrays(savePath, arrays)
+            obj.__dict__[_ARRAYS_NAMES_VAR_NAME] = tuple(arrays.keys())
+
+        # Pickle these objects *AFTER* removing these arrays.
+        pickles.save(datadump, filename=savePath, is_overwritable=True)
+    # Restore this object to its prior state regardless of whether pickling
+    # these objects raised an exception.
+    finally:
+        if arrays:
+            obj.__dict__.pop(_ARRAYS_NAMES_VAR_NAME, None)
+            obj.__dict__.update(arrays)
 
 # ....................{ LOADERS                            }....................
 #FIXME: We should probably perform basic sanity checks on loaded objects --
@@ -83,6 +135,9 @@ def loadSim(loadPath) -> tuple:
     # Unpickle these objects *AFTER* preserving backward importability.
     sim, cells, p = pickles.load(loadPath)
 
+    # Lazily memory-map all time series arrays saved alongside this file.
+    _load_arrays(loadPath, sim)
+
     #FIXME: Validate these objects.
 
     # Return these objects.
@@ -112,7 +167,141 @@ def loadWorld(loadPath) -> tuple:
     # Unpickle these objects *AFTER* preserving backward importability.
     cells, p = pickles.load(loadPath)
 
+    # Lazily memory-map all time series arrays saved alongside this file.
+    _load_arrays(loadPath, cells)
+
     #FIXME: Validate these objects.
 
     # Return these objects.
     return cells, p
+
+# ....................{ PRIVATE ~ getters                  }....................
+def _get_arrays_names(obj: object) -> tuple:
+    '''
+    Tuple of the names of all **time series arrays** (i.e., non-scalar Numpy
+    arrays of non-object type whose names are either ``time`` or suffixed by
+    ``_time``) of the passed object if this object is unslotted *or* the empty
+    tuple otherwise.
+    '''
+
+    # If this object is slotted, this object has no such arrays.
+    if not hasattr(obj, '__dict__'):
+        return ()
+
+    # Return the names of all such arrays.
+    return tuple(
+        array_name
+        for array_name, array in obj.__dict__.items()
+        if (
+            (array_name == 'time' or array_name.endswith('_time')) and
+            isinstance(array, np.ndarray) and
+            array.ndim > 0 and
+            not array.dtype.hasobject
+        )
+    )
+
+
+def _get_arrays_dirname(filename: str) -> str:
+    '''
+    Absolute or relative pathname of the directory containing the time series
+    arrays saved alongside the pickled file with the passed filename.
+    '''
+
+    return filename + _ARRAYS_DIRNAME_SUFFIX
+
+# ....................{ PRIVATE ~ savers                   }....................
+def _save_arrays(filename: str, arrays: dict) -> None:
+    '''
+    Save each passed time series array to a ``.npy`` file in the directory of
+    all time series arrays saved alongside the pickled file with the passed
+    filename, removing all stale ``.npy`` files from that directory.
+
+    To avoid corrupting arrays memory-mapped from a previously saved file of
+    the same name by the active Python process (e.g., an initialization being
+    rerun after loading a prior initialization), each array is first saved to
+    a temporary file that then atomically replaces the existing file. Since
+    existing memory maps then continue to refer to the prior file, those maps
+    remain valid.
+
+    Parameters
+    ----------
+    filename : str
+        Absolute or relative filename of the pickled file.
+    arrays : dict
+        Dictionary mapping from the name to value of each array to be saved.
+    '''
+
+    # Directory containing these arrays, created if needed.
+    arrays_dirname = _get_arrays_dirname(filename)
+    dirs.make_unless_dir(arrays_dirname)
+
+    # Log this save.
+    logs.log_debug(
+        'Saving %d time series to: %s', len(arrays), arrays_dirname)
+
+    # For the name and value of each such array...
+    for array_name, array in arrays.items():
+        # Filename of this array and the temporary file saved to.
+        array_filename = os.path.join(arrays_dirname, array_name + '.npy')
+        array_filename_temp = array_filename + '.tmp'
+
+        # Save this array to this temporary file, which then atomically
+        # replaces the existing file if any. Note that the np.save() function
+        # implicitly suffixes filenames *NOT* suffixed by ".npy" by ".npy",
+        # requiring that this file be passed as an open file handle instead.
+        with open(array_filename_temp, 'wb') as array_file:
+            np.save(array_file, array, allow_pickle=False)
+        os.replace(array_filename_temp, array_filename)
+
+    # For the basename of each file in this directory, remove this file if this
+    # file is a stale array saved by a prior call to this function.
+    for array_basename in dirs.iter_basenames(arrays_dirname):
+        if (
+            array_basename.endswith('.npy') and
+            array_basename[:-len('.npy')] not in arrays
+        ):
+            files.remove_file_if_found(
+                os.path.join(arrays_dirname, array_basename))
+
+# ....................{ PRIVATE ~ loaders                  }....................
+def _load_arrays(filename: str, obj: object) -> None:
+    '''
+    Lazily memory-map all time series arrays previously saved by the
+    :func:`_save_arrays` function alongside the pickled file with the passed
+    filename into the passed object unpickled from that file.
+
+    Each array is memory-mapped in copy-on-write mode. Each array is thus
+    paged in from disk only on first access *and* safely modifiable in-memory
+    without modifying that file. If this object was pickled by an older
+    version of this application embedding these arrays directly into that
+    pickled file, this function silently reduces to a noop.
+
+    Parameters
+    ----------
+    filename : str
+        Absolute or relative filename of the pickled file.
+    obj : object
+        Object unpickled from that file.
+    '''
+
+    # Names of all arrays saved for this object if any or "None" otherwise.
+    arrays_names = getattr(obj, _ARRAYS_NAMES_VAR_NAME, None)
+
+    # If this object has no such arrays, silently reduce to a noop.
+    if not arrays_names:
+        return
+
+    # Directory containing these arrays.
+    arrays_dirname = _get_arrays_dirname(filename)
+
+    # For the name of each such array, memory-map this array into this object.
+    # For safety, this map is viewed as a standard Numpy array rather than the
+    # "numpy.memmap" subclass returned by np.load(), which otherwise
+    # infectiously propagates to all arrays derived from this array.
+    for array_name in arrays_names:
+        array = np.load(
+            os.path.join(arrays_dirname, array_name + '.npy'), mmap_mode='c')
+        setattr(obj, array_name, array.view(np.ndarray))
+
+    # Remove this private instance variable from this object.
+    delattr(obj, _ARRAYS_NAMES_VAR_NAME)
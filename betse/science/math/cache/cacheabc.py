@@ -23,6 +23,8 @@ class SimPhaseCaches(object):
 
     Attributes
     ----------
+    times : SimPhaseCacheTimeSeries
+        Subcache of all stacked sampled time series for this phase.
     upscaled : SimPhaseCacheCellsUpscaled
         Subcache of all upscaled objects constructed for this phase.
     vector : SimPhaseCacheVectorCells
@@ -44,6 +46,8 @@ class SimPhaseCaches(object):
         '''
 
         # Avoid circular import dependencies.
+        from betse.science.math.cache.cachetimes import (
+            SimPhaseCacheTimeSeries)
         from betse.science.math.cache.cacheupscaled import (
             SimPhaseCacheUpscaled)
         from betse.science.math.cache.cachevec import SimPhaseCacheVectorCells
@@ -51,6 +55,7 @@ class SimPhaseCaches(object):
             SimPhaseCacheVectorFieldCells)
 
         # Classify all subcaches imported above.
+        self.times = SimPhaseCacheTimeSeries(phase)
         self.upscaled = SimPhaseCacheUpscaled(phase)
         self.vector = SimPhaseCacheVectorCells(phase)
         self.vector_field = SimPhaseCacheVectorFieldCells(phase)
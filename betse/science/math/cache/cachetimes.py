@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+# --------------------( LICENSE                            )--------------------
+# Copyright 2014-2023 by Alexis Pietak & Cecil Curry.
+# See "LICENSE" for further details.
+
+'''
+High-level sampled time series subcache functionality.
+'''
+
+# ....................{ IMPORTS                            }....................
+import numpy as np
+from betse.science.math.cache.cacheabc import SimPhaseCacheABC
+from betse.util.type.types import type_check, IntOrNoneTypes
+
+# ....................{ SUBCLASSES                         }....................
+class SimPhaseCacheTimeSeries(SimPhaseCacheABC):
+    '''
+    Simulation phase-specific sampled time series subcache, persisting each
+    sampled time series of the current simulation (e.g.,
+    :attr:`betse.science.sim.Simulator.vm_time`) stacked into a single Numpy
+    array whose first dimension indexes each sampled time step.
+
+    Stacking each time series once permits the time series of a single cell to
+    be extracted by slicing across all sampled time steps at once rather than
+    by iterating over each sampled time step. Time series spatially situated at
+    cell membranes rather than cell centres are detected by the length of their
+    last dimension and sliced by the membrane indices of that cell precomputed
+    by :attr:`betse.science.cells.Cells.cell_to_mems`.
+
+    Attributes
+    ----------
+    _series_name_to_times : dict
+        Dictionary mapping from the name of each previously requested time
+        series to either the Numpy array stacking that time series *or* the
+        original list of arrays if these arrays differ in shape (e.g., due to
+        cells being cut), in which case that time series *cannot* be stacked.
+    '''
+
+    # ..................{ INITIALIZORS                       }..................
+    def __init__(self, *args, **kwargs) -> None:
+
+        # Initialize our superclass with all passed parameters.
+        super().__init__(*args, **kwargs)
+
+        # Nullify all instance variables for safety.
+        self._series_name_to_times = {}
+
+    # ..................{ GETTERS                            }..................
+    @type_check
+    def get_times(self, series_name: str) -> object:
+        '''
+        Sampled time series of the current simulation with the passed name
+        stacked into a single Numpy array whose first dimension indexes each
+        sampled time step if the arrays of this series share the same shape
+        *or* the original list of these arrays otherwise.
+
+        Parameters
+        ----------
+        series_name : str
+            Name of this time series as an attribute of the current simulation
+            (e.g., ``vm_time``).
+        '''
+
+        # If this time series has yet to be stacked, do so.
+        if series_name not in self._series_name_to_times:
+            series_times = getattr(self._phase.sim, series_name)
+
+            # If this time series is already stacked (e.g., as a view of the
+            # preallocated arrays written by the simulator), reuse this array.
+            if not isinstance(series_times, np.ndarray):
+                try:
+                    series_times = np.stack(series_times)
+                # If these arrays differ in shape, preserve this list.
+                except ValueError:
+                    pass
+
+            self._series_name_to_times[series_name] = series_times
+
+        return self._series_name_to_times[series_name]
+
+
+    @type_check
+    def get_cell_times(
+        self, series_name: str, cell_index: IntOrNoneTypes = None) -> (
+        np.ndarray):
+        '''
+        Sampled time series of the current simulation with the passed name for
+        the single cell with the passed index, whose first dimension indexes
+        each sampled time step.
+
+        If this time series is spatially situated at cell membranes, this is
+        the time series of the first membrane of this cell.
+
+        Parameters
+        ----------
+        series_name : str
+            Name of this time series as an attribute of the current simulation
+            (e.g., ``rate_NaKATP_time``).
+        cell_index : IntOrNoneTypes
+            0-based index of this cell. Defaults to ``None``, in which case
+            this index defaults to the ``plot cell index`` of the current
+            simulation configuration.
+        '''
+
+        # Index of this cell or of the first membrane of this cell.
+        cell_indices = self._get_cell_indices(series_name, cell_index)
+        if not np.isscalar(cell_indices):
+            cell_indices = cell_indices[0]
+
+        return self._get_times_indexed(series_name, cell_indices)
+
+
+    @type_check
+    def get_cell_times_mems_mean(
+        self, series_name: str, cell_index: IntOrNoneTypes = None) -> (
+        np.ndarray):
+        '''
+        Sampled time series of the current simulation with the passed name for
+        the single cell with the passed index averaged over all membranes of
+        this cell, whose first dimension indexes each sampled time step.
+
+        If this time series is spatially situated at cell centres, this is the
+        time series of this cell as is.
+
+        Parameters
+        ----------
+        series_name : str
+            Name of this time series as an attribute of the current simulation
+            (e.g., ``vm_time``).
+        cell_index : IntOrNoneTypes
+            0-based index of this cell. Defaults to ``None``, in which case
+            this index defaults to the ``plot cell index`` of the current
+            simulation configuration.
+        '''
+
+        # Index of this cell or indices of all membranes of this cell.
+        cell_indices = self._get_cell_indices(series_name, cell_index)
+
+        cell_times = self._get_times_indexed(series_name, cell_indices)
+        if not np.isscalar(cell_indices):
+            cell_times = cell_times.mean(axis=-1)
+
+        return cell_times
+
+    # ..................{ PRIVATE ~ getters                  }..................
+    def _get_cell_indices(
+        self, series_name: str, cell_index: IntOrNoneTypes) -> object:
+        '''
+        Index of the cell with the passed index in the sampled time series with
+        the passed name if this series is spatially situated at cell centres
+        *or* the one-dimensional Numpy array of the indices of all membranes of
+        that cell if this series is spatially situated at cell membranes.
+        '''
+
+        # Default this cell to the single cell of this configuration.
+        if cell_index is None:
+            cell_index = self._phase.p.visual.single_cell_index
+
+        # Length of the last dimension of the last array of this time series.
+        # Since cells may have been cut after the first sampled time step, only
+        # the last array is guaranteed to be situated at the cells or membranes
+        # of the current cell cluster.
+        series_times = self.get_times(series_name)
+        series_len = series_times[-1].shape[-1]
+
+        # If this time series is spatially situated at cell membranes, return
+        # the indices of all membranes of this cell.
+        if series_len == len(self._phase.cells.mem_i):
+            return np.asarray(self._phase.cells.cell_to_mems[cell_index])
+
+        return cell_index
+
+
+    def _get_times_indexed(
+        self, series_name: str, indices: object) -> np.ndarray:
+        '''
+        Numpy array indexing the last dimension of each array of the sampled
+        time series with the passed name by the passed indices, whose first
+        dimension indexes each sampled time step.
+        '''
+
+        series_times = self.get_times(series_name)
+
+        # If this time series is stacked, slice all time steps at once.
+        if isinstance(series_times, np.ndarray):
+            return series_times[..., indices]
+
+        # Else, index each time step separately.
+        return np.stack([
+            series_time[..., indices] for series_time in series_times])
@@ -6,6 +6,8 @@
 import math
 import numpy as np
 # import scipy.ndimage
+from betse.science.math.sparsesolver import SparseFactorSolver
+from scipy.sparse import lil_matrix
 from scipy.spatial import Delaunay, cKDTree
 
 # ....................{ CLASSES                            }....................
@@ -255,6 +257,11 @@ class FiniteDiffSolver(object):
         on a regular Cartesian grid with square boundaries. Note: the graph must have
         equal spacing in the x and y directions (the same delta in x and y directions).
 
+        Returns
+        -------
+        A       Sparse Laplacian operator matrix in CSR format
+        Ainv    Sparse solver applying the pseudo-inverse of this operator via
+                its ``solve()`` method
         """
 
         size_rows = self.cents_shape[0]
@@ -262,17 +269,24 @@ class FiniteDiffSolver(object):
 
         sze = size_rows*size_cols
 
-        A = np.zeros((sze,sze))
+        # Since each row of this operator has at most five nonzero entries,
+        # this operator is assembled in sparse list-of-lists format.
+        A = lil_matrix((sze,sze))
+
+        # Two-dimensional array mapping from the (i,j) indices of each grid
+        # space to the linear unravelled k index of that space.
+        map_k = np.zeros(self.cents_shape, dtype=int)
+        map_k[self.map_ij2k_cents[:,0], self.map_ij2k_cents[:,1]] = np.arange(sze)
 
         for k, (i,j) in enumerate(self.map_ij2k_cents):
 
             # if we're not on a main boundary:
             if i != 0 and j != 0 and i != size_rows-1 and j != size_cols-1:
 
-                k_ip1_j = self.map_ij2k_cents.tolist().index([i + 1,j])
-                k_in1_j = self.map_ij2k_cents.tolist().index([i-1,j])
-                k_i_jp1 = self.map_ij2k_cents.tolist().index([i,j+1])
-                k_i_jn1 = self.map_ij2k_cents.tolist().index([i,j-1])
+                k_ip1_j = map_k[i+1, j]
+                k_in1_j = map_k[i-1, j]
+                k_i_jp1 = map_k[i, j+1]
+                k_i_jn1 = map_k[i, j-1]
 
                 A[k, k_ip1_j] = 1
                 A[k, k_in1_j] = 1
@@ -285,9 +299,9 @@ class FiniteDiffSolver(object):
 
                 if bound['S'] == 'flux':
 
-                    k_ip1_j = self.map_ij2k_cents.tolist().index([i + 1,j])
-                    k_i_jp1 = self.map_ij2k_cents.tolist().index([i,j+1])
-                    k_i_jn1 = self.map_ij2k_cents.tolist().index([i,j-1])
+                    k_ip1_j = map_k[i+1, j]
+                    k_i_jp1 = map_k[i, j+1]
+                    k_i_jn1 = map_k[i, j-1]
 
                     A[k, k_ip1_j] = 1
                     A[k, k_i_jp1] = 1
@@ -297,7 +311,7 @@ class FiniteDiffSolver(object):
 
                 elif bound['S'] == 'value':
 
-                    k_ip1_j = self.map_ij2k_cents.tolist().index([i + 1,j])
+                    k_ip1_j = map_k[i+1, j]
 
                     A[k,k] = 1
                     # A[k,k_ip1_j] = 1
@@ -306,9 +320,9 @@ class FiniteDiffSolver(object):
 
                 if bound['N'] == 'flux':
 
-                    k_in1_j = self.map_ij2k_cents.tolist().index([i-1,j])
-                    k_i_jp1 = self.map_ij2k_cents.tolist().index([i,j+1])
-                    k_i_jn1 = self.map_ij2k_cents.tolist().index([i,j-1])
+                    k_in1_j = map_k[i-1, j]
+                    k_i_jp1 = map_k[i, j+1]
+                    k_i_jn1 = map_k[i, j-1]
 
                     A[k, k_in1_j] = 1
                     A[k, k_i_jp1] = 1
@@ -318,7 +332,7 @@ class FiniteDiffSolver(object):
 
                 elif bound['N'] == 'value':
 
-                    k_in1_j = self.map_ij2k_cents.tolist().index([i-1,j])
+                    k_in1_j = map_k[i-1, j]
 
                     A[k,k] = 1
                     # A[k,k_in1_j] = 1
@@ -327,9 +341,9 @@ class FiniteDiffSolver(object):
 
                 if bound['W'] == 'flux':
 
-                    k_i_jp1 = self.map_ij2k_cents.tolist().index([i,j+1])
-                    k_ip1_j = self.map_ij2k_cents.tolist().index([i + 1,j])
-                    k_in1_j = self.map_ij2k_cents.tolist().index([i-1,j])
+                    k_i_jp1 = map_k[i, j+1]
+                    k_ip1_j = map_k[i+1, j]
+                    k_in1_j = map_k[i-1, j]
 
                     A[k, k_i_jp1] = 1
                     A[k, k_ip1_j] = 1
@@ -339,7 +353,7 @@ class FiniteDiffSolver(object):
 
                 elif bound['W'] == 'value':
 
-                    k_i_jp1 = self.map_ij2k_cents.tolist().index([i,j+1])
+                    k_i_jp1 = map_k[i, j+1]
 
                     A[k,k] = 1
                     # A[k,k_i_jp1] = 1
@@ -348,9 +362,9 @@ class FiniteDiffSolver(object):
 
                 if bound['E'] == 'flux':
 
-                    k_i_jn1 = self.map_ij2k_cents.tolist().index([i,j-1])
-                    k_ip1_j = self.map_ij2k_cents.tolist().index([i + 1,j])
-                    k_in1_j = self.map_ij2k_cents.tolist().index([i-1,j])
+                    k_i_jn1 = map_k[i, j-1]
+                    k_ip1_j = map_k[i+1, j]
+                    k_in1_j = map_k[i-1, j]
 
                     A[k, k_i_jn1] = 1
                     A[k, k_ip1_j] = 1
@@ -360,7 +374,7 @@ class FiniteDiffSolver(object):
 
                 elif bound['E'] == 'value':
 
-                    k_i_jn1 = self.map_ij2k_cents.tolist().index([i,j-1])
+                    k_i_jn1 = map_k[i, j-1]
 
                     A[k,k] = 1
                     # A[k,k_i_jn1] = 1
@@ -370,8 +384,8 @@ class FiniteDiffSolver(object):
 
                 if bound['S'] == 'flux':
 
-                    k_ip1_j = self.map_ij2k_cents.tolist().index([i + 1,j])
-                    k_i_jp1 = self.map_ij2k_cents.tolist().index([i,j+1])
+                    k_ip1_j = map_k[i+1, j]
+                    k_i_jp1 = map_k[i, j+1]
 
                     A[k, k_i_jp1] = 1
                     A[k, k_ip1_j] = 1
@@ -384,8 +398,8 @@ class FiniteDiffSolver(object):
 
                 if bound['N'] == 'flux':
 
-                    k_in1_j = self.map_ij2k_cents.tolist().index([i - 1,j])
-                    k_i_jp1 = self.map_ij2k_cents.tolist().index([i,j+1])
+                    k_in1_j = map_k[i-1, j]
+                    k_i_jp1 = map_k[i, j+1]
 
                     A[k, k_i_jp1] = 1
                     A[k, k_in1_j] = 1
@@ -398,8 +412,8 @@ class FiniteDiffSolver(object):
 
                 if bound['E'] == 'flux':
 
-                    k_ip1_j = self.map_ij2k_cents.tolist().index([i + 1,j])
-                    k_i_jn1 = self.map_ij2k_cents.tolist().index([i,j-1])
+                    k_ip1_j = map_k[i+1, j]
+                    k_i_jn1 = map_k[i, j-1]
 
                     A[k, k_i_jn1] = 1
                     A[k, k_ip1_j] = 1
@@ -412,8 +426,8 @@ class FiniteDiffSolver(object):
 
                 if bound['E'] == 'flux':
 
-                    k_in1_j = self.map_ij2k_cents.tolist().index([i - 1,j])
-                    k_i_jn1 = self.map_ij2k_cents.tolist().index([i,j-1])
+                    k_in1_j = map_k[i-1, j]
+                    k_i_jn1 = map_k[i, j-1]
 
                     A[k, k_i_jn1] = 1
                     A[k, k_in1_j] = 1
@@ -423,10 +437,10 @@ class FiniteDiffSolver(object):
                     A[k,k] = 1
 
 
-        A = A/(self.delta**2)
+        A = A.tocsr()/(self.delta**2)
 
-        # calculate the inverse, which is stored for solution calculation of Laplace and Poisson equations
-        Ainv = np.linalg.pinv(A)
+        # calculate the inverse solver, which is stored for solution calculation of Laplace and Poisson equations
+        Ainv = SparseFactorSolver(A)
 
         return A, Ainv
 
@@ -1234,70 +1248,72 @@ def laplacian(F,delx,dely=None):
     return ddF
 
 def gradient(F,delx,dely=None):
-    # gradient using numpy slicing:
+    # gradient using numpy slicing over the last two axes, such that any
+    # leading axes (e.g., one per ion) index independent grids:
 
     if dely is None:
         dely = delx
 
     # calculate the discrete central first derivatives on the internal mesh points:
-    dF_interior_y = -(F[:-2,:] - F[2:,:])/(2*dely)
-    dF_interior_x = -(F[:,:-2] - F[:,2:])/(2*delx)
+    dF_interior_y = -(F[...,:-2,:] - F[...,2:,:])/(2*dely)
+    dF_interior_x = -(F[...,:,:-2] - F[...,:,2:])/(2*delx)
 
     # calculate the discrete forward or backward first derivatives on the boundary points:
-    dF_B = (F[1,:] - F[0,:])/dely
-    dF_T = (F[-1,:] - F[-2,:])/dely
-    dF_L = (F[:,1] - F[:,0])/delx
-    dF_R = (F[:,-1] - F[:,-2])/delx
+    dF_B = (F[...,1,:] - F[...,0,:])/dely
+    dF_T = (F[...,-1,:] - F[...,-2,:])/dely
+    dF_L = (F[...,:,1] - F[...,:,0])/delx
+    dF_R = (F[...,:,-1] - F[...,:,-2])/delx
 
     # initialize the dFx and dFy arrays:
     dFx = np.zeros(F.shape)
     dFy = np.zeros(F.shape)
 
     # build the final dFx and dFy arrays by splicing together internal and boundary derivatives:
-    dFx[:,1:-1] = dF_interior_x
-    dFy[1:-1,:] = dF_interior_y
+    dFx[...,:,1:-1] = dF_interior_x
+    dFy[...,1:-1,:] = dF_interior_y
 
-    dFx[:,0] = dF_L
-    dFx[:,-1] = dF_R
+    dFx[...,:,0] = dF_L
+    dFx[...,:,-1] = dF_R
 
-    dFy[0,:] = dF_B
-    dFy[-1,:] = dF_T
+    dFy[...,0,:] = dF_B
+    dFy[...,-1,:] = dF_T
 
     return dFx, dFy
 
 def diff(F,delx,axis=0):
-    # dertivative using numpy slicing:
+    # dertivative using numpy slicing over the last two axes, such that any
+    # leading axes (e.g., one per ion) index independent grids:
 
     if axis == 1:
         # calculate the discrete central first derivatives on the internal mesh points:
-        dF_interior = -(F[:-2,:] - F[2:,:])/(2*delx)
+        dF_interior = -(F[...,:-2,:] - F[...,2:,:])/(2*delx)
 
         # calculate the discrete forward or backward first derivatives on the boundary points:
-        dF_B = -(F[1,:] - F[0,:])/delx
-        dF_T = -(F[-1,:] - F[-2,:])/delx
+        dF_B = -(F[...,1,:] - F[...,0,:])/delx
+        dF_T = -(F[...,-1,:] - F[...,-2,:])/delx
 
         dF = np.zeros(F.shape)
 
-        dF[1:-1,:] = dF_interior
+        dF[...,1:-1,:] = dF_interior
 
-        dF[0,:] = dF_B
-        dF[-1,:] = dF_T
+        dF[...,0,:] = dF_B
+        dF[...,-1,:] = dF_T
 
 
     elif axis == 0:
         # calculate the discrete central first derivatives on the internal mesh points:
-        dF_interior = -(F[:,:-2] - F[:,2:])/(2*delx)
+        dF_interior = -(F[...,:,:-2] - F[...,:,2:])/(2*delx)
 
         # calculate the discrete forward or backward first derivatives on the boundary points:
-        dF_L = (F[:,0] - F[:,1])/delx
-        dF_R = (F[:,-2] - F[:,-1])/delx
+        dF_L = (F[...,:,0] - F[...,:,1])/delx
+        dF_R = (F[...,:,-2] - F[...,:,-1])/delx
 
         dF = np.zeros(F.shape)
 
-        dF[:,1:-1] = dF_interior
+        dF[...,:,1:-1] = dF_interior
 
-        dF[:,0] = dF_L
-        dF[:,-1] = dF_R
+        dF[...,:,0] = dF_L
+        dF[...,:,-1] = dF_R
 
 
     return dF
@@ -1481,7 +1497,7 @@ def integrator(P, sharp = 0.5):
     Averages nearest neighbours of the environmental array with a weighting
     given by the "sharp" option.
 
-    P: some 2D matrix
+    P: some 2D matrix (or stack of 2D matrices along any leading axes)
     sharp: weighting of the neigbouring averages; 0.5 is standard finite volume smoothing; 1.0 is no smoothing
 
     Thanks Sess!
@@ -1490,24 +1506,24 @@ def integrator(P, sharp = 0.5):
 
     F = np.zeros(P.shape)
 
-    eP = P[:,1:] # east midpoints
-    wP = P[:,0:-1] # west midpoints
-    nP = P[1:,:] # north midpoints
-    sP = P[0:-1,:] # south midpoints
+    eP = P[...,:,1:] # east midpoints
+    wP = P[...,:,0:-1] # west midpoints
+    nP = P[...,1:,:] # north midpoints
+    sP = P[...,0:-1,:] # south midpoints
 
     sides = (1-sharp)/4
 
-    F[:, :] = sharp * P
-    F[0:-1, :] += sides * nP
-    F[1:, :] += sides * sP
-    F[:, 0:-1] += sides * eP
-    F[:, 1:] += sides * wP
+    F[...,:, :] = sharp * P
+    F[...,0:-1, :] += sides * nP
+    F[...,1:, :] += sides * sP
+    F[...,:, 0:-1] += sides * eP
+    F[...,:, 1:] += sides * wP
 
     # reset boundary values:
-    F[:, 0] = P[:, 0]
-    F[:, -1] = P[:, -1]
-    F[0, :] = P[0, :]
-    F[-1, :] = P[-1, :]
+    F[...,:, 0] = P[...,:, 0]
+    F[...,:, -1] = P[...,:, -1]
+    F[...,0, :] = P[...,0, :]
+    F[...,-1, :] = P[...,-1, :]
 
     return F
 
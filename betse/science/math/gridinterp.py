@@ -0,0 +1,359 @@
+#!/usr/bin/env python3
+# --------------------( LICENSE                           )--------------------
+# Copyright 2014-2023 by Alexis Pietak & Cecil Curry.
+# See "LICENSE" for further details.
+
+'''
+Low-level **interpolation plan** (i.e., objects caching the Delaunay
+triangulation of a fixed set of source points and the barycentric weights of a
+fixed set of target points with respect to that triangulation) facilities.
+
+The :func:`scipy.interpolate.griddata` function re-triangulates its source
+points on each call. Since plots and animations repeatedly interpolate
+different data between the same source points (e.g., cell centres, membrane
+midpoints) and the same target points (e.g., the environmental grid), this
+triangulation is redundantly recomputed for each plot and animation frame. The
+:func:`griddata` function defined below is a drop-in replacement for that
+function instead caching one interpolation plan for each such combination of
+source and target points, reducing each subsequent interpolation to a single
+sparse matrix-vector product.
+'''
+
+# ....................{ IMPORTS                           }....................
+import hashlib
+import numpy as np
+from betse.util.type.types import type_check, NumericSimpleTypes
+from collections import OrderedDict
+from numpy import ndarray
+from scipy.interpolate import CloughTocher2DInterpolator
+from scipy.sparse import csr_matrix
+from scipy.spatial import cKDTree, Delaunay
+
+# ....................{ CLASSES                           }....................
+class GridInterpPlan(object):
+    '''
+    **Interpolation plan** (i.e., object caching all data required to
+    repeatedly interpolate arbitrary data from a fixed set of two-dimensional
+    source points onto a fixed set of two-dimensional target points).
+
+    For the ``linear`` and ``nearest`` interpolation methods, this plan
+    precomputes the sparse matrix of all interpolation weights mapping data on
+    these source points onto these target points, reducing each interpolation
+    to a single sparse matrix-vector product. For the ``cubic`` interpolation
+    method, whose gradient estimation is *not* reducible to fixed weights, this
+    plan instead precomputes only the Delaunay triangulation of these source
+    points.
+
+    Attributes
+    ----------
+    method : str
+        Interpolation method (i.e., ``linear``, ``nearest``, or ``cubic``).
+    points_count : int
+        Number of source points.
+    xi_shape : tuple
+        Shape of the target points excluding the last dimension indexing the X
+        and Y coordinates of each target point, which is also the shape of each
+        interpolated one-dimensional array of data.
+    '''
+
+    # ..................{ INITIALIZERS                      }..................
+    @type_check
+    def __init__(self, points: ndarray, xi: ndarray, method: str) -> None:
+        '''
+        Initialize this interpolation plan.
+
+        Parameters
+        ----------
+        points : ndarray
+            Two-dimensional Numpy array of shape ``(n, 2)`` of the X and Y
+            coordinates of all source points.
+        xi : ndarray
+            Numpy array of shape ``(..., 2)`` of the X and Y coordinates of all
+            target points.
+        method : str
+            Interpolation method (i.e., ``linear``, ``nearest``, or ``cubic``).
+
+        Raises
+        ----------
+        ValueError
+            If this method is unrecognized.
+        '''
+
+        # Classify all passed parameters.
+        self.method = method
+        self.points_count = points.shape[0]
+        self.xi_shape = xi.shape[:-1]
+
+        # Target points flattened into a two-dimensional array.
+        xi_flat = xi.reshape((-1, 2))
+
+        # Sparse matrix of all interpolation weights, defaulting to "None" for
+        # the cubic method.
+        self._weights = None
+
+        # One-dimensional boolean array indexing all target points residing
+        # outside the convex hull of these source points, defaulting to "None"
+        # for the nearest method.
+        self._is_xi_outside = None
+
+        # If interpolating to the nearest source point, the weight of each
+        # target point is 1 for its nearest source point and 0 otherwise.
+        if method == 'nearest':
+            _, points_nearest = cKDTree(points).query(xi_flat)
+            self._weights = csr_matrix(
+                (
+                    np.ones(xi_flat.shape[0]),
+                    (np.arange(xi_flat.shape[0]), points_nearest),
+                ),
+                shape=(xi_flat.shape[0], self.points_count),
+            )
+        # Else if interpolating linearly, the weights of each target point are
+        # its barycentric coordinates with respect to the vertices of the
+        # simplex containing that point. For consistency with SciPy, these
+        # coordinates are computed exactly as the LinearNDInterpolator class
+        # internally computes these coordinates.
+        elif method == 'linear':
+            triangulation = Delaunay(points)
+
+            # Index of the simplex containing each target point if any *OR*
+            # -1 otherwise.
+            xi_simplices = triangulation.find_simplex(xi_flat)
+            self._is_xi_outside = xi_simplices == -1
+            xi_inside = np.flatnonzero(~self._is_xi_outside)
+            xi_simplices = xi_simplices[xi_inside]
+
+            # Affine transforms mapping each such target point onto the first
+            # two barycentric coordinates of that point. The last coordinate is
+            # 1 minus the sum of the first two.
+            xi_transform = triangulation.transform[xi_simplices]
+            xi_barycentric = np.einsum(
+                'ijk,ik->ij',
+                xi_transform[:, :2],
+                xi_flat[xi_inside] - xi_transform[:, 2],
+            )
+            xi_barycentric = np.column_stack(
+                (xi_barycentric, 1 - xi_barycentric.sum(axis=1)))
+
+            self._weights = csr_matrix(
+                (
+                    xi_barycentric.ravel(),
+                    (
+                        np.repeat(xi_inside, 3),
+                        triangulation.simplices[xi_simplices].ravel(),
+                    ),
+                ),
+                shape=(xi_flat.shape[0], self.points_count),
+            )
+        # Else if interpolating cubically, cache only this triangulation.
+        elif method == 'cubic':
+            self._triangulation = Delaunay(points)
+            self._xi_flat = xi_flat
+        # Else, this method is unrecognized. Raise the same exception raised
+        # by the griddata() function in this case.
+        else:
+            raise ValueError(
+                'Unknown interpolation method {!r} for '
+                '2 dimensional data'.format(method))
+
+    # ..................{ INTERPOLATORS                     }..................
+    @type_check
+    def interpolate(
+        self, values: ndarray, fill_value: NumericSimpleTypes = np.nan,
+    ) -> ndarray:
+        '''
+        Interpolate the passed data from the source onto the target points of
+        this plan.
+
+        Parameters
+        ----------
+        values : ndarray
+            Numpy array of shape ``(n, ...)`` of all data defined at the ``n``
+            source points of this plan.
+        fill_value : optional[NumericSimpleTypes]
+            Value assigned to all target points residing outside the convex
+            hull of the source points of this plan. Ignored by the ``nearest``
+            method. Defaults to NaN, as with the :func:`griddata` function.
+
+        Returns
+        ----------
+        ndarray
+            Numpy array of shape ``xi_shape + values.shape[1:]`` of this data
+            interpolated onto these target points.
+        '''
+
+        # If this data is *NOT* defined at these source points, raise the same
+        # exception raised by the griddata() function in this case.
+        if values.shape[0] != self.points_count:
+            raise ValueError('different number of values and points')
+
+        # Interpolate this data as either floating point or complex numbers.
+        if not np.iscomplexobj(values):
+            values = values.astype(np.float64, copy=False)
+
+        # Interpolate this data onto these target points.
+        if self._weights is None:
+            values_interp = CloughTocher2DInterpolator(
+                self._triangulation, values, fill_value=fill_value)(
+                    self._xi_flat)
+        else:
+            values_interp = self._weights.dot(
+                values.reshape((self.points_count, -1)))
+
+            # Assign all target points outside this convex hull this value.
+            if self._is_xi_outside is not None:
+                values_interp[self._is_xi_outside] = fill_value
+
+        # Reshape this data into the expected shape.
+        return values_interp.reshape(self.xi_shape + values.shape[1:])
+
+# ....................{ GETTERS                           }....................
+@type_check
+def get_plan(
+    points: object, xi: object, method: str = 'linear') -> GridInterpPlan:
+    '''
+    Interpolation plan interpolating data from the passed source points onto
+    the passed target points with the passed method, either retrieved from the
+    cache of previously created plans *or* created and cached if uncached.
+
+    This cache is keyed on the hashes of the coordinates of these points and
+    hence persists for the lifetime of the active Python process, including
+    across all plots and animations exported by a single simulation phase. To
+    bound memory consumption, only the :data:`_PLANS_MAX` most recently
+    retrieved plans are retained.
+
+    Parameters
+    ----------
+    points : object
+        Source points in any format accepted by the
+        :func:`scipy.interpolate.griddata` function (i.e., either a 2-tuple of
+        the X and Y coordinates of these points *or* an array of shape
+        ``(n, 2)``).
+    xi : object
+        Target points in any format accepted by the
+        :func:`scipy.interpolate.griddata` function (i.e., either a 2-tuple of
+        broadcastable arrays of the X and Y coordinates of these points *or* an
+        array of shape ``(..., 2)``).
+    method : optional[str]
+        Interpolation method (i.e., ``linear``, ``nearest``, or ``cubic``).
+        Defaults to ``linear``.
+
+    Returns
+    ----------
+    GridInterpPlan
+        Interpolation plan interpolating between these points.
+    '''
+
+    # Numpy arrays of these source and target points.
+    points = _get_coords(points)
+    xi = _get_coords(xi)
+
+    # Key uniquely identifying these points and this method.
+    plan_key = (method, _hash_coords(points), _hash_coords(xi))
+
+    # Plan cached under this key if any *OR* "None" otherwise.
+    plan = _plans.get(plan_key)
+
+    # If this plan is uncached, create and cache this plan, discarding the
+    # least recently retrieved plan if the cache is full.
+    if plan is None:
+        plan = _plans[plan_key] = GridInterpPlan(
+            points=points, xi=xi, method=method)
+        if len(_plans) > _PLANS_MAX:
+            _plans.popitem(last=False)
+    # Else, this plan is cached. Mark this plan as most recently retrieved.
+    else:
+        _plans.move_to_end(plan_key)
+
+    # Return this plan.
+    return plan
+
+# ....................{ INTERPOLATORS                     }....................
+@type_check
+def griddata(
+    points: object,
+    values: object,
+    xi: object,
+    method: str = 'linear',
+    fill_value: NumericSimpleTypes = np.nan,
+) -> ndarray:
+    '''
+    Interpolate the passed data defined at the passed two-dimensional source
+    points onto the passed two-dimensional target points with the passed
+    interpolation method, reusing the interpolation plan cached for these
+    points if any.
+
+    This function is a drop-in replacement for the
+    :func:`scipy.interpolate.griddata` function for two-dimensional data. Since
+    all interpolation weights are applied in a different order, the data
+    returned by this function is equal to that returned by that function only
+    to within floating point roundoff.
+
+    Parameters
+    ----------
+    points : object
+        Source points. See :func:`get_plan` for further details.
+    values : object
+        Array-like of shape ``(n, ...)`` of all data defined at the ``n``
+        source points.
+    xi : object
+        Target points. See :func:`get_plan` for further details.
+    method : optional[str]
+        Interpolation method (i.e., ``linear``, ``nearest``, or ``cubic``).
+        Defaults to ``linear``.
+    fill_value : optional[NumericSimpleTypes]
+        Value assigned to all target points residing outside the convex hull of
+        the source points. Ignored by the ``nearest`` method. Defaults to NaN.
+
+    Returns
+    ----------
+    ndarray
+        Numpy array of this data interpolated onto these target points.
+    '''
+
+    return get_plan(points=points, xi=xi, method=method).interpolate(
+        values=np.asarray(values), fill_value=fill_value)
+
+# ....................{ CLEARERS                          }....................
+def clear_plans() -> None:
+    '''
+    Clear all previously cached interpolation plans.
+    '''
+
+    _plans.clear()
+
+# ....................{ PRIVATE ~ globals                 }....................
+_PLANS_MAX = 32
+'''
+Maximum number of interpolation plans cached by the :func:`get_plan` function.
+'''
+
+
+_plans = OrderedDict()
+'''
+Dictionary mapping from the key uniquely identifying each previously created
+interpolation plan to that plan, ordered from least to most recently retrieved.
+'''
+
+# ....................{ PRIVATE ~ utilities               }....................
+def _get_coords(coords: object) -> ndarray:
+    '''
+    Numpy array of shape ``(..., 2)`` of the X and Y coordinates of all points
+    specified by the passed object in any format accepted by the
+    :func:`scipy.interpolate.griddata` function.
+    '''
+
+    # If these coordinates are a 2-tuple of the X and Y coordinates of these
+    # points, stack these coordinates into the last dimension.
+    if isinstance(coords, tuple):
+        coords = np.stack(np.broadcast_arrays(*coords), axis=-1)
+
+    # Return these coordinates as a contiguous array of floats.
+    return np.ascontiguousarray(coords, dtype=np.float64)
+
+
+def _hash_coords(coords: ndarray) -> tuple:
+    '''
+    Hashable key uniquely identifying the passed coordinates.
+    '''
+
+    return (coords.shape, hashlib.sha1(coords.data).digest())
@@ -22,9 +22,12 @@ from betse.util.math.geometry.polygon.geopoly import (
     is_convex, is_cyclic_quad, orient_counterclockwise,)
 from betse.util.math.geometry.polygon.geopolyconvex import (
     clip_counterclockwise)
+from betse.science.math.sparsesolver import (
+    SparseFactorSolver, SparsePinvSolver, make_dec_laplacian)
 from betse.util.io.log import logs
 from matplotlib import ticker
 from numpy import array
+from scipy.sparse import csr_matrix, identity
 from scipy.spatial import cKDTree, Delaunay
 # from matplotlib import colors
 # from matplotlib import colorbar
@@ -170,7 +173,8 @@ class DECMesh(object):
         self.process_voredges()
 
     def init_and_refine(self, smoothing = None, refinement = True,
-                        max_steps=25, convergence=7.5, fix_bounds=True):
+                        max_steps=25, convergence=7.5, fix_bounds=True,
+                        incremental=False):
 
         if smoothing is not None:
             self.init_mesh()  # init the whole mesh
@@ -182,7 +186,8 @@ class DECMesh(object):
 
         if refinement:
 
-            self.refine_mesh(max_steps=max_steps, convergence=convergence, fix_bounds=fix_bounds)
+            self.refine_mesh(max_steps=max_steps, convergence=convergence, fix_bounds=fix_bounds,
+                             incremental=incremental)
             self.pre_mesh()
 
         self.create_core_operators()
@@ -193,7 +198,8 @@ class DECMesh(object):
         logs.log_info("Mesh creation complete!")
 
     def clip_and_refine(self, imagemask, smoothing = None, refinement = True,
-                        max_steps=25, convergence=7.5, fix_bounds=True):
+                        max_steps=25, convergence=7.5, fix_bounds=True,
+                        incremental=False):
 
         self.pre_mesh()
         self.clip_to_curve(imagemask)
@@ -205,7 +211,8 @@ class DECMesh(object):
 
         if refinement:
 
-            self.refine_mesh(max_steps=max_steps, convergence=convergence, fix_bounds=fix_bounds)
+            self.refine_mesh(max_steps=max_steps, convergence=convergence, fix_bounds=fix_bounds,
+                             incremental=incremental)
             self.pre_mesh()
 
         self.create_core_operators()
@@ -458,37 +465,15 @@ class DECMesh(object):
                 if ai in self.free_to_merge:
                     # If triangle bi has also not yet been used in a merging...
                     if bi in self.free_to_merge:
-                        # Get verts of tri a and tri b.
-                        quad_i = np.unique((vertsa, vertsb))
-
-                        # Get the shared verts, which represent the shared
-                        # edge.
-                        shared_ij = np.intersect1d(vertsa, vertsb)
+                        # Get the merged quad of tri a and tri b if any.
+                        quad_merged = self._get_quad_merged(vertsa, vertsb)
 
                         # If the resulting merger leads to 4 unique vertices
                         # and one edge...
-                        if len(quad_i) == 4 and len(shared_ij) == 2:
-                            # Orient verts counterclockwise.
-                            quad_pts = self.tri_verts[quad_i]
-
-                            # Calculate the centre point.
-                            cent = quad_pts.mean(axis=0)
-
-                            # Calculate point angles.
-                            angles = np.arctan2(quad_pts[:, 1] - cent[1],
-                                                quad_pts[:, 0] - cent[0])
-
-                            # Sort indices counter-clockwise.
-                            sorted_region = quad_i[np.argsort(angles)]
-                            sorted_pts = quad_pts[np.argsort(angles)]
+                        if quad_merged is not None:
+                            sorted_region, sorted_pts, is_quad = quad_merged
 
-                            # Test to see if the merged poly is convex:
-                            conv_quad = is_convex(sorted_pts)
-                            cycl_quad = is_cyclic_quad(
-                                sorted_pts[0], sorted_pts[1],
-                                sorted_pts[2], sorted_pts[3])
-
-                            if conv_quad and cycl_quad:
+                            if is_quad:
                                 Rq, areaq, ccxq, ccyq = self.quad_circumc(
                                     sorted_pts[0], sorted_pts[1],
                                     sorted_pts[2], sorted_pts[3])
@@ -584,6 +569,50 @@ class DECMesh(object):
         self.tri_cell_i = np.asarray([i for i in range(self.n_tcell)])
 
 
+    def _get_quad_merged(self, vertsa, vertsb) -> tuple:
+        '''
+        3-tuple ``(sorted_region, sorted_pts, is_quad)`` describing the
+        quad merging the two passed tri cells if these cells share exactly one
+        edge *or* ``None`` otherwise, where ``sorted_region`` and
+        ``sorted_pts`` are the indices and coordinates of the verts of this
+        quad sorted counter-clockwise and ``is_quad`` is ``True`` only if this
+        quad is both convex and cyclic (i.e., if these cells are to be merged).
+        '''
+
+        # Get verts of tri a and tri b.
+        quad_i = np.unique((vertsa, vertsb))
+
+        # Get the shared verts, which represent the shared edge.
+        shared_ij = np.intersect1d(vertsa, vertsb)
+
+        # If the resulting merger does not lead to 4 unique vertices and one
+        # edge, these cells cannot be merged.
+        if len(quad_i) != 4 or len(shared_ij) != 2:
+            return None
+
+        # Orient verts counterclockwise.
+        quad_pts = self.tri_verts[quad_i]
+
+        # Calculate the centre point.
+        cent = quad_pts.mean(axis=0)
+
+        # Calculate point angles.
+        angles = np.arctan2(quad_pts[:, 1] - cent[1],
+                            quad_pts[:, 0] - cent[0])
+
+        # Sort indices counter-clockwise.
+        sorted_region = quad_i[np.argsort(angles)]
+        sorted_pts = quad_pts[np.argsort(angles)]
+
+        # Test to see if the merged poly is convex:
+        conv_quad = is_convex(sorted_pts)
+        cycl_quad = is_cyclic_quad(
+            sorted_pts[0], sorted_pts[1],
+            sorted_pts[2], sorted_pts[3])
+
+        return sorted_region, sorted_pts, bool(conv_quad and cycl_quad)
+
+
     def process_primary_edges(self):
         '''
         Process the edges and boundary of the primary mesh.
@@ -591,87 +620,39 @@ class DECMesh(object):
 
         logs.log_info("Defining edges of tri mesh...")
 
-        # Calculate edges for cells trimesh, and the hull:
-        all_edges = set()  # set of all vertex pairs
-        unique_edges = set()  # set of unique vertex pairs
-        hull_points = []
-        hull_edges = []
-        tri_mids = [] # midpoint of tri edges
-        tri_edge_len = [] # length of tri edge
-        tri_tang = [] # tri edge tangent
-
         # Begin by creating a master set of all edges, including duplicate
         # (vi, vj) and (vj, vi) combos.
-        for verti_o in self.tri_cells:
-            verti_i = np.roll(verti_o, -1)
-
-            for vi, vj in zip(verti_o, verti_i):
-                all_edges.add((vi, vj))
-
-        for va, vb in all_edges:
-            if (va, vb) in all_edges and (vb, va) not in all_edges:
-                # If there isn't a double-pair, then add these edges to the
-                # hull. This is based on the logic that when traversing the
-                # points of the triangular simplices, only the boundary edges
-                # are traversed once, since they don't have a neighbouring
-                # simplex at the bounds.
-                hull_points.append(va)
-                hull_points.append(vb)
-                hull_edges.append([va, vb])
-
-            # Otherwise add the edge to the set.
-            if (vb, va) not in unique_edges:
-                unique_edges.add((va, vb))
-
-        self.bflags_tverts = np.unique(hull_points)
-        self.tri_edges = np.asarray(list(unique_edges))
+        _, verts_i, verts_j = _flatten_cells(self.tri_cells)
+        all_edges = set(zip(verts_i.tolist(), verts_j.tolist()))
+
+        # Split these edges into unique edges and hull edges. This is based on
+        # the logic that when traversing the points of the triangular
+        # simplices, only the boundary edges are traversed once, since they
+        # don't have a neighbouring simplex at the bounds.
+        self.tri_edges, hull_edges = _get_edges_unique_and_hull(all_edges)
+        self.bflags_tverts = np.unique(hull_edges)
         self.n_tedges = len(self.tri_edges)  # number of edges in trimesh
 
-        # Process edges to create flags of edge indices:
-        tri_edges = self.tri_edges.tolist()
-
-        bflags_tedges = []
-
-        for vi, vj in hull_edges:
-
-            if [vi, vj] in tri_edges:
-                kk = tri_edges.index([vi, vj])
-            elif [vj, vi] in tri_edges:
-                kk = tri_edges.index([vj, vi])
-            bflags_tedges.append(kk)
-
         # Indices of edges on the boundary.
-        self.bflags_tedges = np.asarray(bflags_tedges)
+        self.bflags_tedges = _find_edges_undirected(self.tri_edges, hull_edges)
 
         self.tri_edge_i = np.linspace(
             0, self.n_tedges - 1, self.n_tedges, dtype=int)
         self.inner_tedge_i = np.delete(self.tri_edge_i, self.bflags_tedges)
 
-        # Finally, go through and calculate mids, len, and tangents of
-        # tri_edges, and prepare a mapping between each vertices and edges.
-        for ei, (vi, vj) in enumerate(self.tri_edges):
-
-            # get coordinates associated with each edge
-            tpi = self.tri_verts[vi]
-            tpj = self.tri_verts[vj]
-
-            tan_t = tpj - tpi
+        # Finally, calculate mids, len, and tangents of tri_edges.
+        tpi = self.tri_verts[self.tri_edges[:, 0]]
+        tpj = self.tri_verts[self.tri_edges[:, 1]]
 
-            tri_len = np.linalg.norm(tan_t)
+        tan_t = tpj - tpi
 
-            tan_ti = tan_t/tri_len
+        tri_len = np.linalg.norm(tan_t, axis=1)
 
-            assert (np.round(tri_len, 15) != 0.0), "Tri-edge length equal to zero! Duplicate seed points exist!"
+        assert np.all(np.round(tri_len, 15) != 0.0), "Tri-edge length equal to zero! Duplicate seed points exist!"
 
-            pptm = (tpi + tpj) / 2  # calculate midpoint of tri-edge:
-
-            tri_mids.append(pptm)
-            tri_edge_len.append(tri_len)
-            tri_tang.append(tan_ti)
-
-        self.tri_mids = np.asarray(tri_mids)
-        self.tri_edge_len = np.asarray(tri_edge_len)
-        self.tri_tang = np.asarray(tri_tang)
+        self.tri_mids = (tpi + tpj) / 2  # midpoints of tri-edges
+        self.tri_edge_len = tri_len
+        self.tri_tang = tan_t / tri_len[:, None]
 
         # Inds to inner triverts.
         self.inner_tvert_i = np.delete(self.tri_vert_i, self.bflags_tverts)
@@ -707,42 +688,33 @@ class DECMesh(object):
         Make various mappings for the tri-mesh.
         '''
 
-        # make the face-to-edge indices mapping for the tri_mesh:
-        # tri_edges = self.tri_edges.tolist()
-
-        face_to_edges = [[] for ii in range(self.n_tcell)]
-        # bflags_tcells = []
-
-        # mapping giving list of edge inds for each tri vert
-        verts_to_edges = [[] for i in range(len(self.tri_verts))]
+        # Flatten all pairs of adjacent vertices of all tri cells.
+        cells_i, verts_i, verts_j = _flatten_cells(self.tri_cells)
 
+        # Index of the edge matching each such pair, found by querying all
+        # pairs at once. Only pairs for which the search tree has found the
+        # matching vertices are retained.
         edge_tree = cKDTree(self.tri_edges)
-
-        for ci, vertsi_o in enumerate(self.tri_cells):
-            vertsi_i = np.roll(vertsi_o, -1)
-
-            for vi, vj in zip(vertsi_o, vertsi_i):
-                dist_e, ea = edge_tree.query([vi, vj])
-
-                if dist_e == 0.0: # If the search tree has found the matching vertices, then use the edge index ea:
-                    face_to_edges[ci].append(ea) # append the edge index to the array at the cell index
-                    verts_to_edges[vi].append(ea) # append the edge index to each vertex ind as well
-                    verts_to_edges[vj].append(ea)
+        dist_e, edges_i = edge_tree.query(np.column_stack((verts_i, verts_j)))
+        is_edge = dist_e == 0.0
+        cells_i = cells_i[is_edge]
+        edges_i = edges_i[is_edge]
 
         # tri_face index to tri_edges indices mapping.
-        self.tcell_to_tedges = np.asarray(face_to_edges, dtype=object)
-        # self.bflags_tcells = np.asarray(np.unique(bflags_tcells))  # trimesh faces on boundary
+        self.tcell_to_tedges = np.asarray(
+            _group_by(cells_i, edges_i, self.n_tcell), dtype=object)
 
-        # For each tever, what edges does it belong to?
-        self.tverts_to_tedges = np.asarray(verts_to_edges, dtype=object)
+        # For each tever, what edges does it belong to? Each edge is listed
+        # for both of its vertices, in the order these pairs were traversed.
+        self.tverts_to_tedges = np.asarray(_group_by(
+            np.column_stack((verts_i[is_edge], verts_j[is_edge])).ravel(),
+            np.repeat(edges_i, 2),
+            len(self.tri_verts),
+        ), dtype=object)
 
-        tedges_to_tcell = [[] for xi in self.tri_edges]
-
-        for tcell_i, edge_inds in enumerate(self.tcell_to_tedges):
-            for ei in edge_inds:
-                tedges_to_tcell[ei].append(tcell_i)
-
-        self.tedges_to_tcell = np.asarray(tedges_to_tcell, dtype=object)
+        # For each tri edge, what simplices does it belong to?
+        self.tedges_to_tcell = np.asarray(
+            _group_by(edges_i, cells_i, len(self.tri_edges)), dtype=object)
 
         if ignoreb is False:
             bcellso = self.tedges_to_tcell[self.bflags_tedges]
@@ -770,6 +742,12 @@ class DECMesh(object):
 
         tri_sa_o = [] # extended tri_sa (with elements for voronoi verts on boundary)
 
+        # Boolean masks of tri verts and tri edges on the hull.
+        is_bound_tvert = np.zeros(len(self._tverts_to_tcell), dtype=bool)
+        is_bound_tvert[self.bflags_tverts] = True
+        is_bound_tedge = np.zeros(self.n_tedges, dtype=bool)
+        is_bound_tedge[self.bflags_tedges] = True
+
         for ti, tc_indso in enumerate(self._tverts_to_tcell):
             tc_inds = np.unique(tc_indso)
 
@@ -784,13 +762,13 @@ class DECMesh(object):
             trisai = self.tri_sa[tc_inds]
 
             # If the trivert is on the hull...
-            if ti in self.bflags_tverts:
+            if is_bound_tvert[ti]:
                 # Get verts for trimesh edges of this neighbourhood and sort
                 # them counterclockwise: edge vertices.
                 tedge_inds = np.unique(self.tverts_to_tedges[ti])
 
                 for tei in tedge_inds:
-                    if tei in self.bflags_tedges:
+                    if is_bound_tedge[tei]:
                         # Get the vertices of the boundary edge of the trimesh.
                         bedge_verts = self.tri_verts[self.tri_edges[tei]]
 
@@ -824,10 +802,8 @@ class DECMesh(object):
             vor_cents.append(self.poly_centroid(vverts))
 
             # Calculate vor edge verts.
-            vedge_verts = np.asarray([
-                [vi, vj]
-                for vi, vj in zip(vverts, np.roll(vverts, -1, axis=0))
-            ])
+            vedge_verts = np.stack(
+                (vverts, np.roll(vverts, -1, axis=0)), axis=1)
 
             vor_edge_verts.extend(vedge_verts)
 
@@ -858,14 +834,6 @@ class DECMesh(object):
         # Find edges of Voronoi dual mesh. We want vor edges to have the same
         # index as tri_edges and to be perpendicular bisectors; therefore we're
         # going to have one vor_edge vert pair for each tri-edge.
-        all_edges = set()
-        vedge_set = set()
-        hull_points = []
-        hull_edges = []
-        vor_mids = []
-        vor_tang = []
-        vor_edge_len = []
-        vor_cells = []
 
         # vor_norm = [] # normals to vor cell surfaces (outwards pointing)
         # tri_norm = [] # normals to tri cell surfaces (outwards pointing)
@@ -880,77 +848,40 @@ class DECMesh(object):
         else:
             _, self.inner_vvert_i = vor_tree.query(self.tri_ccents)
 
-        for vpts in self.vcell_verts:
-            # Get inds of the cell verts from the tree.
-            di, vi = vor_tree.query(vpts)
-
-            # Append vor inds to vor verts making up the vor cell
-            vor_cells.append(vi)
-
-        for vedge in self.vor_edge_verts:
-            di, vi = vor_tree.query(vedge)
-            all_edges.add((vi[0], vi[1]))
-
-        for va, vb in all_edges:
-            if (va, vb) in all_edges and (vb, va) not in all_edges:
-                # if there isn't a double-pair, then add these edges to the hull:
-                # (this is based on the logic that when traversing the points of the
-                # triangular simplices, only the boundary edges are traversed once,
-                # since they don't have a neighbouring simplex at the bounds.)
-                hull_points.append(va)
-                hull_points.append(vb)
-
-                hull_edges.append([va, vb])
-
-            if (vb, va) not in vedge_set:  # otherwise add the edge to the set
-                vedge_set.add((va, vb))
-
-        self.bflags_vverts = np.unique(hull_points)
-        vor_edges = np.asarray(list(vedge_set))
-
-        # Process edges to create flags of edge indices:
-        # vor_edges_i = vor_edges.tolist() # FIXME do this as a cKDTree search
-        vedge_tree = cKDTree(vor_edges)
-
-        bflags_vedges = []
-
-        for vi, vj in hull_edges:
-
-            dedgea, ea = vedge_tree.query([vi, vj])
-            dedgeb, eb = vedge_tree.query([vj, vi])
-
-            if dedgea == 0.0:
-                kk = ea
-            elif dedgeb == 0.0:
-                kk = eb
-            bflags_vedges.append(kk)
-
-        self.bflags_vedges = np.asarray(bflags_vedges)  # indices of edges on the boundary
+        # Get inds of the verts of all vor cells from the tree at once, and
+        # split these inds into the vor verts making up each vor cell.
+        vcells_len = [len(vpts) for vpts in self.vcell_verts]
+        _, vi = vor_tree.query(np.vstack(self.vcell_verts))
+        vor_cells = np.split(vi, np.cumsum(vcells_len)[:-1])
+
+        # Get inds of the verts of all vor edges from the tree at once.
+        _, vi = vor_tree.query(self.vor_edge_verts.reshape((-1, 2)))
+        vi = vi.reshape((-1, 2))
+        all_edges = set(zip(vi[:, 0].tolist(), vi[:, 1].tolist()))
+
+        # Split these edges into unique edges and hull edges. If there isn't a
+        # double-pair, these edges are on the hull. (This is based on the logic
+        # that when traversing the points of the triangular simplices, only
+        # the boundary edges are traversed once, since they don't have a
+        # neighbouring simplex at the bounds.)
+        vor_edges, hull_edges = _get_edges_unique_and_hull(all_edges)
+        self.bflags_vverts = np.unique(hull_edges)
 
-        # Finally, go through and calculate mids, len, and tangents of tri_edges, and prepare a mapping between
-        # each vertices and edges:
-        for ei, (vi, vj) in enumerate(vor_edges):
-            # get coordinates associated with each edge
-            vpi = self.vor_verts[vi]
-            vpj = self.vor_verts[vj]
-
-            tan_v = vpj - vpi
-
-            vor_len = np.linalg.norm(tan_v)
+        # Indices of edges on the boundary.
+        self.bflags_vedges = _find_edges_undirected(vor_edges, hull_edges)
 
-            tan_vi = tan_v / vor_len
+        # Finally, calculate mids, len, and tangents of vor_edges:
+        vpi = self.vor_verts[vor_edges[:, 0]]
+        vpj = self.vor_verts[vor_edges[:, 1]]
 
-            assert (np.round(vor_len, 15) != 0.0), "Tri-edge length equal to zero! Duplicate seed points exist!"
+        tan_v = vpj - vpi
 
-            ppvm = (vpi + vpj) / 2  # calculate midpoint of tri-edge:
+        vor_edge_len = np.linalg.norm(tan_v, axis=1)
 
-            vor_mids.append(ppvm)
-            vor_edge_len.append(vor_len)
-            vor_tang.append(tan_vi)
+        assert np.all(np.round(vor_edge_len, 15) != 0.0), "Tri-edge length equal to zero! Duplicate seed points exist!"
 
-        vor_mids = np.asarray(vor_mids)
-        vor_edge_len = np.asarray(vor_edge_len)
-        vor_tang = np.asarray(vor_tang)
+        vor_mids = (vpi + vpj) / 2  # midpoints of vor-edges
+        vor_tang = tan_v / vor_edge_len[:, None]
 
         self.vor_cells = np.asarray(vor_cells, dtype=object)
 
@@ -970,15 +901,9 @@ class DECMesh(object):
 
         # Finally, need to correct the orientation of the voronoi edges to make them all 90 degree
         # rotations of the tri mesh:
-        for ei, (vti, tti) in enumerate(zip(self.vor_tang, self.tri_tang)):
-
-            sign = np.sign(np.cross(tti, vti))
-
-            if sign == 1.0:
-                self.vor_tang[ei] = -vti
-                va, vb = self.vor_edges[ei]
-                self.vor_edges[ei] = [vb, va]
-
+        is_flip = np.sign(np.cross(self.tri_tang, self.vor_tang)) == 1.0
+        self.vor_tang[is_flip] = -self.vor_tang[is_flip]
+        self.vor_edges[is_flip] = self.vor_edges[is_flip][:, ::-1]
 
         self.n_vedges = len(self.vor_edges)
         self.vor_edge_i = np.linspace(
@@ -1170,21 +1095,18 @@ class DECMesh(object):
         Note that the transpose of these matrices are equal to the
         boundary operators, where bount_1 = (delta_0).T and bound_2 = (delta_1).T.
 
+        All operators are sparse matrices, whose pseudo-inverses are applied by
+        sparse solvers rather than stored as dense matrices.
+
         """
 
         logs.log_info("Creating core operators...")
 
         # exterior derivative operator for tri mesh: operates on verts to return edges:
-        delta_tri_0 = np.zeros((self.n_tedges, self.n_tverts))
-
-        for ei, (vi, vj) in enumerate(self.tri_edges):
-            delta_tri_0[ei, vj] = 1.0
-            delta_tri_0[ei, vi] = -1.0
-
-        self.delta_tri_0 = np.asarray(delta_tri_0)
+        self.delta_tri_0 = self._make_delta_0(self.tri_edges, self.n_tverts)
 
         # get and store inverse:
-        self.delta_tri_0_inv = np.linalg.pinv(self.delta_tri_0)
+        self.delta_tri_0_inv = SparsePinvSolver(self.delta_tri_0)
 
 
     def create_aux_operators(self):
@@ -1197,65 +1119,84 @@ class DECMesh(object):
 
         # Exterior derivative operator for tri mesh operating on edges to
         # return faces.
-        delta_tri_1 = np.zeros((self.n_tcell, self.n_tedges))
-
-        tedge_tree = cKDTree(self.tri_edges)
-
-        for ic, vertis_o in enumerate(self.tri_cells):
-            vertis_1 = np.roll(vertis_o, -1)
+        self.delta_tri_1 = self._make_delta_1(
+            self.tri_cells, self.tri_edges, vert_step=1)
 
-            for vi, vj in zip(vertis_o, vertis_1):
-                disttea, ea = tedge_tree.query([vi, vj])
-                distteb, eb = tedge_tree.query([vj, vi])
-
-                if disttea == 0.0 and distteb != 0.0:
-                    delta_tri_1[ic, ea] = 1
-
-                elif distteb == 0.0 and disttea != 0.0:
+        # get and store inverse:
+        self.delta_tri_1_inv = SparsePinvSolver(self.delta_tri_1)
 
-                    delta_tri_1[ic, eb] = -1
+        # exterior derivative operators for vor mesh: operates on verts to return edges
+        self.delta_vor_0 = self._make_delta_0(self.vor_edges, self.n_vverts)
 
+        # get and store inverse:
+        self.delta_vor_0_inv = SparsePinvSolver(self.delta_vor_0)
 
+        #The following creates the delta_vor_1 exterior derivative, which can be used to create
+        # a natural open boundary condition on the tri mesh.
+        self.delta_vor_1 = self._make_delta_1(
+            self.vor_cells[self.inner_tvert_i], self.vor_edges, vert_step=-1)
+        self.delta_vor_1_inv = SparsePinvSolver(self.delta_vor_1)
 
-        self.delta_tri_1 = np.asarray(delta_tri_1)
 
-        # get and store inverse:
-        self.delta_tri_1_inv = np.linalg.pinv(self.delta_tri_1)
+    def _make_delta_0(self, edges, n_verts: int) -> csr_matrix:
+        '''
+        Sparse exterior derivative operator operating on the passed number of
+        vertices to return the passed edges, each of which is oriented from
+        its first to its second vertex.
+        '''
 
-        # exterior derivative operators for vor mesh: operates on verts to return edges
-        delta_vor_0 = np.zeros((self.n_vedges, self.n_vverts))
+        edges = np.asarray(edges, dtype=int).reshape((-1, 2))
+        n_edges = len(edges)
+        edges_i = np.arange(n_edges)
 
-        for ei, (vi, vj) in enumerate(self.vor_edges):
-            delta_vor_0[ei, vj] = 1.0
-            delta_vor_0[ei, vi] = -1.0
+        # Each edge is -1 at its first and +1 at its second vertex.
+        return csr_matrix(
+            (np.hstack((-np.ones(n_edges), np.ones(n_edges))),
+             (np.hstack((edges_i, edges_i)), np.hstack((edges[:, 0], edges[:, 1])))),
+            shape=(n_edges, n_verts))
 
-        self.delta_vor_0 = np.asarray(delta_vor_0)
 
-        # get and store inverse:
-        self.delta_vor_0_inv = np.linalg.pinv(self.delta_vor_0)
+    def _make_delta_1(self, cells, edges, vert_step: int) -> csr_matrix:
+        '''
+        Sparse exterior derivative operator operating on the passed edges to
+        return the passed cells, each of which is a sequence of vertex indices.
+
+        Each pair of vertices ``(vi, vj)`` of each cell, where ``vj`` is the
+        vertex ``vert_step`` positions after ``vi`` in that cell (cyclically),
+        is +1 for the edge oriented from ``vi`` to ``vj`` and -1 for the edge
+        oriented from ``vj`` to ``vi``. Vertex pairs matching both or neither
+        orientation are ignored.
+        '''
 
-        #The following creates the delta_vor_1 exterior derivative, which can be used to create
-        # a natural open boundary condition on the tri mesh.
-        delta_vor_1 = np.zeros((len(self.inner_tvert_i), self.n_vedges))
+        edges = np.asarray(edges, dtype=int).reshape((-1, 2))
 
-        # vor_edges = self.vor_edges.tolist()
-        vedge_tree = cKDTree(self.vor_edges)
+        # Flatten all pairs of vertices of all (possibly ragged) cells.
+        cells_i, verts_i, verts_j = _flatten_cells(cells, vert_step=vert_step)
 
-        for ic, cell_verts in enumerate(self.vor_cells[self.inner_tvert_i]):
+        # Indices of the edges oriented from "vi" to "vj" and from "vj" to "vi"
+        # if any *OR* -1 otherwise, found by querying all vertex pairs at once.
+        edge_tree = cKDTree(edges)
+        dist_a, edges_a = edge_tree.query(np.column_stack((verts_i, verts_j)))
+        dist_b, edges_b = edge_tree.query(np.column_stack((verts_j, verts_i)))
+        edges_a[dist_a != 0.0] = -1
+        edges_b[dist_b != 0.0] = -1
 
-            cell_verts_roll = np.roll(cell_verts, 1)
+        is_a = (edges_a >= 0) & (edges_b < 0)
+        is_b = (edges_b >= 0) & (edges_a < 0)
+        is_entry = is_a | is_b
 
-            for (vi, vj) in zip(cell_verts, cell_verts_roll):
-                distvea, ea = vedge_tree.query([vi, vj])
-                distveb, eb = vedge_tree.query([vj, vi])
+        rows = cells_i[is_entry]
+        cols = np.where(is_a, edges_a, edges_b)[is_entry]
+        vals = np.where(is_a, 1.0, -1.0)[is_entry]
 
-                if distvea == 0.0 and distveb != 0.0:
-                    delta_vor_1[ic, ea] = 1  # Check which sign these should be depending on desired relations!
-                elif distveb == 0.0 and distvea != 0.0:
-                    delta_vor_1[ic, eb] = -1
+        # Assign rather than sum duplicate entries, preserving the last.
+        entries_key = rows*len(edges) + cols
+        _, entries_last = np.unique(entries_key[::-1], return_index=True)
+        entries_last = len(entries_key) - 1 - entries_last
 
-        self.delta_vor_1 = np.asarray(delta_vor_1)
-        self.delta_vor_1_inv = np.linalg.pinv(self.delta_vor_1)
+        return csr_matrix(
+            (vals[entries_last], (rows[entries_last], cols[entries_last])),
+            shape=(len(cells), len(edges)))
 
 
     #----Mathematical operator functions-----------
@@ -1283,8 +1224,8 @@ class DECMesh(object):
 
             Sd = self.verts_to_verts(Sv, gtype = 'tri') # interpolate to verts of dual mesh
 
-            gS_tri = (1/self.tri_edge_len)*np.dot(self.delta_tri_0, Sv) # grad with respect to tri mesh
-            gS_vor = (1/self.vor_edge_len)*np.dot(self.delta_vor_0, Sd) # grad with respect to vor mesh
+            gS_tri = (1/self.tri_edge_len)*self.delta_tri_0.dot(Sv) # grad with respect to tri mesh
+            gS_vor = (1/self.vor_edge_len)*self.delta_vor_0.dot(Sd) # grad with respect to vor mesh
 
 
         elif gtype == 'vor':
@@ -1295,8 +1236,8 @@ class DECMesh(object):
 
             Sd = self.verts_to_verts(Sv, gtype = 'vor') # interpolate to verts of dual mesh
 
-            gS_tri = (1/self.tri_edge_len)*np.dot(self.delta_tri_0, Sd) # grad with respect to tri mesh
-            gS_vor = (1/self.vor_edge_len)*np.dot(self.delta_vor_0, Sv) # grad with respect to vor mesh
+            gS_tri = (1/self.tri_edge_len)*self.delta_tri_0.dot(Sd) # grad with respect to tri mesh
+            gS_vor = (1/self.vor_edge_len)*self.delta_vor_0.dot(Sv) # grad with respect to vor mesh
 
         else:
             raise Exception("valid gtype is 'tri' or 'vor'")
@@ -1332,7 +1273,7 @@ class DECMesh(object):
 
             assert(len(Sv) == self.n_tverts), "Length of array passed to grad is not tri_verts length"
 
-            gS = np.dot(self.delta_tri_0, Sv) # grad with respect to tri mesh
+            gS = self.delta_tri_0.dot(Sv) # grad with respect to tri mesh
 
             gradSx = (1/self.tri_edge_len)*gS*self.tri_tang[:,0]
             gradSy = (1 / self.tri_edge_len)*gS*self.tri_tang[:, 1]
@@ -1343,7 +1284,7 @@ class DECMesh(object):
 
             assert(len(Sv) == self.n_vverts), "Length of array passed to grad is not vor_verts length"
 
-            gS = np.dot(self.delta_vor_0, Sv) # grad with respect to vor mesh
+            gS = self.delta_vor_0.dot(Sv) # grad with respect to vor mesh
 
             gradSx = (1/self.vor_edge_len)*gS*self.vor_tang[:,0]
             gradSy = (1/self.vor_edge_len)*gS*self.vor_tang[:, 1]
@@ -1380,7 +1321,7 @@ class DECMesh(object):
 
             assert(len(S) == self.n_tverts), "Length of array passed to grad is not tri_verts length"
 
-            gradS = (1/self.tri_edge_len)*np.dot(self.delta_tri_0, S)
+            gradS = (1/self.tri_edge_len)*self.delta_tri_0.dot(S)
 
         elif gtype == 'vor':
 
@@ -1388,7 +1329,7 @@ class DECMesh(object):
 
             assert(len(S) == self.n_vverts), "Length of array passed to grad is not vor_verts length"
 
-            gradS = (1/self.vor_edge_len)*np.dot(self.delta_vor_0, S)
+            gradS = (1/self.vor_edge_len)*self.delta_vor_0.dot(S)
 
         else:
             raise Exception("valid gtype is 'tri' or 'vor'")
@@ -1428,10 +1369,10 @@ class DECMesh(object):
 
             if btype == 2:
 
-                divF = (1/self.vor_sa)*np.dot(-self.delta_tri_0.T, self.vor_edge_len*FF)
+                divF = (1/self.vor_sa)*-self.delta_tri_0.T.dot(self.vor_edge_len*FF)
 
             elif btype == 1:
-                divFo = (1/self.vor_sa[self.inner_tvert_i])*np.dot(self.delta_vor_1, self.vor_edge_len*FF)
+                divFo = (1/self.vor_sa[self.inner_tvert_i])*self.delta_vor_1.dot(self.vor_edge_len*FF)
                 divF = np.zeros(len(self.tri_verts))
                 divF[self.inner_tvert_i] = divFo
 
@@ -1446,10 +1387,10 @@ class DECMesh(object):
             FF = Fx*self.vor_tang[:,0] + Fy*self.vor_tang[:,1]
 
             if btype == 2:
-                divF = (1 / self.tri_sa_o) * np.dot(-self.delta_vor_0.T, self.tri_edge_len * FF)
+                divF = (1 / self.tri_sa_o) * -self.delta_vor_0.T.dot(self.tri_edge_len * FF)
 
             elif btype == 1:
-                divFo = (1/self.tri_sa)*np.dot(self.delta_tri_1, self.tri_edge_len*FF)
+                divFo = (1/self.tri_sa)*self.delta_tri_1.dot(self.tri_edge_len*FF)
                 divF = np.zeros(len(self.vor_verts))
                 divF[self.inner_vvert_i] = divFo
 
@@ -1494,10 +1435,10 @@ class DECMesh(object):
 
             if btype == 2:
 
-                divF = (1/self.vor_sa)*np.dot(-self.delta_tri_0.T, self.vor_edge_len*Ft)
+                divF = (1/self.vor_sa)*-self.delta_tri_0.T.dot(self.vor_edge_len*Ft)
 
             elif btype == 1:
-                divFo = (1/self.vor_sa[self.inner_tvert_i])*np.dot(self.delta_vor_1, self.vor_edge_len*Ft)
+                divFo = (1/self.vor_sa[self.inner_tvert_i])*self.delta_vor_1.dot(self.vor_edge_len*Ft)
                 divF = np.zeros(len(self.tri_verts))
                 divF[self.inner_tvert_i] = divFo
 
@@ -1509,11 +1450,11 @@ class DECMesh(object):
             assert(self.make_all_operators), "This mesh hasn't computed auxillary operators to calculate vor div!"
 
             if btype == 2:
-                divF = (1 / self.tri_sa_o) * np.dot(-self.delta_vor_0.T, self.tri_edge_len * Ft)
+                divF = (1 / self.tri_sa_o) * -self.delta_vor_0.T.dot(self.tri_edge_len * Ft)
 
             elif btype == 1:
 
-                divFo = (1/self.tri_sa)*np.dot(self.delta_tri_1, self.tri_edge_len*Ft)
+                divFo = (1/self.tri_sa)*self.delta_tri_1.dot(self.tri_edge_len*Ft)
                 divF = np.zeros(len(self.vor_verts))
                 divF[self.inner_vvert_i] = divFo
 
@@ -1607,15 +1548,15 @@ class DECMesh(object):
 
             if btype == 2:
                 # calculate the inverse divergence of the grad, which is the laplacian:
-                lapS_inv = np.dot(self.delta_tri_0_inv,
+                lapS_inv = self.delta_tri_0_inv.solve(
                                   (self.tri_edge_len/
-                                   (self.vor_edge_len))*np.dot(-self.delta_tri_0_inv.T, S*(self.vor_sa)))
+                                   (self.vor_edge_len))*-self.delta_tri_0_inv.solve_transpose(S*(self.vor_sa)))
 
             elif btype == 1:
                 # calculate the inverse divergence of the grad, which is the laplacian:
-                lapS_inv = np.dot(self.delta_tri_0_inv,
+                lapS_inv = self.delta_tri_0_inv.solve(
                                   (self.tri_edge_len/
-                                   (self.vor_edge_len))*np.dot(self.delta_vor_1_inv,
+                                   (self.vor_edge_len))*self.delta_vor_1_inv.solve(
                                                                S[self.inner_tvert_i]*(self.vor_sa[self.inner_tvert_i])))
 
             else:
@@ -1630,13 +1571,13 @@ class DECMesh(object):
 
             if btype == 2:
                 # calculate inverse Laplacian of S:
-                lapS_inv = np.dot(self.delta_vor_0_inv,
-                                  (self.vor_edge_len/self.tri_edge_len) * np.dot(-self.delta_vor_0_inv.T, S * (self.tri_sa_o)))
+                lapS_inv = self.delta_vor_0_inv.solve(
+                                  (self.vor_edge_len/self.tri_edge_len) * -self.delta_vor_0_inv.solve_transpose(S * (self.tri_sa_o)))
 
             elif btype == 1:
                 # calculate inverse Laplacian of S:
-                lapS_inv = np.dot(self.delta_vor_0_inv,
-                       (self.vor_edge_len/self.tri_edge_len)*np.dot(self.delta_tri_1_inv,
+                lapS_inv = self.delta_vor_0_inv.solve(
+                       (self.vor_edge_len/self.tri_edge_len)*self.delta_tri_1_inv.solve(
                                                                     S[self.inner_vvert_i]*(self.tri_sa)))
 
             else:
@@ -1724,7 +1665,7 @@ class DECMesh(object):
             Ft = Fx*self.tri_tang[:,0] + Fy*self.tri_tang[:,1]
 
             # calculate the curl (which is a vector in the z-direction with + representing out of page):
-            curl_F = (1 / self.tri_sa_o) * np.dot(-self.delta_vor_0.T, (self.tri_edge_len) * Ft)
+            curl_F = (1 / self.tri_sa_o) * -self.delta_vor_0.T.dot((self.tri_edge_len) * Ft)
 
 
         elif gtype == 'vor':
@@ -1733,7 +1674,7 @@ class DECMesh(object):
             Ft = Fx*self.vor_tang[:,0] + Fy*self.vor_tang[:,1]
 
             # calculate the curl (which is a vector in the z-direction with + representing out of page):
-            curl_F = (1/self.vor_sa)*np.dot(-self.delta_tri_0.T, (self.vor_edge_len)*Ft)
+            curl_F = (1/self.vor_sa)*-self.delta_tri_0.T.dot((self.vor_edge_len)*Ft)
 
         else:
             raise Exception("valid gtype is 'tri' or 'vor'")
@@ -1764,18 +1705,18 @@ class DECMesh(object):
 
         if gtype == 'tri':
             assert(len(Sv) == self.n_tverts), "Length of array passed to grad is not tri_verts length"
-            MM = np.abs(self.delta_tri_0)*(1/2)
+            MM = abs(self.delta_tri_0)*(1/2)
 
-            Sm = np.dot(MM, Sv)
+            Sm = MM.dot(Sv)
 
         elif gtype == 'vor':
 
             assert(self.make_all_operators), "This mesh hasn't computed auxillary operators to calculate vor grad"
             assert(len(Sv) == self.n_vverts), "Length of array passed to grad is not vor_verts length"
 
-            MM = np.abs(self.delta_vor_0)*(1/2)
+            MM = abs(self.delta_vor_0)*(1/2)
 
-            Sm = np.dot(MM, Sv)
+            Sm = MM.dot(Sv)
 
         else:
             raise Exception("valid gtype is 'tri' or 'vor'")
@@ -1842,22 +1783,22 @@ class DECMesh(object):
 
         if gtype == 'tri':
             assert(len(Sm) == self.n_tedges), "Length of array passed to grad is not edges length"
-            MM_inv = np.abs(self.delta_tri_0.T)
+            MM_inv = abs(self.delta_tri_0.T)
 
-            path_len = np.dot(MM_inv, self.vor_edge_len)
+            path_len = MM_inv.dot(self.vor_edge_len)
 
-            Sv = np.dot(MM_inv, Sm*self.vor_edge_len)/(path_len + 1.0e-20)
+            Sv = MM_inv.dot(Sm*self.vor_edge_len)/(path_len + 1.0e-20)
 
         elif gtype == 'vor':
 
             assert(self.make_all_operators), "This mesh hasn't computed auxillary operators to calculate vor grad"
             assert(len(Sm) == self.n_vedges), "Length of array passed to grad is not edges length"
 
-            MM_inv = np.abs(self.delta_vor_0.T)
+            MM_inv = abs(self.delta_vor_0.T)
 
-            path_len = np.dot(MM_inv, self.tri_edge_len)
+            path_len = MM_inv.dot(self.tri_edge_len)
 
-            Sv = np.dot(MM_inv, Sm*self.tri_edge_len)/(path_len + 1.0e-20)
+            Sv = MM_inv.dot(Sm*self.tri_edge_len)/(path_len + 1.0e-20)
 
         else:
 
@@ -1884,13 +1825,13 @@ class DECMesh(object):
 
         if gtype == 'vor':
             Sv_edges = self.verts_to_mids(Sv, gtype='vor')
-            path_len_tri = np.dot(np.abs(self.delta_tri_0.T), self.vor_edge_len)
-            Sd = np.dot(np.abs(self.delta_tri_0.T), self.vor_edge_len * Sv_edges) / path_len_tri
+            path_len_tri = abs(self.delta_tri_0.T).dot(self.vor_edge_len)
+            Sd = abs(self.delta_tri_0.T).dot(self.vor_edge_len * Sv_edges) / path_len_tri
 
         elif gtype == 'tri':
             Sv_edges = self.verts_to_mids(Sv, gtype='tri')
-            path_len_vor = np.dot(np.abs(-self.delta_vor_0.T), self.tri_edge_len)
-            Sd = np.dot(np.abs(-self.delta_vor_0.T), self.tri_edge_len*Sv_edges)/path_len_vor
+            path_len_vor = abs(self.delta_vor_0.T).dot(self.tri_edge_len)
+            Sd = abs(self.delta_vor_0.T).dot(self.tri_edge_len*Sv_edges)/path_len_vor
 
         else:
             raise Exception("valid gtype is 'tri' or 'vor'")
@@ -1968,15 +1909,15 @@ class DECMesh(object):
             if btype == 1:
 
                 # calculate the divergence of the grad, which is the laplacian:
-                ccS_inv = np.dot(self.delta_tri_0_inv,
+                ccS_inv = self.delta_tri_0_inv.solve(
                                   (self.tri_edge_len/
-                                   (self.vor_edge_len))*np.dot(-self.delta_tri_0_inv.T, Fz*(self.vor_sa)))
+                                   (self.vor_edge_len))*-self.delta_tri_0_inv.solve_transpose(Fz*(self.vor_sa)))
 
             elif btype == 2:
 
-                ccS_inv = np.dot(self.delta_tri_0_inv,
+                ccS_inv = self.delta_tri_0_inv.solve(
                                   (self.tri_edge_len/
-                                   (self.vor_edge_len))*np.dot(self.delta_vor_1_inv,
+                                   (self.vor_edge_len))*self.delta_vor_1_inv.solve(
                                                                Fz[self.inner_tvert_i]*(self.vor_sa[self.inner_tvert_i])))
 
             else:
@@ -1991,13 +1932,13 @@ class DECMesh(object):
 
             if btype == 1:
                 # calculate inverse Laplacian of S:
-                ccS_inv = np.dot(self.delta_vor_0_inv,
-                                 (self.vor_edge_len/self.tri_edge_len) * np.dot(self.delta_vor_0_inv.T, Fz * (self.tri_sa_o)))
+                ccS_inv = self.delta_vor_0_inv.solve(
+                                 (self.vor_edge_len/self.tri_edge_len) * self.delta_vor_0_inv.solve_transpose(Fz * (self.tri_sa_o)))
 
             elif btype == 2:
                 # calculate inverse Laplacian of S:
-                ccS_inv = np.dot(self.delta_vor_0_inv,
-                       (self.vor_edge_len/self.tri_edge_len)*np.dot(-self.delta_tri_1_inv,
+                ccS_inv = self.delta_vor_0_inv.solve(
+                       (self.vor_edge_len/self.tri_edge_len)*-self.delta_tri_1_inv.solve(
                                                                     Fz[self.inner_vvert_i]*(self.tri_sa)))
 
             else:
@@ -2030,8 +1971,8 @@ class DECMesh(object):
             Ft = Fx*self.tri_tang[:,0] + Fy*self.tri_tang[:,1]
 
             # calculate the curl of the curl:
-            ccft = (1/self.vor_edge_len)*np.dot(self.delta_vor_0,
-                                                          (1/self.tri_sa)*np.dot(self.delta_tri_1,
+            ccft = (1/self.vor_edge_len)*self.delta_vor_0.dot(
+                                                          (1/self.tri_sa)*self.delta_tri_1.dot(
                                                                                  (self.tri_edge_len)*Ft))
 
             lapFx = ccft*self.tri_tang[:,0]
@@ -2044,8 +1985,8 @@ class DECMesh(object):
             Ft = Fx*self.vor_tang[:,0] + Fy*self.vor_tang[:,1]
 
             # calculate the curl of the curl:
-            ccft = -(1/self.tri_edge_len)*np.dot(self.delta_tri_0,
-                                                          (1/self.vor_sa)*np.dot(-self.delta_tri_0.T,
+            ccft = -(1/self.tri_edge_len)*self.delta_tri_0.dot(
+                                                          (1/self.vor_sa)*-self.delta_tri_0.T.dot(
                                                                                  (self.vor_edge_len)*Ft))
 
             lapFx = ccft*self.vor_tang[:,0]
@@ -2079,8 +2020,8 @@ class DECMesh(object):
             Ft = Fx * self.tri_tang[:, 0] + Fy * self.tri_tang[:, 1]
 
             # calculate the inverse curl of the curl:
-            lapFt_inv = (1/self.tri_edge_len)*np.dot(self.delta_tri_1_inv,
-                                                     self.tri_sa*np.dot(self.delta_vor_0_inv,
+            lapFt_inv = (1/self.tri_edge_len)*self.delta_tri_1_inv.solve(
+                                                     self.tri_sa*self.delta_vor_0_inv.solve(
                                                                         Ft*self.vor_edge_len))
 
             lapFx_inv = lapFt_inv*self.tri_tang[:, 0]
@@ -2093,8 +2034,8 @@ class DECMesh(object):
             Ft = Fx * self.vor_tang[:, 0] + Fy * self.vor_tang[:, 1]
 
             # calculate the inverse curl of the curl:
-            lapFt_inv = (1/self.vor_edge_len)*np.dot(-self.delta_tri_0_inv.T,
-                                                     self.vor_sa*np.dot(self.delta_tri_0_inv,
+            lapFt_inv = (1/self.vor_edge_len)*-self.delta_tri_0_inv.solve_transpose(
+                                                     self.vor_sa*self.delta_tri_0_inv.solve(
                                                                         Ft*self.tri_edge_len))
 
             lapFx_inv = lapFt_inv*self.vor_tang[:, 0]
@@ -2210,25 +2151,19 @@ class DECMesh(object):
 
         else:
 
-            search_M = 99 * np.ones((len(pts), len(pt_cloud)))
-
-            pts_inds = np.asarray([i for i, cc in enumerate(pts)])
-
-            for i, pt in enumerate(pts):
-
-                for j, ptc in enumerate(pt_cloud):
-
-                    dist = np.sqrt((pt[0] - ptc[0]) ** 2 + (pt[1] - ptc[1]) ** 2)
-
-                    if dist < 1.0e-15:
-
-                        search_M[i, j] = 1.0
-
-                    else:
+            pts = np.asarray(pts)
 
-                        search_M[i, j] = 0.0
+            # For each point, the indices of all cloud points coincident with
+            # that point (i.e., at a distance of less than 1.0e-15), found by
+            # querying a search tree of the cloud for all points at once.
+            cloud_tree = cKDTree(np.asarray(pt_cloud)[:, :2])
+            matched_inds_cloud = cloud_tree.query_ball_point(
+                pts[:, :2], r=np.nextafter(1.0e-15, 0.0))
 
-            matched_inds, matched_inds_cloud = (search_M == 1).nonzero()
+            # Index of each point repeated once for each coincident cloud point.
+            pts_inds = np.arange(len(pts))
+            matched_inds = np.repeat(
+                pts_inds, [len(inds) for inds in matched_inds_cloud])
 
             unmatched_inds = np.setdiff1d(pts_inds, matched_inds)
 
@@ -2239,7 +2174,33 @@ class DECMesh(object):
 
 
     def refine_mesh(
-        self, max_steps=25, convergence=7.5, fix_bounds=True) -> None:
+        self, max_steps=25, convergence=7.5, fix_bounds=True,
+        incremental=False) -> None:
+        '''
+        Optimize this mesh with Lloyd's algorithm, iteratively moving each
+        tri vert to the centroid of its Voronoi cell until the mesh energy
+        falls below the passed convergence threshold.
+
+        Parameters
+        -----------
+        max_steps : int
+            Maximum number of optimization steps. Defaults to 25.
+        convergence : float
+            Mesh energy below which this optimization has converged. Defaults
+            to 7.5.
+        fix_bounds : bool
+            ``True`` only if tri verts on the boundary are *not* to be moved.
+            Defaults to ``True``.
+        incremental : bool
+            ``True`` only if this mesh is to be rebuilt only on steps changing
+            its topology, as detected by the :meth:`_get_lloyd_topology`
+            method. On all other steps, only the circumcentres, centroids and
+            Voronoi cell centroids required by this optimization are updated
+            in a vectorized manner, leaving all other mesh data stale. Callers
+            are thus required to call :meth:`pre_mesh` after this method.
+            Defaults to ``False``, in which case this mesh is fully rebuilt on
+            each step.
+        '''
 
         # if self.mesh_type == 'tri':
 
@@ -2249,6 +2210,12 @@ class DECMesh(object):
         ui = self.mesh_quality_calc()
         UU = np.sum(ui)/self.cell_radius**2
 
+        # If incrementally optimizing, record the topology of this mesh and
+        # the number of steps rebuilding this mesh.
+        if incremental:
+            self._init_lloyd_topology()
+            rebuilds_count = 0
+
         for i in opti_steps:
 
             self.removed_bad_verts = False  # reset flag for empty tri_vert removal
@@ -2266,7 +2233,18 @@ class DECMesh(object):
                 else:
                     self.tri_verts = self.vor_cents*1
 
-                self.pre_mesh()
+                # If incrementally optimizing *AND* the topology of this mesh
+                # is unchanged, update only the geometry of this mesh.
+                if incremental and np.array_equal(
+                    self._lloyd_topology, self._get_lloyd_topology()):
+                    self._update_lloyd_geometry()
+                # Else, rebuild this mesh.
+                else:
+                    self.pre_mesh()
+
+                    if incremental:
+                        self._init_lloyd_topology()
+                        rebuilds_count += 1
 
                 ui = self.mesh_quality_calc()
 
@@ -2288,6 +2266,232 @@ class DECMesh(object):
                 # Halt this optimization.
                 break
 
+        if incremental:
+            logs.log_info(
+                'Incremental mesh optimization rebuilt the mesh '
+                'on %d step(s).', rebuilds_count)
+
+
+    def _init_lloyd_topology(self) -> None:
+        '''
+        Record the topology of the current mesh for subsequent incremental
+        optimization steps, which are required to have been preceded by a
+        call to the :meth:`pre_mesh` method.
+
+        Specifically, this method records both the key returned by the
+        :meth:`_get_lloyd_topology` method and the sources of the verts of
+        each Voronoi cell: the circumcentres (or centroids) of all simplices
+        containing the tri vert of that cell *and*, for tri verts on the
+        hull, the reflections of these points across all boundary tri edges
+        containing that tri vert.
+        '''
+
+        self._lloyd_topology = self._get_lloyd_topology()
+
+        # Flatten all (tri vert, simplex) pairs.
+        cells_i, verts_i, _ = _flatten_cells(self.tri_cells)
+
+        # Tri verts and simplices of all boundary tri edges.
+        bedges = self.tri_edges[np.asarray(self.bflags_tedges, dtype=int)]
+        self._lloyd_bedge_verts = bedges.astype(int).reshape((-1, 2))
+        self._lloyd_bedge_cells = np.asarray([
+            self.tedges_to_tcell[tei][0] for tei in self.bflags_tedges],
+            dtype=int)
+
+        # Flatten all (tri vert, source) pairs, where sources index the array
+        # of all simplex points followed by all reflected boundary points.
+        vcell_sources = np.unique(np.vstack((
+            np.column_stack((verts_i, cells_i)),
+            np.column_stack((
+                self._lloyd_bedge_verts.ravel(),
+                np.repeat(self.n_tcell + np.arange(len(bedges)), 2))),
+        )), axis=0)
+        self._lloyd_vcell_tverts = vcell_sources[:, 0]
+        self._lloyd_vcell_sources = vcell_sources[:, 1]
+
+
+    def _get_lloyd_topology(self) -> np.ndarray:
+        '''
+        One-dimensional Numpy array uniquely identifying the topology that the
+        :meth:`pre_mesh` method would produce for the current tri verts,
+        computed in a vectorized manner without rebuilding this mesh.
+
+        This array concatenates whether any tri verts are close enough to be
+        removed with either (if merging simplices into quads) the sorted
+        verts of all cells produced by this merging *or* (otherwise) the
+        sorted simplices of the Delaunay triangulation of all tri verts and
+        whether the alpha shape and image mask (if any) retain each such
+        simplex. Since this array is independent of the order of these cells,
+        this order may differ between meshes sharing the same topology.
+        '''
+
+        # Whether any tri verts are close enough to be removed.
+        tri_tree = cKDTree(self.tri_verts)
+        di, _ = tri_tree.query(self.tri_verts, k=2)
+        is_close = np.any(di[:, 1]/self.cell_radius < self.close_thresh)
+
+        # Delaunay triangulation of all tri verts.
+        simplices = Delaunay(self.tri_verts).simplices
+        ccents_x, ccents_y, rcircs = _get_circumcircles(
+            self.tri_verts[simplices[:, 0]],
+            self.tri_verts[simplices[:, 1]],
+            self.tri_verts[simplices[:, 2]])
+
+        # Whether each simplex is retained by both the alpha shape and the
+        # image mask (if any).
+        is_kept = np.ones(len(simplices), dtype=bool)
+        if self.use_alpha_shape:
+            is_kept = rcircs < (self.cell_radius) / self.alpha_shape
+
+            if self.image_mask is not None:
+                is_kept[is_kept] = [
+                    self.image_mask.clipping_function(vx, vy) != 0.0
+                    for vx, vy in zip(ccents_x[is_kept], ccents_y[is_kept])
+                ]
+
+        topology = [[is_close], simplices.ravel(), is_kept]
+
+        # If merging simplices into quads, replace these simplices by the
+        # cells produced by merging these simplices in the same manner as the
+        # merge_tri_mesh() method. Since this merging depends on the order of
+        # these simplices, these cells are sorted only after this merging.
+        if self.allow_merging or self.mesh_type == 'quad':
+            simplices = simplices[is_kept]
+            merge_marks = np.full(len(simplices), -1, dtype=int)
+
+            # Mark simplices for merging in the same manner as the
+            # create_tri_mesh() method.
+            if len(simplices) > 1:
+                ccents = np.column_stack((ccents_x[is_kept], ccents_y[is_kept]))
+                dm, nm = cKDTree(ccents).query(ccents, k=2)
+                is_mark = (
+                    np.ones(len(simplices), dtype=bool)
+                    if self.mesh_type == 'quad' else
+                    dm[:, 1] < self.cell_radius * self.merge_thresh)
+                merge_marks[is_mark] = nm[is_mark, 1]
+
+            cells = []
+            free_to_merge = set(range(len(simplices)))
+
+            for ai, bi in enumerate(merge_marks):
+                if bi < 0:
+                    cells.append(simplices[ai])
+                    free_to_merge.discard(ai)
+                elif ai in free_to_merge:
+                    if bi in free_to_merge:
+                        quad_merged = self._get_quad_merged(
+                            simplices[ai], simplices[bi])
+
+                        if quad_merged is not None:
+                            if quad_merged[2]:
+                                cells.append(quad_merged[0])
+                            else:
+                                cells.extend((simplices[ai], simplices[bi]))
+
+                            free_to_merge.remove(ai)
+                            free_to_merge.remove(bi)
+                    else:
+                        cells.append(simplices[ai])
+                        free_to_merge.remove(ai)
+
+            # Sorted cells, each padded with -1 to the length of a quad.
+            cells = np.asarray([
+                sorted(cell) + [-1]*(4 - len(cell)) for cell in cells],
+                dtype=int).reshape((-1, 4))
+            cells = cells[np.lexsort(cells.T[::-1])]
+            topology = [[is_close], cells]
+        # Else, sort these simplices to be independent of their order.
+        else:
+            simplices = np.sort(simplices, axis=1)
+            simplices_sorted = np.lexsort(simplices.T[::-1])
+            topology = [
+                [is_close], simplices[simplices_sorted],
+                is_kept[simplices_sorted]]
+
+        return np.hstack([
+            np.asarray(topology_part, dtype=int).ravel()
+            for topology_part in topology
+        ])
+
+
+    def _update_lloyd_geometry(self) -> None:
+        '''
+        Update the circumcentres, centroids and Voronoi cell centroids of the
+        current mesh for the current tri verts, assuming the topology of this
+        mesh recorded by the :meth:`_init_lloyd_topology` method to be
+        unchanged.
+
+        All other mesh data is left stale.
+        '''
+
+        # Flatten all verts of all simplices.
+        cells_i, verts_i, _ = _flatten_cells(self.tri_cells)
+        cells_len = np.bincount(cells_i, minlength=self.n_tcell)
+        cells_start = np.cumsum(cells_len) - cells_len
+
+        # Re-sort the verts of all quads counter-clockwise about the mean of
+        # these verts in the same manner as the _get_quad_merged() method,
+        # as these tri verts may have since moved.
+        quads_n = (cells_len == 4).nonzero()[0]
+        if len(quads_n):
+            quads_verts_i = cells_start[quads_n][:, None] + np.arange(4)
+            quads_verts = np.sort(verts_i[quads_verts_i], axis=1)
+            quads_pts = self.tri_verts[quads_verts]
+            quads_rel = quads_pts - quads_pts.mean(axis=1, keepdims=True)
+            quads_angles = np.arctan2(quads_rel[:, :, 1], quads_rel[:, :, 0])
+            verts_i = verts_i.copy()
+            verts_i[quads_verts_i] = np.take_along_axis(
+                quads_verts, np.argsort(quads_angles, axis=1), axis=1)
+
+        # Centroids of all simplices.
+        self.tri_cents, _ = _get_polygons_centroid(
+            self.tri_verts[verts_i], cells_i, self.n_tcell)
+
+        # Circumcentres of all tri and quad simplices, respectively.
+        tri_ccents = np.zeros((self.n_tcell, 2))
+
+        for verts_count in (3, 4):
+            cells_n = (cells_len == verts_count).nonzero()[0]
+            pts = [
+                self.tri_verts[verts_i[cells_start[cells_n] + vert_i]]
+                for vert_i in range(verts_count)
+            ]
+
+            if verts_count == 3:
+                ccents_x, ccents_y, _ = _get_circumcircles(*pts)
+                tri_ccents[cells_n] = np.column_stack((ccents_x, ccents_y))
+            else:
+                tri_ccents[cells_n] = _get_quad_circumcentres(*pts)
+
+        self.tri_ccents = tri_ccents
+
+        # Points of all simplices, followed by the reflections of these points
+        # across all boundary tri edges.
+        cells_pts = self.tri_cents if self.use_centroids else self.tri_ccents
+        bedge_mids = np.mean(self.tri_verts[self._lloyd_bedge_verts], axis=1)
+        sources_pts = np.vstack((
+            cells_pts,
+            2*bedge_mids - cells_pts[self._lloyd_bedge_cells],
+        ))
+
+        # Verts of all Voronoi cells, sorted counter-clockwise about the mean
+        # of the verts of each cell.
+        vcell_tverts = self._lloyd_vcell_tverts
+        vcell_pts = sources_pts[self._lloyd_vcell_sources]
+        vcell_count = np.bincount(vcell_tverts, minlength=self.n_tverts)
+        vcell_mean = np.column_stack([
+            np.bincount(vcell_tverts, vcell_pts[:, axis], self.n_tverts)
+            for axis in (0, 1)
+        ]) / vcell_count[:, None]
+        vcell_angles = np.arctan2(
+            vcell_pts[:, 1] - vcell_mean[vcell_tverts, 1],
+            vcell_pts[:, 0] - vcell_mean[vcell_tverts, 0])
+        vcell_sorted = np.lexsort((vcell_angles, vcell_tverts))
+
+        # Centroids of all Voronoi cells.
+        self.vor_cents, _ = _get_polygons_centroid(
+            vcell_pts[vcell_sorted], vcell_tverts[vcell_sorted], self.n_tverts)
+
 
     def clip_to_curve(self, imagemask):
         '''
@@ -2304,25 +2508,21 @@ class DECMesh(object):
 
         self.removed_bad_verts = False # reset flag for empty tri_vert removal
 
+        # See if each voronoi vert is within the clip curve boundary. Since
+        # voronoi verts are shared between neighbouring cells, the clipping
+        # function is evaluated only once for each such vert.
+        vor_verts_check = np.array([
+            1.0 if imagemask.clipping_function(pnt[0], pnt[1]) != 0.0 else 0.0
+            for pnt in self.vor_verts
+        ])
+
         for ii, (poly_ind, cell_poly, vor_cent) in enumerate(zip(self.vor_cells,
                                                                  self.vcell_verts,
                                                                  self.vor_cents)):
 
-            # see if voronoi cell center is within the clip curve boundary:
-            cent_val = imagemask.clipping_function(vor_cent[0], vor_cent[1])
-            if cent_val != 0.0:
-                cent_val = 1.0
-
             if len(poly_ind) >= 3:
                 cell_polya = cell_poly.tolist()
-                point_check = np.zeros(len(cell_poly))
-
-                for i, pnt in enumerate(cell_poly):
-
-                    point_val = imagemask.clipping_function(pnt[0], pnt[1])
-
-                    if point_val != 0.0:
-                        point_check[i] = 1.0
+                point_check = vor_verts_check[np.asarray(poly_ind, dtype=int)]
 
                 if point_check.sum() == len(cell_poly):  # if all points are all inside the clipping zone
 
@@ -2330,9 +2530,11 @@ class DECMesh(object):
                     cx, cy = self.poly_centroid(cell_polya)
                     clip_vor_cents.append([cx, cy])
 
-                # the region's points are in the clipping func range, and the voronoi cent lays in the bound:
+                # the region's points are in the clipping func range, and the voronoi cent lays in the bound
+                # (only seeing if the voronoi cell center is within the clip curve boundary if needed):
                 elif point_check.sum() > 0.0 and point_check.sum() < len(
-                        cell_poly) and cent_val == 1.0:
+                        cell_poly) and imagemask.clipping_function(
+                            vor_cent[0], vor_cent[1]) != 0.0:
 
                     clip_poly = clip_counterclockwise(
                         cell_poly, imagemask.clipcurve)
@@ -2387,20 +2589,19 @@ class DECMesh(object):
             logs.log_info("Smoothing mesh...")
             self.removed_bad_verts = False # reset flag for empty tri_vert removal
 
-            II = np.diag(np.ones(self.n_tverts)) # Identity matrix
-            HH2 = np.diag(1 / self.vor_sa)  # Hodge star 20
-            HH1 = np.diag(self.vor_edge_len / self.tri_edge_len) # Hodge star 11
-
-            term1 = np.dot(HH2, -self.delta_tri_0.T)
-            term2 = np.dot(HH1, self.delta_tri_0)
+            II = identity(self.n_tverts, format='csr') # Identity matrix
 
-            LL = np.dot(term1, term2) # Forwards Laplacian operator
+            # Forwards Laplacian operator with Hodge stars 20 and 11:
+            LL = make_dec_laplacian(
+                self.delta_tri_0,
+                self.vor_edge_len / self.tri_edge_len,
+                self.vor_sa)
 
             MM = (II - stepsize * LL)    # Matrix equation from diffusion equation
-            MM_inv = np.linalg.pinv(MM)  # Least-squares solution matrix
+            MM_inv = SparseFactorSolver(MM)  # Sparse least-squares solver
 
-            self.tri_verts[:,0] = np.dot(MM_inv, self.tri_verts[:,0]) # Implicit Euler update solution
-            self.tri_verts[:,1] = np.dot(MM_inv, self.tri_verts[:,1])
+            self.tri_verts[:,0] = MM_inv.solve(self.tri_verts[:,0]) # Implicit Euler update solution
+            self.tri_verts[:,1] = MM_inv.solve(self.tri_verts[:,1])
 
 
             # # # Laplacian smoothing of the mesh using explicit Euler:
@@ -2684,8 +2885,13 @@ class DECMesh(object):
         self.tri_mids_o = self.tri_mids*1
         self.tri_edge_i_o = self.tri_edge_i*1
 
-        # Array of tedge_verts.
-        tedge_verts = self.tri_verts[self.tri_edges]
+        # Index translation table mapping the index of each retained tri-vert
+        # to its new index (and each removed tri-vert to -1).
+        tvert_is_kept = np.ones(len(self.tri_verts), dtype=bool)
+        tvert_is_kept[tvert_targets] = False
+        tvert_new_inds = np.full(len(self.tri_verts), -1, dtype=int)
+        tvert_new_inds[tvert_is_kept] = np.arange(
+            np.count_nonzero(tvert_is_kept))
 
         # Get tri-cell indices for tri-cells that will be removed.
         tcell_targets = []
@@ -2702,15 +2908,16 @@ class DECMesh(object):
         self.tri_cents = np.delete(self.tri_cents, tcell_targets, axis=0)  # centroids
         self.tri_sa = np.delete(self.tri_sa, tcell_targets, axis=0)  # surface area of triangle
 
-        # Reconstruct index packages in terms of new tri vertice indices.
-        tri_vtree = cKDTree(self.tri_verts)
-
-        self.tri_cells = []
+        # Reconstruct index packages in terms of new tri vertice indices. Since
+        # all removed tri-cells are those containing a removed tri-vert, every
+        # retained tri-cell contains only retained tri-verts.
+        tri_cells = np.delete(self.tri_cells, tcell_targets, axis=0)
+        tcell_lens = [len(tverts) for tverts in tri_cells]
+        tcell_tverts = np.concatenate(list(tri_cells)).astype(int)
 
-        for tvrts in self.tcell_verts:
-            self.tri_cells.append(tri_vtree.query(tvrts)[1])
-
-        self.tri_cells = np.asarray(self.tri_cells, dtype=object)
+        self.tri_cells = np.asarray(np.split(
+            tvert_new_inds[tcell_tverts], np.cumsum(tcell_lens)[:-1]),
+            dtype=object)
 
         self.n_tverts = len(self.tri_verts)  # number of tri_verts
         self.tri_vert_i = np.linspace(
@@ -2729,16 +2936,11 @@ class DECMesh(object):
             tedge_targs.extend(sublist)
         tedge_targs = np.unique(tedge_targs)
 
-        tedge_verts = np.delete(tedge_verts, tedge_targs, axis=0)
-        tri_edges = []
-
-        # Reconstruct edges in terms of new tri_vert array inds.
-        for everts in tedge_verts:
-            edge_inds = tri_vtree.query(everts)[1]
-            if len(edge_inds) == 2:
-                tri_edges.append(edge_inds)
-
-        self.tri_edges = np.asarray(tri_edges)
+        # Reconstruct edges in terms of new tri_vert array inds. Since all
+        # removed edges are those touching a removed tri-vert, every retained
+        # edge joins only retained tri-verts.
+        self.tri_edges = tvert_new_inds[
+            np.delete(self.tri_edges, tedge_targs, axis=0)]
 
         self.n_tedges = len(self.tri_edges)  # number of edges in trimesh
         self.tri_edge_i = np.linspace(
@@ -3259,3 +3461,242 @@ class DECMesh(object):
 
 
 
+
+# ....................{ PRIVATE ~ geometry                 }....................
+def _get_circumcircles(A: np.ndarray, B: np.ndarray, C: np.ndarray) -> tuple:
+    '''
+    3-tuple ``(ox, oy, rc)`` of one-dimensional Numpy arrays of the x and y
+    coordinates of the circumcentres and the circumradii of all triangles
+    whose vertices are the passed two-dimensional Numpy arrays of points,
+    vectorizing the :meth:`DECMesh.circumc` method.
+    '''
+
+    Ax, Ay = A[:, 0], A[:, 1]
+    Bx, By = B[:, 0], B[:, 1]
+    Cx, Cy = C[:, 0], C[:, 1]
+
+    A2 = Ax ** 2 + Ay ** 2
+    B2 = Bx ** 2 + By ** 2
+    C2 = Cx ** 2 + Cy ** 2
+
+    denom = 2 * (Ax * (By - Cy) + Bx * (Cy - Ay) + Cx * (Ay - By))
+
+    ox = (A2 * (By - Cy) + B2 * (Cy - Ay) + C2 * (Ay - By)) / denom
+    oy = (A2 * (Cx - Bx) + B2 * (Ax - Cx) + C2 * (Bx - Ax)) / denom
+
+    a = np.sqrt((Ax - Bx) ** 2 + (Ay - By) ** 2)
+    b = np.sqrt((Bx - Cx) ** 2 + (By - Cy) ** 2)
+    c = np.sqrt((Cx - Ax) ** 2 + (Cy - Ay) ** 2)
+
+    s = (a + b + c) / 2.0
+    area = np.sqrt(np.maximum(s * (s - a) * (s - b) * (s - c), 0.0))
+
+    # Circumradii, defined as zero for degenerate triangles.
+    rc = np.zeros(len(area))
+    is_area = area > 0.0
+    rc[is_area] = a[is_area] * b[is_area] * c[is_area] / (4.0 * area[is_area])
+
+    return ox, oy, rc
+
+
+def _get_quad_circumcentres(
+    A: np.ndarray, B: np.ndarray, C: np.ndarray, D: np.ndarray) -> np.ndarray:
+    '''
+    Two-dimensional Numpy array of the circumcentres of all cyclic
+    quadrilaterals whose vertices are the passed two-dimensional Numpy arrays
+    of points, vectorizing the :meth:`DECMesh.quad_circumc` method.
+    '''
+
+    a = np.linalg.norm(B - A, axis=1)
+    b = np.linalg.norm(C - B, axis=1)
+    c = np.linalg.norm(D - C, axis=1)
+    d = np.linalg.norm(A - D, axis=1)
+
+    s = (1 / 2) * (a + b + c + d)
+
+    area = np.sqrt((s - a) * (s - b) * (s - c) * (s - d))
+
+    R = (1 / 4) * (np.sqrt((a * c + b * d) * (a * d + b * c) * (a * b + c * d)) / area)
+
+    tand = (C - A) / np.linalg.norm(C - A, axis=1)[:, None]
+
+    return A + R[:, None] * tand
+
+
+def _get_polygons_centroid(
+    points: np.ndarray, polys_i: np.ndarray, polys_count: int) -> tuple:
+    '''
+    2-tuple ``(centroids, areas)`` of the centroids and signed areas of all
+    polygons whose vertices are the passed points, vectorizing the
+    :meth:`DECMesh.poly_centroid` and :meth:`DECMesh.area` methods.
+
+    Parameters
+    ----------
+    points : np.ndarray
+        Two-dimensional Numpy array of the vertices of all polygons, grouped
+        contiguously by polygon in the order of the vertices of each polygon.
+    polys_i : np.ndarray
+        One-dimensional Numpy array of the index of the polygon of each such
+        vertex, sorted in ascending order.
+    polys_count : int
+        Number of polygons.
+    '''
+
+    # Index of the next vertex of the same polygon as each vertex.
+    polys_len = np.bincount(polys_i, minlength=polys_count)
+    polys_start = np.cumsum(polys_len) - polys_len
+    verts_pos = np.arange(len(polys_i)) - polys_start[polys_i]
+    points_next = points[polys_start[polys_i] + (
+        (verts_pos + 1) % polys_len[polys_i])]
+
+    x, y = points[:, 0], points[:, 1]
+    x_next, y_next = points_next[:, 0], points_next[:, 1]
+    cross = x * y_next - x_next * y
+
+    areas = (1 / 2) * np.bincount(polys_i, cross, polys_count)
+
+    # Centroids, defined as the mean of all vertices for degenerate polygons.
+    centroids = np.column_stack((
+        np.bincount(polys_i, (x + x_next) * cross, polys_count),
+        np.bincount(polys_i, (y + y_next) * cross, polys_count),
+    ))
+    is_area = areas != 0.0
+    centroids[is_area] /= 6 * areas[is_area, None]
+    centroids[~is_area] = np.column_stack([
+        np.bincount(polys_i, points[:, axis], polys_count)
+        for axis in (0, 1)
+    ])[~is_area] / np.maximum(polys_len[~is_area, None], 1)
+
+    return centroids, areas
+
+# ....................{ PRIVATE ~ utilities                }....................
+def _flatten_cells(cells, vert_step: int = 1) -> tuple:
+    '''
+    3-tuple ``(cells_i, verts_i, verts_j)`` of one-dimensional Numpy arrays
+    flattening all vertex pairs of the passed (possibly ragged) cells, each of
+    which is a sequence of vertex indices, in cell and then vertex order.
+
+    For each such pair, ``cells_i`` is the index of the cell containing that
+    pair, ``verts_i`` the index of the first vertex of that pair, and
+    ``verts_j`` the index of the vertex ``vert_step`` positions after that
+    vertex in that cell (cyclically).
+    '''
+
+    # If these cells are non-ragged, flatten these cells trivially.
+    if (
+        isinstance(cells, np.ndarray) and
+        cells.ndim == 2 and
+        cells.dtype != object
+    ):
+        cells_len = np.full(cells.shape[0], cells.shape[1], dtype=int)
+        verts_i = cells.astype(int).ravel()
+    # Else, flatten these cells cell-by-cell.
+    else:
+        cells_len = np.array([len(cell) for cell in cells], dtype=int)
+        verts_i = (
+            np.hstack([np.asarray(cell, dtype=int) for cell in cells])
+            if len(cells_len) else np.zeros(0, dtype=int))
+
+    # Index of each cell and of the first vertex of each cell.
+    cells_start = np.cumsum(cells_len) - cells_len
+    cells_i = np.repeat(np.arange(len(cells_len)), cells_len)
+
+    # Index of the vertex paired with each vertex in the same cell.
+    verts_pos = np.arange(len(verts_i)) - cells_start[cells_i]
+    verts_j = verts_i[cells_start[cells_i] + (
+        (verts_pos + vert_step) % cells_len[cells_i])]
+
+    return cells_i, verts_i, verts_j
+
+
+def _group_by(keys: np.ndarray, values: np.ndarray, groups_count: int) -> list:
+    '''
+    List of ``groups_count`` lists, the ``k``-th of which lists all passed
+    values whose corresponding passed key is ``k`` in their passed order.
+    '''
+
+    keys = np.asarray(keys, dtype=int)
+    values_sorted = np.asarray(values)[np.argsort(keys, kind='stable')]
+    groups_end = np.cumsum(np.bincount(keys, minlength=groups_count))
+
+    return [
+        group.tolist()
+        for group in np.split(values_sorted, groups_end[:-1])
+    ]
+
+
+def _find_edges(edges: np.ndarray, edges_query: np.ndarray) -> np.ndarray:
+    '''
+    One-dimensional Numpy array of the index in the passed edges of each
+    passed queried edge if found *or* -1 otherwise, found by binary search on
+    a table of these edges sorted by vertex indices.
+
+    Edges are directed, such that the edge ``(vi, vj)`` is distinct from the
+    edge ``(vj, vi)``. Where an edge is duplicated, the first such edge is
+    found.
+    '''
+
+    edges = np.asarray(edges, dtype=int).reshape((-1, 2))
+    edges_query = np.asarray(edges_query, dtype=int).reshape((-1, 2))
+
+    # If no edges are to be searched, no queried edges are found.
+    if not len(edges):
+        return np.full(len(edges_query), -1, dtype=int)
+
+    # Unique key of each edge, sorted.
+    verts_count = max(edges.max(initial=0), edges_query.max(initial=0)) + 1
+    edges_key = edges[:, 0]*verts_count + edges[:, 1]
+    edges_sorted = np.argsort(edges_key, kind='stable')
+    edges_key_sorted = edges_key[edges_sorted]
+
+    # Position of the key of each queried edge in these sorted keys.
+    query_key = edges_query[:, 0]*verts_count + edges_query[:, 1]
+    query_pos = np.minimum(
+        np.searchsorted(edges_key_sorted, query_key), len(edges) - 1)
+
+    return np.where(
+        edges_key_sorted[query_pos] == query_key,
+        edges_sorted[query_pos], -1)
+
+
+def _get_edges_unique_and_hull(edges_all: set) -> tuple:
+    '''
+    2-tuple ``(edges_unique, edges_hull)`` of two-dimensional Numpy arrays
+    of the unique undirected edges and the directed boundary edges of the
+    mesh whose cells traverse the passed set of all directed edges.
+
+    Boundary edges are those traversed in only one direction, as interior
+    edges are traversed once in each direction by the two cells sharing
+    them. Of each pair of interior edges ``(vi, vj)`` and ``(vj, vi)``, the
+    edge first iterated by the passed set is retained. Unique edges are
+    ordered as iterated by a set of these retained edges, preserving the edge
+    ordering established by prior pure-Python implementations.
+    '''
+
+    # All directed edges in set iteration order.
+    edges = np.array(list(edges_all), dtype=int).reshape((-1, 2))
+
+    # Position in this order of the reverse of each edge if any *OR* -1.
+    edges_rev_pos = _find_edges(edges, edges[:, ::-1])
+
+    # Boundary edges and retained edges.
+    is_hull = edges_rev_pos < 0
+    is_unique = is_hull | (np.arange(len(edges)) < edges_rev_pos)
+
+    edges_unique = np.asarray(list(set(map(tuple, edges[is_unique].tolist()))))
+
+    return edges_unique, edges[is_hull]
+
+
+def _find_edges_undirected(
+    edges: np.ndarray, edges_query: np.ndarray) -> np.ndarray:
+    '''
+    One-dimensional Numpy array of the index in the passed edges of each
+    passed queried edge in either direction, preferring the queried direction.
+    '''
+
+    edges_query = np.asarray(edges_query, dtype=int).reshape((-1, 2))
+    edges_i = _find_edges(edges, edges_query)
+    edges_rev_i = _find_edges(edges, edges_query[:, ::-1])
+
+    return np.where(edges_i >= 0, edges_i, edges_rev_i)
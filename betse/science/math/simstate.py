@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+# --------------------( LICENSE                           )--------------------
+# Copyright 2014-2023 by Alexis Pietak & Cecil Curry.
+# See "LICENSE" for further details.
+
+'''
+High-level **simulation state snapshot** (i.e., restorable copy of the mutable
+state of a simulation at a single time) functionality.
+'''
+
+# ....................{ IMPORTS                           }....................
+import numpy as np
+from betse.util.type.types import type_check, IterableTypes
+
+# ....................{ CONSTANTS                         }....................
+_SIM_STATE_OBJECT_NAMES = ('gj_funk', 'endo_retic',)
+'''
+Tuple of the names of all attributes of the simulator referring to objects
+whose attributes are advanced by each time step (e.g., gap junction gating
+states) *or* ``None`` if the corresponding subsystem is disabled.
+'''
+
+
+_SIM_NETWORK_NAMES = ('molecules', 'grn',)
+'''
+Tuple of the names of all attributes of the simulator referring to networks
+(i.e., objects whose ``core`` attribute is a
+:class:`betse.science.chemistry.networks.MasterOfNetworks` instance) *or*
+``None`` if the corresponding network is disabled.
+'''
+
+# ....................{ CLASSES                           }....................
+class SimStateSnapshot(object):
+    '''
+    **Simulation state snapshot** (i.e., copy of the attributes of the
+    simulator and of all objects advanced by each time step of that simulator
+    at a single time, restorable to roll that simulator back to that time).
+
+    The state of each such object is the dictionary of its attributes, copying
+    each Numpy array attribute and referring to each other attribute as is.
+    Restoring this snapshot replaces the attributes of each such object by
+    copies of these attributes, such that this snapshot may be restored
+    repeatedly. These objects are:
+
+    * The simulator itself.
+    * The tissue handler ``phase.dyna``, if passed.
+    * The gap junction gating object ``sim.gj_funk`` and endoplasmic
+      reticulum ``sim.endo_retic``, if enabled.
+    * Each enabled network of the simulator together with its molecules,
+      channels, and channel cores (e.g., voltage-gated gating states).
+
+    Attributes
+    ----------
+    _names_ignored : frozenset
+        Set of the names of all Numpy array attributes referred to as is
+        rather than copied.
+    _objs_state : list
+        List of 2-tuples ``(obj, obj_state)`` of each such object and the
+        dictionary of its attributes at the time of this snapshot, the first of
+        which is the simulator.
+    '''
+
+    # ..................{ INITIALIZERS                      }..................
+    @type_check
+    def __init__(
+        self,
+        sim: object,
+        dyna: object = None,
+        names_ignored: IterableTypes = (),
+    ) -> None:
+        '''
+        Snapshot the current state of the passed simulator.
+
+        Parameters
+        ----------
+        sim : betse.science.sim.Simulator
+            Current simulator.
+        dyna : betse.science.tissue.tishandler.TissueHandler
+            Current tissue handler whose state is also snapshotted *or*
+            ``None`` if this handler is unmodified by time steps. Defaults to
+            ``None``.
+        names_ignored : IterableTypes
+            Iterable of the names of all Numpy array attributes of the
+            simulator to be referred to as is rather than copied (e.g., sampled
+            time series, which are only written at sampled time steps).
+            Defaults to the empty tuple.
+        '''
+
+        self._names_ignored = frozenset(names_ignored)
+        self._objs_state = [
+            (obj, _get_obj_state(obj, self._names_ignored))
+            for obj in _iter_sim_state_objs(sim, dyna)
+        ]
+
+    # ..................{ RESTORERS                         }..................
+    def restore(self) -> None:
+        '''
+        Restore all objects of this snapshot to their state at the time of
+        this snapshot.
+        '''
+
+        for obj, obj_state in self._objs_state:
+            obj_vars = vars(obj)
+            obj_vars.clear()
+            obj_vars.update(_get_obj_state_copy(obj_state, self._names_ignored))
+
+# ....................{ PRIVATE ~ getters                 }....................
+def _get_obj_state(obj: object, names_ignored: frozenset) -> dict:
+    '''
+    Dictionary of the attributes of the passed object, copying each Numpy
+    array attribute whose name is *not* in the passed set.
+    '''
+
+    return _get_obj_state_copy(vars(obj), names_ignored)
+
+
+def _get_obj_state_copy(obj_state: dict, names_ignored: frozenset) -> dict:
+    '''
+    Shallow copy of the passed dictionary of the attributes of an object,
+    copying each Numpy array attribute whose name is *not* in the passed set.
+    '''
+
+    return {
+        attr_name: (
+            np.array(attr_value, copy=True)
+            if (type(attr_value) is np.ndarray and
+                attr_name not in names_ignored) else
+            attr_value
+        )
+        for attr_name, attr_value in obj_state.items()
+    }
+
+# ....................{ PRIVATE ~ iterators               }....................
+def _iter_sim_state_objs(sim: object, dyna: object) -> (
+    'collections.abc.Generator'):
+    '''
+    Generator yielding the passed simulator followed by each object whose
+    attributes are advanced by each time step of that simulator.
+    '''
+
+    yield sim
+
+    if dyna is not None:
+        yield dyna
+
+    for obj_name in _SIM_STATE_OBJECT_NAMES:
+        obj = getattr(sim, obj_name, None)
+        if obj is not None:
+            yield obj
+
+    for network_name in _SIM_NETWORK_NAMES:
+        network = getattr(sim, network_name, None)
+        if network is not None:
+            yield from network.core.iter_state_objs()
@@ -0,0 +1,471 @@
+#!/usr/bin/env python3
+# --------------------( LICENSE                           )--------------------
+# Copyright 2014-2023 by Alexis Pietak & Cecil Curry.
+# See "LICENSE" for further details.
+
+'''
+Low-level **sparse solver** (i.e., objects caching a sparse factorization of a
+linear operator and efficiently applying the pseudo-inverse of that operator to
+arbitrary right-hand sides) facilities.
+
+These solvers replace the dense :func:`numpy.linalg.pinv` matrices previously
+precomputed for Poisson equations on both the cell cluster and environmental
+grid. Whereas those dense matrices required ``O(N**3)`` time to compute and
+``O(N**2)`` time and space to apply and store, these solvers require roughly
+``O(N)`` space and ``O(N)`` to ``O(N**1.5)`` time to both factorize and apply
+for the sparse Laplacian-like operators of interest.
+'''
+
+# ....................{ IMPORTS                           }....................
+from abc import ABCMeta, abstractmethod
+import numpy as np
+from betse.util.io.log import logs
+from numpy import ndarray
+from scipy.sparse import csc_matrix, csr_matrix, diags, issparse
+from scipy.sparse.csgraph import connected_components
+from scipy.sparse.linalg import splu
+
+# ....................{ SUPERCLASSES                      }....................
+class SparseSolverABC(object, metaclass=ABCMeta):
+    '''
+    Abstract base class of all sparse solvers.
+
+    Each sparse solver effectively replaces a dense matrix ``Ainv`` previously
+    precomputed as the pseudo-inverse of some linear operator ``A``, such that
+    calling ``solver.solve(rhs)`` yields the same result as the dense matrix
+    product ``np.dot(Ainv, rhs)`` (to within floating point roundoff).
+
+    Attributes
+    ----------
+    shape : tuple
+        2-tuple ``(m, n)`` of the shape of the dense pseudo-inverse matrix
+        emulated by this solver, such that :meth:`solve` accepts right-hand
+        sides of length ``n`` and returns solutions of length ``m``.
+    '''
+
+    # ..................{ INITIALIZERS                      }..................
+    def __init__(self, shape: tuple) -> None:
+        '''
+        Initialize this sparse solver.
+
+        Parameters
+        ----------
+        shape : tuple
+            2-tuple ``(m, n)`` of the shape of the dense pseudo-inverse matrix
+            emulated by this solver.
+        '''
+
+        self.shape = shape
+
+    # ..................{ SOLVERS                           }..................
+    @abstractmethod
+    def solve(self, rhs: ndarray) -> ndarray:
+        '''
+        Apply the pseudo-inverse of the operator underlying this solver to the
+        passed right-hand side.
+
+        Parameters
+        ----------
+        rhs : ndarray
+            Either a one-dimensional Numpy array of length ``n`` *or* a
+            two-dimensional Numpy array whose first dimension has length ``n``,
+            in which case each column is solved for independently.
+
+        Returns
+        ----------
+        ndarray
+            Solution of the same dimensionality as the passed right-hand side
+            whose first dimension has length ``m``.
+        '''
+
+        pass
+
+# ....................{ SUBCLASSES                        }....................
+class SparseFactorSolver(SparseSolverABC):
+    '''
+    Sparse solver applying the pseudo-inverse of a square sparse matrix via a
+    cached sparse LU factorization of that matrix.
+
+    This solver supports both non-singular matrices (e.g., Laplacians with
+    Dirichlet boundary conditions) *and* singular Laplacian-like matrices whose
+    rows and columns sum to zero over each connected component of their
+    sparsity graph (e.g., Laplacians with Neumann boundary conditions), whose
+    null space is thus spanned by the component-wise constant vectors. In the
+    latter case, this solver grounds one vertex of each such component,
+    projects the right-hand side onto the range of this matrix, and projects
+    the solution onto the orthogonal complement of this null space, exactly
+    reproducing the minimum-norm least-squares solution returned by the dense
+    pseudo-inverse of this matrix.
+
+    Attributes
+    ----------
+    matrix : csr_matrix
+        Square sparse matrix whose pseudo-inverse this solver applies.
+    _comps_mask : ndarray
+        One-dimensional Numpy array of the indices of all matrix rows residing
+        in singular connected components.
+    _comps_sum : csr_matrix
+        Sparse indicator matrix of size ``c x n`` for ``c`` the number of
+        singular connected components such that each item ``[i, j]`` is 1 only
+        if the ``j``-th row resides in the ``i``-th such component.
+    _comps_size : ndarray
+        One-dimensional Numpy array of the number of rows in each singular
+        connected component.
+    _ground_inds : ndarray
+        One-dimensional Numpy array of the index of the grounded row of each
+        singular connected component.
+    _lu : scipy.sparse.linalg.SuperLU
+        Sparse LU factorization of this matrix after grounding all singular
+        connected components.
+    _pinv : ndarray
+        Dense pseudo-inverse of this matrix if this matrix is singular in an
+        unsupported manner *or* ``None`` otherwise.
+    _tol : float
+        Tolerance below which row and column sums are considered to be zero.
+    '''
+
+    # ..................{ INITIALIZERS                      }..................
+    def __init__(self, matrix, tol: float = 1e-10) -> None:
+        '''
+        Factorize the passed square matrix.
+
+        Parameters
+        ----------
+        matrix : csr_matrix
+            Square sparse (or dense) matrix to be factorized.
+        tol : optional[float]
+            Tolerance relative to the magnitude of each row and column below
+            which the sum of that row or column is considered to be zero.
+            Defaults to ``1e-10``.
+        '''
+
+        # Coerce this matrix into sparse format.
+        self.matrix = csr_matrix(matrix, dtype=np.float64)
+
+        self._tol = tol
+
+        # Initialize our superclass.
+        super().__init__(shape=self.matrix.shape)
+
+        # Factorize this matrix.
+        self._factorize()
+
+    # ..................{ PICKLERS                          }..................
+    def __getstate__(self) -> dict:
+        '''
+        Pickle all attributes of this solver *except* the sparse LU
+        factorization of this matrix, which SciPy is unable to pickle.
+        '''
+
+        state = self.__dict__.copy()
+        state['_lu'] = None
+        return state
+
+
+    def __setstate__(self, state: dict) -> None:
+        '''
+        Unpickle all attributes of this solver and then refactorize this
+        matrix, which is typically much faster than unpickling an equivalent
+        dense pseudo-inverse.
+        '''
+
+        self.__dict__.update(state)
+
+        if self._pinv is None:
+            self._factorize()
+
+    # ..................{ FACTORIZERS                       }..................
+    def _factorize(self) -> None:
+        '''
+        Ground all singular connected components of this matrix and factorize
+        the resulting non-singular matrix.
+        '''
+
+        A = self.matrix
+        tol = self._tol
+        n = A.shape[0]
+
+        # Label each row by the connected component of the sparsity graph of
+        # this matrix containing that row.
+        _, comps = connected_components(
+            A, directed=True, connection='weak')
+
+        # Absolute and signed row and column sums of this matrix.
+        A_abs = abs(A)
+        row_abs = np.asarray(A_abs.sum(axis=1)).ravel()
+        col_abs = np.asarray(A_abs.sum(axis=0)).ravel()
+        row_sum = np.asarray(A.sum(axis=1)).ravel()
+        col_sum = np.asarray(A.sum(axis=0)).ravel()
+
+        # Boolean array flagging each row whose row and column sums are *NOT*
+        # effectively zero, implying its component to be non-singular.
+        is_nonzero = (
+            (np.abs(row_sum) > tol*row_abs) | (np.abs(col_sum) > tol*col_abs))
+
+        # Boolean array flagging each connected component as singular.
+        comps_singular = np.bincount(
+            comps, weights=is_nonzero.astype(np.float64)) == 0
+
+        # Indices and sizes of these components, relabelled to be contiguous.
+        comps_inds = np.flatnonzero(comps_singular)
+        self._comps_mask = np.flatnonzero(comps_singular[comps])
+        comps_label = np.searchsorted(comps_inds, comps[self._comps_mask])
+
+        self._comps_sum = csr_matrix(
+            (np.ones(len(self._comps_mask)), (comps_label, self._comps_mask)),
+            shape=(len(comps_inds), n))
+        self._comps_size = np.bincount(comps_label, minlength=len(comps_inds))
+
+        # Index of the first row of each such component, which is grounded.
+        _, ground_first = np.unique(comps_label, return_index=True)
+        self._ground_inds = self._comps_mask[ground_first]
+
+        # Ground these rows by zeroing their rows and columns and setting their
+        # diagonal entries to unity.
+        keep = np.ones(n)
+        keep[self._ground_inds] = 0.0
+        keep_diag = diags(keep)
+        A_grounded = keep_diag.dot(A).dot(keep_diag) + diags(1.0 - keep)
+
+        # Factorize this grounded matrix, falling back to the dense
+        # pseudo-inverse if this matrix is singular in an unsupported manner.
+        self._lu = None
+        self._pinv = None
+
+        try:
+            self._lu = splu(csc_matrix(A_grounded))
+        except RuntimeError as exception:
+            logs.log_debug(
+                'Sparse factorization failed (%s); '
+                'falling back to dense pseudo-inverse...', exception)
+            self._pinv = np.linalg.pinv(A.toarray())
+
+    # ..................{ SOLVERS                           }..................
+    def solve(self, rhs: ndarray) -> ndarray:
+
+        rhs = np.asarray(rhs, dtype=np.float64)
+
+        # If this matrix was *NOT* sparsely factorizable, defer to the dense
+        # pseudo-inverse.
+        if self._pinv is not None:
+            return np.dot(self._pinv, rhs)
+
+        # Project this right-hand side onto the range of this matrix and zero
+        # all grounded entries, solve, and project the solution onto the
+        # orthogonal complement of the null space of this matrix.
+        rhs = self._remove_comps_mean(rhs)
+        rhs[self._ground_inds] = 0.0
+
+        return self._remove_comps_mean(self._lu.solve(rhs))
+
+
+    def _remove_comps_mean(self, x: ndarray) -> ndarray:
+        '''
+        Copy of the passed array with the mean over each singular connected
+        component of this matrix subtracted from each entry of that component.
+        '''
+
+        x = np.array(x, dtype=np.float64)
+
+        if len(self._comps_size):
+            comps_mean = self._comps_sum.dot(x)
+
+            # Support both one- and two-dimensional arrays.
+            if x.ndim == 1:
+                comps_mean /= self._comps_size
+            else:
+                comps_mean /= self._comps_size[:, None]
+
+            x -= self._comps_sum.T.dot(comps_mean)
+
+        return x
+
+
+class SparseDECPoissonSolver(SparseSolverABC):
+    '''
+    Sparse solver applying the inverse of the Discrete Exterior Calculus (DEC)
+    Laplacian ``L = star_a^-1 (-d0^T) star_e d0`` defined on the vertices of a
+    mesh, computed as the product of the pseudo-inverses of the factors of this
+    Laplacian.
+
+    Specifically, this solver applies the operator::
+
+        pinv(d0) star_e^-1 (-pinv(d0)^T) star_a
+
+    where:
+
+    * ``d0`` is the sparse incidence matrix of size ``e x v`` mapping from the
+      ``v`` vertices onto the ``e`` edges of this mesh.
+    * ``star_e`` is the diagonal Hodge star of edge length ratios.
+    * ``star_a`` is the diagonal Hodge star of vertex areas.
+
+    Since ``pinv(d0) = G^+ d0^T`` for the graph Laplacian ``G = d0^T d0``, each
+    application reduces to two solves against the cached sparse factorization
+    of ``G`` and a few sparse matrix-vector products, exactly reproducing the
+    product of dense pseudo-inverses previously precomputed for this operator.
+
+    Attributes
+    ----------
+    delta : csr_matrix
+        Sparse incidence matrix ``d0``.
+    edge_ratio : ndarray
+        One-dimensional Numpy array of the diagonal of ``star_e``.
+    vert_area : ndarray
+        One-dimensional Numpy array of the diagonal of ``star_a``.
+    _graph_solver : SparseFactorSolver
+        Sparse solver applying the pseudo-inverse of ``G``.
+    '''
+
+    # ..................{ INITIALIZERS                      }..................
+    def __init__(
+        self, delta, edge_ratio: ndarray, vert_area: ndarray) -> None:
+        '''
+        Factorize the graph Laplacian of the passed incidence matrix.
+
+        Parameters
+        ----------
+        delta : csr_matrix
+            Sparse (or dense) incidence matrix ``d0``.
+        edge_ratio : ndarray
+            One-dimensional Numpy array of the diagonal of ``star_e``.
+        vert_area : ndarray
+            One-dimensional Numpy array of the diagonal of ``star_a``.
+        '''
+
+        self.delta = csr_matrix(delta, dtype=np.float64)
+        self.edge_ratio = np.asarray(edge_ratio, dtype=np.float64)
+        self.vert_area = np.asarray(vert_area, dtype=np.float64)
+
+        # Initialize our superclass.
+        n_verts = self.delta.shape[1]
+        super().__init__(shape=(n_verts, n_verts))
+
+        # Factorize the graph Laplacian of this incidence matrix.
+        self._graph_solver = SparseFactorSolver(self.delta.T.dot(self.delta))
+
+    # ..................{ SOLVERS                           }..................
+    def solve(self, rhs: ndarray) -> ndarray:
+
+        rhs = np.asarray(rhs, dtype=np.float64)
+
+        # Support both one- and two-dimensional arrays.
+        if rhs.ndim == 1:
+            vert_area = self.vert_area
+            edge_ratio = self.edge_ratio
+        else:
+            vert_area = self.vert_area[:, None]
+            edge_ratio = self.edge_ratio[:, None]
+
+        # -pinv(d0)^T star_a rhs, where pinv(d0)^T = d0 G^+.
+        flux = -self.delta.dot(self._graph_solver.solve(vert_area*rhs))
+
+        # pinv(d0) star_e^-1 flux, where pinv(d0) = G^+ d0^T.
+        return self._graph_solver.solve(self.delta.T.dot(flux/edge_ratio))
+
+class SparsePinvSolver(SparseSolverABC):
+    '''
+    Sparse solver applying the pseudo-inverse of a rectangular sparse matrix
+    ``A`` of size ``m x n`` (e.g., the incidence matrices of a Discrete
+    Exterior Calculus (DEC) mesh) *and* the transpose of that pseudo-inverse
+    via a cached sparse factorization of the Gram matrix of ``A``.
+
+    Specifically, this solver applies the identities::
+
+        pinv(A)   = (A^T A)^+ A^T      pinv(A)^T = A (A^T A)^+      if m >= n
+        pinv(A)   = A^T (A A^T)^+      pinv(A)^T = (A A^T)^+ A      if m <  n
+
+    where the smaller of the two Gram matrices ``A^T A`` and ``A A^T`` is
+    factorized by a :class:`SparseFactorSolver`. For the incidence matrices of
+    interest, this Gram matrix is either a graph Laplacian (whose null space is
+    spanned by the component-wise constant vectors) or non-singular, both of
+    which that solver supports.
+
+    Attributes
+    ----------
+    matrix : csr_matrix
+        Sparse matrix ``A`` whose pseudo-inverse this solver applies.
+    _gram_solver : SparseFactorSolver
+        Sparse solver applying the pseudo-inverse of the Gram matrix of ``A``.
+    _is_tall : bool
+        ``True`` only if ``A`` has at least as many rows as columns, in which
+        case the Gram matrix is ``A^T A`` rather than ``A A^T``.
+    '''
+
+    # ..................{ INITIALIZERS                      }..................
+    def __init__(self, matrix) -> None:
+        '''
+        Factorize the Gram matrix of the passed matrix.
+
+        Parameters
+        ----------
+        matrix : csr_matrix
+            Sparse (or dense) matrix ``A`` of size ``m x n``.
+        '''
+
+        self.matrix = csr_matrix(matrix, dtype=np.float64)
+
+        # Initialize our superclass with the shape of the pseudo-inverse.
+        n_rows, n_cols = self.matrix.shape
+        super().__init__(shape=(n_cols, n_rows))
+
+        # Factorize the smaller Gram matrix of this matrix.
+        self._is_tall = n_rows >= n_cols
+        self._gram_solver = SparseFactorSolver(
+            self.matrix.T.dot(self.matrix) if self._is_tall else
+            self.matrix.dot(self.matrix.T))
+
+    # ..................{ SOLVERS                           }..................
+    def solve(self, rhs: ndarray) -> ndarray:
+
+        rhs = np.asarray(rhs, dtype=np.float64)
+
+        if self._is_tall:
+            return self._gram_solver.solve(self.matrix.T.dot(rhs))
+        else:
+            return self.matrix.T.dot(self._gram_solver.solve(rhs))
+
+
+    def solve_transpose(self, rhs: ndarray) -> ndarray:
+        '''
+        Apply the transpose of the pseudo-inverse of the matrix underlying
+        this solver to the passed right-hand side, yielding the same result as
+        the dense matrix product ``np.dot(pinv(A).T, rhs)``.
+
+        Parameters
+        ----------
+        rhs : ndarray
+            Either a one-dimensional Numpy array of length ``n`` *or* a
+            two-dimensional Numpy array whose first dimension has length ``n``.
+
+        Returns
+        ----------
+        ndarray
+            Solution of the same dimensionality as the passed right-hand side
+            whose first dimension has length ``m``.
+        '''
+
+        rhs = np.asarray(rhs, dtype=np.float64)
+
+        if self._is_tall:
+            return self.matrix.dot(self._gram_solver.solve(rhs))
+        else:
+            return self._gram_solver.solve(self.matrix.dot(rhs))
+
+# ....................{ MAKERS                            }....................
+def make_dec_laplacian(delta, edge_ratio: ndarray, vert_area: ndarray):
+    '''
+    Sparse Discrete Exterior Calculus (DEC) Laplacian
+    ``L = star_a^-1 (-d0^T) star_e d0`` whose inverse is applied by the
+    :class:`SparseDECPoissonSolver` class given the same parameters.
+
+    Returns
+    ----------
+    csr_matrix
+        Sparse DEC Laplacian.
+    '''
+
+    if not issparse(delta):
+        delta = csr_matrix(delta)
+
+    return csr_matrix(
+        diags(1/vert_area).dot(-delta.T).dot(diags(edge_ratio)).dot(delta))
@@ -0,0 +1,664 @@
+#!/usr/bin/env python3
+# --------------------( LICENSE                           )--------------------
+# Copyright 2014-2023 by Alexis Pietak & Cecil Curry.
+# See "LICENSE" for further details.
+
+'''
+High-level **steady-state solving** (i.e., directly solving for the resting
+transmembrane voltages and ion concentrations of the full BETSE solver rather
+than time stepping towards them) functionality.
+'''
+
+# ....................{ IMPORTS                           }....................
+import numpy as np
+from betse.exceptions import BetseSimUnstableException
+from betse.science.math.simstate import SimStateSnapshot
+from betse.util.io.log import logs
+from betse.util.type.types import type_check, CallableTypes
+
+# ....................{ CONSTANTS                         }....................
+_CONC_ABSOLUTE = 1.0e-3
+'''
+Absolute scale in mmol/L added to the magnitude of each ion concentration when
+scaling that concentration into a dimensionless unknown.
+'''
+
+
+_VMEM_ABSOLUTE = 1.0e-3
+'''
+Absolute scale in volts added to the magnitude of each transmembrane voltage
+when scaling that voltage into a dimensionless unknown.
+'''
+
+
+_JACOBIAN_STEP = 1.0e-8
+'''
+Relative size of the perturbation of each scaled unknown when approximating
+the Jacobian by finite differences.
+'''
+
+
+_PSEUDO_TIME_STEP_INITIAL = 1.0
+'''
+Initial pseudo-time step-size in seconds of the first damped Newton iteration,
+subsequently grown as the residual shrinks.
+'''
+
+
+_PSEUDO_TIME_STEP_GROWTH_MIN = 2.0
+'''
+Minimum factor by which the pseudo-time step-size grows after each accepted
+damped Newton iteration.
+'''
+
+
+_PSEUDO_TIME_STEP_MAX = 1.0e12
+'''
+Maximum pseudo-time step-size in seconds of each damped Newton iteration,
+effectively reducing that iteration to an undamped Newton iteration.
+'''
+
+
+_RESIDUAL_GROWTH_MAX = 10.0
+'''
+Maximum factor by which the norm of the residual may grow over a damped Newton
+iteration before that iteration is retried with a smaller pseudo-time
+step-size.
+'''
+
+
+_PSEUDO_TIME_STEP_REJECTS_MAX = 8
+'''
+Maximum number of times each damped Newton iteration is retried with a
+quartered pseudo-time step-size before failing.
+'''
+
+# ....................{ CLASSES                           }....................
+class SteadyStateSolver(object):
+    '''
+    **Steady-state solver** (i.e., object solving for the fixed point of the
+    time step of the full BETSE solver by damped Newton iteration).
+
+    The unknowns of this solver are the intracellular ion concentrations
+    ``sim.cc_cells`` and extracellular ion concentrations ``sim.cc_env`` of all
+    moving ions *and*, if cells are polarizable, the transmembrane voltages
+    ``sim.vm``. Each unknown is scaled by the magnitude of its initial value.
+    The residual of these unknowns is their rate of change over a single time
+    step taken from these unknowns, whose roots are exactly the steady states
+    of the time-stepped system. If gap junctions are voltage-sensitive, their
+    open states ``sim.gjopen`` are *not* unknowns but are instead set to their
+    steady states at the transjunctional voltages of these unknowns before each
+    such time step, which these time steps then leave unchanged.
+
+    Since transmembrane voltages are extremely sensitive to the net charge of
+    these concentrations, this system is extremely stiff. Each iteration thus
+    takes an implicit Euler step of a pseudo-time step-size grown as the
+    residual shrinks (i.e., pseudo-transient continuation), reducing to
+    Newton's method near steady state. The Jacobian of each iteration is
+    approximated by finite differences over its sparsity pattern, as inferred
+    from the gap junction and extracellular grid topology of the cell cluster,
+    perturbing each group of structurally independent unknowns in a single
+    time step. Couplings absent from that pattern (e.g., extracellular voltage
+    smoothing) merely slow convergence rather than bias the result.
+
+    Only the pump, electrodiffusion, and gap junction subsystems are supported.
+    Enabling any subsystem whose state is *not* captured by these unknowns
+    (e.g., gene regulatory networks) disables this solver, in which case the
+    caller is expected to time step as usual.
+
+    Attributes
+    ----------
+    steps_count : int
+        Number of time steps taken by the most recent solve.
+    _iterations_max : int
+        Maximum number of damped Newton iterations.
+    _p : betse.science.parameters.Parameters
+        Current simulation configuration.
+    _tolerance : float
+        Maximum scaled rate of change in 1/s of any unknown at steady state.
+    '''
+
+    # ..................{ INITIALIZERS                      }..................
+    @type_check
+    def __init__(self, p: 'betse.science.parameters.Parameters') -> None:
+        '''
+        Initialize this steady-state solver.
+
+        Parameters
+        ----------
+        p : betse.science.parameters.Parameters
+            Current simulation configuration.
+        '''
+
+        # Classify all passed parameters.
+        self._p = p
+
+        # Classify all steady-state parameters.
+        self._iterations_max = p.steady_state_iterations_max
+        self._tolerance = p.steady_state_tolerance
+
+        # Initialize all remaining instance variables.
+        self.steps_count = 0
+
+    # ..................{ SOLVERS                           }..................
+    def solve(
+        self,
+        sim: 'betse.science.sim.Simulator',
+        cells: 'betse.science.cells.Cells',
+        step: CallableTypes,
+        dyna: object = None,
+    ) -> bool:
+        '''
+        Solve for the steady state of the passed simulation, leaving that
+        simulation in that state on success *or* in its initial state on
+        failure.
+
+        Since each time step taken by this solve (including each time step
+        perturbing these unknowns to approximate the Jacobian) advances not
+        only these unknowns but all other state of this simulation (e.g., gap
+        junction gating states, channel states), the initial state of this
+        simulation is snapshotted beforehand and restored on failure.
+
+        Parameters
+        ----------
+        sim : betse.science.sim.Simulator
+            Current simulation, whose ``update_V`` method is called after
+            setting the unknowns of this solver to recompute all voltages and
+            fields depending on those unknowns.
+        cells : betse.science.cells.Cells
+            Current cell cluster.
+        step : CallableTypes
+            Callable accepting no parameters taking exactly one time step of
+            the configured step-size from the current state of this simulation.
+        dyna : betse.science.tissue.tishandler.TissueHandler
+            Current tissue handler whose state is also restored on failure *or*
+            ``None`` if this handler is unmodified by time steps. Defaults to
+            ``None``.
+
+        Returns
+        ----------
+        bool
+            ``True`` only if this solve converged.
+        '''
+
+        # If any subsystem unsupported by this solver is enabled, fail.
+        feature_unsupported = self._get_feature_unsupported()
+        if feature_unsupported is not None:
+            logs.log_warning(
+                'Steady-state initialization unsupported with %s; '
+                'reverting to time stepping.', feature_unsupported)
+            return False
+
+        # Snapshot of the initial state of this simulation, restored on failure.
+        sim_snapshot = SimStateSnapshot(sim=sim, dyna=dyna)
+
+        self.steps_count = 0
+
+        # Attempt to solve for the steady state.
+        try:
+            iterations_count = self._solve(sim, cells, step)
+        # If this solve fails for any reason, restore the initial state of
+        # this simulation and fail.
+        except (
+            ArithmeticError,
+            BetseSimUnstableException,
+            RuntimeError,
+            ValueError,
+        ) as exception:
+            sim_snapshot.restore()
+
+            logs.log_warning(
+                'Steady-state initialization failed after %d time steps '
+                '(i.e., %s); reverting to time stepping.',
+                self.steps_count, exception)
+            return False
+
+        logs.log_info(
+            'Steady-state initialization converged after '
+            '%d Newton iterations and %d time steps.',
+            iterations_count, self.steps_count)
+        return True
+
+
+    def _solve(
+        self,
+        sim: 'betse.science.sim.Simulator',
+        cells: 'betse.science.cells.Cells',
+        step: CallableTypes,
+    ) -> int:
+        '''
+        Solve for the steady state of the passed simulation, leaving that
+        simulation in that state and returning the number of damped Newton
+        iterations performed on success *or* raising an exception otherwise.
+        '''
+
+        # Defer heavyweight imports.
+        from scipy.sparse import identity
+        from scipy.sparse.linalg import splu
+
+        # Localize frequently accessed variables for efficiency.
+        p = self._p
+
+        # Initial unknowns, the scale of each unknown, and the indices of all
+        # unknowns required to be non-negative.
+        state = self._get_state(sim)
+        field_sizes = self._get_field_sizes(sim)
+        state_scale = np.abs(state) + np.repeat(
+            (_CONC_ABSOLUTE, _CONC_ABSOLUTE, _VMEM_ABSOLUTE), field_sizes)
+        state_nonneg_indices = np.arange(field_sizes[0] + field_sizes[1])
+
+        def get_residual(
+            state_scaled: np.ndarray, gjopen: np.ndarray = None) -> (
+            np.ndarray):
+            '''
+            Scaled rate of change of the passed scaled unknowns over a single
+            time step taken from these unknowns, optionally with the passed
+            gap junction open states rather than their steady states.
+            '''
+
+            self.steps_count += 1
+            self._set_state(sim, cells, state_scaled*state_scale, gjopen)
+            step()
+
+            return (self._get_state(sim)/state_scale - state_scaled)/p.dt
+
+        # Sparsity pattern of the Jacobian and the group of each unknown.
+        jacobian_sparsity = self._get_jacobian_sparsity(sim, cells)
+        groups = _get_column_groups(jacobian_sparsity)
+        logs.log_debug(
+            'Approximating %d x %d Jacobian in %d time steps...',
+            state.size, state.size, groups.max() + 1)
+
+        # Scaled unknowns, residual, and pseudo-time step-size.
+        state_scaled = state/state_scale
+        residual = get_residual(state_scaled)
+        residual_norm = np.linalg.norm(residual)
+        gjopen = np.array(sim.gjopen)
+        pseudo_dt = _PSEUDO_TIME_STEP_INITIAL
+        identity_matrix = identity(state.size, format='csc')
+
+        for iteration in range(self._iterations_max + 1):
+            logs.log_debug(
+                'Newton iteration %d: maximum residual %g; '
+                'pseudo-time step-size %gs.',
+                iteration, np.max(np.abs(residual)), pseudo_dt)
+
+            # If the residual is within tolerance, this is a steady state.
+            if np.max(np.abs(residual)) <= self._tolerance:
+                break
+
+            # If the maximum number of iterations has been performed, fail.
+            if iteration == self._iterations_max:
+                raise RuntimeError(
+                    'no convergence in {} Newton iterations'.format(
+                        self._iterations_max))
+
+            # Jacobian of the residual at the current scaled unknowns. Since
+            # gap junction gating depends on the absolute transjunctional
+            # voltage, which is non-differentiable where neighbouring cells
+            # are at the same voltage, and since voltages are extremely
+            # sensitive to concentrations, differencing across this kink
+            # yields arbitrarily large derivatives. Gap junction open states
+            # are thus held constant while approximating this Jacobian.
+            jacobian = _get_jacobian(
+                get_residual=lambda state_scaled_perturbed: get_residual(
+                    state_scaled_perturbed, gjopen),
+                state=state_scaled,
+                residual=residual,
+                sparsity=jacobian_sparsity,
+                groups=groups,
+            )
+
+            # Take an implicit Euler step of this size, quartering this size
+            # while this step produces a non-physical state or a residual
+            # substantially larger than the current residual.
+            for _ in range(_PSEUDO_TIME_STEP_REJECTS_MAX):
+                state_delta = splu(
+                    identity_matrix/pseudo_dt - jacobian).solve(residual)
+                state_scaled_next = state_scaled + state_delta
+
+                if np.all(state_scaled_next[state_nonneg_indices] >= 0.0):
+                    residual_next = get_residual(state_scaled_next)
+                    residual_norm_next = np.linalg.norm(residual_next)
+                    if (np.isfinite(residual_norm_next) and
+                        residual_norm_next <=
+                        _RESIDUAL_GROWTH_MAX*residual_norm):
+                        break
+
+                pseudo_dt /= 4
+            else:
+                raise RuntimeError(
+                    'pseudo-time step-size {}s too small'.format(pseudo_dt))
+
+            # Grow the next pseudo-time step-size at least geometrically and
+            # faster while the residual shrinks faster (i.e., switched
+            # evolution relaxation).
+            pseudo_dt = min(
+                pseudo_dt*max(
+                    residual_norm/residual_norm_next,
+                    _PSEUDO_TIME_STEP_GROWTH_MIN),
+                _PSEUDO_TIME_STEP_MAX)
+
+            state_scaled = state_scaled_next
+            residual = residual_next
+            residual_norm = residual_norm_next
+            gjopen = np.array(sim.gjopen)
+
+        # Leave this simulation in this steady state.
+        self._set_state(sim, cells, state_scaled*state_scale)
+
+        return iteration
+
+    # ..................{ PRIVATE ~ getters                 }..................
+    def _get_feature_unsupported(self) -> str:
+        '''
+        Human-readable name of the first enabled subsystem unsupported by this
+        solver *or* ``None`` if all enabled subsystems are supported.
+        '''
+
+        # Localize frequently accessed variables for efficiency.
+        p = self._p
+
+        for feature_name, is_feature in (
+            ('general networks', p.molecules_enabled),
+            ('gene regulatory networks', p.grn_enabled),
+            ('calcium dynamics', p.Ca_dyn),
+            ('deformation', p.deformation or p.deform_osmo),
+            ('fluid flow', p.fluid_flow),
+        ):
+            if is_feature:
+                return feature_name
+
+        return None
+
+
+    def _get_field_sizes(self, sim: 'betse.science.sim.Simulator') -> list:
+        '''
+        List of the number of unknowns of the passed simulation in each field
+        of these unknowns (i.e., intracellular concentrations, extracellular
+        concentrations, and transmembrane voltages), each of which is zero if
+        that field is *not* an unknown.
+        '''
+
+        # Localize frequently accessed variables for efficiency.
+        p = self._p
+        ions_count = len(sim.movingIons)
+
+        return [
+            ions_count*sim.cc_cells.shape[1],
+            ions_count*(sim.cc_env.shape[1] if p.is_ecm else 1),
+            sim.vm.size if p.cell_polarizability != 0.0 else 0,
+        ]
+
+
+    def _get_state(self, sim: 'betse.science.sim.Simulator') -> np.ndarray:
+        '''
+        One-dimensional array of copies of all unknowns of the passed
+        simulation, concatenated in the same order as the
+        :meth:`_get_field_sizes` method.
+
+        If extracellular spaces are disabled, the environment is well-mixed;
+        the extracellular concentration of each moving ion is then a single
+        unknown, averaged over all membranes.
+        '''
+
+        # Localize frequently accessed variables for efficiency.
+        ions = sim.movingIons
+        field_sizes = self._get_field_sizes(sim)
+
+        cc_env = sim.cc_env[ions]
+        if not self._p.is_ecm:
+            cc_env = cc_env.mean(axis=1)
+
+        return np.concatenate((
+            sim.cc_cells[ions].ravel(),
+            cc_env.ravel(),
+            sim.vm[:field_sizes[2]],
+        ))
+
+
+    def _get_jacobian_sparsity(
+        self,
+        sim: 'betse.science.sim.Simulator',
+        cells: 'betse.science.cells.Cells',
+    ) -> 'scipy.sparse.csc_matrix':
+        '''
+        Sparsity pattern of the Jacobian of the residual of the passed
+        simulation, such that the element in row ``i`` and column ``j`` is
+        nonzero if the ``i``-th unknown after a time step possibly depends on
+        the ``j``-th unknown before that time step.
+
+        The intracellular concentrations of each cell depend on all moving ion
+        concentrations of that cell and gap junction-connected cells and on the
+        extracellular concentrations and transmembrane voltages at the
+        membranes of that cell. If extracellular spaces are
+        enabled, the extracellular concentrations of each grid space depend on
+        the extracellular concentrations of the same ion at most two grid
+        spaces away (by central differencing of the Nernst-Planck flux) and on
+        all cells with a membrane mapped to that grid space. Since the
+        extracellular concentrations of a well-mixed environment depend on
+        *all* cells, these weak dependencies are omitted.
+        '''
+
+        # Defer heavyweight imports.
+        from scipy.sparse import bmat, csr_matrix, identity, kron
+
+        # Localize frequently accessed variables for efficiency.
+        p = self._p
+        ions_count = len(sim.movingIons)
+        mems_count = len(cells.mem_to_cells)
+        cells_count = sim.cc_cells.shape[1]
+        mem_range = np.arange(mems_count)
+        mem_ones = np.ones(mems_count)
+        ions_all = np.ones((ions_count, ions_count))
+        ions_row = np.ones((1, ions_count))
+        ions_col = np.ones((ions_count, 1))
+        is_vm_unknown = self._get_field_sizes(sim)[2] > 0
+
+        # Membrane-to-cell and membrane-to-partnering membrane incidence.
+        mem_to_cell = csr_matrix(
+            (mem_ones, (mem_range, cells.mem_to_cells)),
+            shape=(mems_count, cells_count))
+        mem_to_mems = identity(mems_count, format='csr') + csr_matrix(
+            (mem_ones, (mem_range, cells.nn_i)),
+            shape=(mems_count, mems_count))
+
+        # Cells connected to each cell by gap junctions, including that cell.
+        cell_to_cells = mem_to_cell.T @ mem_to_mems @ mem_to_cell
+
+        # Membrane-to-grid space incidence and grid space adjacency.
+        if p.is_ecm:
+            env_count = sim.cc_env.shape[1]
+            mem_to_env = csr_matrix(
+                (mem_ones, (mem_range, cells.map_mem2ecm)),
+                shape=(mems_count, env_count))
+
+            rows_count, cols_count = cells.X.shape
+            env_to_envs = (
+                kron(identity(rows_count), _get_band(cols_count, 2)) +
+                kron(_get_band(rows_count, 2), identity(cols_count)))
+
+            # If smoothing the environment, widen this adjacency by the
+            # three-by-three stencil of that smoothing.
+            if p.sharpness < 1.0:
+                env_to_envs = env_to_envs @ kron(
+                    _get_band(rows_count, 1), _get_band(cols_count, 1))
+        # Else, the environment is a single well-mixed space.
+        else:
+            mem_to_env = csr_matrix(mem_ones[:, None])
+            env_to_envs = identity(1)
+
+        cell_to_envs = mem_to_cell.T @ mem_to_env
+
+        # Blocks of this pattern, indexed first by the field of the dependent
+        # unknown and then by the field of the independent unknown.
+        blocks = [[None]*3 for _ in range(3)]
+        blocks[0][0] = kron(ions_all, cell_to_cells)
+        blocks[0][1] = kron(ions_all, cell_to_envs)
+        blocks[1][1] = kron(identity(ions_count), env_to_envs)
+        if p.is_ecm:
+            blocks[1][0] = kron(ions_all, cell_to_envs.T)
+
+        # If voltages are unknowns, the voltages at each membrane depend on
+        # the voltages at all membranes of the same cell (by smoothing of the
+        # transmembrane current) and at their partnering membranes.
+        if is_vm_unknown:
+            blocks[0][2] = kron(ions_col, mem_to_cell.T @ mem_to_mems)
+            blocks[2][0] = kron(ions_row, mem_to_cell @ cell_to_cells)
+            blocks[2][1] = kron(ions_row, mem_to_cell @ cell_to_envs)
+            blocks[2][2] = mem_to_cell @ mem_to_cell.T @ mem_to_mems
+            if p.is_ecm:
+                blocks[1][2] = kron(ions_col, mem_to_env.T)
+        # Else, discard all blocks of voltages.
+        else:
+            blocks = [block_row[:2] for block_row in blocks[:2]]
+
+        sparsity = bmat(blocks, format='csc')
+
+        # Each unknown depends on itself.
+        sparsity = (sparsity + identity(sparsity.shape[0])).tocsc()
+        sparsity.data[:] = 1.0
+        sparsity.sort_indices()
+        return sparsity
+
+    # ..................{ PRIVATE ~ setters                 }..................
+    def _set_state(
+        self,
+        sim: 'betse.science.sim.Simulator',
+        cells: 'betse.science.cells.Cells',
+        state: np.ndarray,
+        gjopen: np.ndarray = None,
+    ) -> None:
+        '''
+        Set all unknowns of the passed simulation to the passed one-dimensional
+        array and recompute all voltages and fields depending on these
+        unknowns.
+
+        If gap junctions are voltage-sensitive, their open states are also set
+        to the passed array if non-``None`` *or* to their steady states at
+        these voltages otherwise.
+        '''
+
+        # Localize frequently accessed variables for efficiency.
+        p = self._p
+        ions = sim.movingIons
+        cc_cells, cc_env, vm = np.split(
+            state, np.cumsum(self._get_field_sizes(sim))[:-1])
+
+        # Set all concentrations *BEFORE* recomputing voltages from the net
+        # charge of these concentrations, assuming instant mixing in each cell
+        # as does each time step.
+        sim.cc_cells[ions] = cc_cells.reshape(len(ions), -1)
+        sim.cc_env[ions] = cc_env.reshape(len(ions), -1)
+        sim.cc_at_mem[ions] = sim.cc_cells[ions][:, cells.mem_to_cells]
+
+        sim.update_V(cells, p)
+
+        # If cells are polarizable, set voltages *AFTER* recomputing voltages.
+        # Voltages are then unknowns rather than functions of this charge and
+        # would otherwise be overwritten by this recomputation.
+        if vm.size:
+            sim.vm = np.array(vm)
+
+        # If gap junctions are voltage-sensitive, set their open states.
+        if p.v_sensitive_gj:
+            if gjopen is None:
+                sim.vgj = sim.vm[cells.nn_i] - sim.vm[cells.mem_i]
+                gjopen = sim.gj_funk.get_gjopen_steady(sim, p)
+
+            sim.gjopen = np.array(gjopen)
+
+# ....................{ PRIVATE ~ getters                 }....................
+def _get_band(size: int, width: int) -> 'scipy.sparse.csr_matrix':
+    '''
+    Square banded matrix of the passed size whose elements are one on the
+    main diagonal and on the passed number of diagonals above and below the
+    main diagonal *and* zero elsewhere.
+    '''
+
+    # Defer heavyweight imports.
+    from scipy.sparse import diags
+
+    return diags(
+        [np.ones(size - abs(offset)) for offset in range(-width, width + 1)],
+        list(range(-width, width + 1)),
+        shape=(size, size),
+        format='csr',
+    )
+
+
+def _get_column_groups(sparsity: 'scipy.sparse.csc_matrix') -> np.ndarray:
+    '''
+    One-dimensional array of the group of each column of the passed sparsity
+    pattern, such that no two columns of the same group are nonzero in the
+    same row.
+
+    Groups are assigned greedily in column order, each column receiving the
+    smallest group not assigned to any previous column sharing a row with that
+    column.
+    '''
+
+    # Columns sharing a row with each column.
+    columns_adjacency = (sparsity.T @ sparsity).tocsr()
+
+    groups = np.full(sparsity.shape[1], -1)
+    for column in range(sparsity.shape[1]):
+        # Groups already assigned to adjacent columns.
+        groups_adjacent = groups[columns_adjacency.indices[
+            columns_adjacency.indptr[column]:
+            columns_adjacency.indptr[column + 1]]]
+        groups_adjacent = groups_adjacent[groups_adjacent >= 0]
+
+        # Smallest group not already assigned to an adjacent column. Since at
+        # most one group per adjacent column is taken, this group is at most
+        # the number of adjacent columns.
+        is_group_taken = np.zeros(len(groups_adjacent) + 1, dtype=bool)
+        is_group_taken[
+            groups_adjacent[groups_adjacent <= len(groups_adjacent)]] = True
+        groups[column] = np.argmin(is_group_taken)
+
+    return groups
+
+
+def _get_jacobian(
+    get_residual: CallableTypes,
+    state: np.ndarray,
+    residual: np.ndarray,
+    sparsity: 'scipy.sparse.csc_matrix',
+    groups: np.ndarray,
+) -> 'scipy.sparse.csc_matrix':
+    '''
+    Jacobian of the passed residual function at the passed state with the
+    passed sparsity pattern, approximated by forward differences perturbing
+    all columns of each group of the passed column groups at once.
+    '''
+
+    # Defer heavyweight imports.
+    from scipy.sparse import csc_matrix
+
+    # Perturbation of each unknown, exactly representable when added to that
+    # unknown.
+    state_delta = _JACOBIAN_STEP*np.maximum(np.abs(state), 1.0)
+    state_delta = (state + state_delta) - state
+
+    # Row, column, and group of each nonzero element of this Jacobian.
+    rows = sparsity.indices
+    columns = np.repeat(
+        np.arange(sparsity.shape[1]), np.diff(sparsity.indptr))
+    columns_group = groups[columns]
+
+    jacobian_data = np.zeros(len(rows))
+    for group in range(groups.max() + 1):
+        is_column_group = groups == group
+        state_perturbed = state + np.where(is_column_group, state_delta, 0.0)
+        residual_delta = get_residual(state_perturbed) - residual
+
+        # Since no two columns of this group share a row, the change in each
+        # row is due to the one column of this group nonzero in that row.
+        is_data_group = columns_group == group
+        jacobian_data[is_data_group] = (
+            residual_delta[rows[is_data_group]] /
+            state_delta[columns[is_data_group]])
+
+    return csc_matrix(
+        (jacobian_data, rows, sparsity.indptr), shape=sparsity.shape)
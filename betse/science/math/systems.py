@@ -17,6 +17,7 @@ from betse.exceptions import BetseSimConfException
 from betse.lib import libs
 from betse.util.io.log import logs
 from betse.util.path import dirs, pathnames
+from betse.util.py import pyeval
 from betse.util.type.iterable.mapping.mapcls import DynamicValue, DynamicValueDict
 from collections import OrderedDict
 from matplotlib import colors
@@ -2668,7 +2669,7 @@ class SimMaster(object):
                                                   "entities have been specified. Please check the config "
                                                   "settings and try again.")
 
-                r_base = [eval(self.react_handler[rea], self.globals, self.locals).mean() for rea in
+                r_base = [pyeval.eval_expr(self.react_handler[rea], self.globals, self.locals).mean() for rea in
                           self.react_handler]
 
                 outputs = np.dot(self.network_opt_M, r_base)
@@ -0,0 +1,177 @@
+#!/usr/bin/env python3
+# --------------------( LICENSE                           )--------------------
+# Copyright 2014-2023 by Alexis Pietak & Cecil Curry.
+# See "LICENSE" for further details.
+
+'''
+High-level **sampled time series** (i.e., preallocated Numpy arrays storing
+the values of simulation quantities at each sampled time step) functionality.
+'''
+
+# ....................{ IMPORTS                           }....................
+import numpy as np
+from betse.util.type.types import type_check
+
+# ....................{ CLASSES                           }....................
+class SampledTimeSeries(object):
+    '''
+    **Sampled time series store** (i.e., object writing the values of
+    simulation quantities at each sampled time step into preallocated Numpy
+    arrays exposed as attributes of another object).
+
+    For each attribute stored by this object, the first call to the
+    :meth:`store` method preallocates a Numpy array whose first dimension is
+    the maximum number of sampled time steps and whose remaining dimensions
+    are those of the passed value. That call and each subsequent call then
+    copies the passed value in-place into the next unwritten slot of that
+    array and exposes the view of that array containing only the written slots
+    as the attribute of the same name of the owning object. Since each such
+    attribute supports the same indexing, iteration, and :func:`len` semantics
+    as the list of arrays it supplants, callers may continue to access these
+    attributes as before (e.g., ``sim.vm_time[-1]``) while also efficiently
+    slicing across all sampled time steps (e.g., ``sim.vm_time[:, 0]``).
+
+    If the shape of a subsequently stored value differs from that of the first
+    value stored for the same attribute (e.g., due to cells being cut), that
+    attribute silently reverts to a list of arrays for the remainder of the
+    current simulation phase.
+
+    Attributes
+    ----------
+    _obj : object
+        Object whose attributes are the time series stored by this object,
+        typically a :class:`betse.science.sim.Simulator` instance.
+    _samples_max : int
+        Maximum number of sampled time steps to be stored.
+    _series : dict
+        Dictionary mapping from the name of each attribute stored by this
+        object to the preallocated Numpy array backing that attribute *or*
+        ``None`` if that attribute has reverted to a list of arrays.
+    _series_len : dict
+        Dictionary mapping from the name of each attribute stored by this
+        object to the number of sampled time steps stored for that attribute.
+    '''
+
+    # ..................{ INITIALIZERS                      }..................
+    @type_check
+    def __init__(self, obj: object, samples_max: int) -> None:
+        '''
+        Initialize this time series store.
+
+        Parameters
+        ----------
+        obj : object
+            Object whose attributes are the time series stored by this object.
+        samples_max : int
+            Maximum number of sampled time steps to be stored, typically the
+            number of sampled time steps for the current simulation phase.
+        '''
+
+        # Classify all passed parameters.
+        self._obj = obj
+        self._samples_max = samples_max
+
+        # Initialize all remaining instance variables.
+        self._series = {}
+        self._series_len = {}
+
+    # ..................{ PROPERTIES                        }..................
+    @property
+    def names(self) -> frozenset:
+        '''
+        Set of the names of all attributes stored by this object.
+        '''
+
+        return frozenset(self._series)
+
+    # ..................{ STORERS                           }..................
+    def store(self, name: str, value: object) -> None:
+        '''
+        Copy the passed value into the next unwritten slot of the time series
+        exposed as the attribute with the passed name of the owning object.
+
+        Parameters
+        ----------
+        name : str
+            Name of the attribute of the owning object to be stored to (e.g.,
+            ``vm_time``).
+        value : object
+            Value of the corresponding simulation quantity at the current
+            sampled time step. For safety, this value is always copied; callers
+            need *not* (and should not) copy this value beforehand.
+        '''
+
+        # Number of sampled time steps previously stored for this attribute.
+        series_len = self._series_len.get(name, 0)
+
+        # Preallocated array backing this attribute if any or "None" otherwise.
+        series = self._series.get(name)
+
+        # If this is the first sampled time step for this attribute, preallocate
+        # an array large enough to store all sampled time steps of this value.
+        if series_len == 0:
+            value = np.asarray(value)
+            series = np.empty(
+                (self._samples_max,) + value.shape, dtype=value.dtype)
+            self._series[name] = series
+        # Else if this attribute has already reverted to a list of arrays,
+        # append a copy of this value to that list and return.
+        elif series is None:
+            getattr(self._obj, name).append(np.copy(value))
+            self._series_len[name] = series_len + 1
+            return
+        # Else, this attribute is backed by a preallocated array.
+        else:
+            value = np.asarray(value)
+
+            # If this value is no longer storable in this array, revert this
+            # attribute to a list of arrays and return.
+            if (
+                value.shape != series.shape[1:] or
+                series_len >= self._samples_max
+            ):
+                series_list = list(series[:series_len])
+                series_list.append(np.copy(value))
+                setattr(self._obj, name, series_list)
+                self._series[name] = None
+                self._series_len[name] = series_len + 1
+                return
+
+            # If this value's type is *NOT* safely castable to this array's
+            # type (e.g., floats stored into an array of integers), reallocate
+            # this array with a type accommodating both.
+            if not np.can_cast(value.dtype, series.dtype, casting='safe'):
+                series = series.astype(
+                    np.result_type(series.dtype, value.dtype))
+                self._series[name] = series
+
+        # Copy this value into the next unwritten slot of this array.
+        series[series_len] = value
+        series_len += 1
+        self._series_len[name] = series_len
+
+        # Expose only the written slots of this array as this attribute.
+        setattr(self._obj, name, series[:series_len])
+
+    # ..................{ FINALIZERS                        }..................
+    def finalize(self) -> None:
+        '''
+        Release all excess storage preallocated by this store.
+
+        If the current simulation phase halted prematurely (e.g., due to
+        computational instability), each attribute stored by this object is
+        replaced by a compact copy of only its written slots, preventing the
+        unwritten remainder of each preallocated array from persisting in
+        memory. This store should not be used after calling this method.
+        '''
+
+        # For the name and array backing each attribute stored by this object...
+        for name, series in self._series.items():
+            # If this attribute is backed by a partially written array, replace
+            # this attribute by a compact copy of the written slots.
+            if series is not None and self._series_len[name] < len(series):
+                setattr(self._obj, name, series[:self._series_len[name]].copy())
+
+        # Release all references to these arrays.
+        self._series = {}
+        self._series_len = {}
@@ -0,0 +1,447 @@
+#!/usr/bin/env python3
+# --------------------( LICENSE                           )--------------------
+# Copyright 2014-2023 by Alexis Pietak & Cecil Curry.
+# See "LICENSE" for further details.
+
+'''
+High-level **adaptive time stepping** (i.e., dynamically varying the time
+step-size of the full BETSE solver to the rate of change of the simulation)
+functionality.
+'''
+
+# ....................{ IMPORTS                           }....................
+import numpy as np
+from betse.science.math.simstate import SimStateSnapshot
+from betse.util.io.log import logs
+from betse.util.type.types import type_check, CallableOrNoneTypes, IterableTypes
+
+# ....................{ CONSTANTS                         }....................
+_SAFETY_FACTOR = 0.9
+'''
+Factor by which each time step-size predicted by the error controller is
+scaled, biasing this controller towards slightly smaller steps than the
+largest step predicted to satisfy the tolerance.
+'''
+
+
+_GROWTH_MIN = 0.2
+'''
+Minimum factor by which each time step-size may be scaled from the last,
+including when retrying a rejected time step.
+'''
+
+
+_GROWTH_MAX = 2.0
+'''
+Maximum factor by which each time step-size may be scaled from the last.
+'''
+
+
+_VMEM_ABSOLUTE = 1.0e-3
+'''
+Absolute scale in volts added to the magnitude of each transmembrane voltage
+when scaling the local error of that voltage, preventing voltages near zero
+from demanding vanishingly small errors.
+'''
+
+
+_CONC_ABSOLUTE = 1.0e-3
+'''
+Absolute scale in mmol/L added to the magnitude of each intracellular ion
+concentration when scaling the local error of that concentration.
+'''
+
+# ....................{ CLASSES                           }....................
+class AdaptiveTimeStepper(object):
+    '''
+    **Adaptive time stepper** (i.e., object iteratively selecting the
+    time step-size of each time step of the full BETSE solver).
+
+    The configured time step-size ``p.dt`` is the smallest step this stepper
+    ever takes. The local error of each step of at least twice that size is
+    estimated by step doubling: that step is taken once at its full size from
+    a :class:`SimStateSnapshot` of the simulation, that snapshot is restored,
+    and that step is then retaken as two half-steps. The difference between
+    the transmembrane voltages ``sim.vm`` and intracellular ion concentrations
+    ``sim.cc_cells`` of these two results, scaled by the configured tolerance,
+    is the estimated local error of the half-step result. If this error
+    exceeds the tolerance, the snapshot is restored and the step is retried at
+    the smaller size predicted to satisfy the tolerance. Else, the half-step
+    result is accepted and the next step-size grows by the factor predicted to
+    satisfy the tolerance.
+
+    Step-sizes are additionally reset to the configured step-size whenever the
+    transmembrane voltage changes by more than the configured amount over a
+    single step and throughout each **event window** (i.e., time interval over
+    which a scheduled intervention switches on or off). Steps are truncated to
+    land exactly on the start of each event window, each sampled time step,
+    and the last time step. Since the caller samples data immediately *after*
+    taking the step starting at each sampled time step, each such step is
+    taken at the configured step-size, guaranteeing that data is sampled at
+    exactly the same times as with fixed time stepping.
+
+    Attributes
+    ----------
+    steps_count : int
+        Number of time steps taken by the most recent iteration, including
+        the full and half-steps of each step-doubled time step and all
+        rejected time steps.
+    steps_rejected_count : int
+        Number of these time steps whose estimated local error exceeded the
+        configured tolerance, each of which was rejected and retried.
+    _dt_base : float
+        Configured time step-size in seconds.
+    _dt_max : float
+        Maximum time step-size in seconds.
+    _event_windows : list
+        List of all event windows as ``(time_start, time_stop)`` 2-tuples
+        sorted in ascending order.
+    _p : betse.science.parameters.Parameters
+        Current simulation configuration, whose ``dt`` attribute is set to the
+        size of each time step immediately before that step is taken.
+    _time_end : float
+        Time in seconds of the last time step.
+    _time_steps_sampled : frozenset
+        Set of all sampled time steps, each of which starts a time step of the
+        configured step-size.
+    _time_landings : ndarray
+        One-dimensional Numpy array of all times in seconds at which time
+        steps are required to land exactly (i.e., all sampled time steps
+        followed by the last time step) sorted in ascending order.
+    _tolerance : float
+        Relative tolerance of the estimated local error of each time step.
+    _vmem_change_max : float
+        Maximum change in volts of the transmembrane voltage over a single
+        time step before resetting the step-size to the configured step-size.
+    '''
+
+    # ..................{ INITIALIZERS                      }..................
+    @type_check
+    def __init__(
+        self,
+        p: 'betse.science.parameters.Parameters',
+        time_end: float,
+        time_steps_sampled: IterableTypes,
+        event_windows: IterableTypes = (),
+    ) -> None:
+        '''
+        Initialize this adaptive time stepper.
+
+        Parameters
+        ----------
+        p : betse.science.parameters.Parameters
+            Current simulation configuration.
+        time_end : float
+            Time in seconds of the last time step.
+        time_steps_sampled : IterableTypes
+            Iterable of all **sampled time steps** (i.e., times in seconds at
+            which data is sampled).
+        event_windows : IterableTypes
+            Iterable of all event windows as ``(time_start, time_stop)``
+            2-tuples. Defaults to the empty tuple.
+        '''
+
+        # Classify all passed parameters.
+        self._p = p
+        self._time_end = time_end
+        self._event_windows = sorted(event_windows)
+
+        # Classify all adaptive time stepping parameters.
+        self._dt_base = p.dt
+        self._dt_max = p.dt * max(p.adaptive_dt_max_factor, 1.0)
+        self._tolerance = p.adaptive_tolerance
+        self._vmem_change_max = p.adaptive_vmem_change_max
+
+        # All times at which time steps are required to land exactly.
+        self._time_steps_sampled = frozenset(time_steps_sampled)
+        self._time_landings = np.array(sorted(
+            [time for time in self._time_steps_sampled
+             if 0.0 < time < time_end] +
+            [time_end]))
+
+        # Initialize all remaining instance variables.
+        self.steps_count = 0
+        self.steps_rejected_count = 0
+
+    # ..................{ ITERATORS                         }..................
+    def iter_time_steps(
+        self,
+        sim: 'betse.science.sim.Simulator',
+        get_snapshot: CallableOrNoneTypes = None,
+    ) -> 'collections.abc.Generator':
+        '''
+        Generator yielding the time in seconds of each time step to be taken
+        by the full BETSE solver for the passed simulator, setting the
+        ``dt`` attribute of the current simulation configuration to the size
+        of that step *before* yielding that time.
+
+        The caller is expected to take exactly one time step of the yielded
+        size between each iteration. Since step-doubled and rejected time
+        steps are retaken from a restored snapshot, the same time may be
+        yielded several times in succession; the caller should treat each
+        yield as an independent time step. Each sampled time step is yielded
+        exactly once. On completion, ``dt`` is restored to the configured time
+        step-size.
+
+        Parameters
+        ----------
+        sim : betse.science.sim.Simulator
+            Current simulation, whose ``vm`` and ``cc_cells`` arrays are
+            inspected after each time step to estimate the local error of that
+            step.
+        get_snapshot : CallableOrNoneTypes
+            Callable accepting no parameters returning a
+            :class:`SimStateSnapshot` of the current state of this simulation
+            *or* ``None``, in which case this defaults to snapshotting only the
+            simulator itself. Defaults to ``None``.
+
+        Yields
+        ----------
+        float
+            Time in seconds of the next time step.
+        '''
+
+        # Localize frequently accessed variables for efficiency.
+        p = self._p
+        dt_base = self._dt_base
+
+        # Default the snapshot callable to snapshotting only this simulator.
+        if get_snapshot is None:
+            get_snapshot = lambda: SimStateSnapshot(sim=sim)
+
+        # Time, size, and end time of the next time step.
+        t = 0.0
+        dt, t_next = self._get_time_step(t=t, dt=dt_base)
+
+        # Size of the next time step predicted by the error controller, before
+        # constraining that step to event windows and landing times.
+        dt_predicted = dt_base
+
+        self.steps_count = 0
+        self.steps_rejected_count = 0
+
+        while True:
+            # Simulation state at the start of this time step.
+            state_prev = self._get_state(sim)
+
+            # If this time step is at least twice the configured step-size...
+            if dt >= 2.0*dt_base:
+                # Take this time step once at its full size.
+                snapshot = get_snapshot()
+                p.dt = dt
+                yield t
+                state_full = self._get_state(sim)
+
+                # Retake this time step from the same state as two half-steps.
+                snapshot.restore()
+                p.dt = 0.5*dt
+                yield t
+                yield t + 0.5*dt
+                self.steps_count += 3
+
+                # Estimated local error of the half-step result scaled by the
+                # tolerance, such that errors exceeding 1 exceed the tolerance.
+                error = self._get_error_scaled(
+                    state_full=state_full, state_half=self._get_state(sim))
+
+                # If this error exceeds the tolerance, reject this time step
+                # and retry this step at the smaller size predicted to satisfy
+                # the tolerance.
+                if error > 1.0:
+                    snapshot.restore()
+                    self.steps_rejected_count += 1
+                    dt, t_next = self._get_time_step(
+                        t=t, dt=self._get_dt_constrained(
+                            dt*self._get_growth(error)))
+                    continue
+
+                # Else, accept this time step and grow the next step-size by
+                # the factor predicted to satisfy the tolerance.
+                dt_predicted = dt*self._get_growth(error)
+            # Else, take this time step as is. If this step was reduced to the
+            # configured step-size only to start at a sampled time step,
+            # preserve the prior prediction; else, cautiously grow this step.
+            else:
+                p.dt = dt
+                yield t
+                self.steps_count += 1
+
+                if t not in self._time_steps_sampled:
+                    dt_predicted = dt*_GROWTH_MAX
+
+            # If this was the last time step, halt.
+            if t >= self._time_end:
+                break
+
+            # If the transmembrane voltage changed appreciably over this time
+            # step (or cells were cut), reset the next step-size to the
+            # configured step-size.
+            state = self._get_state(sim)
+            if (
+                state[0].shape != state_prev[0].shape or
+                np.max(np.abs(state[0] - state_prev[0]), initial=0.0) >
+                self._vmem_change_max
+            ):
+                dt_predicted = dt_base
+
+            # Constrain the next time step to the permissible range of
+            # step-sizes, to event windows, and to times at which time steps
+            # are required to land.
+            dt_predicted = self._get_dt_constrained(dt_predicted)
+            t = t_next
+            dt, t_next = self._get_time_step(t=t, dt=dt_predicted)
+
+        # Restore the configured time step-size.
+        p.dt = dt_base
+
+
+    def log_summary(self, time_steps_fixed_count: int) -> None:
+        '''
+        Log an informational summary of the time steps taken by the most
+        recent iteration.
+
+        Parameters
+        ----------
+        time_steps_fixed_count : int
+            Number of time steps that fixed time stepping would have taken.
+        '''
+
+        logs.log_info(
+            'Adaptive time stepping took %d time steps '
+            '(versus %d fixed time steps), '
+            'rejecting %d that exceeded the error tolerance.',
+            self.steps_count,
+            time_steps_fixed_count,
+            self.steps_rejected_count,
+        )
+
+    # ..................{ PRIVATE ~ getters                 }..................
+    def _get_state(self, sim: 'betse.science.sim.Simulator') -> tuple:
+        '''
+        2-tuple ``(vm, cc_cells)`` of copies of the transmembrane voltages and
+        intracellular ion concentrations of the passed simulation.
+        '''
+
+        return (np.array(sim.vm, copy=True), np.array(sim.cc_cells, copy=True))
+
+
+    def _get_error_scaled(self, state_full: tuple, state_half: tuple) -> (
+        float):
+        '''
+        Maximum estimated local error of a step-doubled time step across all
+        transmembrane voltages and intracellular ion concentrations, each
+        scaled by the tolerance of that quantity, given the states resulting
+        from one full step and from two half-steps respectively.
+
+        If cells were cut during this time step, the shapes of these states
+        differ; this error is then infinite.
+        '''
+
+        # Maximum scaled local error across all such quantities.
+        error_max = 0.0
+
+        for value_full, value_half, scale_absolute in zip(
+            state_full, state_half, (_VMEM_ABSOLUTE, _CONC_ABSOLUTE)):
+            if value_full.shape != value_half.shape:
+                return np.inf
+
+            # Difference between one full step and two half-steps, estimating
+            # the local error of the latter, scaled by the tolerance.
+            error = np.abs(value_half - value_full)/(
+                self._tolerance*(np.abs(value_half) + scale_absolute))
+
+            if error.size:
+                error_max = max(error_max, float(np.max(error)))
+
+        return error_max
+
+
+    def _get_growth(self, error: float) -> float:
+        '''
+        Factor by which to scale the size of a time step with the passed scaled
+        local error to satisfy the tolerance.
+
+        Since the local error of each explicit Euler update of this solver is
+        quadratic in the step-size, this factor is the square root of the
+        reciprocal of this error, biased and bounded by the module constants.
+        '''
+
+        if error == 0.0:
+            return _GROWTH_MAX
+
+        # If this error is non-finite (e.g., due to cells being cut), shrink.
+        if not np.isfinite(error):
+            return _GROWTH_MIN
+
+        return min(max(_SAFETY_FACTOR*np.sqrt(1.0/error), _GROWTH_MIN),
+                   _GROWTH_MAX)
+
+
+    def _get_dt_constrained(self, dt: float) -> float:
+        '''
+        Passed time step-size constrained to the permissible range of
+        step-sizes.
+
+        Since only step-sizes of at least twice the configured step-size are
+        step-doubled, step-sizes less than that are reduced to the configured
+        step-size, whose error is *not* estimated.
+        '''
+
+        if dt < 2.0*self._dt_base:
+            return self._dt_base
+
+        return min(dt, self._dt_max)
+
+
+    def _get_time_step(self, t: float, dt: float) -> tuple:
+        '''
+        2-tuple ``(dt, t_next)`` of the size and end time of the time step
+        starting at the passed time, constrained from the passed size to event
+        windows and to times at which time steps are required to land.
+
+        The passed size is assumed to have already been constrained to the
+        permissible range of step-sizes.
+        '''
+
+        # Localize frequently accessed variables for efficiency.
+        dt_base = self._dt_base
+
+        # If this is the last time step, take the configured step-size.
+        if t >= self._time_end:
+            return dt_base, t + dt_base
+
+        # If this time step starts at a sampled time step, take the configured
+        # step-size. Since the caller samples data immediately after this
+        # step, this samples the same state as fixed time stepping.
+        if t in self._time_steps_sampled:
+            dt = dt_base
+
+        # For the first event window not yet passed...
+        for time_start, time_stop in self._event_windows:
+            if time_stop < t:
+                continue
+
+            # If this time step starts in this window, take the configured
+            # step-size. Else if this time step would overlap this window, land
+            # this step on the start of this window.
+            if time_start <= t:
+                dt = dt_base
+            elif time_start < t + dt:
+                dt = max(time_start - t, dt_base)
+
+            break
+
+        # Next time at which a time step is required to land, found by binary
+        # search. Since the last time step is such a time, this time exists.
+        time_landing = self._time_landings[
+            np.searchsorted(self._time_landings, t, side='right')]
+
+        # If this time step would overshoot or fall just short of this time,
+        # land this step exactly on this time. Since floating-point addition
+        # does not guarantee "t + (time_landing - t) == time_landing", the end
+        # time of this step is this time rather than that sum.
+        if t + dt + 0.5*dt_base >= time_landing:
+            return time_landing - t, time_landing
+
+        # Else, take this time step as is.
+        return dt, t + dt
@@ -11,8 +11,8 @@ BETSE project.
 import math, copy
 import numpy as np
 import scipy.spatial as sps
+from betse.science.math import gridinterp
 from betse.util.type.types import type_check, SequenceTypes
-from scipy import interpolate as interp
 
 # ....................{ UTILITIES                          }....................
 #FIXME: Consider shifting this general-purpose sequence method to
@@ -451,11 +451,11 @@ def grid_vector_data(xpts,ypts,zdata_x,zdata_y,cells,p):
     #
     # new_mask = mask_funk.ev(xgrid,ygrid)
 
-    zi_x = interp.griddata((xpts,ypts),zdata_x,(X,Y))
+    zi_x = gridinterp.griddata((xpts,ypts),zdata_x,(X,Y))
     zi_x = np.nan_to_num(zi_x)
     # zi_x = np.multiply(zi_x,new_mask)
 
-    zi_y = interp.griddata((xpts,ypts),zdata_y,(X,Y))
+    zi_y = gridinterp.griddata((xpts,ypts),zdata_y,(X,Y))
     zi_y = np.nan_to_num(zi_y)
     # zi_y = np.multiply(zi_y,new_mask)
 
@@ -501,7 +501,7 @@ def griddata(xpts,ypts,zdata,gridsize,cells):
     #
     X,Y = np.meshgrid(xlin,ylin)
 #
-    zi = interp.griddata((xpts,ypts),zdata,(X,Y))
+    zi = gridinterp.griddata((xpts,ypts),zdata,(X,Y))
     zi = np.nan_to_num(zi)
     # zi = np.multiply(new_mask,zi)
 
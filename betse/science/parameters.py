@@ -20,6 +20,14 @@ from betse.util.path import dirs, pathnames
 from betse.util.type.descriptor.descs import classproperty_readonly
 from betse.util.type.types import IterableTypes, SequenceTypes, StrOrNoneTypes
 
+# ....................{ CONSTANTS                         }....................
+_YAML_VERSION = '1.2'
+'''
+Version of the YAML specification all simulation configuration files are
+implicitly assumed to comply with, preserving backward compatibility with older
+files erroneously prefaced by the ``%YAML 1.1`` directive.
+'''
+
 # ....................{ SUBCLASSES                        }....................
 class Parameters(YamlFileDefaultABC):
     '''
@@ -478,18 +486,27 @@ class Parameters(YamlFileDefaultABC):
     #aliases of the above form. Brainy rainbows!
     def load(self, *args, **kwargs) -> None:
 
-        # Avoid circular import dependencies.
-        from betse.science.compat import compatconf
-
-        # Version of the YAML specification this file is implicitly assumed to
-        # comply with, preserving backward compatibility with older files
-        # erroneously prefaced by the "%YAML 1.1" directive.
-        YAML_VERSION = '1.2'
-
         # Load this file under the typically safe assumption this file complies
         # with the YAML 1.2 specification, preserving backward compatibility
         # with older files erroneously prefaced by the "%YAML 1.1" directive.
-        super().load(*args, yaml_version=YAML_VERSION, **kwargs)
+        super().load(*args, yaml_version=_YAML_VERSION, **kwargs)
+
+        # Parse all settings from the low-level container loaded above.
+        self.reload()
+
+
+    def reload(self) -> None:
+        '''
+        Reparse all settings of this configuration from the low-level container
+        previously loaded into memory by the :meth:`load` method.
+
+        This method is principally intended to be called after modifying this
+        container in memory (e.g., by a parameter sweep), avoiding the need to
+        save this container back to disk and reload the resulting file.
+        '''
+
+        # Avoid circular import dependencies.
+        from betse.science.compat import compatconf
 
         # Preserve backward compatibility with prior configuration formats
         # *BEFORE* other initialization, which expects the passed YAML file to
@@ -547,11 +564,14 @@ class Parameters(YamlFileDefaultABC):
             self.refine_mesh = mesh_refine['refine mesh']
             self.maximum_voronoi_steps = int(mesh_refine['maximum steps'])
             self.voronoi_convergence = float(mesh_refine['convergence threshold'])
+            self.refine_mesh_incremental = bool(
+                mesh_refine.get('incremental', False))
 
         else:
             self.refine_mesh = False
             self.maximum_voronoi_steps = 10
             self.voronoi_convergence = 2.5
+            self.refine_mesh_incremental = False
 
         # Parameters for import of cell seed centers and clipping curve from user-defined svg files:
         # FIXME need to be put into betse.science.compat:
@@ -791,7 +811,7 @@ class Parameters(YamlFileDefaultABC):
                 # sane version of the YAML specification.
                 self.expression_data = yamls.load(
                     filename=self.expression_data_path,
-                    yaml_version=YAML_VERSION)
+                    yaml_version=_YAML_VERSION)
         else:
             self.mol_mit_enabled = False
 
@@ -807,7 +827,7 @@ class Parameters(YamlFileDefaultABC):
             # complies with a sane version of the YAML specification.
             self.grn.load(
                 conf_filename=self.grn_config_filename,
-                yaml_version=YAML_VERSION)
+                yaml_version=_YAML_VERSION)
 
         simgrndic = (
             self._conf['gene regulatory network settings']['sim-grn settings'])
@@ -817,6 +837,15 @@ class Parameters(YamlFileDefaultABC):
         self.grn_tsample = float(simgrndic.get('sampling rate', 1.0))
         self.grn_runmodesim = simgrndic.get('run as sim', False)
 
+        # Solver integrating chemical reactions in cells by "betse sim-grn",
+        # either "explicit" (i.e., forward Euler at the above time step) or the
+        # name of a stiff implicit method supported by scipy's solve_ivp().
+        self.grn_solver = simgrndic.get('solver', 'explicit')
+        if self.grn_solver not in {'explicit', 'BDF', 'Radau', 'LSODA'}:
+            raise BetseSimConfException(
+                'sim-grn solver "{}" not "explicit", "BDF", "Radau", '
+                'or "LSODA".'.format(self.grn_solver))
+
         #--------------------------------------------------------------------------------------------------------------
         # VARIABLE SETTINGS
         #--------------------------------------------------------------------------------------------------------------
@@ -1038,6 +1067,10 @@ class Parameters(YamlFileDefaultABC):
         self.IecmPlot = ro['plot total current']    # True = plot extracellular currents, false plot gj
         self.plotMask = ro['plot masked geometry']
 
+        # number of processes concurrently running the exports (e.g., CSVs, plots, animations) of each phase. Exports are
+        # run serially by the current process if 1 or if any plots or animations are displayed.
+        self.export_workers = int(ro.get('export workers', 1))
+
         #FIXME: Remove all of the following after globally removing "plot seed".
         # Plot seed options.
         self.plot_cluster_mask = ro.get('plot cluster mask', True)
@@ -1141,6 +1174,36 @@ class Parameters(YamlFileDefaultABC):
 
         self.fast_update_ecm = iu.get('fast update ecm', False)  # quick or slow update to cell<--> ecm grid exchange?
 
+        # advance voltage-gated gap junctions once per moving ion rather than once per time step? (legacy behaviour,
+        # preserved for regression comparisons only)
+        self.gj_gating_per_ion = bool(iu.get('gj gating per ion', False))
+
+        # log the wall-time spent in each solver subsystem after each phase, optionally also saved as JSON beside the
+        # pickled results of that phase?
+        self.solver_timing = bool(iu.get('solver timing', False))
+        self.solver_timing_json = bool(iu.get('solver timing json', False))
+
+        # adaptively grow the time step of the full solver while near steady state? The maximum time step is given as a
+        # multiple of the configured time step, the tolerance as the relative local error of Vmem and concentrations
+        # per step, and the maximum Vmem change per step (in mV) as the change above which steps revert to the
+        # configured time step.
+        self.adaptive_time_step = bool(iu.get('adaptive time step', False))
+        self.adaptive_dt_max_factor = float(iu.get('adaptive max dt factor', 10.0))
+        self.adaptive_tolerance = float(iu.get('adaptive tolerance', 1.0e-4))
+        self.adaptive_vmem_change_max = float(iu.get('adaptive max Vmem change', 0.1))*1e-3
+
+        # solve the init phase directly for the steady state of the full solver by the Newton-Krylov method, falling
+        # back to time stepping if this fails to converge? The tolerance is the maximum relative rate of change [1/s] of
+        # any concentration (or Vmem, if cells are polarizable) at steady state.
+        self.steady_state_init = bool(iu.get('steady state init', False))
+        self.steady_state_tolerance = float(iu.get('steady state tolerance', 1.0e-6))
+        self.steady_state_iterations_max = int(iu.get('steady state max iterations', 50))
+
+        if self.steady_state_tolerance <= 0.0:
+            raise BetseSimConfException(
+                'Steady state tolerance {} not positive.'.format(
+                    self.steady_state_tolerance))
+
         self.sharpness = float(iu.get('sharpness env', 0.999))
 
         self.smooth_cells = 1/float(iu.get('sharpness cell', 0.5))
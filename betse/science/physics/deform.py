@@ -41,8 +41,8 @@ def getDeformation(sim, cells, t, p):
     gPx = -gPP*cells.nn_tx
     gPy = -gPP*cells.nn_ty
 
-    sim.gPxc = np.dot(cells.M_sum_mems, gPx) / cells.num_mems
-    sim.gPyc = np.dot(cells.M_sum_mems, gPy) / cells.num_mems
+    sim.gPxc = cells.M_sum_mems.dot(gPx) / cells.num_mems
+    sim.gPyc = cells.M_sum_mems.dot(gPy) / cells.num_mems
 
     # deformation by "galvanotropic" mechanism (electrostrictive forces
     # influenced by biology, e.g. cytoskeletal).
@@ -53,8 +53,8 @@ def getDeformation(sim, cells, t, p):
 
     # Calculate flow under body forces using time-independent linear elasticity
     # equation.
-    dxo = np.dot(cells.lapGJinv, -Fx)
-    dyo = np.dot(cells.lapGJinv, -Fy)
+    dxo = cells.lapGJinv.solve(-Fx)
+    dyo = cells.lapGJinv.solve(-Fy)
 
     # Deformation must be made divergence-free. To do so, use the
     # Helmholtz-Hodge decomposition method.
@@ -69,8 +69,8 @@ def getDeformation(sim, cells, t, p):
         dx = -gPP * cells.nn_tx
         dy = -gPP * cells.nn_ty
 
-        dxco = np.dot(cells.M_sum_mems, dx) / cells.num_mems
-        dyco = np.dot(cells.M_sum_mems, dy) / cells.num_mems
+        dxco = cells.M_sum_mems.dot(dx) / cells.num_mems
+        dyco = cells.M_sum_mems.dot(dy) / cells.num_mems
 
         # _, dxc, dyc, _, _, _ = cells.HH_cells(dxco, dyco, rot_only=True,
         #                                                           bounds_closed=p.fixed_cluster_bound)
@@ -134,8 +134,8 @@ def timeDeform(sim, cells, t, p):
     gPx = -gPP * cells.nn_tx
     gPy = -gPP * cells.nn_ty
 
-    sim.gPxc = np.dot(cells.M_sum_mems, gPx) / cells.num_mems
-    sim.gPyc = np.dot(cells.M_sum_mems, gPy) / cells.num_mems
+    sim.gPxc = cells.M_sum_mems.dot(gPx) / cells.num_mems
+    sim.gPyc = cells.M_sum_mems.dot(gPy) / cells.num_mems
 
     # deformation by "galvanotropic" mechanism (electrostrictive forces influenced by biology, e.g. cytoskeletal):
     F_cell_x = (1 / p.lame_mu) * ( (1/sim.sigma) * sim.J_cell_x * sim.rho_cells * p.galvanotropism + sim.gPxc)
@@ -161,9 +161,9 @@ def timeDeform(sim, cells, t, p):
         logs.log_info('Try a world size of at least: ' + str(round((5 / 3) * (wave_speed / 500) * 1e6))
                       + ' um for resonance.')
 
-        sim.d_cells_x = k_const * np.dot(cells.lapGJ, sim.dx_time[-1]) + (k_const / p.lame_mu) * F_cell_x + \
+        sim.d_cells_x = k_const * cells.lapGJ.dot(sim.dx_time[-1]) + (k_const / p.lame_mu) * F_cell_x + \
                         sim.dx_time[-1]
-        sim.d_cells_y = k_const * np.dot(cells.lapGJ, sim.dy_time[-1]) + (k_const / p.lame_mu) * F_cell_y + \
+        sim.d_cells_y = k_const * cells.lapGJ.dot(sim.dy_time[-1]) + (k_const / p.lame_mu) * F_cell_y + \
                         sim.dy_time[-1]
 
     elif t > 0.0:
@@ -176,10 +176,10 @@ def timeDeform(sim, cells, t, p):
 
         gamma = ((p.dt ** 2) * (p.mu_tissue * p.lame_mu)) / (1000 * (2 * p.cell_radius))
 
-        sim.d_cells_x = k_const * np.dot(cells.lapGJ, sim.dx_time[-1]) - gamma * d_ux_dt + \
+        sim.d_cells_x = k_const * cells.lapGJ.dot(sim.dx_time[-1]) - gamma * d_ux_dt + \
                          (k_const / p.lame_mu) * F_cell_x + 2 * sim.dx_time[-1] - sim.dx_time[-2]
 
-        sim.d_cells_y = k_const * np.dot(cells.lapGJ, sim.dy_time[-1]) - gamma * d_uy_dt + \
+        sim.d_cells_y = k_const * cells.lapGJ.dot(sim.dy_time[-1]) - gamma * d_uy_dt + \
                          (k_const / p.lame_mu) * F_cell_y + 2 * sim.dy_time[-1] - sim.dy_time[-2]
 
 
@@ -207,12 +207,12 @@ def timeDeform(sim, cells, t, p):
     #
     #
     # calculate the reaction pressure required to counter-balance the flow field:
-    # P_react = np.dot(cells.lapGJinv, div_u)
+    # P_react = cells.lapGJinv.solve(div_u)
     #
     # else:
     #
     #     # calculate the reaction pressure required to counter-balance the flow field:
-    #     P_react = np.dot(cells.lapGJinv, div_u)
+    #     P_react = cells.lapGJinv.solve(div_u)
     #
     # # calculate its gradient:
     # gradP_react = (P_react[cells.cell_nn_i[:, 1]] - P_react[cells.cell_nn_i[:, 0]]) / (cells.nn_len)
@@ -265,8 +265,8 @@ def implement_deform_timestep(sim, cells, t, p):
     yv2 = cells.mem_verts[:, 1] + dyv
 
     # calculate new cell centres:
-    cell_cent_x = np.dot(cells.M_sum_mems, xv2*cells.mem_sa)/cells.cell_sa
-    cell_cent_y = np.dot(cells.M_sum_mems, yv2*cells.mem_sa)/cells.cell_sa
+    cell_cent_x = cells.M_sum_mems.dot(xv2*cells.mem_sa)/cells.cell_sa
+    cell_cent_y = cells.M_sum_mems.dot(yv2*cells.mem_sa)/cells.cell_sa
 
     # smooth the vertices:
     # xv2 = sim.smooth_weight_mem*xv2 + cell_cent_x[cells.mem_to_cells]*sim.smooth_weight_o
@@ -35,8 +35,8 @@ def getFlow(sim, cells, p):
             sim.D_env_weight
         )
 
-        uxo = np.dot(cells.lapENVinv, -muFx.ravel())
-        uyo = np.dot(cells.lapENVinv, -muFy.ravel())
+        uxo = cells.lapENVinv.solve(-muFx.ravel())
+        uyo = cells.lapENVinv.solve(-muFy.ravel())
 
         _, sim.u_env_x, sim.u_env_y, _, _, _ = stb.HH_Decomp(uxo, uyo, cells)
 
@@ -47,8 +47,8 @@ def getFlow(sim, cells, p):
     Fyc = sim.E_cell_y*sim.rho_cells*(1/p.mu_water)*p.gj_surface
 
     # Calculate flow under body forces using Stokes flow:
-    u_gj_xo = np.dot(cells.lapGJinv, -Fxc)
-    u_gj_yo = np.dot(cells.lapGJinv, -Fyc)
+    u_gj_xo = cells.lapGJinv.solve(-Fxc)
+    u_gj_yo = cells.lapGJinv.solve(-Fyc)
 
     # Coerce the flow to be divergence-free via the standard Helmholtz-Hodge
     # decomposition method.
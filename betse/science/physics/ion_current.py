@@ -28,7 +28,7 @@ def get_current(sim, cells, p) -> None:
     sim.Jn = sim.Jmem + sim.Jgj
 
     # average the transmembrane current to the cell centre (for smoothing):
-    Jn_ave = np.dot(cells.M_sum_mems, sim.Jn*cells.mem_sa) / cells.cell_sa
+    Jn_ave = cells.M_sum_mems.dot(sim.Jn*cells.mem_sa) / cells.cell_sa
     # Smooth the free current at the membrane:
     sim.Jn = sim.smooth_weight_mem * sim.Jn + Jn_ave[cells.mem_to_cells] * sim.smooth_weight_o
 
@@ -40,8 +40,8 @@ def get_current(sim, cells, p) -> None:
     Jcy = sim.Jn * cells.mem_vects_flat[:,3]
 
     # average intracellular current to cell centres
-    sim.J_cell_x = np.dot(cells.M_sum_mems, Jcx*cells.mem_sa) / cells.cell_sa
-    sim.J_cell_y = np.dot(cells.M_sum_mems, Jcy*cells.mem_sa) / cells.cell_sa
+    sim.J_cell_x = cells.M_sum_mems.dot(Jcx*cells.mem_sa) / cells.cell_sa
+    sim.J_cell_y = cells.M_sum_mems.dot(Jcy*cells.mem_sa) / cells.cell_sa
 
     # normal component of J_cell at the membranes:
     sim.Jc = sim.J_cell_x[cells.mem_to_cells]*cells.mem_vects_flat[:,2] + sim.J_cell_y[cells.mem_to_cells]*cells.mem_vects_flat[:,3]
@@ -87,7 +87,7 @@ def get_current(sim, cells, p) -> None:
         div_Jb[-1, :] = -sim.bound_V['T'] / cells.delta ** 2
         div_Jb[0, :] = -sim.bound_V['B'] / cells.delta ** 2
 
-        Phi_b = np.dot(cells.lapENVinv, -div_Jb.ravel())
+        Phi_b = cells.lapENVinv.solve(-div_Jb.ravel())
 
         # Voltage in the environment is related to extra surface surface charge:
         sim.rho_env_surf = np.zeros(sim.edl)
@@ -167,7 +167,7 @@ def get_current(sim, cells, p) -> None:
         div_Jb[-1, :] = -sim.bound_V['T'] / cells.delta ** 2
         div_Jb[0, :] = -sim.bound_V['B'] / cells.delta ** 2
 
-        Phi_b = np.dot(cells.lapENVinv, -div_Jb.ravel())
+        Phi_b = cells.lapENVinv.solve(-div_Jb.ravel())
         sim.Phi_b = Phi_b # save the boundary value problem
 
 # WASTELANDS (Options)--------------------------------------------------------------------------------------------------
@@ -195,7 +195,7 @@ def get_current(sim, cells, p) -> None:
         #
         # #calculate mapped current component from transmembrane fluxes (which is always curl-free):
         # #Important for 100% biophysical correctness, but we can skip adding these in for efficiency
-        # Phi_cells = np.dot(cells.lapENVinv, -div_Je_fromcells.ravel())
+        # Phi_cells = cells.lapENVinv.solve(-div_Je_fromcells.ravel())
         # Jex_cells, Jey_cells = fd.gradient(Phi_cells.reshape(cells.X.shape), cells.delta)
         #
         # sim.Jtx += Jex_cells
@@ -291,7 +291,7 @@ def get_current(sim, cells, p) -> None:
     # # divJo = fd.integrator(divJo.reshape(cells.X.shape), 0.5)
     #
     # # environmental local field potential:
-    # Phi = np.dot(cells.lapENVinv, -divJo.ravel())
+    # Phi = cells.lapENVinv.solve(-divJo.ravel())
     #
     # # smooth it:
     # Phi = fd.integrator(Phi.reshape(cells.X.shape), 0.5)
@@ -330,7 +330,7 @@ def get_current(sim, cells, p) -> None:
     # # divJo[0, :] = -sim.bound_V['B'] / (cells.delta ** 2)
     # #
     # # # environmental local field potential:
-    # # lfp = np.dot(cells.lapENVinv, -divJo.ravel())
+    # # lfp = cells.lapENVinv.solve(-divJo.ravel())
     #
     # # v_env = vce + ((sim.rho_env) / ((sim.ko_env ** 2) * p.eo * p.er))
     #
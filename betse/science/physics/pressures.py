@@ -37,7 +37,7 @@ def osmotic_P(sim, cells, p):
 
     if p.is_ecm is False:
 
-        op_env = np.dot(cells.M_sum_mems, sim.osmo_P_env)/cells.num_mems
+        op_env = cells.M_sum_mems.dot(sim.osmo_P_env)/cells.num_mems
 
         sim.osmo_P_delta = op_env - sim.osmo_P_cell
 
@@ -56,7 +56,7 @@ def osmotic_P(sim, cells, p):
     sim.div_u_osmo = sim.u_osmo*(cells.cell_sa/cells.cell_vol)
 
     # calculate pressure in whole network resulting from divergence :
-    sim.PP = np.dot(cells.lapGJinv, -sim.div_u_osmo * p.rho * p.dt)
+    sim.PP = cells.lapGJinv.solve(-sim.div_u_osmo * p.rho * p.dt)
 
     # ------------------------------------------------------------------------------------------------------------
     # # actual volume change is amount of flow over the cell surface area per unit time:
@@ -11,21 +11,34 @@ spreadsheets in comma-separated value (CSV) format.
 
 # ....................{ IMPORTS                           }....................
 import numpy as np
-from betse.lib.numpy import nparray, npcsv
+from betse.lib.numpy import npcsv
 from betse.science.config.export.confexpcsv import SimConfExportCSV
+from betse.science.enum.enumconf import CsvLayoutType
 from betse.science.math import mathunit
 from betse.science.phase.phasecls import SimPhase
 from betse.science.enum.enumphase import SimPhaseKind
 from betse.science.phase.require import phasereqs
 from betse.science.pipe.export.pipeexpabc import SimPipeExportABC
 from betse.science.pipe.piperun import piperunner
-from betse.science.visual.plot.plotutil import cell_ave
 # from betse.util.io.log import logs
 from betse.util.path import dirs, pathnames
 from betse.util.type.descriptor.descs import classproperty_readonly
 from betse.util.type.iterable.mapping.mapcls import OrderedArgsDict
 from betse.util.type.types import (
-    type_check, NumpyArrayType, SequenceTypes, StrOrNoneTypes,)
+    type_check,
+    MappingType,
+    NumpyArrayType,
+    SequenceTypes,
+    StrOrNoneTypes,
+)
+
+# ....................{ CONSTANTS                         }....................
+_LONG_CSV_ROWS_CHUNK_SIZE = 100000
+'''
+Minimum number of rows of each chunk of a long-format CSV file formatted and
+appended to that file at once, trading memory consumption for fewer calls to
+the :func:`numpy.savetxt` function.
+'''
 
 # ....................{ SUBCLASSES                        }....................
 class SimPipeExportCSVs(SimPipeExportABC):
@@ -66,8 +79,8 @@ class SimPipeExportCSVs(SimPipeExportABC):
         indexed ``plot cell index`` in the current simulation configuration.
         '''
 
-        # 0-based index of the cell to serialize time data for.
-        cell_index = phase.p.visual.single_cell_index
+        # Subcache of all stacked sampled time series for this phase.
+        times_cache = phase.cache.times
 
         # Sequence of key-value pairs containing all simulation data to be
         # exported for this cell, suitable for passing to the
@@ -88,70 +101,51 @@ class SimPipeExportCSVs(SimPipeExportABC):
 
         # ................{ VMEM ~ goldman                  }..................
         if phase.p.GHK_calc:
-            vm_goldman = mathunit.upscale_units_milli([
-                vm_GHK_time_cells[cell_index]
-                for vm_GHK_time_cells in phase.sim.vm_GHK_time])
+            vm_goldman = mathunit.upscale_units_milli(
+                times_cache.get_cell_times('vm_GHK_time'))
         else:
             vm_goldman = column_data_empty
 
         csv_column_name_values.extend(('Goldman_Vmem_mV', vm_goldman))
 
         # ................{ Na K PUMP RATE                  }..................
-        if phase.p.is_ecm:
-            pump_rate = [
-                pump_array[phase.cells.cell_to_mems[cell_index][0]]
-                for pump_array in phase.sim.rate_NaKATP_time]
-        else:
-            pump_rate = [
-                pump_array[cell_index]
-                for pump_array in phase.sim.rate_NaKATP_time]
-
         csv_column_name_values.extend((
-            'NaK-ATPase_Rate_mol/m2s', pump_rate))
+            'NaK-ATPase_Rate_mol/m2s',
+            times_cache.get_cell_times('rate_NaKATP_time'),
+        ))
 
         # ................{ ION CONCENTRATIONS              }..................
+        # Two-dimensional Numpy array of all cell concentrations of all ions
+        # for each sampled time step.
+        cc_times = times_cache.get_cell_times('cc_time')
+
         # Create the header starting with cell concentrations.
         for i in range(len(phase.sim.ionlabel)):
             csv_column_name = 'cell_{}_mmol/L'.format(
                 phase.sim.ionlabel[i])
-            cc_m = [arr[i][cell_index] for arr in phase.sim.cc_time]
-            csv_column_name_values.extend((csv_column_name, cc_m))
+            csv_column_name_values.extend((csv_column_name, cc_times[:, i]))
 
         # ................{ MEMBRANE PERMEABILITIES         }..................
+        # Two-dimensional Numpy array of all membrane permeabilities of all
+        # ions for each sampled time step.
+        dd_times = times_cache.get_cell_times('dd_time')
+
         # Create the header starting with membrane permeabilities.
         for i in range(len(phase.sim.ionlabel)):
-            if phase.p.is_ecm:
-                dd_m = [
-                    arr[i][phase.cells.cell_to_mems[cell_index][0]]
-                    for arr in phase.sim.dd_time
-                ]
-            else:
-                dd_m = [arr[i][cell_index] for arr in phase.sim.dd_time]
-
             csv_column_name = 'Dm_{}_m2/s'.format(phase.sim.ionlabel[i])
-            csv_column_name_values.extend((csv_column_name, dd_m))
+            csv_column_name_values.extend((csv_column_name, dd_times[:, i]))
 
         # ................{ TRANSMEMBRANE CURRENTS          }..................
-        if phase.p.is_ecm:
-            Imem = [
-                memArray[phase.cells.cell_to_mems[cell_index][0]]
-                for memArray in phase.sim.I_mem_time]
-        else:
-            Imem = [
-                memArray[cell_index]
-                for memArray in phase.sim.I_mem_time
-            ]
-
-        csv_column_name_values.extend(('I_A/m2', Imem))
+        csv_column_name_values.extend((
+            'I_A/m2', times_cache.get_cell_times('I_mem_time')))
 
         # ................{ HYDROSTATIC PRESSURE            }..................
-        p_hydro = [arr[cell_index] for arr in phase.sim.P_cells_time]
-        csv_column_name_values.extend(('HydroP_Pa', p_hydro))
+        csv_column_name_values.extend((
+            'HydroP_Pa', times_cache.get_cell_times('P_cells_time')))
 
         # ................{ OSMOTIC PRESSURE                }..................
         if phase.p.deform_osmo:
-            p_osmo = [
-                arr[cell_index] for arr in phase.sim.osmo_P_delta_time]
+            p_osmo = times_cache.get_cell_times('osmo_P_delta_time')
         else:
             p_osmo = column_data_empty
 
@@ -163,10 +157,8 @@ class SimPipeExportCSVs(SimPipeExportABC):
             phase.kind is SimPhaseKind.SIM
         ):
             # Extract time-series deformation data for the plot cell:
-            dx = nparray.from_iterable([
-                arr[cell_index] for arr in phase.sim.dx_cell_time])
-            dy = nparray.from_iterable([
-                arr[cell_index] for arr in phase.sim.dy_cell_time])
+            dx = times_cache.get_cell_times('dx_cell_time')
+            dy = times_cache.get_cell_times('dy_cell_time')
 
             # Get the total magnitude.
             disp = mathunit.upscale_coordinates(np.sqrt(dx ** 2 + dy ** 2))
@@ -180,23 +172,17 @@ class SimPipeExportCSVs(SimPipeExportABC):
         csv_column_name_to_values = OrderedArgsDict(*csv_column_name_values)
 
         # Export this data to this CSV file.
-        npcsv.write_csv(
+        self._write_csv(
+            phase=phase,
             filename=self._get_csv_filename(
                 phase=phase, basename_sans_filetype='ExportedData'),
             column_name_to_values=csv_column_name_to_values,
         )
 
     # ..................{ EXPORTERS ~ cell : vmem           }..................
-    #FIXME: This exporter appears to currently be broken for the non-ECM
-    #case, despite working for the ECM case. The exception being raised is:
-    #
-    #    BetseSequenceException: Column "FFT_Vmem" length 9 differs from length
-    #    5 of prior columns.
     @piperunner(
         categories=('Single Cell', 'Voltage', 'FFT'),
-
-        #FIXME: Eliminate this requirement after resolving the above issue.
-        requirements=phasereqs.VOLTAGE_EXTRA,
+        requirements=phasereqs.SOLVER_FULL,
     )
     def export_cell_vmem_fft(
         self, phase: SimPhase, conf: SimConfExportCSV) -> None:
@@ -240,7 +226,8 @@ class SimPipeExportCSVs(SimPipeExportABC):
         )
 
         # Export this data to this CSV file.
-        npcsv.write_csv(
+        self._write_csv(
+            phase=phase,
             filename=self._get_csv_filename(
                 phase=phase, basename_sans_filetype='ExportedData_FFT'),
             column_name_to_values=csv_column_name_to_values,
@@ -271,6 +258,29 @@ class SimPipeExportCSVs(SimPipeExportABC):
         )
 
     # ..................{ PRIVATE ~ getters                 }..................
+    @type_check
+    def _get_column_format(self, phase: SimPhase) -> str:
+        '''
+        ``%``-prefixed format string formatting all floating-point columns of
+        all CSV files exported for the passed simulation phase, preserving the
+        number of significant digits configured by that phase.
+
+        Parameters
+        ----------
+        phase : SimPhase
+            Current simulation phase.
+        '''
+
+        # Number of significant digits, defaulting to full precision.
+        precision = phase.p.csv.precision
+        if precision is None:
+            precision = 19
+
+        # Since scientific notation formats one digit before the decimal point,
+        # format one less digit after the decimal point.
+        return '%.{}e'.format(precision - 1)
+
+
     @type_check
     def _get_csv_filename(
         self,
@@ -338,6 +348,12 @@ class SimPipeExportCSVs(SimPipeExportABC):
         containing arbitrary simulation data spatially situated at cell centres
         for each sampled time step of the current simulation phase.
 
+        If the current simulation configuration instead requests the long or
+        NPZ layout (i.e., :attr:`CsvLayoutType.LONG` or
+        :attr:`CsvLayoutType.NPZ`), this method instead saves one file
+        containing this data for all sampled time steps whose basename is the
+        passed directory basename.
+
         Parameters
         ----------
         phase : SimPhase
@@ -356,10 +372,8 @@ class SimPipeExportCSVs(SimPipeExportABC):
             exported by this method.
         '''
 
-        # Absolute pathname of the directory containing all CSV files
-        # specifically exported by this method.
-        csv_dirname = pathnames.join(
-            phase.export_dirname, csv_dir_basename)
+        # Layout of the files exported by this method.
+        layout = phase.p.csv.layout
 
         # One-dimensional Numpy arrays of the X and Y coordinates
         # (respectively) of the centres of all cells.
@@ -368,6 +382,35 @@ class SimPipeExportCSVs(SimPipeExportABC):
         cell_centres_y = mathunit.upscale_coordinates(
             phase.cells.cell_centres[:,1])
 
+        # If exporting one columnar binary archive of all time steps, do so.
+        if layout is CsvLayoutType.NPZ:
+            self._export_cells_times_data_npz(
+                phase=phase,
+                cells_times_data=cells_times_data,
+                cell_centres_x=cell_centres_x,
+                cell_centres_y=cell_centres_y,
+                csv_column_name=csv_column_name,
+                csv_dir_basename=csv_dir_basename,
+            )
+            return
+        # Else if exporting one long-format CSV file of all time steps, do so.
+        elif layout is CsvLayoutType.LONG:
+            self._export_cells_times_data_long(
+                phase=phase,
+                cells_times_data=cells_times_data,
+                cell_centres_x=cell_centres_x,
+                cell_centres_y=cell_centres_y,
+                csv_column_name=csv_column_name,
+                csv_dir_basename=csv_dir_basename,
+            )
+            return
+        # Else, export one CSV file for each time step.
+
+        # Absolute pathname of the directory containing all CSV files
+        # specifically exported by this method.
+        csv_dirname = pathnames.join(
+            phase.export_dirname, csv_dir_basename)
+
         # For the 0-based index of each sampled time step...
         for time_step in range(len(phase.sim.time)):
             # Basename of the CSV-formatted file exported for this time step,
@@ -390,9 +433,153 @@ class SimPipeExportCSVs(SimPipeExportABC):
             )
 
             # Export this data to this CSV file.
-            npcsv.write_csv(
+            self._write_csv(
+                phase=phase,
                 filename=csv_filename,
-                column_name_to_values=csv_column_name_to_values)
+                column_name_to_values=csv_column_name_to_values,
+            )
+
+
+    @type_check
+    def _export_cells_times_data_long(
+        self,
+        phase: SimPhase,
+        cells_times_data: SequenceTypes,
+        cell_centres_x: NumpyArrayType,
+        cell_centres_y: NumpyArrayType,
+        csv_column_name: str,
+        csv_dir_basename: str,
+    ) -> None:
+        '''
+        Save one long-format plaintext file in comma-separated value (CSV)
+        format containing one row for each cell and each sampled time step of
+        the current simulation phase, formatted and appended to this file in
+        chunks of time steps.
+
+        See Also
+        ----------
+        :meth:`_export_cells_times_data`
+            Further details.
+        '''
+
+        # Number of cells and sampled time steps.
+        cells_count = len(cell_centres_x)
+        times_count = len(phase.sim.time)
+
+        # Number of time steps formatted at once.
+        times_chunk_size = max(1, _LONG_CSV_ROWS_CHUNK_SIZE // cells_count)
+
+        def iter_rows_chunks():
+            '''
+            Generator yielding one two-dimensional Numpy array of the rows of
+            each chunk of time steps.
+            '''
+
+            for time_first in range(0, times_count, times_chunk_size):
+                time_last = min(time_first + times_chunk_size, times_count)
+                chunk_times_count = time_last - time_first
+
+                yield np.column_stack((
+                    np.repeat(
+                        phase.sim.time[time_first:time_last], cells_count),
+                    np.tile(cell_centres_x, chunk_times_count),
+                    np.tile(cell_centres_y, chunk_times_count),
+                    np.asarray(
+                        cells_times_data[time_first:time_last]).ravel(),
+                ))
+
+        npcsv.write_csv_chunks(
+            filename=self._get_csv_filename(
+                phase=phase, basename_sans_filetype=csv_dir_basename),
+            column_names=('time [s]', 'x [um]', 'y [um]', csv_column_name),
+            rows_chunks=iter_rows_chunks(),
+            column_format=self._get_column_format(phase),
+        )
+
+
+    @type_check
+    def _export_cells_times_data_npz(
+        self,
+        phase: SimPhase,
+        cells_times_data: SequenceTypes,
+        cell_centres_x: NumpyArrayType,
+        cell_centres_y: NumpyArrayType,
+        csv_column_name: str,
+        csv_dir_basename: str,
+    ) -> None:
+        '''
+        Save one uncompressed NumPy ``.npz`` archive containing the sampled
+        times, cell centre coordinates, and two-dimensional array of the passed
+        data for all sampled time steps of the current simulation phase, keyed
+        by the same names as the columns of the equivalent CSV files.
+
+        If the configured precision is at most the 7 significant digits of
+        single-precision floats, all floating-point arrays are saved as such.
+
+        See Also
+        ----------
+        :meth:`_export_cells_times_data`
+            Further details.
+        '''
+
+        # Floating-point type of all saved arrays.
+        precision = phase.p.csv.precision
+        dtype = (
+            np.float32 if precision is not None and precision <= 7 else
+            np.float64)
+
+        # Absolute filename of this archive.
+        npz_filename = pathnames.join(
+            phase.export_dirname, csv_dir_basename + '.npz')
+        dirs.make_parent_unless_dir(npz_filename)
+
+        np.savez(
+            npz_filename,
+            **{
+                'time [s]': np.asarray(phase.sim.time, dtype=dtype),
+                'x [um]': np.asarray(cell_centres_x, dtype=dtype),
+                'y [um]': np.asarray(cell_centres_y, dtype=dtype),
+                csv_column_name: np.asarray(cells_times_data, dtype=dtype),
+            }
+        )
+
+    # ..................{ PRIVATE ~ writers                 }..................
+    @type_check
+    def _write_csv(
+        self,
+        phase: SimPhase,
+        filename: str,
+        column_name_to_values: MappingType,
+    ) -> None:
+        '''
+        Save the passed columns to the CSV file with the passed filename,
+        formatted with the precision configured by the passed simulation phase.
+
+        Parameters
+        ----------
+        phase : SimPhase
+            Current simulation phase.
+        filename : str
+            Absolute filename of this CSV file.
+        column_name_to_values : MappingType
+            Ordered dictionary mapping from CSV column names to data arrays.
+        '''
+
+        # Dictionary mapping from CSV column names to format strings if a
+        # precision is configured *OR* "None" to format at full precision.
+        column_name_to_format = None
+        if phase.p.csv.precision is not None:
+            column_format = self._get_column_format(phase)
+            column_name_to_format = {
+                column_name: column_format
+                for column_name in column_name_to_values.keys()
+            }
+
+        npcsv.write_csv(
+            filename=filename,
+            column_name_to_values=column_name_to_values,
+            column_name_to_format=column_name_to_format,
+        )
 
     # ..................{ PRIVATE ~ properties              }..................
     @type_check
@@ -409,17 +596,5 @@ class SimPipeExportCSVs(SimPipeExportABC):
             Current simulation phase.
         '''
 
-        # 0-based index of the cell to serialize time data for.
-        cell_index = phase.p.visual.single_cell_index
-
-        if phase.p.is_ecm:
-            cell_times_vmems = []
-            for vm_at_mem in phase.sim.vm_time:
-                vm_t = mathunit.upscale_units_milli(
-                    cell_ave(phase.cells,vm_at_mem)[cell_index])
-                cell_times_vmems.append(vm_t)
-        else:
-            cell_times_vmems = mathunit.upscale_units_milli(
-                phase.sim.vm_time)
-
-        return nparray.from_iterable(cell_times_vmems)
+        return mathunit.upscale_units_milli(
+            phase.cache.times.get_cell_times_mems_mean('vm_time'))
@@ -9,7 +9,8 @@ aggregating runners defined by all available export pipelines) facilities.
 '''
 
 # ....................{ IMPORTS                           }....................
-from betse.exceptions import BetseSimPipeRunnerUnsatisfiedException
+from betse.exceptions import (
+    BetseSimPipeException, BetseSimPipeRunnerUnsatisfiedException)
 from betse.lib.matplotlib import mplfigure
 from betse.science.phase.phasecls import SimPhase
 from betse.science.pipe.export.pipeexpcsv import SimPipeExportCSVs
@@ -19,7 +20,9 @@ from betse.science.pipe.export.plot.pipeexpplotcell import (
 from betse.science.pipe.export.plot.pipeexpplotcells import (
     SimPipeExportPlotCells)
 from betse.util.io.log import logs
-from betse.util.type.types import type_check, IterableTypes
+from betse.util.os.process import prcfork
+from betse.util.type.types import type_check, IterableTypes, SequenceTypes
+from concurrent.futures import ProcessPoolExecutor, as_completed
 
 # ....................{ CONSTANTS                         }....................
 _PIPES_EXPORT_TYPE = (
@@ -107,6 +110,14 @@ class SimPipesExport(object):
 
         * Else, log an informative message and ignore that pipeline.
 
+        If the current simulation configuration requests two or more export
+        workers *and* no plots or animations are displayed, all such runners
+        are instead run concurrently across a pool of worker processes forked
+        from the current process. In this case, runners failing with an
+        exception are logged rather than halting all other runners; after all
+        runners complete, a single exception aggregating all such failures is
+        raised.
+
         Parameters
         ----------
         phase: SimPhase
@@ -133,40 +144,19 @@ class SimPipesExport(object):
         # calling that callback (e.g., SimCallbacksBC.progressed_next()).
         phase.callbacks.progress_ranged(progress_max=len(runners_enabled))
 
-        # For the method and configuration of each enabled pipeline runner...
-        for runner_method, runner_conf in runners_enabled:
-            # Metadata associated with this runner.
-            runner_metadata = runner_method.metadata
-
-            # Attempt to...
-            try:
-                # Run this runner with this phase and configuration.
-                runner_method(phase, runner_conf)
-
-                #FIXME: Refactor this low-level kludge from the BETSE codebase
-                #into a high-level implementation in the BETSEE codebase. See
-                #the prominent "FIXME" comment in the "pipeabc" submodule for
-                #preliminary work required to begin doing so. For now, this
-                #tragically suffices.
-
-                # Notify the caller of the successful completion of this
-                # runner. Since the prior call failed to raise an exception,
-                # this runner necessarily succeeded.
-                phase.callbacks.progressed_next(
-                    status='Exported {} "{}".'.format(
-                        runner_metadata.noun_singular_lowercase,
-                        runner_metadata.kind))
-            # If this runner's requirements are unsatisfied (e.g., due to the
-            # current simulation configuration disabling fluid flow), notify
-            # the caller of this non-fatal condition and continue.
-            except BetseSimPipeRunnerUnsatisfiedException as exception:
-                phase.callbacks.progressed_next(
-                    status='Excluding {} "{}", as {}.'.format(
-                        runner_metadata.noun_singular_lowercase,
-                        runner_metadata.kind,
-                        exception.reason))
-            # Else if this runner raises any other exception, permit this
-            # exception to propagate up the callstack without intervention.
+        # If running these runners concurrently, do so.
+        if _is_export_concurrent(phase, runners_enabled):
+            _export_concurrent(phase, runners_enabled)
+        # Else, run these runners serially. For the method and configuration
+        # of each enabled pipeline runner...
+        else:
+            for runner_method, runner_conf in runners_enabled:
+                # Run this runner and notify the caller of its completion. If
+                # this runner raises an exception *OTHER* than that signifying
+                # its requirements to be unsatisfied, permit this exception to
+                # propagate up the callstack without intervention.
+                phase.callbacks.progressed_next(status=_run_runner(
+                    phase, runner_method, runner_conf))
 
         # Unconditionally close all currently open matplotlib figures
         # regardless of whether any of the above runners invoked matplotlib.
@@ -180,3 +170,232 @@ class SimPipesExport(object):
         # Log the directory to which all results were exported.
         logs.log_info('Simulation results exported to:')
         logs.log_info('\t%s', phase.export_dirname)
+
+# ....................{ PRIVATE ~ runners                 }....................
+def _run_runner(
+    phase: SimPhase, runner_method: object, runner_conf: object) -> str:
+    '''
+    Run the passed export pipeline runner with the passed simulation phase and
+    runner configuration, returning a human-readable status describing the
+    completion of this runner.
+
+    If this runner reports its requirements to be unsatisfied (e.g., due to
+    the current simulation configuration disabling extracellular spaces), this
+    runner is ignored and the returned status describes why. All other
+    exceptions raised by this runner are propagated to the caller.
+
+    Parameters
+    ----------
+    phase: SimPhase
+        Current simulation phase.
+    runner_method : SimPipeRunner
+        Method implementing this runner.
+    runner_conf : SimConfExportABC
+        Configuration of this runner.
+
+    Returns
+    ----------
+    str
+        Human-readable status describing the completion of this runner.
+    '''
+
+    # Metadata associated with this runner.
+    runner_metadata = runner_method.metadata
+
+    # Attempt to...
+    try:
+        # Run this runner with this phase and configuration.
+        runner_method(phase, runner_conf)
+
+        #FIXME: Refactor this low-level kludge from the BETSE codebase
+        #into a high-level implementation in the BETSEE codebase. See
+        #the prominent "FIXME" comment in the "pipeabc" submodule for
+        #preliminary work required to begin doing so. For now, this
+        #tragically suffices.
+
+        # Describe the successful completion of this runner. Since the prior
+        # call failed to raise an exception, this runner necessarily
+        # succeeded.
+        return 'Exported {} "{}".'.format(
+            runner_metadata.noun_singular_lowercase, runner_metadata.kind)
+    # If this runner's requirements are unsatisfied (e.g., due to the
+    # current simulation configuration disabling fluid flow), describe this
+    # non-fatal condition.
+    except BetseSimPipeRunnerUnsatisfiedException as exception:
+        return 'Excluding {} "{}", as {}.'.format(
+            runner_metadata.noun_singular_lowercase,
+            runner_metadata.kind,
+            exception.reason)
+
+
+def _run_runner_forked(runner_index: int) -> str:
+    '''
+    Run the export pipeline runner with the passed index in the sequence of
+    runners with the simulation phase exposed to forked worker processes by the
+    :func:`_export_concurrent` function, returning a human-readable status
+    describing the completion of this runner.
+
+    This function is intended to be called *only* from worker processes forked
+    by the :func:`_export_concurrent` function. Since exceptions raised by
+    runners are *not* necessarily picklable, this function logs and reraises
+    any such exception as a picklable exception embedding only its message.
+
+    Parameters
+    ----------
+    runner_index : int
+        0-based index of the runner to be run in the sequence of runners
+        exposed to forked worker processes.
+
+    Returns
+    ----------
+    str
+        Human-readable status describing the completion of this runner.
+
+    Raises
+    ----------
+    BetseSimPipeException
+        If this runner raises any exception other than that signifying its
+        requirements to be unsatisfied.
+    '''
+
+    # Method and configuration of this runner.
+    runner_method, runner_conf = prcfork.get_forked_global('runners')[
+        runner_index]
+
+    # Attempt to run this runner.
+    try:
+        return _run_runner(
+            prcfork.get_forked_global('phase'), runner_method, runner_conf)
+    # If doing so fails, log this exception *BEFORE* reraising a picklable
+    # exception, preserving this exception's traceback in the logfile.
+    except Exception as exception:
+        logs.log_exception(exception)
+        raise BetseSimPipeException(str(exception)) from None
+    # Unconditionally close all matplotlib figures opened by this runner
+    # *BEFORE* this worker runs another runner.
+    finally:
+        mplfigure.close_figures_all()
+
+# ....................{ PRIVATE ~ concurrency             }....................
+def _is_export_concurrent(
+    phase: SimPhase, runners_enabled: SequenceTypes) -> bool:
+    '''
+    ``True`` only if the passed enabled export pipeline runners are to be run
+    concurrently across two or more worker processes.
+
+    Specifically, this function returns ``True`` only if:
+
+    * The current simulation configuration requests two or more export
+      workers.
+    * Two or more runners are enabled.
+    * No plots or animations are displayed.
+    * The current platform safely supports forking processes. See the
+      :func:`betse.util.os.process.prcfork.is_forkable` tester.
+
+    Parameters
+    ----------
+    phase: SimPhase
+        Current simulation phase.
+    runners_enabled : SequenceTypes
+        Sequence of all 2-tuples ``(runner_method, runner_conf)`` of all
+        enabled export pipeline runners.
+    '''
+
+    # If running these runners serially, return false immediately.
+    if not (
+        phase.p.export_workers > 1 and
+        len(runners_enabled) > 1 and
+        not phase.p.plot.is_after_sim_show and
+        not phase.p.anim.is_after_sim_show
+    ):
+        return False
+
+    # Run these runners concurrently only if forking is safe.
+    return prcfork.is_forkable_else_warn('Exports')
+
+
+def _export_concurrent(
+    phase: SimPhase, runners_enabled: SequenceTypes) -> None:
+    '''
+    Run the passed enabled export pipeline runners with the passed simulation
+    phase concurrently across a pool of forked worker processes.
+
+    Each runner writes only the files named by its own configuration, which
+    are thus independent of the order in which runners complete. Each runner
+    failing with an exception is logged rather than halting all other
+    runners; after all runners complete, a single exception aggregating all
+    such failures is raised.
+
+    Parameters
+    ----------
+    phase: SimPhase
+        Current simulation phase.
+    runners_enabled : SequenceTypes
+        Sequence of all 2-tuples ``(runner_method, runner_conf)`` of all
+        enabled export pipeline runners.
+
+    Raises
+    ----------
+    BetseSimPipeException
+        If one or more runners failed.
+    '''
+
+    # Number of worker processes, ignoring excess workers.
+    export_workers = min(phase.p.export_workers, len(runners_enabled))
+
+    # Log this concurrency.
+    logs.log_info(
+        'Exporting %d results across %d processes...',
+        len(runners_enabled), export_workers)
+
+    # Dictionary mapping from the 0-based index of each failed runner to a
+    # 2-tuple "(runner_kind, exception)" describing that failure.
+    runners_failed = {}
+
+    # Expose this phase and these runners to these workers, which inherit
+    # rather than pickle these objects on forking.
+    with prcfork.forking(
+        workers=export_workers, phase=phase, runners=runners_enabled,
+    ), ProcessPoolExecutor(
+        max_workers=export_workers, mp_context=prcfork.get_fork_context(),
+    ) as executor:
+        # Dictionary mapping from the future running each runner to the
+        # 0-based index of that runner.
+        future_to_runner_index = {
+            executor.submit(_run_runner_forked, runner_index): runner_index
+            for runner_index in range(len(runners_enabled))
+        }
+
+        # For each such future in order of completion...
+        for future in as_completed(future_to_runner_index):
+            # Index and metadata of this runner.
+            runner_index = future_to_runner_index[future]
+            runner_metadata = runners_enabled[runner_index][0].metadata
+
+            # Attempt to notify the caller of the completion of this
+            # runner.
+            try:
+                phase.callbacks.progressed_next(status=future.result())
+            # If this runner failed, record this failure and continue.
+            except Exception as exception:
+                logs.log_error(
+                    'Exporting %s "%s" failed: %s',
+                    runner_metadata.noun_singular_lowercase,
+                    runner_metadata.kind,
+                    exception)
+                runners_failed[runner_index] = (
+                    runner_metadata.kind, exception)
+                phase.callbacks.progressed_next()
+
+    # If one or more runners failed, raise an exception aggregating all such
+    # failures in the order of these runners.
+    if runners_failed:
+        raise BetseSimPipeException(
+            '{} of {} exports failed:\n{}'.format(
+                len(runners_failed),
+                len(runners_enabled),
+                '\n'.join(
+                    '\t{}: {}'.format(*runners_failed[runner_index])
+                    for runner_index in sorted(runners_failed)
+                ),
+            ))
@@ -14,6 +14,10 @@ from betse.science.chemistry.gene import MasterOfGenes
 from betse.science.chemistry.molecules import MasterOfMolecules
 from betse.science.enum.enumconf import SolverType
 from betse.science.math import finitediff as fd
+from betse.science.math.simstate import SimStateSnapshot
+from betse.science.math.steadystate import SteadyStateSolver
+from betse.science.math.timeseries import SampledTimeSeries
+from betse.science.math.timestep import AdaptiveTimeStepper
 from betse.science.organelles.endo_retic import EndoRetic
 from betse.science.physics.deform import (
     getDeformation, timeDeform, implement_deform_timestep)
@@ -25,6 +29,8 @@ from betse.science.enum.enumphase import SimPhaseKind
 # from betse.science.organelles.microtubules import Mtubes
 from betse.science.visual.anim.animwhile import AnimCellsWhileSolving
 from betse.util.io.log import logs
+from betse.util.path import pathnames
+from betse.util.py.pytimer import SectionTimer
 from betse.util.type.contexts import noop_context
 from betse.util.type.types import type_check, NoneType
 from numpy import ndarray
@@ -48,12 +54,10 @@ class Simulator(object):
     update_C(ion_i,flux, cells, p)     Updates concentration of ion with index
                                             ion_i in cell and environment for a flux leaving the cell.
 
-    update_gj(cells,p,t,i)                  Calculates the voltage gradient between two cells, the gating character of
-                                            gap junctions, and updates concentration for ion 'i' and voltage of each
-                                            cell after electrodiffusion of ion 'i' between gap junction connected cells.
-
-    update_ecm(cells,p,t,i)                 Updates the environmental spaces by calculating electrodiffusive transport
-                                            of ion 'i'.
+    update_electrodiffusion(cells,p)        Calculates the voltage gradient between two cells, the gating character of
+                                            gap junctions, and the electrodiffusive transport of all moving ions
+                                            across membranes, between gap junction connected cells, and throughout
+                                            the environmental spaces.
 
 
     get_Efield(cells,p)                     Calculates electric fields in cells and environment.
@@ -105,42 +109,42 @@ class Simulator(object):
           either dimension) such that each item is the Y component of the
           extracellular current density vector spatially situated at the centre
           of that space for this time step.
-    I_tot_x_time : list
-        Two-dimensional list of the X components of all extracellular current
-        densities over all time steps, whose:
+    I_tot_x_time : ndarray
+        Two-dimensional Numpy array of the X components of all extracellular
+        current densities over all time steps, whose:
 
         * First dimension indexes each sampled time step.
         * Second dimension yields a one-dimensional Numpy array of the X
           components of all extracellular current densities for this time step,
           defined as for the corresponding :attr:`J_env_x` array.
 
-        Equivalently, this list is the concatenation of all :attr:`J_env_x`
+        Equivalently, this array is the concatenation of all :attr:`J_env_x`
         arrays for all sampled time steps.
-    I_tot_y_time : list
-        Two-dimensional list of the Y components of all extracellular current
-        densities over all time steps, whose:
+    I_tot_y_time : ndarray
+        Two-dimensional Numpy array of the Y components of all extracellular
+        current densities over all time steps, whose:
 
         * First dimension indexes each sampled time step.
         * Second dimension yields a one-dimensional Numpy array of the Y
           components of all extracellular current densities for this time step,
           defined as for the corresponding :attr:`J_env_y` array.
 
-        Equivalently, this list is the concatenation of all :attr:`J_env_y`
+        Equivalently, this array is the concatenation of all :attr:`J_env_y`
         arrays for all sampled time steps.
 
     Attributes (Current Density: Intracellular)
     ----------
-    I_cell_x_time : list
-        Two-dimensional list of the X components of all intracellular current
-        densities, whose:
+    I_cell_x_time : ndarray
+        Two-dimensional Numpy array of the X components of all intracellular
+        current densities, whose:
 
         * First dimension indexes each sampled time step.
         * Second dimension indexes each cell such that each item is the X
           component of the intracellular current density vector spatially
           situated at the center of that cell for this time step.
-    I_cell_y_time : list
-        Two-dimensional list of the Y components of all intracellular current
-        densities, whose:
+    I_cell_y_time : ndarray
+        Two-dimensional Numpy array of the Y components of all intracellular
+        current densities, whose:
 
         * First dimension indexes each sampled time step.
         * Second dimension indexes each cell such that each item is the Y
@@ -175,27 +179,27 @@ class Simulator(object):
         the Y component of the total cellular displacement spatially situated
         at the centre of the cell indexed by that item for the current time
         step.
-    dx_cell_time : list
-        Two-dimensional list of the X components of all cellular deformations,
-        for all sampled time steps, whose:
+    dx_cell_time : ndarray
+        Two-dimensional Numpy array of the X components of all cellular
+        deformations, for all sampled time steps, whose:
 
         * First dimension indexes each sampled time step.
         * Second dimension indexes each cell such that each item is the X
           component of the total deformation for that cell defined as for the
           :attr:`d_cells_x` array.
 
-        Equivalently, this list is the concatenation of all :attr:`d_cells_x`
+        Equivalently, this array is the concatenation of all :attr:`d_cells_x`
         arrays for all sampled time steps.
-    dy_cell_time : list
-        Two-dimensional list of the Y components of all cellular deformations
-        for all sampled time steps, whose:
+    dy_cell_time : ndarray
+        Two-dimensional Numpy array of the Y components of all cellular
+        deformations for all sampled time steps, whose:
 
         * First dimension indexes each sampled time step.
         * Second dimension indexes each cell such that each item is the Y
           component of the total deformation for that cell defined as for the
           :attr:`d_cells_y` array.
 
-        Equivalently, this list is the concatenation of all :attr:`d_cells_y`
+        Equivalently, this array is the concatenation of all :attr:`d_cells_y`
         arrays for all sampled time steps.
 
     Attributes (Electric Field: Extracellular)
@@ -222,8 +226,8 @@ class Simulator(object):
           such that each item is the Y component of the extracellular
           electric field spatially situated at the centre of the extracellular
           grid space corresponding to the current row and column.
-    efield_ecm_x_time : list
-        Three-dimensional list of the X components of the extracellular
+    efield_ecm_x_time : ndarray
+        Three-dimensional Numpy array of the X components of the extracellular
         electric fields over all time steps, whose:
 
         * First dimension indexes each sampled time step.
@@ -231,10 +235,10 @@ class Simulator(object):
           components of the extracellular electric field for this time step,
           defined as for the corresponding :attr:`E_env_x` array.
 
-        Equivalently, this list is the concatenation of all :attr:`E_env_x`
+        Equivalently, this array is the concatenation of all :attr:`E_env_x`
         arrays for all sampled time steps.
-    efield_ecm_y_time : list
-        Three-dimensional list of the Y components of the extracellular
+    efield_ecm_y_time : ndarray
+        Three-dimensional Numpy array of the Y components of the extracellular
         electric fields over all time steps, whose:
 
         * First dimension indexes each sampled time step.
@@ -242,7 +246,7 @@ class Simulator(object):
           components of the extracellular electric field for this time step,
           defined as for the corresponding :attr:`E_env_y` array.
 
-        Equivalently, this list is the concatenation of all :attr:`E_env_y`
+        Equivalently, this array is the concatenation of all :attr:`E_env_y`
         arrays for all sampled time steps.
 
     Attributes (Electric Field: Intracellular)
@@ -261,27 +265,27 @@ class Simulator(object):
         item is the Y component of the intracellular electric field vector
         for the current time step defined as for the corresponding
         :attr:`E_gj_X` array.
-    efield_gj_x_time : list
-        Two-dimensional list of the X components of the intracellular electric
-        fields for all time steps, whose:
+    efield_gj_x_time : ndarray
+        Two-dimensional Numpy array of the X components of the intracellular
+        electric fields for all time steps, whose:
 
         * First dimension indexes each sampled time step.
         * Second dimension indexes each cell membrane such that each item is
           the X component of the intracellular electric field vector defined as
           for the :attr:`E_gj_x` array.
 
-        Equivalently, this list is the concatenation of all :attr:`E_gj_x`
+        Equivalently, this array is the concatenation of all :attr:`E_gj_x`
         arrays for all sampled time steps.
-    efield_gj_y_time : list
-        Two-dimensional list of the Y components of the intracellular electric
-        fields for all time steps, whose:
+    efield_gj_y_time : ndarray
+        Two-dimensional Numpy array of the Y components of the intracellular
+        electric fields for all time steps, whose:
 
         * First dimension indexes each sampled time step.
         * Second dimension indexes each cell membrane such that each item is
           the Y component of the intracellular electric field vector defined as
           for the :attr:`E_gj_y` array.
 
-        Equivalently, this list is the concatenation of all :attr:`E_gj_y`
+        Equivalently, this array is the concatenation of all :attr:`E_gj_y`
         arrays for all sampled time steps.
 
     Attributes (Ion)
@@ -300,16 +304,16 @@ class Simulator(object):
         #. First dimension indexes each ion enabled by the current ion profile.
         #. Second dimension indexes each cell such that each item is the
            concentration of that ion in that cell's endoplasmic reticulum.
-    cc_time : list
-        Three-dimensional list of all cellular ion concentrations for all time
-        steps, whose:
+    cc_time : ndarray
+        Three-dimensional Numpy array of all cellular ion concentrations for
+        all time steps, whose:
 
         #. First dimension indexes each sampled time step.
         #. Second dimension indexes each ion such that each item is the array
            of all cellular concentrations of that ion for this time step,
            defined as for the :attr:`cc_cells` array.
 
-        Equivalently, this list is the concatenation of all :attr:`cc_cells`
+        Equivalently, this array is the concatenation of all :attr:`cc_cells`
         arrays for all sampled time steps.
 
     Attributes (Ion: Index)
@@ -365,8 +369,8 @@ class Simulator(object):
         the **total cellular pressure** (i.e., summation of the mechanical and
         osmotic cellular pressure) spatially situated at the centre of the cell
         indexed by that item for the current time step.
-    P_cells_time : list
-        Two-dimensional list of all **total cellular pressures** (i.e.,
+    P_cells_time : ndarray
+        Two-dimensional Numpy array of all **total cellular pressures** (i.e.,
         summation of all mechanical and osmotic cellular pressures) for all time
         steps, whose:
 
@@ -374,7 +378,7 @@ class Simulator(object):
         * Second dimension indexes each cell such that each item is the
           total pressure for that cell defined as for the :attr:`P_cells` array.
 
-        Equivalently, this list is the concatenation of all :attr:`P_cells`
+        Equivalently, this array is the concatenation of all :attr:`P_cells`
         arrays for all sampled time steps.
 
     Attributes (Voltage: Extracellular)
@@ -385,9 +389,9 @@ class Simulator(object):
         time step, indexing each environmental grid space such that each item
         is the extracellular voltage spatially situated at the centre of that
         grid space.
-    venv_time : list
-        Two-dimensional list of all extracellular voltages over all time steps,
-        whose:
+    venv_time : ndarray
+        Two-dimensional Numpy array of all extracellular voltages over all time
+        steps, whose:
 
         #. First dimension indexes each sampled time step.
         #. Second dimension indexes each environmental grid space such that each
@@ -410,9 +414,9 @@ class Simulator(object):
         cell membranes at the current time step, indexing each cell membrane
         such that each item is the transmembrane voltage spatially situated
         across that cell membrane.
-    vm_time : list
-        Two-dimensional list of all transmembrane voltages across all cell
-        membranes over all sampled time steps, whose:
+    vm_time : ndarray
+        Two-dimensional Numpy array of all transmembrane voltages across all
+        cell membranes over all sampled time steps, whose:
 
         #. First dimension indexes each sampled time step.
         #. Second dimension indexes each cell membrane such that each item is
@@ -425,9 +429,10 @@ class Simulator(object):
         One-dimensional Numpy array indexing each cell such that each item is
         the transmembrane voltage spatially situated at the centre of the cell
         indexed by that item for the current sampled time step.
-    vm_ave_time : list
-        Two-dimensional list of all transmembrane voltages averaged from all
-        cell membranes onto cell centres over all sampled time steps, whose:
+    vm_ave_time : ndarray
+        Two-dimensional Numpy array of all transmembrane voltages averaged from
+        all cell membranes onto cell centres over all sampled time steps,
+        whose:
 
         #. First dimension indexes each sampled time step.
         #. Second dimension indexes each cell such that each item is the
@@ -789,6 +794,11 @@ class Simulator(object):
         if p.v_sensitive_gj:
             self.gj_funk = Gap_Junction(self, cells, p)
 
+        # Indices of all moving ions and the work buffer of their charges
+        # lazily allocated by the update_electrodiffusion() method.
+        self._moving_ions = np.asarray(self.movingIons, dtype=int)
+        self._zs_mems = None
+
         # Initialize diffusion constants for the extracellular transport.
         self.initDenv(cells, p)
 
@@ -1048,6 +1058,14 @@ class Simulator(object):
         #   core time loop for this phase.
         time_steps, time_steps_sampled, solver_context = self._plot_loop(phase)
 
+        # Preallocate storage for all time series sampled by this phase.
+        self._time_series = SampledTimeSeries(
+            obj=self, samples_max=len(time_steps_sampled))
+
+        # Accumulate the time spent in each subsystem of this solver only if
+        # requested by this configuration.
+        self._solver_timer = SectionTimer(is_enabled=phase.p.solver_timing)
+
         # Notify the caller of the range of work performed by this subcommand.
         # The phase.callbacks.progressed() callback is called exactly once for
         # each sampled time step, implying the maximum progress value to be
@@ -1058,6 +1076,9 @@ class Simulator(object):
         # handling of this instability (e.g., by saving simulation results).
         exception_instability = None
 
+        # Configured time step-size for this phase.
+        solver_dt = phase.p.dt
+
         # Attempt to...
         try:
             # If this is the full BETSE solver, set appropriate locals.
@@ -1077,7 +1098,30 @@ class Simulator(object):
             # Log this solver type.
             logs.log_info('Solver: %s in use.', solver_label)
 
+            # Keyword arguments specific to this solver.
+            solver_kwargs = {}
+
+            # If solving this initialization directly for its steady state...
+            if phase.kind is SimPhaseKind.INIT and phase.p.steady_state_init:
+                if phase.p.solver_type is not SolverType.FULL:
+                    logs.log_warning(
+                        'Steady-state initialization unsupported by '
+                        'the fast solver; reverting to time stepping.')
+                # If this solve converges, take only one time step at each
+                # sampled time step. Since this steady state is invariant under
+                # time stepping, this samples the same time series that time
+                # stepping to this steady state would have.
+                elif SteadyStateSolver(p=phase.p).solve(
+                    sim=self,
+                    cells=phase.cells,
+                    step=lambda: self._run_sim_core_step(phase=phase, t=0.0),
+                    dyna=phase.dyna,
+                ):
+                    time_steps = np.array(sorted(time_steps_sampled))
+                    solver_kwargs['is_time_step_adaptive'] = False
+
             # Perform the time loop for this simulation phase.
+            solver_time_start = time.perf_counter()
             with solver_context:
                 solver_method(
                     phase=phase,
@@ -1099,6 +1143,7 @@ class Simulator(object):
                     #  the noop() context manager.
                     anim_cells=(solver_context if isinstance(
                         solver_context, AnimCellsWhileSolving) else None),
+                    **solver_kwargs
                 )
         # If this phase becomes computationally unstable...
         except BetseSimUnstableException as exception:
@@ -1116,10 +1161,39 @@ class Simulator(object):
         # has occurred. In this case, these results are likely to be in an
         # inconsistent, nonsensical state and hence safely discarded.
 
+        # Total time in seconds spent in the time loop for this phase.
+        solver_seconds = time.perf_counter() - solver_time_start
+
+        # Restore the configured time step-size *BEFORE* saving results, as
+        # adaptive time stepping varies this size and may have been halted
+        # prematurely by the above exception.
+        phase.p.dt = solver_dt
+
+        # Release excess time series storage *BEFORE* saving results, which
+        # would otherwise be pickled as is.
+        self._time_series.finalize()
+        self._time_series = None
+
+        # Release the solver timer *BEFORE* saving results, preserving this
+        # timer locally for reporting below.
+        solver_timer = self._solver_timer
+        self._solver_timer = None
+
+        # Release this phase-specific work buffer *BEFORE* saving results.
+        self._zs_mems = None
+
         # Save this initialization or simulation and report results of
         # potential interest to the user.
         self._pickle_phase(phase)
 
+        # If timing this solver, report the time spent in each subsystem.
+        if solver_timer.is_enabled:
+            self._log_solver_timing(
+                phase=phase,
+                solver_timer=solver_timer,
+                solver_seconds=solver_seconds,
+            )
+
         # If the simulation went unstable, inform the user and reraise the
         # previously raised exception to preserve the underlying cause. To
         # avoid data loss, this exception is raised *AFTER* all pertinent
@@ -1135,6 +1209,7 @@ class Simulator(object):
         time_steps: ndarray,
         time_steps_sampled: set,
         anim_cells: (AnimCellsWhileSolving, NoneType),
+        is_time_step_adaptive: bool = True,
     ) -> None:
         '''
         Drive the time loop for the current simulation phase, including:
@@ -1157,39 +1232,128 @@ class Simulator(object):
         anim_cells : (AnimCellsWhileSolving, NoneType)
             A mid-simulation animation of cell voltage as a function of time if
             enabled by this configuration *or* ``None`` otherwise.
+        is_time_step_adaptive : bool
+            ``True`` only if adaptively time stepping when enabled by this
+            configuration. Defaults to ``True``.
         '''
 
         # Localize frequently accessed variables for efficiency when iterating.
         p = phase.p
         cells = phase.cells
+        timer = self._solver_timer
 
         # True only on the first time step of this phase.
         is_time_step_first = True
 
+        # Adaptive time stepper if enabled by this configuration *OR* "None".
+        time_stepper = None
+
+        # If adaptively time stepping, iterate over the time steps selected by
+        # this stepper rather than the fixed time steps.
+        if p.adaptive_time_step and is_time_step_adaptive:
+            # Since deformation integrates a second-order equation of motion
+            # against the history of prior displacements, adaptive time
+            # stepping is unsupported here.
+            if p.deformation:
+                logs.log_warning(
+                    'Adaptive time stepping unsupported with deformation; '
+                    'reverting to fixed time stepping.')
+            else:
+                time_stepper = AdaptiveTimeStepper(
+                    p=p,
+                    time_end=float(time_steps[-1]),
+                    time_steps_sampled=time_steps_sampled,
+                    event_windows=phase.dyna.get_event_windows(phase),
+                )
+                time_steps_fixed_count = len(time_steps)
+                time_steps = time_stepper.iter_time_steps(
+                    sim=self,
+                    get_snapshot=lambda: SimStateSnapshot(
+                        sim=self,
+                        dyna=phase.dyna,
+                        names_ignored=self._time_series.names,
+                    ),
+                )
+
         for t in time_steps:  # run through the loop
             # Start the timer to approximate time for the simulation.
             if is_time_step_first:
                 loop_measure = time.time()
 
-            # Reinitialize flux storage devices.
-            self.fluxes_mem.fill(0)
-            self.fluxes_gj.fill(0)
+            # Take this time step.
+            self._run_sim_core_step(phase=phase, t=t)
 
-            if p.is_ecm:
-                self.fluxes_env_x = np.zeros((len(self.zs), self.edl))
-                self.fluxes_env_y = np.zeros((len(self.zs), self.edl))
-                # self.Phi_vect = np.zeros((len(self.zs), self.edl))
-                # self.conc_J_x = np.zeros(self.edl)
-                # self.conc_J_y = np.zeros(self.edl)
+            # ---------time sampling and data storage---------------------------------------------------
+            # If this time step is sampled...
+            if t in time_steps_sampled:
+                # Notify the caller that an additional sampled time step has
+                # been successfully simulated.
+                phase.callbacks.progressed_next()
 
-            # Calculate the values of scheduled and dynamic quantities (e.g..
-            # ion channel multipliers).
-            if phase.kind is SimPhaseKind.SIM:
+                # Write data to time storage vectors.
+                with timer('write2storage'):
+                    self.write2storage(t, cells, p)
+
+                # If animating this phase, display and/or save the next frame
+                # of this animation. For simplicity, pass "-1" implying the
+                # last frame and hence the results of the most recently solved
+                # time step.
+                if anim_cells is not None:
+                    with timer('animation'):
+                        anim_cells.plot_frame(time_step=-1)
+
+            # If this is the first time step...
+            if is_time_step_first:
+                # Ignore this conditional on all subsequent time steps.
+                is_time_step_first = False
+
+                # Log an estimate of the time required to compute this phase.
+                self._log_solver_time_estimate(
+                    phase=phase, step_first_time=loop_measure)
+
+        # If adaptively time stepping, report the time steps taken.
+        if time_stepper is not None:
+            time_stepper.log_summary(time_steps_fixed_count)
+
+    def _run_sim_core_step(self, phase: SimPhase, t: float) -> None:
+        '''
+        Take exactly one time step of the current configured step-size from
+        the current state of the current simulation phase.
+
+        Parameters
+        --------
+        phase : SimPhase
+            Current simulation phase.
+        t : float
+            Time in seconds of this time step.
+        '''
+
+        # Localize frequently accessed variables for efficiency.
+        p = phase.p
+        cells = phase.cells
+        timer = self._solver_timer
+
+        # Reinitialize flux storage devices.
+        self.fluxes_mem.fill(0)
+        self.fluxes_gj.fill(0)
+
+        if p.is_ecm:
+            self.fluxes_env_x = np.zeros((len(self.zs), self.edl))
+            self.fluxes_env_y = np.zeros((len(self.zs), self.edl))
+            # self.Phi_vect = np.zeros((len(self.zs), self.edl))
+            # self.conc_J_x = np.zeros(self.edl)
+            # self.conc_J_y = np.zeros(self.edl)
+
+        # Calculate the values of scheduled and dynamic quantities (e.g..
+        # ion channel multipliers).
+        if phase.kind is SimPhaseKind.SIM:
+            with timer('events'):
                 phase.dyna.fire_events(phase=phase, t=t)
 
-            # -----------------PUMPS-------------------------------------------
-            # have the pump run only if the rate constant is larger than 0.0 (so people can shut it off):
+        # -----------------PUMPS-------------------------------------------
+        # have the pump run only if the rate constant is larger than 0.0 (so people can shut it off):
 
+        with timer('pumps'):
             if p.alpha_NaK == 0.0:
                 self.rate_NaKATP = np.zeros(self.mdl)
 
@@ -1246,48 +1410,23 @@ class Simulator(object):
                 #                                                              self.cc_env[self.iK], fK_NaK,
                 #                                                              cells, p, ignoreECM = self.ignore_ecm)
 
-            # ----------------ELECTRODIFFUSION---------------------------------------------------------------------------
-            # electro-diffuse all ions (except for proteins, which don't move) across the cell membrane:
-
-            # shuffle(self.movingIons)
-            for i in self.movingIons:
-                IdM = np.ones(self.mdl)
-
-                if p.is_ecm:
-                    f_ED = stb.electroflux(self.cc_env[i][cells.map_mem2ecm], self.cc_at_mem[i],
-                        self.Dm_cells[i], IdM*p.tm, self.zs[i]*IdM, self.vm, self.T, p,
-                        rho=self.rho_channel)
-                else:
-                    f_ED = stb.electroflux(self.cc_env[i],self.cc_at_mem[i],
-                                            self.Dm_cells[i],IdM*p.tm,self.zs[i]*IdM,
-                                    self.vm,self.T,p,rho=self.rho_channel)
-
-                if not p.cluster_open:
-                    f_ED[cells.bflags_mems] = 0
-
-                # add membrane flux to storage
-                self.fluxes_mem[i] += f_ED
+        # ----------------ELECTRODIFFUSION---------------------------------------------------------------------------
+        # electro-diffuse all ions (except for proteins, which don't move) across the cell membrane:
 
-                # update flux between cells due to gap junctions
-                self.update_gj(cells, p, t, i)
+        self.update_electrodiffusion(cells, p)
 
-                if p.is_ecm:
-                    #update concentrations in the extracellular spaces:
-                    self.update_ecm(cells, p, t, i)
-
-                # update concentration gradient to estimate concentrations at membranes:
-                self.update_intra(cells, p, i)
-
-            # ----transport and handling of special ions-----------------------
-            if p.ions_dict['Ca'] == 1:
+        # ----transport and handling of special ions-----------------------
+        if p.ions_dict['Ca'] == 1:
+            with timer('calcium'):
                 self.ca_handler(cells, p)
 
-            # update the microtubules:-----------------------------------------
-            # if p.use_microtubules:
-            #     self.mtubes.update_mtubes(cells, self, p)
+        # update the microtubules:-----------------------------------------
+        # if p.use_microtubules:
+        #     self.mtubes.update_mtubes(cells, self, p)
 
-            # update the general molecules handler-----------------------------
-            if p.molecules_enabled:
+        # update the general molecules handler-----------------------------
+        if p.molecules_enabled:
+            with timer('molecules'):
                 self.molecules.core.clear_run_loop(self)
 
                 if self.molecules.transporters:
@@ -1302,8 +1441,9 @@ class Simulator(object):
                 # Update the main molecules network.
                 self.molecules.core.run_loop(phase=phase, t=t)
 
-            # update gene regulatory network handler---------------------------
-            if p.grn_enabled:
+        # update gene regulatory network handler---------------------------
+        if p.grn_enabled:
+            with timer('grn'):
                 self.grn.core.clear_run_loop(self)
 
                 if self.grn.transporters:
@@ -1318,77 +1458,55 @@ class Simulator(object):
                 # Update the main gene regulatory network.
                 self.grn.core.run_loop(phase=phase, t=t)
 
-            # dynamic noise handling-------------------------------------------
-            if p.dynamic_noise == 1 and p.ions_dict['P'] == 1 and phase.kind is SimPhaseKind.SIM:
-
-                # Add a random walk on protein concentration to generate
-                # dynamic noise.
-                self.protein_noise_flux = (
-                    p.dynamic_noise_level * (np.random.random(self.mdl) - 0.5))
-
-                # Update the concentration of P in cells and environment.
-                self.cc_cells[self.iP], self.cc_at_mem[self.iP], self.cc_env[self.iP] = stb.update_Co(
-                    self,
-                    self.cc_cells[self.iP],
-                    self.cc_at_mem[self.iP],
-                    self.cc_env[self.iP],
-                    self.protein_noise_flux,
-                    cells,
-                    p,
-                    ignoreECM=False,
-                )
+        # dynamic noise handling-------------------------------------------
+        if p.dynamic_noise == 1 and p.ions_dict['P'] == 1 and phase.kind is SimPhaseKind.SIM:
 
-            #-----forces, fields, and flow-------------------------------------
-            # calculate specific forces and pressures:
+            # Add a random walk on protein concentration to generate
+            # dynamic noise.
+            self.protein_noise_flux = (
+                p.dynamic_noise_level * (np.random.random(self.mdl) - 0.5))
 
-            if p.deform_osmo:
+            # Update the concentration of P in cells and environment.
+            self.cc_cells[self.iP], self.cc_at_mem[self.iP], self.cc_env[self.iP] = stb.update_Co(
+                self,
+                self.cc_cells[self.iP],
+                self.cc_at_mem[self.iP],
+                self.cc_env[self.iP],
+                self.protein_noise_flux,
+                cells,
+                p,
+                ignoreECM=False,
+            )
+
+        #-----forces, fields, and flow-------------------------------------
+        # calculate specific forces and pressures:
+
+        if p.deform_osmo:
+            with timer('deformation'):
                 osmotic_P(self,cells, p)
 
-            if p.fluid_flow:
+        if p.fluid_flow:
+            with timer('flow'):
                 getFlow(self,cells, p)
 
-            if p.deformation:
+        if p.deformation:
+            with timer('deformation'):
                 if p.td_deform:
                     timeDeform(self,cells, t, p)
                 else:
                     getDeformation(self,cells, t, p)
 
-            # Use fluxes to update all concentrations in the cells.
+        # Use fluxes to update all concentrations in the cells.
+        with timer('concentrations'):
             self.update_all_concs(cells, p)
 
-            # recalculate the net, unbalanced charge and voltage in each cell:
+        # recalculate the net, unbalanced charge and voltage in each cell:
+        with timer('update_V'):
             self.update_V(cells, p)
 
             # check for NaNs in voltage and stop simulation if found:
             stb.check_v(self.vm)
 
-
-            # ---------time sampling and data storage---------------------------------------------------
-            # If this time step is sampled...
-            if t in time_steps_sampled:
-                # Notify the caller that an additional sampled time step has
-                # been successfully simulated.
-                phase.callbacks.progressed_next()
-
-                # Write data to time storage vectors.
-                self.write2storage(t, cells, p)
-
-                # If animating this phase, display and/or save the next frame
-                # of this animation. For simplicity, pass "-1" implying the
-                # last frame and hence the results of the most recently solved
-                # time step.
-                if anim_cells is not None:
-                    anim_cells.plot_frame(time_step=-1)
-
-            # If this is the first time step...
-            if is_time_step_first:
-                # Ignore this conditional on all subsequent time steps.
-                is_time_step_first = False
-
-                # Log an estimate of the time required to compute this phase.
-                self._log_solver_time_estimate(
-                    phase=phase, step_first_time=loop_measure)
-
     # ..................{ SOLVERS ~ fast                    }..................
     def fast_sim_init(self, cells, p):
         '''
@@ -1440,7 +1558,7 @@ class Simulator(object):
         self.cbar_all = np.mean([v for k, v in self.cbar_dic.items()])
         self.cbar_sum = np.sum([v.mean() for k, v in self.cbar_dic.items()])
 
-        self.G_Leak = (np.dot(cells.M_sum_mems, sum(sigma_mem)*cells.mem_sa)/cells.cell_sa)*self.geo_conv
+        self.G_Leak = (cells.M_sum_mems.dot(sum(sigma_mem)*cells.mem_sa)/cells.cell_sa)*self.geo_conv
 
         # get the average gap junction conductivity:
         # self.G_gj = sum(sigma_gj)*self.geo_conv*(cells.mem_sa.mean()/cells.cell_sa.mean())
@@ -1482,6 +1600,7 @@ class Simulator(object):
         # Localize frequently-accessed variables for efficiency when iterating.
         p = phase.p
         cells = phase.cells
+        timer = self._solver_timer
 
         # True only on the first time step of this phase.
         is_time_step_first = True
@@ -1498,7 +1617,8 @@ class Simulator(object):
             # Calculate the values of scheduled and dynamic quantities (e.g..
             # ion channel multipliers).
             if phase.kind is SimPhaseKind.SIM:
-                phase.dyna.fire_events(phase=phase, t=t)
+                with timer('events'):
+                    phase.dyna.fire_events(phase=phase, t=t)
 
             # update the microtubules:-----------------------------------------
             # if p.use_microtubules:
@@ -1506,82 +1626,86 @@ class Simulator(object):
 
             # update the general molecules handler-----------------------------
             if p.molecules_enabled:
-                self.molecules.core.clear_run_loop(self)
+                with timer('molecules'):
+                    self.molecules.core.clear_run_loop(self)
 
-                if self.molecules.transporters:
-                    self.molecules.core.run_loop_transporters(t, self, cells, p)
+                    if self.molecules.transporters:
+                        self.molecules.core.run_loop_transporters(t, self, cells, p)
 
-                if self.molecules.channels:
-                    self.molecules.core.run_fast_loop_channels(phase)
+                    if self.molecules.channels:
+                        self.molecules.core.run_fast_loop_channels(phase)
 
-                if self.molecules.modulators:
-                    self.molecules.core.run_loop_modulators(self, cells, p)
+                    if self.molecules.modulators:
+                        self.molecules.core.run_loop_modulators(self, cells, p)
 
-                # Update the main molecules network.
-                self.molecules.core.run_loop(phase=phase, t=t)
+                    # Update the main molecules network.
+                    self.molecules.core.run_loop(phase=phase, t=t)
 
             # update gene regulatory network handler---------------------------
             if p.grn_enabled:
-                self.grn.core.clear_run_loop(self)
+                with timer('grn'):
+                    self.grn.core.clear_run_loop(self)
 
-                if self.grn.transporters:
-                    self.grn.core.run_loop_transporters(t, self, cells, p)
+                    if self.grn.transporters:
+                        self.grn.core.run_loop_transporters(t, self, cells, p)
 
-                if self.grn.channels:
-                    self.grn.core.run_fast_loop_channels(phase)
+                    if self.grn.channels:
+                        self.grn.core.run_fast_loop_channels(phase)
 
-                if self.grn.modulators:
-                    self.grn.core.run_loop_modulators(self, cells, p)
+                    if self.grn.modulators:
+                        self.grn.core.run_loop_modulators(self, cells, p)
 
-                # Update the main gene regulatory network.
-                self.grn.core.run_loop(phase=phase, t=t)
+                    # Update the main gene regulatory network.
+                    self.grn.core.run_loop(phase=phase, t=t)
 
             # Update gap junctions:
-            self.vgj = self.vm_ave[cells.cell_nn_i[:, 1]] - self.vm_ave[cells.cell_nn_i[:, 0]]
+            with timer('gj'):
+                self.vgj = self.vm_ave[cells.cell_nn_i[:, 1]] - self.vm_ave[cells.cell_nn_i[:, 0]]
 
-            if p.v_sensitive_gj is True:
+                if p.v_sensitive_gj is True:
 
-                # run the gap junction dynamics object to update gj open state of sim:
-                self.gj_funk.run(self, cells, p)
+                    # run the gap junction dynamics object to update gj open state of sim:
+                    self.gj_funk.run(self, cells, p)
 
-            else:
-                self.gjopen = self.gj_block*np.ones(len(cells.mem_i))*cells.gj_default_weights
+                else:
+                    self.gjopen = self.gj_block*np.ones(len(cells.mem_i))*cells.gj_default_weights
 
-            Jgj = self.G_gj*np.dot(cells.M_sum_mems, self.vgj)
+            with timer('update_V'):
+                Jgj = self.G_gj*cells.M_sum_mems.dot(self.vgj)
 
-            Jmem = np.dot(cells.M_sum_mems, self.extra_J_mem*cells.mem_sa)/cells.cell_sa
+                Jmem = cells.M_sum_mems.dot(self.extra_J_mem*cells.mem_sa)/cells.cell_sa
 
-            self.vm_ave += p.dt*(1/p.cm)*(Jgj - Jmem - self.G_Leak*(self.vm_ave - self.E_Leak))
+                self.vm_ave += p.dt*(1/p.cm)*(Jgj - Jmem - self.G_Leak*(self.vm_ave - self.E_Leak))
 
-            self.vm = self.vm_ave[cells.mem_to_cells]
+                self.vm = self.vm_ave[cells.mem_to_cells]
 
-            # Currents:
-            Jtot = -self.vgj*self.G_gj[cells.mem_to_cells] + self.extra_J_mem
+                # Currents:
+                Jtot = -self.vgj*self.G_gj[cells.mem_to_cells] + self.extra_J_mem
 
-            self.Jn = Jtot
+                self.Jn = Jtot
 
-            Jmx = self.Jn*cells.mem_vects_flat[:,2]
-            Jmy = self.Jn*cells.mem_vects_flat[:,3]
+                Jmx = self.Jn*cells.mem_vects_flat[:,2]
+                Jmy = self.Jn*cells.mem_vects_flat[:,3]
 
-            self.Emx, self.Emy = cells.single_cell_div_free(Jmx/(0.1*self.sigma_cell.mean()), Jmy/(0.1*self.sigma_cell.mean()))
+                self.Emx, self.Emy = cells.single_cell_div_free(Jmx/(0.1*self.sigma_cell.mean()), Jmy/(0.1*self.sigma_cell.mean()))
 
-            Jcx = self.Jn * cells.mem_vects_flat[:, 2]
-            Jcy = self.Jn * cells.mem_vects_flat[:, 3]
+                Jcx = self.Jn * cells.mem_vects_flat[:, 2]
+                Jcy = self.Jn * cells.mem_vects_flat[:, 3]
 
-            # average intracellular current to cell centres
-            self.J_cell_x = np.dot(cells.M_sum_mems, Jcx * cells.mem_sa) / cells.cell_sa
-            self.J_cell_y = np.dot(cells.M_sum_mems, Jcy * cells.mem_sa) / cells.cell_sa
+                # average intracellular current to cell centres
+                self.J_cell_x = cells.M_sum_mems.dot(Jcx * cells.mem_sa) / cells.cell_sa
+                self.J_cell_y = cells.M_sum_mems.dot(Jcy * cells.mem_sa) / cells.cell_sa
 
-            # intracellular electric field:
-            self.E_cell_x = self.J_cell_x / (0.1 * self.sigma_cell)
-            self.E_cell_y = self.J_cell_y / (0.1 * self.sigma_cell)
+                # intracellular electric field:
+                self.E_cell_x = self.J_cell_x / (0.1 * self.sigma_cell)
+                self.E_cell_y = self.J_cell_y / (0.1 * self.sigma_cell)
 
-            # # calculate electric field in cells using net intracellular current and cytosol conductivity:
-            # self.Emc = (self.E_cell_x[cells.mem_to_cells] * cells.mem_vects_flat[:, 2] +
-            #            self.E_cell_y[cells.mem_to_cells] * cells.mem_vects_flat[:, 3])
+                # # calculate electric field in cells using net intracellular current and cytosol conductivity:
+                # self.Emc = (self.E_cell_x[cells.mem_to_cells] * cells.mem_vects_flat[:, 2] +
+                #            self.E_cell_y[cells.mem_to_cells] * cells.mem_vects_flat[:, 3])
 
-            # check for NaNs in voltage and stop simulation if found:
-            stb.check_v(self.vm_ave)
+                # check for NaNs in voltage and stop simulation if found:
+                stb.check_v(self.vm_ave)
 
             # ---------time sampling and data storage---------------------------------------------------
             # If this time step is sampled...
@@ -1591,44 +1715,46 @@ class Simulator(object):
                 phase.callbacks.progressed_next()
 
                 # Write data to time storage vectors.
-                self.vm_time.append(self.vm * 1)
+                with timer('write2storage'):
+                    time_series = self._time_series
+                    time_series.store('vm_time', self.vm)
 
-                # # microtubules:
-                # self.mtubes_x_time.append(self.mtubes.mtubes_x * 1)
-                # self.mtubes_y_time.append(self.mtubes.mtubes_y * 1)
+                    # # microtubules:
+                    # self.mtubes_x_time.append(self.mtubes.mtubes_x * 1)
+                    # self.mtubes_y_time.append(self.mtubes.mtubes_y * 1)
 
-                # Record membrane potentials:
-                ddc = np.copy(self.Dm_cells)
-                ddc.tolist()
-                self.dd_time.append(ddc)
-                ddc = None
+                    # Record membrane potentials:
+                    time_series.store('dd_time', self.Dm_cells)
 
-                self.I_cell_x_time.append(self.J_cell_x * 1)
-                self.I_cell_y_time.append(self.J_cell_y * 1)
+                    time_series.store('I_cell_x_time', self.J_cell_x)
+                    time_series.store('I_cell_y_time', self.J_cell_y)
 
-                self.efield_gj_x_time.append(self.E_cell_x[cells.mem_to_cells] * 1)
-                self.efield_gj_y_time.append(self.E_cell_y[cells.mem_to_cells] * 1)
+                    time_series.store(
+                        'efield_gj_x_time', self.E_cell_x[cells.mem_to_cells])
+                    time_series.store(
+                        'efield_gj_y_time', self.E_cell_y[cells.mem_to_cells])
 
-                self.gjopen_time.append(self.gjopen*1)
+                    time_series.store('gjopen_time', self.gjopen)
 
-                self.time.append(t * 1)
+                    time_series.store('time', t)
 
-                if p.molecules_enabled:
-                    self.molecules.core.write_data(self, cells, p)
-                    self.molecules.core.report(self, p)
+                    if p.molecules_enabled:
+                        self.molecules.core.write_data(self, cells, p)
+                        self.molecules.core.report(self, p)
 
-                if p.grn_enabled:
-                    self.grn.core.write_data(self, cells, p)
-                    self.grn.core.report(self, p)
+                    if p.grn_enabled:
+                        self.grn.core.write_data(self, cells, p)
+                        self.grn.core.report(self, p)
 
-                self.vm_ave_time.append(self.vm_ave*1)
+                    time_series.store('vm_ave_time', self.vm_ave)
 
                 # If animating this phase, display and/or save the next frame
                 # of this animation. For simplicity, pass "-1" implying the
                 # last frame and hence the results of the most recently solved
                 # time step.
                 if anim_cells is not None:
-                    anim_cells.plot_frame(time_step=-1)
+                    with timer('animation'):
+                        anim_cells.plot_frame(time_step=-1)
 
             # If this is the first time step...
             if is_time_step_first:
@@ -1676,6 +1802,49 @@ class Simulator(object):
             'This run should take approximately %fs to compute...',
             time_estimate)
 
+
+    def _log_solver_timing(
+        self,
+        phase: SimPhase,
+        solver_timer: SectionTimer,
+        solver_seconds: float,
+    ) -> None:
+        '''
+        Log an informational table of the time spent in each subsystem of the
+        current solver (e.g., pumps, electrodiffusion) while computing the
+        passed simulation phase *and*, if requested by the current
+        configuration, save this table in JSON format beside the results of
+        this phase.
+
+        Parameters
+        --------
+        phase : SimPhase
+            Current simulation phase.
+        solver_timer : SectionTimer
+            Timer having accumulated the time spent in each such subsystem.
+        solver_seconds : float
+            Total number of seconds spent computing this phase, including time
+            spent outside these subsystems.
+        '''
+
+        # Log this table.
+        solver_timer.log_table(
+            title='Solver time by subsystem:', total_seconds=solver_seconds)
+
+        # If saving this table, do so beside the pickled results of this phase
+        # (e.g., "INITS/init_1_timing.json" beside "INITS/init_1.betse.gz").
+        if phase.p.solver_timing_json:
+            pickle_filename = (
+                phase.p.init_pickle_filename
+                if phase.kind is SimPhaseKind.INIT else
+                phase.p.sim_pickle_filename)
+            timing_filename = (
+                pathnames.get_pathname_sans_filetypes(pickle_filename) +
+                '_timing.json')
+            solver_timer.save_json(
+                filename=timing_filename, total_seconds=solver_seconds)
+            logs.log_info('Solver timing saved to:\n\t%s', timing_filename)
+
     # ..................{ FINALIZERS                        }..................
     def clear_storage(self, cells, p):
         '''
@@ -1788,47 +1957,43 @@ class Simulator(object):
 
     def write2storage(self,t,cells,p):
         '''
-        Append each multidimensional Numpy array covering all time steps (e.g.,
-        :attr:`cc_env_time`) with the corresponding Numpy array of fewer
-        dimensions specific to the passed time step (e.g., :attr:`cc_env`).
+        Write each Numpy array specific to the passed time step (e.g.,
+        :attr:`cc_env`) into the next slot of the corresponding
+        multidimensional Numpy array covering all sampled time steps (e.g.,
+        :attr:`cc_env_time`), preallocated by the :class:`SampledTimeSeries`
+        store for the current simulation phase.
         '''
 
+        time_series = self._time_series
+
         if p.GHK_calc:
             stb.ghk_calculator(self,cells,p)
-            self.vm_GHK_time.append(self.vm_GHK) # data array holding GHK vm estimates
+            time_series.store('vm_GHK_time', self.vm_GHK) # data array holding GHK vm estimates
 
         # add the new concentration and voltage data to the time-storage matrices:
-        self.efield_gj_x_time.append(self.E_gj_x*1)
-        self.efield_gj_y_time.append(self.E_gj_y*1)
-
-        concs = np.copy(self.cc_cells)
-        self.cc_time.append(concs)
-        concs = None
+        time_series.store('efield_gj_x_time', self.E_gj_x)
+        time_series.store('efield_gj_y_time', self.E_gj_y)
 
-        envsc = np.copy(self.cc_env)
-        self.cc_env_time.append(envsc)
-        envsc = None
+        time_series.store('cc_time', self.cc_cells)
+        time_series.store('cc_env_time', self.cc_env)
 
-        ddc = np.copy(self.Dm_cells)
-        ddc.tolist()
-        self.dd_time.append(ddc)
-        ddc = None
+        time_series.store('dd_time', self.Dm_cells)
 
-        self.I_cell_x_time.append(self.J_cell_x*1)
-        self.I_cell_y_time.append(self.J_cell_y*1)
+        time_series.store('I_cell_x_time', self.J_cell_x)
+        time_series.store('I_cell_y_time', self.J_cell_y)
 
-        self.I_mem_time.append(self.I_mem*1)
+        time_series.store('I_mem_time', self.I_mem)
 
-        self.vm_time.append(self.vm*1)
+        time_series.store('vm_time', self.vm)
 
-        self.rho_cells_time.append(self.rho_cells*1)
-        self.rate_NaKATP_time.append(self.rate_NaKATP*1)
-        self.P_cells_time.append(self.P_cells)
+        time_series.store('rho_cells_time', self.rho_cells)
+        time_series.store('rate_NaKATP_time', self.rate_NaKATP)
+        time_series.store('P_cells_time', self.P_cells)
 
-        self.venv_time.append(self.v_env * 1)
+        time_series.store('venv_time', self.v_env)
 
         if p.deform_osmo:
-            self.osmo_P_delta_time.append(self.osmo_P_delta)
+            time_series.store('osmo_P_delta_time', self.osmo_P_delta)
 
         # microtubules:
         # self.mtubes_x_time.append(self.mtubes.mtubes_x*1)
@@ -1838,19 +2003,19 @@ class Simulator(object):
             # make a copy of cells to apply deformation to:
             # self.cellso = copy.deepcopy(cells)
             implement_deform_timestep(self, self.cellso, t, p)
-            self.dx_cell_time.append(self.d_cells_x*1)
-            self.dy_cell_time.append(self.d_cells_y*1)
+            time_series.store('dx_cell_time', self.d_cells_x)
+            time_series.store('dy_cell_time', self.d_cells_y)
 
         if p.fluid_flow:
-            self.u_cells_x_time.append(self.u_cells_x*1)
-            self.u_cells_y_time.append(self.u_cells_y*1)
+            time_series.store('u_cells_x_time', self.u_cells_x)
+            time_series.store('u_cells_y_time', self.u_cells_y)
 
         # if p.sim_eosmosis:
         #     self.rho_channel_time.append(self.rho_channel*1)
         #     self.rho_pump_time.append(self.rho_pump*1)
 
-        self.gjopen_time.append(self.gjopen*1)
-        self.time.append(t)
+        time_series.store('gjopen_time', self.gjopen)
+        time_series.store('time', t)
 
         if p.molecules_enabled:
             self.molecules.core.write_data(self, cells, p)
@@ -1863,18 +2028,18 @@ class Simulator(object):
         if p.Ca_dyn == 1 and p.ions_dict['Ca'] == 1:
             self.endo_retic.write_cache(self)
 
-        self.I_tot_x_time.append(self.J_env_x*1)
-        self.I_tot_y_time.append(self.J_env_y*1)
+        time_series.store('I_tot_x_time', self.J_env_x)
+        time_series.store('I_tot_y_time', self.J_env_y)
 
         if p.is_ecm:
-            self.efield_ecm_x_time.append(self.E_env_x*1)
-            self.efield_ecm_y_time.append(self.E_env_y*1)
+            time_series.store('efield_ecm_x_time', self.E_env_x)
+            time_series.store('efield_ecm_y_time', self.E_env_y)
 
             if p.fluid_flow:
-                self.u_env_x_time.append(self.u_env_x*1)
-                self.u_env_y_time.append(self.u_env_y*1)
+                time_series.store('u_env_x_time', self.u_env_x)
+                time_series.store('u_env_y_time', self.u_env_y)
 
-        self.vm_ave_time.append(self.vm_ave)
+        time_series.store('vm_ave_time', self.vm_ave)
 
         # # magnetic vector potential:
         # self.Ax_time.append(self.Ax)
@@ -2035,7 +2200,7 @@ class Simulator(object):
 
             # average vm:
             # self.vm_ave = np.dot(cells.M_sum_mems, self.vm*cells.mem_sa)/cells.cell_sa
-            self.vm_ave = np.dot(cells.M_sum_mems, self.vm) / cells.num_mems
+            self.vm_ave = cells.M_sum_mems.dot(self.vm) / cells.num_mems
 
             self.E_cell_x = self.J_cell_x/(self.sigma_cell)
             self.E_cell_y = self.J_cell_y/(self.sigma_cell)
@@ -2061,7 +2226,7 @@ class Simulator(object):
                        ((p.dt*self.sigma_cell[cells.mem_to_cells])/(p.cm*cells.R_rads)))
 
             # average vm:
-            self.vm_ave = np.dot(cells.M_sum_mems, self.vm) / cells.num_mems
+            self.vm_ave = cells.M_sum_mems.dot(self.vm) / cells.num_mems
 
             # True cell radii:
             Rcells = cells.R_rads*(p.true_cell_size/p.cell_radius)
@@ -2072,8 +2237,8 @@ class Simulator(object):
             gEx = -gE * cells.mem_vects_flat[:, 2]
             gEy = -gE * cells.mem_vects_flat[:, 3]
 
-            self.E_cell_x = np.dot(cells.M_sum_mems, gEx * cells.mem_sa) / cells.cell_sa
-            self.E_cell_y = np.dot(cells.M_sum_mems, gEy * cells.mem_sa) / cells.cell_sa
+            self.E_cell_x = cells.M_sum_mems.dot(gEx * cells.mem_sa) / cells.cell_sa
+            self.E_cell_y = cells.M_sum_mems.dot(gEy * cells.mem_sa) / cells.cell_sa
 
             # calculate electric field in cells using net intracellular current and cytosol conductivity:
             self.Emc = (self.E_cell_x[cells.mem_to_cells] * cells.mem_vects_flat[:, 2] +
@@ -2102,8 +2267,8 @@ class Simulator(object):
                 ignoreECM=False,
             )
 
-            delta_cgj = np.dot(
-                cells.M_sum_mems, -f_gj_i*cells.mem_sa) / cells.cell_vol
+            delta_cgj = cells.M_sum_mems.dot(
+                -f_gj_i*cells.mem_sa) / cells.cell_vol
 
             self.cc_cells[i] +=  p.dt*delta_cgj
 
@@ -2159,155 +2324,158 @@ class Simulator(object):
             self.endo_retic.update(self, cells, p)
 
 
-    def update_gj(self,cells,p,t,i):
-
-        # calculate voltage difference (gradient*len_gj) between gj-connected cells:
-
-        self.vgj = self.vm[cells.nn_i]- self.vm[cells.mem_i]
-
-        ## smooth the vgj:
-        # vgj_ave = np.dot(cells.M_sum_mems, self.vgj * cells.mem_sa) / cells.cell_sa
-        # self.vgj = self.smooth_weight_mem * self.vgj + vgj_ave[cells.mem_to_cells] * self.smooth_weight_o
-
-        # store transjunctional electric field:
-        self.Egj = -self.vgj/cells.gj_len
-
-        # self.Egj = -self.vgj/cells.nn_len
-
-        self.E_gj_x = self.Egj*cells.mem_vects_flat[:,2]
-        self.E_gj_y = self.Egj*cells.mem_vects_flat[:,3]
-
-        if p.v_sensitive_gj is True:
-
-            # run the gap junction dynamics object to update gj open state of sim:
-            self.gj_funk.run(self, cells, p)
-
-        else:
-            self.gjopen = self.gj_block*np.ones(len(cells.mem_i))*cells.gj_default_weights
-
-
-        conc_mem = self.cc_at_mem[i]
-
-        fgj_X = stb.electroflux(conc_mem[cells.mem_i],
-                       conc_mem[cells.nn_i],
-                       self.D_gj[i]*p.gj_surface*self.gjopen,
-                       cells.gj_len*np.ones(self.mdl),
-                       self.zs[i]*np.ones(self.mdl),
-                       self.vgj,
-                       p.T,
-                       p,
-                       rho=1
-                       )
-
-        # enforce zero flux at outer boundary:
-        fgj_X[cells.bflags_mems] = 0.0
-
-
-        self.fluxes_gj[i] = self.fluxes_gj[i] + fgj_X   # store gap junction flux for this ion
-
-
-    def update_ecm(self,cells,p,t,i):
+    def update_electrodiffusion(self, cells, p) -> None:
+        '''
+        Electrodiffuse all moving ions across all cell membranes and gap
+        junctions *and* (if simulating extracellular spaces) throughout the
+        environment for the current time step.
+
+        For efficiency, the fluxes of all moving ions are computed at once over
+        two-dimensional arrays whose first dimension indexes each such ion
+        (e.g., ``(n_ions, n_mems)``) rather than iteratively one ion at a time.
+        Since the fluxes of each ion depend only on the concentrations of that
+        ion, the results are numerically identical to the latter.
+
+        Gap junction gating (e.g., transjunctional voltages and open states) is
+        updated exactly once per time step and shared by the fluxes of all
+        moving ions, unless the legacy ``gj gating per ion`` option is enabled.
+        '''
 
-        cenv = self.cc_env[i]
-        cenv = cenv.reshape(cells.X.shape)
+        # Indices of all moving ions.
+        ions = self._moving_ions
 
-        cenv[:,0] =  self.c_env_bound[i]
-        cenv[:,-1] =  self.c_env_bound[i]
-        cenv[0,:] =  self.c_env_bound[i]
-        cenv[-1,:] =  self.c_env_bound[i]
+        # Solver timer accumulating the time spent in each subsystem below.
+        timer = self._solver_timer
 
-        gcx, gcy = fd.gradient(cenv, cells.delta)
+        # Work buffer of the charges of all moving ions broadcast over all
+        # membranes, reallocated only if the number of membranes has changed
+        # (e.g., due to a cutting event). Since stb.electroflux() increments
+        # this buffer in-place, this buffer is refilled before each call.
+        if self._zs_mems is None or self._zs_mems.shape != (len(ions), self.mdl):
+            self._zs_mems = np.empty((len(ions), self.mdl))
+        zs_mems = self._zs_mems
 
-        if p.fluid_flow is True:
+        # ..................{ MEMBRANES                     }..................
+        with timer('electrodiffusion'):
+            if p.is_ecm:
+                cc_env_mems = self.cc_env[np.ix_(ions, cells.map_mem2ecm)]
+            else:
+                cc_env_mems = self.cc_env[ions]
 
-            ux = self.u_env_x
-            uy = self.u_env_y
+            zs_mems[:] = self.zs[ions, None]
+            f_ED = stb.electroflux(
+                cc_env_mems, self.cc_at_mem[ions], self.Dm_cells[ions], p.tm,
+                zs_mems, self.vm, self.T, p, rho=self.rho_channel)
 
-        else:
+            if not p.cluster_open:
+                f_ED[:, cells.bflags_mems] = 0
 
-            ux = np.zeros(cells.X.shape)
-            uy = np.zeros(cells.X.shape)
+            # add membrane flux to storage
+            self.fluxes_mem[ions] += f_ED
 
-        denv = (
-            self.D_env[i].reshape(cells.X.shape)*
-            self.TJ_modulator[i].reshape(cells.X.shape))
+        # ..................{ GAP JUNCTIONS                 }..................
+        with timer('gj'):
+            # calculate voltage difference (gradient*len_gj) between gj-connected cells:
+            self.vgj = self.vm[cells.nn_i]- self.vm[cells.mem_i]
 
-        # This equation assumes environmental transport is electrodiffusive.
-        fx, fy = stb.nernst_planck_flux(cenv, gcx, gcy, -self.E_env_x, -self.E_env_y, ux, uy,
-                                          denv, self.zs[i], self.T, p)
+            # store transjunctional electric field:
+            self.Egj = -self.vgj/cells.gj_len
 
+            self.E_gj_x = self.Egj*cells.mem_vects_flat[:,2]
+            self.E_gj_y = self.Egj*cells.mem_vects_flat[:,3]
 
-        self.fluxes_env_x[i] = fx.ravel()  # store ecm junction flux for this ion
-        self.fluxes_env_y[i] = fy.ravel()  # store ecm junction flux for this ion
+            if p.v_sensitive_gj is True:
+                # If reproducing legacy behaviour for regression comparisons,
+                # run the gap junction dynamics object to update gj open state
+                # of sim once for each moving ion, recording the open state
+                # seen by the flux of each such ion:
+                if p.gj_gating_per_ion:
+                    gjopen = np.empty((len(ions), self.mdl))
+                    for gjopen_ion in gjopen:
+                        self.gj_funk.run(self, cells, p)
+                        gjopen_ion[:] = self.gjopen
+                # Else, advance gj open state exactly once per time step,
+                # shared by the fluxes of all moving ions:
+                else:
+                    self.gj_funk.run(self, cells, p)
+                    gjopen = self.gjopen
+            else:
+                self.gjopen = self.gj_block*np.ones(len(cells.mem_i))*cells.gj_default_weights
+                gjopen = self.gjopen
+
+            conc_mems = self.cc_at_mem[ions]
+
+            zs_mems[:] = self.zs[ions, None]
+            fgj_X = stb.electroflux(
+                conc_mems[:, cells.mem_i],
+                conc_mems[:, cells.nn_i],
+                self.D_gj[ions]*p.gj_surface*gjopen,
+                cells.gj_len,
+                zs_mems,
+                self.vgj,
+                p.T,
+                p,
+                rho=1,
+            )
 
-        # divergence of total flux:
-        div_fa = fd.divergence(-fx, -fy, cells.delta, cells.delta)
+            # enforce zero flux at outer boundary:
+            fgj_X[:, cells.bflags_mems] = 0.0
 
-        # update concentration in the environment:
-        cenv = cenv + div_fa * p.dt
+            # store gap junction flux for these ions
+            self.fluxes_gj[ions] = self.fluxes_gj[ions] + fgj_X
 
-        if p.sharpness < 1.0:
+        # ..................{ ENVIRONMENT                   }..................
+        if p.is_ecm:
+            with timer('ecm'):
+                # update concentrations in the extracellular spaces:
+                shape_env = (len(ions),) + cells.X.shape
 
-            # smooth concentration in the environment:
-            cenv = fd.integrator(cenv, sharp = p.sharpness)
+                cenv = self.cc_env[ions].reshape(shape_env)
+                c_env_bound = np.asarray(self.c_env_bound)[ions, None]
 
-        self.cc_env[i] = cenv.ravel()
+                cenv[..., :, 0] = c_env_bound
+                cenv[..., :, -1] = c_env_bound
+                cenv[..., 0, :] = c_env_bound
+                cenv[..., -1, :] = c_env_bound
 
+                gcx, gcy = fd.gradient(cenv, cells.delta)
 
-    def update_intra(self, cells, p, i):
+                if p.fluid_flow is True:
+                    ux = self.u_env_x
+                    uy = self.u_env_y
+                else:
+                    ux = 0.0
+                    uy = 0.0
 
-        cav = self.cc_cells[i][cells.mem_to_cells]  # concentration at cell centre
-        # cmi = self.cc_at_mem[i]  # concentration at membrane
-        # z = self.zs[i]    # charge of ion
-        # Do = 0.1*self.D_free[i]  # diffusion constant of ion, assuming diffusion in cytoplasm is 10x slower than free
-        #
-        # cp = (cav + cmi)/2   # concentration at midpoint between cell centre and membrane
-        # cg = (cmi - cav)/cells.R_rads  # concentration gradients
-        #
-        # # normal component of electric field at membranes:
-        # En = (self.E_cell_x[cells.mem_to_cells] * cells.mem_vects_flat[:, 2] +
-        #       self.E_cell_y[cells.mem_to_cells] * cells.mem_vects_flat[:, 3])
+                denv = (
+                    self.D_env[ions].reshape(shape_env)*
+                    self.TJ_modulator[ions].reshape(shape_env))
 
-        # calculate normal component of microtubules at membrane:
-        # umtn = self.mtubes.mtubes_x*cells.mem_vects_flat[:, 2] + self.mtubes.mtubes_y*cells.mem_vects_flat[:, 3]
+                # This equation assumes environmental transport is electrodiffusive.
+                fx, fy = stb.nernst_planck_flux(
+                    cenv, gcx, gcy, -self.E_env_x, -self.E_env_y, ux, uy, denv,
+                    self.zs[ions, None, None], self.T, p)
 
+                # store ecm junction flux for these ions
+                self.fluxes_env_x[ions] = fx.reshape(len(ions), -1)
+                self.fluxes_env_y[ions] = fy.reshape(len(ions), -1)
 
-        # if p.cell_polarizability != 0.0:
-        #
-        #     # cflux = np.zeros(self.mdl)
-        #     # self.cc_at_mem[i] = cav*1
-        #
-        #     cfluxo = (-Do*cg + ((Do*p.q*cp*z)/(p.kb*self.T))*En)*p.cell_polarizability
-        #
-        #     # as no net mass must leave this intracellular movement, make the flux divergence-free:
-        #     cflux = stb.single_cell_div_free(cfluxo, cells)
-        #
-        #     # update the concentration at membranes:
-        #     # flux is positive as the field is internal to the cell, working in the opposite direction to transmem fluxes
-        #     self.cc_at_mem[i] = cmi + cflux*(cells.mem_sa/cells.mem_vol)*p.dt
-        #
-        #     # smooth the concentration:
-        #     self.cc_at_mem[i] = self.smooth_weight_mem*self.cc_at_mem[i] + cav*self.smooth_weight_o
-        #
-        # elif p.cell_polarizability == 0.0:
+                # divergence of total flux:
+                div_fa = fd.divergence(-fx, -fy, cells.delta, cells.delta)
 
-            # cflux = np.zeros(self.mdl)
-            # self.cc_at_mem[i] = cav*1
+                # update concentration in the environment:
+                cenv = cenv + div_fa * p.dt
 
+                if p.sharpness < 1.0:
+                    # smooth concentration in the environment:
+                    cenv = fd.integrator(cenv, sharp = p.sharpness)
 
-        # deal with the fact that our coarse diffusion model may leave some sub-zero concentrations:
-        # indsZ = (self.cc_at_mem[i] < 0.0).nonzero()
-        #
-        # if len(indsZ[0]):
-        #
-        #     raise BetseSimUnstableException("Ion concentration value on membrane below zero! Your simulation has"
-        #                                        " become unstable.")
-        #
-        # # update the main matrices:
-        # self.fluxes_intra[i] = cflux * 1
+                self.cc_env[ions] = cenv.reshape(len(ions), -1)
 
-        # uncomment this to skip the above computational loop ---------------
-        self.cc_at_mem[i] = cav*1
+        # ..................{ INTRACELLULAR                 }..................
+        # update concentration gradient to estimate concentrations at
+        # membranes, assuming instant mixing in each cell:
+        self.cc_at_mem[ions] = self.cc_cells[ions][:, cells.mem_to_cells]
 
     # ..................{ GETTERS                           }..................
     def get_ion(self, ion_name: str) -> int:
@@ -5,11 +5,11 @@
 # ....................{ IMPORTS                            }....................
 import numpy as np
 import numpy.ma as ma
-from scipy import interpolate as interp
 from scipy.ndimage import gaussian_filter
 # from betse.science.math import toolbox as tb
 from betse.exceptions import BetseSimUnstableException
 from betse.science.math import finitediff as fd
+from betse.science.math import gridinterp
 
 # ....................{ UTILITIES                          }....................
 # Toolbox of functions used in the Simulator class to calculate key bioelectric
@@ -368,7 +368,7 @@ def vertData(data, cells, p):
     plot_data = np.hstack((data,verts_data))
 
     # interpolate the stack to the plotting grid:
-    dat_grid = interp.griddata((cells.plot_xy[:,0],cells.plot_xy[:,1]),plot_data,(cells.Xgrid,cells.Ygrid),
+    dat_grid = gridinterp.griddata((cells.plot_xy[:,0],cells.plot_xy[:,1]),plot_data,(cells.Xgrid,cells.Ygrid),
                                method=p.interp_type,
                                fill_value=0)
 
@@ -544,16 +544,16 @@ def ghk_calculator(sim, cells, p):
         ion_type = np.sign(z)
 
         # average values from membranes or environment to cell centres:
-        Dm = np.dot(cells.M_sum_mems, sim.Dm_cells[i]) / cells.num_mems
+        Dm = cells.M_sum_mems.dot(sim.Dm_cells[i]) / cells.num_mems
         conc_cells = sim.cc_cells[i]
 
         if p.is_ecm is True:
             # average entities from membranes to the cell centres:
-            conc_env = np.dot(cells.M_sum_mems, sim.cc_env[i][cells.map_mem2ecm]) / cells.num_mems
+            conc_env = cells.M_sum_mems.dot(sim.cc_env[i][cells.map_mem2ecm]) / cells.num_mems
 
         else:
 
-            conc_env = np.dot(cells.M_sum_mems, sim.cc_env[i]) / cells.num_mems
+            conc_env = cells.M_sum_mems.dot(sim.cc_env[i]) / cells.num_mems
 
         if ion_type == -1:
 
@@ -582,15 +582,15 @@ def ghk_calculator(sim, cells, p):
 
                 if p.is_ecm is True:
                     # average entities from membranes to the cell centres:
-                    conc_env = np.dot(cells.M_sum_mems, sim.cc_env[ion_i][cells.map_mem2ecm]) / cells.num_mems
+                    conc_env = cells.M_sum_mems.dot(sim.cc_env[ion_i][cells.map_mem2ecm]) / cells.num_mems
 
                 else:
 
-                    conc_env = np.dot(cells.M_sum_mems, sim.cc_env[ion_i]) / cells.num_mems
+                    conc_env = cells.M_sum_mems.dot(sim.cc_env[ion_i]) / cells.num_mems
 
                 if obj.channel_core.DChan is not None:
                     Dmo = obj.channel_core.DChan*relP
-                    Dm = np.dot(cells.M_sum_mems, Dmo) / cells.num_mems
+                    Dm = cells.M_sum_mems.dot(Dmo) / cells.num_mems
 
                 else:
                     Dm = 0.0
@@ -619,16 +619,16 @@ def ghk_calculator(sim, cells, p):
 
                 if p.is_ecm is True:
                     # average entities from membranes to the cell centres:
-                    conc_env = np.dot(cells.M_sum_mems,
-                                      sim.cc_env[ion_i][cells.map_mem2ecm]) / cells.num_mems
+                    conc_env = cells.M_sum_mems.dot(
+                        sim.cc_env[ion_i][cells.map_mem2ecm]) / cells.num_mems
 
                 else:
 
-                    conc_env = np.dot(cells.M_sum_mems, sim.cc_env[ion_i]) / cells.num_mems
+                    conc_env = cells.M_sum_mems.dot(sim.cc_env[ion_i]) / cells.num_mems
 
                 if obj.channel_core.DChan is not None:
                     Dmo = obj.channel_core.DChan * relP
-                    Dm = np.dot(cells.M_sum_mems, Dmo) / cells.num_mems
+                    Dm = cells.M_sum_mems.dot(Dmo) / cells.num_mems
 
                 else:
                     Dm = 0.0
@@ -987,7 +987,7 @@ def molecule_mover(sim, cX_env_o, cX_cells, cells, p, z=0, Dm=1.0e-18, Do=1.0e-9
         # enforce zero flux at outer boundary:
         fgj_X[cells.bflags_mems] = 0.0
 
-        delta_cco = np.dot(cells.M_sum_mems, -fgj_X * cells.mem_sa) / cells.cell_vol
+        delta_cco = cells.M_sum_mems.dot(-fgj_X * cells.mem_sa) / cells.cell_vol
 
         # Calculate the final concentration change (the acceleration effectively speeds up time):
         if update_intra is False: # do the GJ transfer assuming instant mixing in the cell:
@@ -1050,7 +1050,7 @@ def molecule_mover(sim, cX_env_o, cX_cells, cells, p, z=0, Dm=1.0e-18, Do=1.0e-9
 
         flux_mtn[cells.bflags_mems] = 0.0
 
-        div_ccmt = -np.dot(cells.M_sum_mems, flux_mtn*cells.mem_sa)/cells.cell_vol
+        div_ccmt = -cells.M_sum_mems.dot(flux_mtn*cells.mem_sa)/cells.cell_vol
 
         # update cell concentration:
         cX_cells += div_ccmt*p.dt*time_dilation_factor
@@ -1174,7 +1174,7 @@ def update_Co(sim, cX_cell, cX_mem, cX_env, flux, cells, p, ignoreECM = True, up
     """
 
     # take the divergence of the flux for each enclosed cell:
-    delta_cells = np.dot(cells.M_sum_mems, flux * cells.mem_sa) / cells.cell_vol
+    delta_cells = cells.M_sum_mems.dot(flux * cells.mem_sa) / cells.cell_vol
 
     # update cell concentration of substance:
     if update_at_mems is False: # treat cell mem and centre values as equal
@@ -1260,7 +1260,7 @@ def HH_Decomp(JJx, JJy, cells, bounds = None, sigma = 1.0):
     divJr[0, :] = 0.0
     divJr[-1, :] = 0.0
 
-    AA = np.dot(cells.lapENVinv, -divJr.ravel())
+    AA = cells.lapENVinv.solve(-divJr.ravel())
 
     gAx, gAy = fd.gradient(AA.reshape(cells.X.shape), cells.delta)
 
@@ -1281,7 +1281,7 @@ def HH_Decomp(JJx, JJy, cells, bounds = None, sigma = 1.0):
     divJd[-1, :] = -Tb * (1 / cells.delta ** 2)
 
 
-    BB = np.dot(cells.lapENVinv, divJd.ravel())
+    BB = cells.lapENVinv.solve(divJd.ravel())
 
     Gx, Gy = fd.gradient(BB.reshape(cells.X.shape), cells.delta)
 
@@ -1306,7 +1306,7 @@ def div_free(Fxo, Fyo, cells):
     divF = fd.divergence(Fxo.reshape(cells.X.shape), Fyo.reshape(cells.X.shape), cells.delta, cells.delta)
 
     # value of the correcting potenial:
-    Phi = np.dot(cells.lapENVinv, divF.ravel())
+    Phi = cells.lapENVinv.solve(divF.ravel())
 
     gPhix, gPhiy = fd.gradient(Phi.reshape(cells.X.shape), cells.delta)
 
@@ -1355,8 +1355,8 @@ def map_to_cells(Fx, Fy, cells, p, smoothing=1.0):
     Fmem = (Fx_atmem * cells.mem_vects_flat[:, 2] +
             Fy_atmem * cells.mem_vects_flat[:, 3])
 
-    Fx_atcell = (np.dot(cells.M_sum_mems, Fx_atmem * cells.mem_sa) / cells.cell_sa)
-    Fy_atcell = (np.dot(cells.M_sum_mems, Fy_atmem * cells.mem_sa) / cells.cell_sa)
+    Fx_atcell = (cells.M_sum_mems.dot(Fx_atmem * cells.mem_sa) / cells.cell_sa)
+    Fy_atcell = (cells.M_sum_mems.dot(Fy_atmem * cells.mem_sa) / cells.cell_sa)
 
     return Fx_atcell, Fy_atcell, Fmem
 
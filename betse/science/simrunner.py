@@ -7,7 +7,6 @@
 import matplotlib.pyplot as plt
 import numpy as np
 from betse.exceptions import BetseSimException, BetseSimConfException
-from betse.lib.pickle import pickles
 from betse.science import filehandling as fh
 from betse.science.cells import Cells
 from betse.science.chemistry.gene import MasterOfGenes
@@ -445,7 +444,7 @@ class SimRunner(object):
                 subcommand_label='Gene regulatory network')
 
             # Unpickle this file into a high-level "MasterOfGenes" object.
-            MoG, _, _ = pickles.load(self._p.grn_unpickle_filename)
+            MoG, _, _ = fh.loadSim(self._p.grn_unpickle_filename)
 
             # If running on a sim with a cut event, perform this cut...
             if (
@@ -0,0 +1,488 @@
+#!/usr/bin/env python3
+# --------------------( LICENSE                           )--------------------
+# Copyright 2014-2023 by Alexis Pietak & Cecil Curry.
+# See "LICENSE" for further details.
+
+'''
+High-level **parameter sweep** (i.e., batch of initialization and simulation
+phases differing only in a few configuration settings, run in parallel across
+multiple processes) functionality.
+'''
+
+# ....................{ IMPORTS                           }....................
+import itertools, multiprocessing, os
+import numpy as np
+from betse.exceptions import BetseSimConfException
+from betse.lib.numpy.npcsv import write_csv
+from betse.science.enum.enumconf import SolverType
+from betse.science.parameters import Parameters
+from betse.science.simrunner import SimRunner
+from betse.util.io.log import logs
+from betse.util.os.process import prcfork
+from betse.util.path import dirs, pathnames
+from betse.util.type.types import (
+    type_check, IntOrNoneTypes, MappingType, StrOrNoneTypes)
+from concurrent.futures import ProcessPoolExecutor
+
+# ....................{ CONSTANTS                         }....................
+SWEEP_DIRNAME_DEFAULT = 'SWEEP'
+'''
+Default basename of the directory to which all parameter sweep results are
+written, relative to the directory containing the base configuration file.
+'''
+
+
+SWEEP_SUMMARY_BASENAME = 'sweep_summary.csv'
+'''
+Basename of the CSV file summarizing all runs of a parameter sweep, written to
+the directory containing all results for that sweep.
+'''
+
+
+# ....................{ CLASSES                           }....................
+class SimSweeper(object):
+    '''
+    **Parameter sweeper** (i.e., object running the initialization and
+    optionally simulation phases of one simulation configuration for each
+    combination of values in a grid of configuration settings, distributing
+    these runs across a pool of worker processes).
+
+    All runs share the same cell cluster, seeded at most once from the base
+    configuration; the settings swept by this object hence *cannot* include
+    seed-dependent settings (i.e., settings under the ``general options`` or
+    ``world options`` keys), which would invalidate this cell cluster.
+
+    Each run writes its pickled phase results and exports to its own
+    subdirectory of the sweep directory (e.g., ``SWEEP/run_0003/INITS``).
+    After all runs complete, a CSV file summarizing the swept settings, final
+    average transmembrane voltage, and final average cytosolic ion
+    concentrations of each run is written to that directory.
+
+    Caveats
+    ----------
+    Since worker processes are *spawned* rather than forked (ensuring the
+    thread limits of the BLAS implementation underlying Numpy are respected
+    by each worker), scripts running parameter sweeps *must* guard their
+    top-level logic with the standard ``if __name__ == '__main__':`` idiom.
+
+    Attributes
+    ----------
+    _conf_filename : str
+        Absolute filename of the base simulation configuration file.
+    _key_path_to_values : dict
+        Dictionary mapping from the key path of each swept setting to the
+        sequence of all values to be swept over for that setting.
+    _processes : int
+        Maximum number of worker processes to run concurrently.
+    _sweep_dirname : str
+        Absolute dirname of the directory to which all results are written.
+    _threads_per_process : int
+        Maximum number of BLAS threads available to each worker process.
+    '''
+
+    # ..................{ INITIALIZERS                      }..................
+    @type_check
+    def __init__(
+        self,
+
+        # Mandatory parameters.
+        conf_filename: str,
+        grid: MappingType,
+
+        # Optional parameters.
+        sweep_dirname: StrOrNoneTypes = None,
+        processes: IntOrNoneTypes = None,
+        threads_per_process: int = 1,
+    ) -> None:
+        '''
+        Initialize this parameter sweeper.
+
+        Parameters
+        ----------
+        conf_filename : str
+            Absolute or relative filename of the base simulation configuration
+            file, whose settings are shared by all runs except where overridden
+            by the passed grid.
+        grid : MappingType
+            Dictionary mapping from the **key path** (i.e., ``/``-delimited
+            sequence of the YAML keys and list indices locating a setting in
+            the base configuration file) of each swept setting to the sequence
+            of all values to be swept over for that setting. One run is
+            performed for each combination of these values (e.g.,
+            ``{'internal parameters/alpha_NaK': (1e-8, 2e-8)}``).
+        sweep_dirname : StrOrNoneTypes
+            Absolute or relative dirname of the directory to which all results
+            are written. Defaults to ``None``, in which case this defaults to
+            the :data:`SWEEP_DIRNAME_DEFAULT` subdirectory of the directory
+            containing the base configuration file.
+        processes : IntOrNoneTypes
+            Maximum number of worker processes to run concurrently. Defaults to
+            ``None``, in which case this defaults to the number of logical
+            processors divided by ``threads_per_process``.
+        threads_per_process : int
+            Maximum number of BLAS threads available to each worker process.
+            Defaults to 1, avoiding oversubscription of processors by the
+            multithreaded BLAS implementations commonly underlying Numpy.
+
+        Raises
+        ----------
+        BetseSimConfException
+            If this grid is empty *or* any key path of this grid either fails
+            to locate an existing setting, locates a seed-dependent setting,
+            *or* maps to an empty sequence of values.
+        '''
+
+        # If this grid is empty, raise an exception.
+        if not grid:
+            raise BetseSimConfException('Parameter sweep grid empty.')
+
+        # Default all unpassed parameters to sane defaults.
+        if processes is None:
+            processes = max(1, (os.cpu_count() or 1) // threads_per_process)
+
+        # Base simulation configuration, loaded solely for validation.
+        p = Parameters.make(conf_filename)
+
+        if sweep_dirname is None:
+            sweep_dirname = pathnames.join(
+                p.conf_dirname, SWEEP_DIRNAME_DEFAULT)
+
+        # For each key path of this grid, raise an exception unless this key
+        # path locates an existing setting that is safely sweepable.
+        for key_path in grid:
+            if key_path.split('/')[0] in ('general options', 'world options'):
+                raise BetseSimConfException(
+                    'Parameter sweep setting "{}" seed-dependent '
+                    '(i.e., invalidates the shared cell cluster).'.format(
+                        key_path))
+            _get_conf_value(p.conf, key_path)
+
+            # If no values are swept over for this setting, raise an exception.
+            if not grid[key_path]:
+                raise BetseSimConfException(
+                    'Parameter sweep setting "{}" values empty.'.format(
+                        key_path))
+
+        # Classify all passed parameters.
+        self._conf_filename = pathnames.canonicalize(p.conf_filename)
+        self._key_path_to_values = {
+            key_path: tuple(values) for key_path, values in grid.items()}
+        self._processes = processes
+        self._sweep_dirname = pathnames.canonicalize(sweep_dirname)
+        self._threads_per_process = threads_per_process
+
+    # ..................{ PROPERTIES                        }..................
+    @property
+    def sweep_dirname(self) -> str:
+        '''
+        Absolute dirname of the directory to which all results are written.
+        '''
+
+        return self._sweep_dirname
+
+
+    @property
+    def summary_filename(self) -> str:
+        '''
+        Absolute filename of the CSV file summarizing all runs of this sweep.
+        '''
+
+        return pathnames.join(self._sweep_dirname, SWEEP_SUMMARY_BASENAME)
+
+    # ..................{ RUNNERS                           }..................
+    @type_check
+    def run(self, is_sim: bool = True) -> list:
+        '''
+        Run the initialization and optionally simulation phases for each
+        combination of values in the grid of settings swept by this object,
+        seeding the shared cell cluster first if needed.
+
+        Runs raising exceptions are logged and summarized as ``NaN`` values
+        rather than halting the entire sweep.
+
+        Parameters
+        ----------
+        is_sim : bool
+            ``True`` only if the simulation phase is to be run after the
+            initialization phase of each run. Defaults to ``True``.
+
+        Returns
+        ----------
+        list
+            List of dictionaries summarizing each run (in run order), each
+            mapping from column names to values of the summary written to
+            :attr:`summary_filename`.
+        '''
+
+        # Base simulation configuration.
+        p = Parameters.make(self._conf_filename)
+
+        # Seed the shared cell cluster if needed *BEFORE* spawning workers.
+        if not os.path.isfile(p.seed_pickle_filename):
+            logs.log_info('Seeding cell cluster shared by parameter sweep...')
+            SimRunner(p=p).seed()
+        else:
+            logs.log_info(
+                'Reusing cell cluster for parameter sweep:\n\t%s',
+                p.seed_pickle_filename)
+
+        # Tuple of all swept key paths and list of dictionaries mapping from
+        # these key paths to the values of these settings for each run.
+        key_paths = tuple(self._key_path_to_values.keys())
+        runs_key_path_to_value = [
+            dict(zip(key_paths, values))
+            for values in itertools.product(*self._key_path_to_values.values())
+        ]
+
+        # Create the sweep directory if needed.
+        dirs.make_unless_dir(self._sweep_dirname)
+
+        logs.log_info(
+            'Running %d parameter sweep runs across %d processes...',
+            len(runs_key_path_to_value),
+            min(self._processes, len(runs_key_path_to_value)))
+
+        # List of the names of all runs (in run order).
+        run_names = [
+            'run_{:04d}'.format(run_index)
+            for run_index in range(len(runs_key_path_to_value))
+        ]
+
+        # List of dictionaries summarizing all runs (in run order).
+        runs_summary = []
+
+        # Spawn a pool of worker processes whose BLAS implementations are
+        # limited to this number of threads.
+        with prcfork.limiting_blas_threads(self._threads_per_process), (
+            ProcessPoolExecutor(
+                max_workers=min(
+                    self._processes, len(runs_key_path_to_value)),
+                mp_context=multiprocessing.get_context('spawn'),
+            )) as executor:
+            # List of futures running each run (in run order).
+            futures = [
+                executor.submit(
+                    _run_sweep_job,
+                    conf_filename=self._conf_filename,
+                    seed_pickle_filename=p.seed_pickle_filename,
+                    run_dirname=pathnames.join(self._sweep_dirname, run_name),
+                    key_path_to_value=key_path_to_value,
+                    is_sim=is_sim,
+                )
+                for run_name, key_path_to_value in zip(
+                    run_names, runs_key_path_to_value)
+            ]
+
+            # For each such future, collect the summary of this run.
+            for run_name, future in zip(run_names, futures):
+                try:
+                    run_summary = future.result()
+                # If this run failed, log this failure and continue.
+                except Exception as exception:
+                    logs.log_error(
+                        'Parameter sweep run "%s" failed: %s',
+                        run_name, exception)
+                    run_summary = {}
+
+                runs_summary.append(run_summary)
+
+        # List of the names of all summary columns (in first-seen order).
+        summary_names = []
+        for run_summary in runs_summary:
+            for summary_name in run_summary:
+                if summary_name not in summary_names:
+                    summary_names.append(summary_name)
+
+        # List of dictionaries summarizing each run, defaulting the summary of
+        # failed runs to "NaN".
+        runs_row = [
+            {
+                'run': run_name,
+                **key_path_to_value,
+                **{
+                    summary_name: run_summary.get(summary_name, np.nan)
+                    for summary_name in summary_names
+                },
+            }
+            for run_name, key_path_to_value, run_summary in zip(
+                run_names, runs_key_path_to_value, runs_summary)
+        ]
+
+        # Write this summary as one row per run.
+        column_names = ('run',) + key_paths + tuple(summary_names)
+        write_csv(
+            filename=self.summary_filename,
+            column_name_to_values={
+                column_name: [run_row[column_name] for run_row in runs_row]
+                for column_name in column_names
+            },
+            column_name_to_format={
+                column_name: '%s' for column_name in column_names},
+        )
+
+        logs.log_info(
+            'Parameter sweep summary saved to:\n\t%s', self.summary_filename)
+
+        # Return this summary.
+        return runs_row
+
+# ....................{ PRIVATE ~ runners                 }....................
+def _run_sweep_job(
+    conf_filename: str,
+    seed_pickle_filename: str,
+    run_dirname: str,
+    key_path_to_value: dict,
+    is_sim: bool,
+) -> dict:
+    '''
+    Run the initialization and optionally simulation phases of the passed base
+    simulation configuration with the passed settings overridden, writing all
+    results to the passed run directory and returning a summary of these
+    results.
+
+    This function is intended to be called *only* from worker processes
+    spawned by the :meth:`SimSweeper.run` method.
+
+    Parameters
+    ----------
+    conf_filename : str
+        Absolute filename of the base simulation configuration file.
+    seed_pickle_filename : str
+        Absolute filename of the cell cluster shared by all runs.
+    run_dirname : str
+        Absolute dirname of the directory to which all results are written.
+    key_path_to_value : dict
+        Dictionary mapping from the key path of each overridden setting to the
+        value of that setting for this run.
+    is_sim : bool
+        ``True`` only if the simulation phase is to be run after the
+        initialization phase.
+
+    Returns
+    ----------
+    dict
+        Dictionary mapping from the names to values of the final average
+        transmembrane voltage and cytosolic ion concentrations of this run.
+    '''
+
+    # Base simulation configuration, loaded relative to the directory of the
+    # base configuration file to preserve all relative input pathnames.
+    p = Parameters.make(conf_filename)
+
+    # Override all swept settings.
+    for key_path, value in key_path_to_value.items():
+        _set_conf_value(p.conf, key_path, value)
+
+    # Redirect all results to this run directory, relative to the directory
+    # of the base configuration file.
+    run_dirname_relative = pathnames.relativize(p.conf_dirname, run_dirname)
+    p.init_pickle_dirname_relative = pathnames.join(
+        run_dirname_relative, 'INITS')
+    p.sim_pickle_dirname_relative = pathnames.join(
+        run_dirname_relative, 'SIMS')
+    p.init_export_dirname_relative = pathnames.join(
+        run_dirname_relative, 'RESULTS', 'init')
+    p.sim_export_dirname_relative = pathnames.join(
+        run_dirname_relative, 'RESULTS', 'sim')
+    p.grn_pickle_dirname_relative = pathnames.join(
+        run_dirname_relative, 'RESULTS', 'GRN')
+
+    # Reparse this configuration from these settings *AFTER* overriding these
+    # settings.
+    p.reload()
+
+    # Prevent animations from being displayed by this non-interactive worker.
+    p.anim.is_while_sim_show = False
+
+    # Load the shared cell cluster rather than seeding another.
+    p.seed_pickle_filename = seed_pickle_filename
+
+    # Run all requested phases.
+    sim_runner = SimRunner(p=p)
+    phase = sim_runner.init()
+    if is_sim:
+        phase = sim_runner.sim()
+
+    # Summarize the final state of the last such phase.
+    sim = phase.sim
+    run_summary = {'Vmem (mV)': 1000*np.mean(sim.vm_time[-1])}
+    if p.solver_type is SolverType.FULL:
+        for ion_index, ion_name in sim.ionlabel.items():
+            run_summary['{} (mmol/L)'.format(ion_name)] = np.mean(
+                sim.cc_time[-1][ion_index])
+
+    # Return this summary.
+    return run_summary
+
+# ....................{ PRIVATE ~ getters                 }....................
+def _get_conf_value(conf: object, key_path: str) -> object:
+    '''
+    Value of the setting with the passed key path in the passed low-level
+    container of a simulation configuration.
+
+    Parameters
+    ----------
+    conf : object
+        Low-level container of all settings of a simulation configuration.
+    key_path : str
+        ``/``-delimited sequence of the YAML keys and list indices locating
+        this setting in this container (e.g.,
+        ``tissue profile definition/tissue/profiles/0/diffusion constants``).
+
+    Returns
+    ----------
+    object
+        Value of this setting.
+
+    Raises
+    ----------
+    BetseSimConfException
+        If this key path fails to locate an existing setting.
+    '''
+
+    for key in key_path.split('/'):
+        try:
+            conf = conf[int(key) if isinstance(conf, list) else key]
+        except (IndexError, KeyError, TypeError, ValueError):
+            raise BetseSimConfException(
+                'Parameter sweep setting "{}" not found.'.format(key_path))
+
+    return conf
+
+
+def _set_conf_value(conf: object, key_path: str, value: object) -> None:
+    '''
+    Set the setting with the passed key path in the passed low-level container
+    of a simulation configuration to the passed value.
+
+    Parameters
+    ----------
+    conf : object
+        Low-level container of all settings of a simulation configuration.
+    key_path : str
+        ``/``-delimited sequence of the YAML keys and list indices locating
+        this setting in this container.
+    value : object
+        Value to set this setting to.
+
+    Raises
+    ----------
+    BetseSimConfException
+        If this key path fails to locate an existing setting.
+
+    See Also
+    ----------
+    :func:`_get_conf_value`
+        Further details.
+    '''
+
+    # Key path of the container of this setting and key of this setting.
+    key_path_parent, _, key = key_path.rpartition('/')
+
+    # Container of this setting.
+    conf_parent = (
+        _get_conf_value(conf, key_path_parent) if key_path_parent else conf)
+
+    # Validate this setting to exist *BEFORE* setting this setting.
+    _get_conf_value(conf_parent, key)
+    conf_parent[int(key) if isinstance(conf_parent, list) else key] = value
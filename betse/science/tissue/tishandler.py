@@ -12,6 +12,7 @@ import copy
 import numpy as np
 from betse.exceptions import BetseSimTissueException
 from betse.science.enum.enumconf import CellsPickerType, SolverType
+from betse.science.enum.enumphase import SimPhaseKind
 from betse.science.math import modulate as mod
 from betse.science.math import toolbox as tb
 from betse.science.phase.phasecls import SimPhase
@@ -704,6 +705,96 @@ class TissueHandler(object):
             self.targets_ecmJ = [
                 item for sublist in self.targets_ecmJ for item in sublist]
 
+    # ..................{ GETTERS                           }..................
+    @type_check
+    def get_event_windows(self, phase: SimPhase) -> list:
+        '''
+        List of all **event windows** (i.e., time intervals over which a
+        scheduled intervention switches on or off) for the passed simulation
+        phase as ``(time_start, time_stop)`` 2-tuples in seconds.
+
+        Since each such intervention is modulated by the logistic
+        :func:`betse.science.math.toolbox.pulse` function, each intervention
+        switching on at time ``t_on`` and off at time ``t_off`` with ramp time
+        ``t_change`` yields the two windows ``(t_on - t_change, t_on +
+        t_change)`` and ``(t_off - t_change, t_off + t_change)``, outside of
+        which that function is effectively constant.
+
+        Parameters
+        ----------
+        phase : SimPhase
+            Current simulation phase. Since events are only fired while
+            simulating, this method returns the empty list for all other
+            phases.
+
+        Returns
+        ----------
+        list
+            List of all event windows in arbitrary order.
+        '''
+
+        # If this is not the simulation phase, no events are fired.
+        if phase.kind is not SimPhaseKind.SIM:
+            return []
+
+        # Localize pertinent simulation phase objects for convenience.
+        p = phase.p
+
+        # List of all enabled pulses as "(t_on, t_off, t_change)" 3-tuples.
+        pulses = []
+
+        if p.global_options['K_env'] != 0:
+            pulses.append((self.t_on_Kenv, self.t_off_Kenv, self.t_change_Kenv))
+        if p.global_options['Cl_env'] != 0:
+            pulses.append((
+                self.t_on_Clenv, self.t_off_Clenv, self.t_change_Clenv))
+        if p.global_options['Na_env'] != 0:
+            pulses.append((
+                self.t_on_Naenv, self.t_off_Naenv, self.t_change_Naenv))
+        if p.global_options['T_change'] != 0:
+            pulses.append((self.tonT, self.toffT, self.trampT))
+        if p.global_options['gj_block'] != 0:
+            pulses.append((self.tonGJ, self.toffGJ, self.trampGJ))
+        if p.global_options['NaKATP_block'] != 0:
+            pulses.append((self.tonNK, self.toffNK, self.trampNK))
+
+        if p.scheduled_options['Na_mem'] != 0:
+            pulses.append((
+                self.t_on_Namem, self.t_off_Namem, self.t_change_Namem))
+        if p.scheduled_options['K_mem'] != 0:
+            pulses.append((self.t_on_Kmem, self.t_off_Kmem, self.t_change_Kmem))
+        if p.scheduled_options['Cl_mem'] != 0:
+            pulses.append((
+                self.t_on_Clmem, self.t_off_Clmem, self.t_change_Clmem))
+        if p.scheduled_options['Ca_mem'] != 0:
+            pulses.append((
+                self.t_on_Camem, self.t_off_Camem, self.t_change_Camem))
+        if p.scheduled_options['pressure'] != 0:
+            pulses.append((self.t_onP, self.t_offP, self.t_changeP))
+        if p.scheduled_options['ecmJ'] != 0 and p.is_ecm:
+            pulses.append((self.t_on_ecmJ, self.t_off_ecmJ, self.t_change_ecmJ))
+
+        # If the voltage event is enabled, this event is also such a pulse.
+        if self._event_voltage is not None:
+            pulses.append((
+                self._event_voltage.start_time_step,
+                self._event_voltage.stop_time_step,
+                self._event_voltage.time_step_rate,
+            ))
+
+        # List of all event windows bracketing these pulses.
+        event_windows = []
+        for t_on, t_off, t_change in pulses:
+            event_windows.append((t_on - t_change, t_on + t_change))
+            event_windows.append((t_off - t_change, t_off + t_change))
+
+        # If the cutting event is enabled, this event occurs instantaneously.
+        if self.event_cut is not None:
+            event_windows.append((p.event_cut_time, p.event_cut_time))
+
+        # Return these windows.
+        return event_windows
+
     # ..................{ FIRERS                            }..................
     @type_check
     def fire_events(self, phase: SimPhase, t: float) -> None:
@@ -905,8 +996,8 @@ class TissueHandler(object):
             # updated world.
             self.data_length = len(cells.mem_i)
 
-            self.init_profiles(phase)
-            cells.redo_gj(phase)
+            # Tissue profiles and gap junctions have already been redone for
+            # the updated world by each _cut_cells() call above.
             self.init_events(phase)
 
             # Avoid repeating this cutting event at subsequent time steps.
@@ -991,22 +1082,28 @@ class TissueHandler(object):
         # old_bflag_cellxy = np.copy(cells.cell_centres[cells.bflags_cells])
         # old_bflag_memxy = np.copy(cells.mem_mids_flat[cells.bflags_mems])
 
-        # set up the situation to make world joined to cut world have more permeable membranes:
-        hurt_cells = np.zeros(len(cells.cell_i))
-
-        # If we're creating a wound-induced channel ------------------------------------------------
-        target_inds_gj_unique = np.unique(target_inds_gj)
+        # Boolean arrays flagging each retained cell and cell membrane, with
+        # which all data defined on cells and cell membranes is compacted below.
+        cells_count = len(cells.cell_i)
+        mems_count = len(cells.mem_i)
+        is_cell_kept = np.ones(cells_count, dtype=bool)
+        is_cell_kept[target_inds_cell] = False
+        is_mem_kept = np.ones(mems_count, dtype=bool)
+        is_mem_kept[target_inds_mem] = False
+
+        # set up the situation to make world joined to cut world have more permeable membranes,
+        # flagging each cell sharing a gap junction with a removed cell as a "hurt" cell:
+        nn_full_counts = np.asarray([len(inds) for inds in cells.cell_to_nn_full], dtype=int)
+        nn_full_inds = np.asarray(
+            [ind for inds in cells.cell_to_nn_full for ind in inds], dtype=int)
+        is_nn_full_target = np.isin(nn_full_inds, target_inds_gj)
+
+        hurt_cells = np.bincount(
+            np.repeat(np.arange(cells_count), nn_full_counts)[is_nn_full_target],
+            minlength=cells_count)
 
-        for i, inds in enumerate(cells.cell_to_nn_full): # for all the nn inds to a cell...
-            inds_array = np.asarray(inds)
-            inds_in_target = np.intersect1d(inds_array,target_inds_gj_unique)
-
-            if len(inds_in_target):
-                hurt_cells[i] = 1  # flag the cell as a "hurt" cell
-
-        hurt_inds = (hurt_cells == 1).nonzero()
         sim.hurt_mask = np.zeros(sim.cdl)
-        sim.hurt_mask[hurt_inds] = 1.0
+        sim.hurt_mask[hurt_cells > 0] = 1.0
 
         #----------------------------------------------------------------------------------
 
@@ -1050,91 +1147,31 @@ class TissueHandler(object):
 
         special_names = set(specials_list)
 
-        #FIXME: This is awesome-sauce in a BETSE jar, but I don't quite grok what's
-        #going on. It'd be swell if this could recieve some documentation
-        #massaging. The tidal waves of time recede, inch by minute inch!
+        # Compact all data defined on cells or cell membranes, including all
+        # nested data structures (e.g., one array for each ion), by retaining
+        # only the entries for retained cells or cell membranes.
         for name in sim_names:
-            if name in special_names: # if this is a nested data structure...
-                super_data = getattr(sim, name)
-                super_data2 = []
-
-                for i, data in enumerate(super_data):
-                    if isinstance(data, np.ndarray):
-                        if len(data) == len(cells.cell_i):
-                            data2 = np.delete(data,target_inds_cell)
-
-                        elif len(data) == len(cells.mem_i):
-                            data2 = np.delete(data,target_inds_mem)
-
-                        # elif len(data) == len(cells.nn_i):
-                        #     data2 = np.delete(data,target_inds_gj)
-
-                    elif isinstance(data, list):
-                        data2 = []
-                        if len(data) == len(cells.cell_i):
-                            for index in sorted(target_inds_cell, reverse=True):
-                                del data[index]
-                            data2.append(data[index])
-
-                        elif len(data) == len(cells.mem_i):
-                            for index in sorted(target_inds_mem, reverse=True):
-                                del data[index]
-                            data2.append(data[index])
-
-                    super_data2.append(data2)
-
-                if type(super_data) == np.ndarray:
-                    super_data2 = np.asarray(super_data2)
-
-                setattr(sim, name, super_data2)
+            data = getattr(sim, name)
 
+            if name in special_names: # if this is a nested data structure...
+                data2 = _cut_nested_data(data, is_cell_kept, is_mem_kept)
             else:
-                data = getattr(sim, name)
-
-                if isinstance(data, np.ndarray):
-                    if len(data) == len(cells.cell_i):
-                        data2 = np.delete(data, target_inds_cell)
-                        setattr(sim, name, data2)
-
-                    elif len(data) == len(cells.mem_i):
-                        data2 = np.delete(data, target_inds_mem)
-                        setattr(sim, name, data2)
+                data2 = _cut_data(data, is_cell_kept, is_mem_kept)
 
-                elif isinstance(data, list):
-                    index = None
-                    data2 = []
-
-                    if len(data) == len(cells.cell_i):
-                        for index in sorted(target_inds_cell, reverse=True):
-                            del data[index]
-                        data2.append(data[index])
-                        setattr(sim, name, data2)
-
-                    elif len(data) == len(cells.mem_i):
-                        for index in sorted(target_inds_mem, reverse=True):
-                            del data[index]
-                        data2.append(data[index])
-                        setattr(sim, name, data2)
+            if data2 is not data:
+                setattr(sim, name, data2)
 
         if p.Ca_dyn and sim.endo_retic is not None:
             sim.endo_retic.remove_ers(sim, target_inds_cell)
 
         #------------------------------ Fix-up cell world ---------------------
-        new_cell_centres = []
-        new_ecm_verts = []
-        removal_flags = np.zeros(len(cells.cell_i))
-        removal_flags[target_inds_cell] = 1
-
-        for i, flag in enumerate(removal_flags):
-            if flag == 0:
-                new_cell_centres.append(cells.cell_centres[i])
-                new_ecm_verts.append(cells.ecm_verts[i])
-
-        cells.cell_centres = np.asarray(new_cell_centres)
-        cells.ecm_verts = np.asarray(new_ecm_verts, dtype=object)
+        cells.cell_centres = cells.cell_centres[is_cell_kept]
+        cells.ecm_verts = np.asarray(
+            [cells.ecm_verts[i] for i in np.flatnonzero(is_cell_kept)],
+            dtype=object)
 
         # recalculate ecm_verts_unique:
-        ecm_verts_flat,_,_ = tb.flatten(cells.ecm_verts)
+        ecm_verts_flat = np.concatenate(list(cells.ecm_verts))
         ecm_verts_set = set()
 
         for vert in ecm_verts_flat:
@@ -1330,3 +1367,102 @@ class TissueHandler(object):
         )
 
         sim.P_cells = sim.P_mod + sim.P_base
+
+# ....................{ PRIVATE ~ cutters                 }....................
+def _cut_data(
+    data: object, is_cell_kept: np.ndarray, is_mem_kept: np.ndarray) -> object:
+    '''
+    Compact the passed data in the wake of a cutting event by retaining only
+    the entries for all retained cells if this data is an array or list
+    defined on cells, *or* only the entries for all retained cell membranes if
+    this data is an array or list defined on cell membranes, *or* return this
+    data as is otherwise.
+
+    Parameters
+    ----------
+    data : object
+        Arbitrary simulation data to be compacted.
+    is_cell_kept : np.ndarray
+        One-dimensional boolean Numpy array flagging each retained cell.
+    is_mem_kept : np.ndarray
+        One-dimensional boolean Numpy array flagging each retained cell
+        membrane.
+
+    Returns
+    ----------
+    object
+        Either this compacted data if this data is defined on cells or cell
+        membranes *or* this data as is otherwise.
+    '''
+
+    # If this data is neither an array nor list, return this data as is.
+    if isinstance(data, np.ndarray):
+        if data.ndim == 0:
+            return data
+    elif not isinstance(data, list):
+        return data
+
+    # Boolean array flagging each retained entry of this data if this data is
+    # defined on cells or cell membranes *OR* "None" otherwise.
+    if len(data) == len(is_cell_kept):
+        is_kept = is_cell_kept
+    elif len(data) == len(is_mem_kept):
+        is_kept = is_mem_kept
+    else:
+        return data
+
+    # Compact this array by boolean indexing *OR* this list by filtering.
+    if isinstance(data, np.ndarray):
+        return data[is_kept]
+    else:
+        return [item for item, is_item_kept in zip(data, is_kept)
+                if is_item_kept]
+
+
+def _cut_nested_data(
+    data: object, is_cell_kept: np.ndarray, is_mem_kept: np.ndarray) -> object:
+    '''
+    Compact the passed nested data (e.g., array of the concentrations of each
+    ion in all cells) in the wake of a cutting event by compacting each item
+    of this data with the :func:`_cut_data` function.
+
+    Parameters
+    ----------
+    data : object
+        Arbitrary nested simulation data to be compacted.
+    is_cell_kept : np.ndarray
+        One-dimensional boolean Numpy array flagging each retained cell.
+    is_mem_kept : np.ndarray
+        One-dimensional boolean Numpy array flagging each retained cell
+        membrane.
+
+    Returns
+    ----------
+    object
+        This compacted nested data.
+    '''
+
+    # If this data is a non-ragged array, compact all rows of this array at
+    # once along its second axis. Unlike boolean indexing (which returns a
+    # Fortran-ordered array here), compression preserves C ordering and hence
+    # the floating point behaviour of all subsequent operations on this array.
+    if (
+        isinstance(data, np.ndarray) and
+        data.dtype != object and
+        data.ndim >= 2
+    ):
+        if data.shape[1] == len(is_cell_kept):
+            return np.compress(is_cell_kept, data, axis=1)
+        elif data.shape[1] == len(is_mem_kept):
+            return np.compress(is_mem_kept, data, axis=1)
+        else:
+            return data
+
+    # Else, compact each item of this data.
+    data2 = [_cut_data(item, is_cell_kept, is_mem_kept) for item in data]
+
+    # Preserve the type of this data.
+    if isinstance(data, np.ndarray):
+        data2 = np.asarray(data2)
+
+    return data2
@@ -31,13 +31,12 @@ Matplotlib-based animation classes.
 # ....................{ IMPORTS                            }....................
 import numpy as np
 from betse.lib.numpy import nparray
-from betse.science.math import mathunit
+from betse.science.math import gridinterp, mathunit
 from betse.science.visual.anim.animafter import (
     AnimCellsAfterSolving, AnimVelocity)
 from betse.science.visual.plot.plotutil import cell_mosaic, cell_mesh
 from betse.util.type.types import type_check, SequenceTypes
 from matplotlib.collections import LineCollection, PolyCollection
-from scipy import interpolate
 
 # ....................{ CLASSES ~ after                    }....................
 #FIXME: This class should probably no longer be used, now that the Gouraud
@@ -501,14 +500,14 @@ class AnimVelocityIntracellular(AnimVelocity):
         #FIXME: Ugh. Duplicate code already performed by the superclass
         #AnimCellsABC._init_current_density() method. We clearly need a
         #general-purpose interpolation utility method. Hawkish doves in a cove!
-        u_gj_x = self._phase.cells.maskECM * interpolate.griddata(
+        u_gj_x = self._phase.cells.maskECM * gridinterp.griddata(
             cell_centres,
             self._phase.sim.u_cells_x_time[time_step],
             cell_grid,
             fill_value=0,
             method=self._phase.p.interp_type,
         )
-        u_gj_y = self._phase.cells.maskECM * interpolate.griddata(
+        u_gj_y = self._phase.cells.maskECM * gridinterp.griddata(
             cell_centres,
             self._phase.sim.u_cells_y_time[time_step],
             cell_grid,
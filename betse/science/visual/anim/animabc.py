@@ -95,7 +95,9 @@ Abstract base classes of all Matplotlib-based animation subclasses.
 #    https://stackoverflow.com/questions/21099121/python-matplotlib-unable-to-call-funcanimation-from-inside-a-function
 
 # ....................{ IMPORTS                           }....................
-from betse.exceptions import BetseSimConfException
+import os, tempfile
+import numpy as np
+from betse.exceptions import BetseSimConfException, BetseSimVisualException
 from betse.lib.matplotlib.matplotlibs import mpl_config
 from betse.lib.matplotlib.writer import mplvideo
 from betse.lib.matplotlib.writer.mplcls import (
@@ -107,9 +109,16 @@ from betse.science.visual.layer.vectorfield.lyrvecfldstream import (
     LayerCellsFieldStream)
 from betse.science.visual.visabc import VisualCellsABC
 from betse.util.io.log import logs
+from betse.util.os.process import prcfork
 from betse.util.path import dirs, pathnames
 from betse.util.type.iterable import itertest
-from betse.util.type.types import type_check, BoolOrNoneTypes, IntOrNoneTypes
+from betse.util.type.types import (
+    type_check,
+    BoolOrNoneTypes,
+    IntOrNoneTypes,
+    SequenceTypes,
+    StrOrNoneTypes,
+)
 from matplotlib import pyplot
 from matplotlib.animation import FuncAnimation
 
@@ -526,6 +535,15 @@ class AnimCellsABC(VisualCellsABC):
         # Prepare for plotting immediately *BEFORE* plotting the first frame.
         self._prep_figure(*args, **kwargs)
 
+        # If only saving but not displaying this animation across two or more
+        # processes as requested by the current simulation configuration, do
+        # so and finalize this animation. See the _save_frames_parallel()
+        # method for further details.
+        if self._is_save_frames_parallel():
+            self._save_frames_parallel()
+            self.close()
+            return
+
         #FIXME: For efficiency, we should probably be passing "blit=True," to
         #FuncAnimation(). Unfortunately, doing so will necessitate
         #restructuring animations to conform to blitting-specific requirements,
@@ -701,6 +719,236 @@ class AnimCellsABC(VisualCellsABC):
             else:
                 raise
 
+    # ..................{ SAVERS ~ parallel                 }..................
+    def _is_save_frames_parallel(self) -> bool:
+        '''
+        ``True`` only if this animation is to be saved but *not* displayed by
+        rendering its frames across two or more worker processes.
+
+        Specifically, this method returns ``True`` only if:
+
+        * This animation is saved but *not* displayed.
+        * At least one animation writer doing so is enabled.
+        * This animation has two or more frames.
+        * The current simulation configuration requests two or more frame
+          workers.
+        * The current platform safely supports forking processes. See the
+          :func:`betse.util.os.process.prcfork.is_forkable` tester.
+        '''
+
+        # Number of worker processes requested by this configuration.
+        frame_workers = self._phase.p.anim.frame_workers
+
+        # If rendering frames serially, return false immediately.
+        if not (
+            self._is_save and not self._is_show and (
+                self._writer_images is not None or
+                self._writer_video is not None
+            ) and
+            self._time_step_count > 1 and
+            frame_workers > 1
+        ):
+            return False
+
+        # Render frames in parallel only if forking is safe.
+        return prcfork.is_forkable_else_warn(
+            'Animation "{}" frames'.format(self._kind))
+
+
+    def _save_frames_parallel(self) -> None:
+        '''
+        Save all frames of this animation by partitioning these frames into
+        contiguous ranges, each rendered by a separate worker process.
+
+        Each worker is forked from the current process and hence inherits this
+        prepared animation (including the memory-mapped time series plotted by
+        this animation) without pickling. Each worker then plots and saves the
+        frames in its range, numbering each saved image by that frame's index.
+
+        If saving video, each worker also saves its frames as images at the
+        video resolution to a temporary directory. After all workers finish,
+        the current process then encodes these images (in frame order) with
+        the video writer configured by the current simulation configuration.
+
+        Raises
+        ----------
+        BetseSimVisualException
+            If any worker fails to render its frames.
+        '''
+
+        # Number of worker processes, ignoring excess workers.
+        frame_workers = min(
+            self._phase.p.anim.frame_workers, self._time_step_count)
+
+        # Log this parallelization.
+        logs.log_info(
+            'Rendering animation "%s" frames across %d processes...',
+            self._kind, frame_workers)
+
+        # Temporary directory to which workers save video frames if saving
+        # video *OR* "None" otherwise.
+        frames_video_dir = None
+
+        # Template expanding to the absolute path of each video frame to be
+        # saved by workers if saving video *OR* "None" otherwise.
+        frames_video_template = None
+
+        # If saving video, save video frames to a temporary directory. For
+        # lossless reencoding, these frames are saved as PNG images.
+        if self._writer_video is not None:
+            frames_video_dir = tempfile.TemporaryDirectory(prefix='betse-')
+            frames_video_template = pathnames.join(
+                frames_video_dir.name, '{:07d}.png')
+
+        try:
+            # Worker processes, each rendering a contiguous range of frames.
+            # Contiguous ranges allow layers to update rather than recreate
+            # their artists on all frames except the first in each range.
+            workers = [
+                prcfork.get_fork_context().Process(
+                    target=self._save_frames_worker,
+                    args=(time_steps, frames_video_template),
+                )
+                for time_steps in np.array_split(
+                    np.arange(self._time_step_count), frame_workers)
+            ]
+
+            # Start all workers *BEFORE* waiting on any worker, limiting each
+            # to its share of BLAS threads.
+            with prcfork.forking(workers=frame_workers):
+                for worker in workers:
+                    worker.start()
+            for worker in workers:
+                worker.join()
+
+            # If any worker failed, raise an exception.
+            if any(worker.exitcode != 0 for worker in workers):
+                raise BetseSimVisualException(
+                    'Animation "{}" frames not rendered '
+                    '(i.e., worker process failed).'.format(self._kind))
+
+            # If saving video, encode the frames saved above as such.
+            if frames_video_template is not None:
+                self._save_video_frames(frames_video_template)
+        # Remove all temporary video frames regardless of success.
+        finally:
+            if frames_video_dir is not None:
+                frames_video_dir.cleanup()
+
+
+    def _save_frames_worker(
+        self, time_steps: SequenceTypes, frames_video_template: StrOrNoneTypes,
+    ) -> None:
+        '''
+        Plot and save the frames of this animation with the passed indices
+        *and* terminate the current worker process.
+
+        This method is intended to be called *only* in a worker process
+        forked by the :meth:`_save_frames_parallel` method. Since this process
+        inherits the video writer of the parent process (including any pipe to
+        an external video encoder), this method replaces that writer by an
+        image writer saving video frames to the passed template instead.
+
+        Parameters
+        ----------
+        time_steps : SequenceTypes
+            Sequence of the 0-based indices of all frames to be rendered.
+        frames_video_template : StrOrNoneTypes
+            :func:`str.format`-formatted template which, when formatted with
+            the 0-based index of a frame, yields the absolute path of the image
+            file to save that video frame to if saving video *or* ``None``
+            otherwise.
+        '''
+
+        # Attempt to render these frames.
+        try:
+            # If saving video, save video frames as images instead.
+            if frames_video_template is not None:
+                writer_video_dpi = self._writer_video.dpi
+                self._writer_video = ImageMovieWriter()
+                self._writer_video.setup(
+                    fig=self._figure,
+                    outfile=frames_video_template,
+                    dpi=writer_video_dpi,
+                )
+
+            # For each frame to be rendered...
+            for time_step in time_steps:
+                # Number the images saved for this frame by this frame's index.
+                for writer in (self._writer_images, self._writer_video):
+                    if writer is not None:
+                        writer.frame_number = time_step
+
+                # Plot and save this frame.
+                self.plot_frame(int(time_step))
+        # If doing so fails, log this exception and terminate this worker
+        # with failure. Exceptions raised in forked workers are otherwise
+        # silently discarded.
+        except BaseException as exception:
+            logs.log_exception(exception)
+            os._exit(1)
+
+        # Terminate this worker with success *WITHOUT* performing the cleanup
+        # (e.g., atexit handlers, figure destruction) of the parent process.
+        os._exit(0)
+
+
+    @type_check
+    def _save_video_frames(self, frames_video_template: str) -> None:
+        '''
+        Encode the video frames previously saved by all workers forked by the
+        :meth:`_save_frames_parallel` method with the video writer configured
+        by the current simulation configuration.
+
+        Since this writer expects to grab each frame from a figure, each frame
+        is drawn as a figure image filling a bare figure of the same size as
+        the figure of this animation.
+
+        Parameters
+        ----------
+        frames_video_template : str
+            :func:`str.format`-formatted template which, when formatted with
+            the 0-based index of a frame, yields the absolute path of the image
+            file to which that video frame was saved.
+        '''
+
+        # Log this encoding.
+        logs.log_debug('Encoding animation "%s" video...', self._kind)
+
+        # Bare figure of the same size and resolution as each video frame.
+        figure = pyplot.figure(
+            figsize=self._figure.get_size_inches(),
+            dpi=self._writer_video.dpi,
+        )
+
+        # Grab each video frame from this figure rather than that animation.
+        self._writer_video.fig = figure
+
+        # Figure image to be drawn with each video frame.
+        figure_image = None
+
+        try:
+            # For debuggability, temporarily escalate the matplotlib-specific
+            # verbosity level.
+            with mpl_config.reducing_log_level_to_debug_if_info():
+                for time_step in range(self._time_step_count):
+                    # Pixels of this video frame.
+                    frame_pixels = pyplot.imread(
+                        frames_video_template.format(time_step))
+
+                    # Draw these pixels onto this figure.
+                    if figure_image is None:
+                        figure_image = figure.figimage(frame_pixels)
+                    else:
+                        figure_image.set_data(frame_pixels)
+
+                    # Encode this video frame.
+                    self._writer_video.grab_frame(
+                        **self._writer_savefig_kwargs)
+        # Close this figure regardless of success.
+        finally:
+            pyplot.close(figure)
+
     # ..................{ CLOSERS                           }..................
     def close(self) -> None:
         '''
@@ -140,12 +140,9 @@ class AnimCellsWhileSolving(AnimCellsABC):
         #Cells.map_membranes_midpoint_to_cells_centre() method instead.
 
         # Vmem averaged over cell centres.
-        vm_o = np.dot(self._phase.cells.M_sum_mems, self._phase.sim.vm) / (
+        vm_o = self._phase.cells.M_sum_mems.dot(self._phase.sim.vm) / (
             self._phase.cells.num_mems)
 
-        # self._cell_time_series = self.sim.vm_time
-        self._cell_time_series = self._phase.sim.vm_ave_time
-
         # cell_data_current = self.sim.vm
         cell_data_current = vm_o
 
@@ -222,9 +219,11 @@ class AnimCellsWhileSolving(AnimCellsABC):
     # ..................{ PLOTTERS                          }..................
     def _plot_frame_figure(self) -> None:
 
-        # Upscaled cell data for the current time step.
+        # Upscaled cell data for the current time step. Since the simulator
+        # rebinds this time series to a larger view of its preallocated storage
+        # on each sampled time step, this series is *NOT* safely cacheable.
         cell_data = mathunit.upscale_units_milli(
-            self._cell_time_series[self._time_step])
+            self._phase.sim.vm_ave_time[self._time_step])
 
         #FIXME: Duplicated from above. What we probably want to do is define a
         #new _get_cell_data() method returning this array in a centralized
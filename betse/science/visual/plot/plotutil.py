@@ -10,9 +10,9 @@ import matplotlib.cm as cm
 import matplotlib.pyplot as plt
 import numpy as np
 import numpy.ma as ma
+from betse.science.math import gridinterp
 # from betse.util.io.log import logs
 from matplotlib.collections import LineCollection, PolyCollection
-from scipy import interpolate
 
 
 def plotSingleCellVData(sim,celli,p,fig=None,ax=None, lncolor='k'):
@@ -1018,8 +1018,8 @@ def cell_quiver(datax, datay, ax, cells, p):
     """
 
     if len(datax) == len(cells.mem_i):
-        Fx = np.dot(cells.M_sum_mems,datax)/cells.num_mems
-        Fy = np.dot(cells.M_sum_mems,datay)/cells.num_mems
+        Fx = cells.M_sum_mems.dot(datax)/cells.num_mems
+        Fy = cells.M_sum_mems.dot(datay)/cells.num_mems
     else:
         Fx = datax
         Fy = datay
@@ -1098,14 +1098,14 @@ def cell_stream(
         ax.add_collection(coll)
 
     if datax.shape != cells.X.shape: # if the data hasn't been interpolated yet...
-        Fx = interpolate.griddata(
+        Fx = gridinterp.griddata(
             (cells.cell_centres[:,0], cells.cell_centres[:,1]),
             datax,
             (cells.X, cells.Y),
             fill_value=0,
             method=p.interp_type,
         )
-        Fy = interpolate.griddata(
+        Fy = gridinterp.griddata(
             (cells.cell_centres[:,0], cells.cell_centres[:,1]),
             datay,
             (cells.X, cells.Y),
@@ -220,6 +220,80 @@ class BetseWrapper(object):
         if self.verbose is True:
             logs.log_info("Successfully run simulation on BETSE model!")
 
+
+    @beartype
+    def run_sweep(
+        self,
+        grid: dict,
+        run_sim: bool = True,
+        sweep_dirname: Optional[str] = None,
+        processes: Optional[int] = None,
+        threads_per_process: int = 1,
+        verbose: bool = False,
+    ) -> list:
+        '''
+        Runs a parameter sweep, running the init phase and optionally the sim
+        phase for each combination of values in the passed grid of config
+        settings in parallel across multiple processes. All runs share a single
+        cell cluster, seeded only if not already saved.
+
+        Parameters
+        --------------
+        grid : dict
+            Dictionary mapping from the "/"-delimited path of each swept config
+            setting (e.g., 'internal parameters/alpha_NaK') to the sequence of
+            all values to be swept over for that setting.
+        run_sim : bool
+            Whether to run a sim phase after each init phase (True) or not
+            (False).
+        sweep_dirname : Optional[str]
+            Path to the directory to save the results of each run to, each in
+            its own subdirectory. Defaults to the "SWEEP" subdirectory of the
+            directory containing the config file.
+        processes : Optional[int]
+            Maximum number of runs to perform at once. Defaults to the number
+            of processors divided by threads_per_process.
+        threads_per_process : int
+            Maximum number of BLAS threads used by each run.
+        verbose: bool
+            Spit out comments (True) or stay silent (False).
+
+        Returns
+        --------------
+        list
+            List of dictionaries summarizing each run, including the swept
+            settings and final average Vmem and ion concentrations of that
+            run. This summary is also saved as a CSV file to the sweep
+            directory.
+        '''
+
+        # Defer heavyweight imports.
+        from betse.science.simsweep import SimSweeper
+
+        # Make an instance of the BETSE 'parameters' object based on
+        # settings in the configuration file supplied:
+
+        self.p = p.make(self._config_filename)
+
+        self.verbose = verbose  # save verbosity setting
+
+        self._set_logging(verbose=verbose)
+
+        sim_sweeper = SimSweeper(
+            conf_filename=self._config_filename,
+            grid=grid,
+            sweep_dirname=sweep_dirname,
+            processes=processes,
+            threads_per_process=threads_per_process,
+        )
+
+        runs_summary = sim_sweeper.run(is_sim=run_sim)
+
+        if self.verbose is True:
+            logs.log_info("Successfully run parameter sweep on BETSE model!")
+
+        return runs_summary
+
     # ..................{ LOADERS                            }..................
     #FIXME: Docstring us up, please. Flying churros at midnight!
     @beartype
@@ -79,6 +79,11 @@ class AppMetaABC(object, metaclass=ABCMeta):
         ``True`` only if the :meth:`init_libs` method has already been called,
         enabling the optimal :meth:`init_libs_if_needed` method to silently
         reduce to a noop when ``True``.
+    _libs_kwargs_deferred : MappingOrNoneTypes
+        Dictionary of all keyword arguments to be passed to the
+        :meth:`init_libs` method by the next call to the
+        :meth:`init_libs_if_needed` method if the :meth:`defer_libs` method
+        has been called *or* ``None`` otherwise.
     '''
 
     # ..................{ INITIALIZERS                       }..................
@@ -131,6 +136,7 @@ class AppMetaABC(object, metaclass=ABCMeta):
         #
         # Note the init_libs() method to *NOT* have been called yet.
         self._is_libs_initted = False
+        self._libs_kwargs_deferred = None
 
         # Globalize this singleton *BEFORE* subsequent logic (e.g., the
         # logconf.init() call performed by the self.init() call), any of
@@ -275,6 +281,10 @@ class AppMetaABC(object, metaclass=ABCMeta):
         initialized (i.e., if the :meth:`init_libs` method has yet to be
         called) *or* silently reduce to a noop otherwise.
 
+        If the :meth:`defer_libs` method was previously called, the keyword
+        arguments passed to that method are also passed to the
+        :meth:`init_libs` method, overridden by any passed keyword arguments.
+
         Parameters
         ----------
         All passed parameters are passed as is to the :meth:`init_libs` method.
@@ -290,8 +300,58 @@ class AppMetaABC(object, metaclass=ABCMeta):
                 'Ignoring request to reload third-party dependencies...')
         # Else, the init_libs() method has yet to be called. So, do so.
         else:
+            if self._libs_kwargs_deferred is not None:
+                kwargs = {**self._libs_kwargs_deferred, **kwargs}
             self.init_libs(*args, **kwargs)
 
+
+    def init_libs_if_undeferred(self) -> None:
+        '''
+        Initialize all mandatory third-party dependencies of the current
+        application with sane defaults if these dependencies have yet to be
+        initialized *and* the :meth:`defer_libs` method has yet to be called
+        *or* silently reduce to a noop otherwise.
+
+        This method is intended to be called on importing subpackages
+        requiring these dependencies (e.g., :mod:`betse.science`), preserving
+        the contractual guarantee that importing these subpackages suffices to
+        initialize these dependencies *unless* the caller explicitly deferred
+        doing so.
+        '''
+
+        if self._libs_kwargs_deferred is None:
+            self.init_libs_if_needed()
+
+
+    def defer_libs(self, **kwargs) -> None:
+        '''
+        Defer initializing all mandatory third-party dependencies of the
+        current application until the next call to the
+        :meth:`init_libs_if_needed` method.
+
+        Since initializing these dependencies (especially matplotlib, whose
+        backends are probed for usability) consumes non-trivial time,
+        callers that may *not* require these dependencies (e.g., command-line
+        subcommands neither simulating nor plotting) should call this rather
+        than the :meth:`init_libs` method. Code requiring these dependencies
+        is then responsible for calling the :meth:`init_libs_if_needed`
+        method beforehand.
+
+        Parameters
+        ----------
+        All passed keyword arguments are passed as is to the :meth:`init_libs`
+        method by the next call to the :meth:`init_libs_if_needed` method.
+        '''
+
+        # Avoid circular import dependencies.
+        from betse.util.io.log import logs
+
+        # Log this deferral.
+        logs.log_debug('Deferring loading third-party dependencies...')
+
+        # Record these arguments for subsequent use.
+        self._libs_kwargs_deferred = kwargs
+
     # ..................{ DEINITIALIZERS                     }..................
     def deinit(self) -> None:
         '''
@@ -166,9 +166,9 @@ class CLIABC(object, metaclass=ABCMeta):
             # logging of exceptions raised by this parsing.
             self._parse_args()
 
-            # (Re-)initialize all mandatory runtime dependencies of this
-            # application *AFTER* parsing and handling all logging-specific CLI
-            # options and thus finalizing the logging configuration for the
+            # Defer (re-)initializing all mandatory runtime dependencies of
+            # this application *AFTER* parsing and handling all logging-specific
+            # CLI options and thus finalizing the logging configuration for the
             # active Python process.
             self._init_app_libs()
 
@@ -646,9 +646,17 @@ class CLIABC(object, metaclass=ABCMeta):
 
         Design
         ----------
-        Defaults to (re-)initializing all mandatory runtime dependencies of
-        BETSE. Subclasses overriding this method to perform additional
-        initialization must manually call the
+        Defaults to deferring the initialization of all mandatory runtime
+        dependencies of BETSE until first required. Since initializing these
+        dependencies (especially matplotlib) consumes non-trivial time, only
+        subcommands requiring these dependencies (e.g., simulating or plotting)
+        initialize these dependencies by calling the
+        :meth:`betse.util.app.meta.appmetaabc.AppMetaABC.init_libs_if_needed`
+        method, which then enables the matplotlib backend selected here.
+        All other subcommands (e.g., ``info``, ``config``) avoid this cost.
+
+        Subclasses overriding this method to perform additional
+        initialization must manually call either that method *or* the
         :meth:`betse.util.app.meta.appmetaabc.AppMetaABC.init_libs` method to
         initialize these dependencies.
         '''
@@ -669,8 +677,9 @@ class CLIABC(object, metaclass=ABCMeta):
             self._matplotlib_backend_name_forced
         )
 
-        # (Re-)initialize all mandatory runtime dependencies.
-        app_meta.init_libs(matplotlib_backend_name=matplotlib_backend_name)
+        # Defer initializing all mandatory runtime dependencies until first
+        # required, enabling this backend on doing so.
+        app_meta.defer_libs(matplotlib_backend_name=matplotlib_backend_name)
 
     # ..................{ LOGGERS                           }..................
     def _log_header(self) -> None:
@@ -0,0 +1,253 @@
+#!/usr/bin/env python3
+# --------------------( LICENSE                           )--------------------
+# Copyright 2014-2023 by Alexis Pietak & Cecil Curry.
+# See "LICENSE" for further details.
+
+'''
+Low-level **process forking** (i.e., running tasks in worker processes forked
+from the active Python process, inheriting rather than pickling the objects
+these tasks require) facilities.
+'''
+
+# ....................{ IMPORTS                           }....................
+import multiprocessing, os
+from betse.exceptions import BetseProcessException
+from betse.util.io.log import logs
+from betse.util.os.brand import macos
+from betse.util.os.shell import shellenv
+from betse.util.type.types import type_check, GeneratorType
+from contextlib import contextmanager
+
+# ....................{ CONSTANTS                         }....................
+BLAS_THREADS_VAR_NAMES = (
+    'OMP_NUM_THREADS',
+    'OPENBLAS_NUM_THREADS',
+    'MKL_NUM_THREADS',
+    'VECLIB_MAXIMUM_THREADS',
+    'NUMEXPR_NUM_THREADS',
+)
+'''
+Names of all environment variables limiting the number of threads spawned by
+the BLAS and LAPACK implementations commonly underlying Numpy and SciPy.
+'''
+
+# ....................{ TESTERS                           }....................
+def is_forkable() -> bool:
+    '''
+    ``True`` only if the current platform both supports and safely permits
+    forking worker processes from the active Python process.
+
+    Specifically, this tester returns ``True`` only if:
+
+    * The current platform supports the ``fork`` start method (i.e., is
+      POSIX-compatible).
+    * The current platform is *not* macOS. Forking processes that have already
+      loaded macOS system frameworks (e.g., the Accelerate framework
+      underlying Numpy, the Cocoa frameworks underlying matplotlib) is unsafe
+      and commonly crashes or deadlocks those processes, which is why Python
+      itself defaults to spawning rather than forking under macOS.
+    '''
+
+    return (
+        'fork' in multiprocessing.get_all_start_methods() and
+        not macos.is_macos()
+    )
+
+
+@type_check
+def is_forkable_else_warn(task_desc: str) -> bool:
+    '''
+    ``True`` only if the current platform both supports and safely permits
+    forking worker processes from the active Python process *or* ``False``
+    after logging a warning that the task with the passed description is to be
+    run serially instead.
+
+    Parameters
+    ----------
+    task_desc : str
+        Human-readable description of the task to be run by these workers,
+        capitalized and suitable for embedding in this warning (e.g.,
+        ``Exports``).
+
+    See Also
+    ----------
+    :func:`is_forkable`
+        Further details.
+    '''
+
+    # If forking is safe, return true immediately.
+    if is_forkable():
+        return True
+
+    # Else, log a warning and return false.
+    logs.log_warning(
+        '%s run serially '
+        '(i.e., process forking unsupported or unsafe on this platform).',
+        task_desc)
+    return False
+
+# ....................{ GETTERS                           }....................
+def get_fork_context() -> multiprocessing.context.BaseContext:
+    '''
+    Multiprocessing context forking rather than spawning worker processes.
+
+    Callers should call this getter *only* if the :func:`is_forkable` tester
+    returns ``True`` and *only* within the :func:`forking` context.
+    '''
+
+    return multiprocessing.get_context('fork')
+
+
+@type_check
+def get_forked_global(name: str) -> object:
+    '''
+    Object with the passed name exposed to worker processes forked within the
+    current :func:`forking` context.
+
+    This getter is intended to be called *only* from those workers.
+
+    Parameters
+    ----------
+    name : str
+        Name of the keyword argument passed to that context.
+
+    Raises
+    ----------
+    BetseProcessException
+        If no such context is active.
+    '''
+
+    # If no such context is active, raise an exception.
+    if _globals_forked is None:
+        raise BetseProcessException(
+            'Forked global "{}" undefined '
+            '(i.e., not called from a forked worker process).'.format(name))
+
+    # Else, return this object.
+    return _globals_forked[name]
+
+
+@type_check
+def get_threads_per_worker(workers: int) -> int:
+    '''
+    Maximum number of threads to be spawned by the BLAS and LAPACK
+    implementations of each of the passed number of worker processes, evenly
+    partitioning all available processors between these workers.
+
+    Parameters
+    ----------
+    workers : int
+        Number of worker processes running concurrently.
+    '''
+
+    return max(1, (os.cpu_count() or 1) // max(1, workers))
+
+# ....................{ CONTEXTS                          }....................
+@contextmanager
+@type_check
+def forking(workers: int, **globals_forked) -> GeneratorType:
+    '''
+    Context manager preparing the active Python process to fork the passed
+    number of worker processes within this context.
+
+    Specifically, for the duration of this context, this context manager:
+
+    * Exposes each passed keyword argument to these workers as a global
+      retrievable by the :func:`get_forked_global` getter. Workers inherit
+      these objects on forking, avoiding the need to pickle these objects
+      (e.g., simulation phases, which are typically unpicklable or costly to
+      pickle) for each worker.
+    * Limits the BLAS and LAPACK implementations of these workers to their
+      share of all available processors, preventing these workers from
+      oversubscribing these processors with threads. See the
+      :func:`limiting_blas_threads` context manager for further details.
+
+    Parameters
+    ----------
+    workers : int
+        Number of worker processes to be forked within this context.
+
+    All remaining keyword arguments are exposed to these workers as is.
+    '''
+
+    # Globals inherited by the worker processes forked within this context.
+    global _globals_forked
+
+    # Expose these objects to these workers *BEFORE* forking.
+    _globals_forked = globals_forked
+
+    # Limit these workers to this number of BLAS threads *BEFORE* forking.
+    try:
+        with limiting_blas_threads(get_threads_per_worker(workers)):
+            yield
+    # Release these objects regardless of success.
+    finally:
+        _globals_forked = None
+
+
+@contextmanager
+@type_check
+def limiting_blas_threads(threads: int) -> GeneratorType:
+    '''
+    Context manager limiting the number of threads spawned by the BLAS and
+    LAPACK implementations of all processes spawned or forked by the active
+    Python process for the duration of this context.
+
+    Since these implementations read these limits from the environment only
+    when first loaded, these environment limits apply only to processes
+    *spawned* (rather than forked) within this context and to processes
+    forked within this context that load these implementations only after
+    forking. If the optional :mod:`threadpoolctl` dependency is importable,
+    the implementations already loaded by the active Python process are also
+    limited for the duration of this context and hence by inheritance in all
+    processes forked within this context; else, a debug message is logged.
+
+    Parameters
+    ----------
+    threads : int
+        Maximum number of threads per spawned or forked process.
+    '''
+
+    # Avoid circular import dependencies.
+    from betse.lib import libs
+
+    # Dictionary mapping from the name to prior value of each such variable.
+    var_name_to_value_old = {
+        var_name: shellenv.get_var_or_none(var_name)
+        for var_name in BLAS_THREADS_VAR_NAMES
+    }
+
+    try:
+        for var_name in BLAS_THREADS_VAR_NAMES:
+            shellenv.set_var(var_name, str(threads))
+
+        # If "threadpoolctl" is available, also limit the implementations
+        # already loaded by the active Python process.
+        if libs.is_runtime_optional('threadpoolctl'):
+            # Defer heavyweight imports.
+            from threadpoolctl import threadpool_limits
+
+            with threadpool_limits(limits=threads):
+                yield
+        # Else, only processes loading these implementations after forking
+        # are limited.
+        else:
+            logs.log_debug(
+                'BLAS threads of forked processes unlimited '
+                '(i.e., "threadpoolctl" not found).')
+            yield
+    # Restore these variables to their prior values.
+    finally:
+        for var_name, value_old in var_name_to_value_old.items():
+            if value_old is None:
+                shellenv.unset_var_if_set(var_name)
+            else:
+                shellenv.set_var(var_name, value_old)
+
+# ....................{ PRIVATE ~ globals                 }....................
+_globals_forked = None
+'''
+Dictionary mapping from the name to value of each object exposed to worker
+processes forked within the current :func:`forking` context *or* ``None`` if
+no such context is active.
+'''
@@ -25,7 +25,6 @@ from betse.util.type.types import (
     NumericSimpleTypes,
     SequenceTypes,
 )
-from distutils import dir_util
 from os import path as os_path
 
 # ....................{ ENUMERATIONS                       }....................
@@ -689,6 +688,11 @@ def copy_dir(
                 'dirs.copy() parameter "ignore_basename_globs" '
                 'ignored when parameter "is_overwritable" enabled.')
 
+        # Defer heavyweight imports. Importing "distutils" indirectly imports
+        # most of "setuptools", which this module is otherwise imported too
+        # early at application startup to afford.
+        from distutils import dir_util
+
         # Recursively copy this source to target directory, preserving symbolic
         # links as is. To silently overwrite all conflicting target paths, the
         # dir_util.copy_tree() rather than shutil.copytree() function is
@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+# --------------------( LICENSE                           )--------------------
+# Copyright 2014-2023 by Alexis Pietak & Cecil Curry.
+# See "LICENSE" for further details.
+
+'''
+Low-level **expression evaluation** (i.e., dynamic evaluation of Python
+expressions embedded in strings) facilities.
+'''
+
+# ....................{ IMPORTS                           }....................
+from functools import lru_cache
+from types import CodeType
+
+# ....................{ COMPILERS                         }....................
+@lru_cache(maxsize=None)
+def compile_expr(expr: str) -> CodeType:
+    '''
+    Code object compiled from the passed Python expression, cached on the first
+    call to this function passed this expression.
+
+    Since each unique expression is parsed and compiled exactly once for the
+    lifetime of the active Python process, evaluating the code object returned
+    by this function is substantially faster than repeatedly evaluating the
+    same expression as a raw string (e.g., ``eval(expr, ...)``), which
+    reparses and recompiles that string on each evaluation.
+
+    Since this cache is keyed on the contents of this expression rather than
+    on the object owning this expression, this cache is trivially robust
+    against expressions being redefined at runtime (e.g., on rebuilding a
+    network) *and* requires no changes to the pickling of those objects.
+
+    Parameters
+    ----------
+    expr : str
+        Python expression to be compiled.
+
+    Returns
+    ----------
+    CodeType
+        Code object compiled in ``eval`` mode from this expression.
+    '''
+
+    return compile(expr, '<expr>', 'eval')
+
+# ....................{ EVALUATORS                        }....................
+def eval_expr(expr: str, globals_dict: dict, locals_dict: dict) -> object:
+    '''
+    Evaluate the passed Python expression in the passed global and local
+    namespaces, compiling this expression on the first evaluation of this
+    expression and reusing that compilation on all subsequent evaluations.
+
+    This function is a drop-in replacement for the builtin :func:`eval`
+    function for expressions evaluated repeatedly (e.g., on each time step of
+    a simulation).
+
+    Parameters
+    ----------
+    expr : str
+        Python expression to be evaluated.
+    globals_dict : dict
+        Dictionary mapping from the names to values of all global variables
+        accessible to this expression.
+    locals_dict : dict
+        Dictionary mapping from the names to values of all local variables
+        accessible to this expression.
+
+    Returns
+    ----------
+    object
+        Value to which this expression evaluates.
+
+    See Also
+    ----------
+    :func:`compile_expr`
+        Further details.
+    '''
+
+    return eval(compile_expr(expr), globals_dict, locals_dict)
@@ -0,0 +1,268 @@
+#!/usr/bin/env python3
+# --------------------( LICENSE                           )--------------------
+# Copyright 2014-2023 by Alexis Pietak & Cecil Curry.
+# See "LICENSE" for further details.
+
+'''
+Low-level **section timing** (i.e., accumulating the wall-clock time and number
+of calls of named sections of code repeatedly executed in a loop) facilities.
+'''
+
+# ....................{ IMPORTS                           }....................
+import json
+from betse.util.io.log import logs
+from betse.util.type.types import type_check, NumericOrNoneTypes
+from contextlib import nullcontext
+from time import perf_counter
+
+# ....................{ CLASSES                           }....................
+class SectionTimer(object):
+    '''
+    **Section timer** (i.e., object accumulating the wall-clock time and
+    number of calls of each named section of code executed within a context
+    returned by calling this object).
+
+    Each section is timed by calling this object with the name of that section
+    in a ``with`` statement (e.g., ``with timer('pumps'): ...``). If this timer
+    is disabled, each such call instead returns a shared context manager
+    reducing to a noop, minimizing the overhead of instrumenting code that is
+    only occasionally timed.
+
+    Attributes
+    ----------
+    is_enabled : bool
+        ``True`` only if this timer is timing sections.
+    _sections : dict
+        Dictionary mapping from the name of each section timed by this object
+        (in first-timed order) to the :class:`_SectionTimed` instance timing
+        that section.
+    '''
+
+    # ..................{ INITIALIZERS                      }..................
+    @type_check
+    def __init__(self, is_enabled: bool = True) -> None:
+        '''
+        Initialize this section timer.
+
+        Parameters
+        ----------
+        is_enabled : bool
+            ``True`` only if this timer is to time sections. Defaults to
+            ``True``.
+        '''
+
+        # Classify all passed parameters.
+        self.is_enabled = is_enabled
+
+        # Initialize all remaining instance variables.
+        self._sections = {}
+
+    # ..................{ CALLERS                           }..................
+    def __call__(self, name: str) -> object:
+        '''
+        Context manager timing the section of code with the passed name
+        executed within this context if this timer is enabled *or* a context
+        manager reducing to a noop otherwise.
+
+        Parameters
+        ----------
+        name : str
+            Human-readable name of this section (e.g., ``pumps``).
+
+        Returns
+        ----------
+        object
+            Context manager timing this section.
+        '''
+
+        # If this timer is disabled, return a noop context manager.
+        if not self.is_enabled:
+            return _SECTION_NOOP
+
+        # Context manager timing this section, created on the first timing.
+        section = self._sections.get(name)
+        if section is None:
+            section = self._sections[name] = _SectionTimed()
+
+        # Return this context manager.
+        return section
+
+    # ..................{ GETTERS                           }..................
+    @type_check
+    def get_summary(self, total_seconds: NumericOrNoneTypes = None) -> dict:
+        '''
+        Dictionary summarizing all sections timed by this object.
+
+        Parameters
+        ----------
+        total_seconds : NumericOrNoneTypes
+            Total wall-clock time in seconds of the code containing all timed
+            sections (e.g., an entire loop). Defaults to ``None``. If
+            non-``None``, the difference between this time and the total time
+            of all timed sections is summarized as the pseudo-section
+            ``other``.
+
+        Returns
+        ----------
+        dict
+            Dictionary mapping from the name of each timed section (in
+            first-timed order) to a dictionary mapping from:
+
+            * ``calls`` to the number of times this section was executed.
+            * ``seconds`` to the total wall-clock time in seconds of all such
+              executions.
+        '''
+
+        # Summary of all timed sections.
+        summary = {
+            name: {'calls': section.calls, 'seconds': section.seconds}
+            for name, section in self._sections.items()
+        }
+
+        # If a total time was passed, summarize all untimed code.
+        if total_seconds is not None:
+            summary['other'] = {
+                'calls': 0,
+                'seconds': max(0.0, total_seconds - sum(
+                    section.seconds for section in self._sections.values())),
+            }
+
+        # Return this summary.
+        return summary
+
+
+    @type_check
+    def get_table(self, total_seconds: NumericOrNoneTypes = None) -> str:
+        '''
+        Human-readable plaintext table summarizing all sections timed by this
+        object, sorted in descending order of total time.
+
+        Parameters
+        ----------
+        total_seconds : NumericOrNoneTypes
+            Total wall-clock time in seconds of the code containing all timed
+            sections. Defaults to ``None``. See :meth:`get_summary`.
+
+        Returns
+        ----------
+        str
+            Table whose rows are timed sections and whose columns are the name,
+            number of calls, total time, mean time per call, and percentage of
+            the total time of each section.
+        '''
+
+        # Summary of all timed sections.
+        summary = self.get_summary(total_seconds=total_seconds)
+
+        # Total time of all rows, preventing division by zero below.
+        seconds_total = sum(
+            section['seconds'] for section in summary.values()) or 1.0
+
+        # List of all table rows, starting with this table header.
+        rows = ['{:<20} {:>10} {:>12} {:>12} {:>7}'.format(
+            'section', 'calls', 'total (s)', 'mean (ms)', '%')]
+
+        # For each timed section in descending order of total time...
+        for name, section in sorted(
+            summary.items(), key=lambda item: -item[1]['seconds']):
+            calls = section['calls']
+            seconds = section['seconds']
+            rows.append('{:<20} {:>10} {:>12.3f} {:>12} {:>7.1f}'.format(
+                name,
+                calls,
+                seconds,
+                '{:.4f}'.format(1000*seconds/calls) if calls else '-',
+                100*seconds/seconds_total,
+            ))
+
+        # Return these rows as a newline-delimited string.
+        return '\n'.join(rows)
+
+    # ..................{ LOGGERS                           }..................
+    @type_check
+    def log_table(
+        self, title: str, total_seconds: NumericOrNoneTypes = None) -> None:
+        '''
+        Log an informational table summarizing all sections timed by this
+        object if this timer is enabled *or* reduce to a noop otherwise.
+
+        Parameters
+        ----------
+        title : str
+            Human-readable line preceding this table.
+        total_seconds : NumericOrNoneTypes
+            Total wall-clock time in seconds of the code containing all timed
+            sections. Defaults to ``None``. See :meth:`get_summary`.
+        '''
+
+        if self.is_enabled:
+            logs.log_info(
+                '%s\n%s', title, self.get_table(total_seconds=total_seconds))
+
+    # ..................{ SAVERS                            }..................
+    @type_check
+    def save_json(
+        self, filename: str, total_seconds: NumericOrNoneTypes = None) -> None:
+        '''
+        Save a JSON-formatted summary of all sections timed by this object to
+        the file with the passed filename, silently overwriting this file if
+        this file already exists.
+
+        Parameters
+        ----------
+        filename : str
+            Absolute or relative filename of the JSON file to be written.
+        total_seconds : NumericOrNoneTypes
+            Total wall-clock time in seconds of the code containing all timed
+            sections. Defaults to ``None``. See :meth:`get_summary`.
+        '''
+
+        # Log this save.
+        logs.log_debug('Saving section timings: %s', filename)
+
+        # Save this summary.
+        with open(filename, 'w') as json_file:
+            json.dump(
+                self.get_summary(total_seconds=total_seconds),
+                json_file,
+                indent=2,
+            )
+
+# ....................{ PRIVATE ~ classes                 }....................
+class _SectionTimed(object):
+    '''
+    Context manager accumulating the wall-clock time and number of calls of
+    the section of code executed within this context.
+
+    Attributes
+    ----------
+    calls : int
+        Number of times this context has been entered and exited.
+    seconds : float
+        Total wall-clock time in seconds spent in this context.
+    _time_start : float
+        Timestamp in fractional seconds at which this context was most
+        recently entered.
+    '''
+
+    __slots__ = ('calls', 'seconds', '_time_start')
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.seconds = 0.0
+        self._time_start = 0.0
+
+
+    def __enter__(self) -> None:
+        self._time_start = perf_counter()
+
+
+    def __exit__(self, *args) -> None:
+        self.seconds += perf_counter() - self._time_start
+        self.calls += 1
+
+# ....................{ PRIVATE ~ globals                 }....................
+_SECTION_NOOP = nullcontext()
+'''
+Context manager reducing to a noop, returned by all disabled section timers.
+'''
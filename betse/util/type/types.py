@@ -677,16 +677,6 @@ subclass :class:`collections.abc.Sequence` despite implementing the entirety of
 that that API.
 '''
 
-# ....................{ TUPLES : lib ~ matplotlib         }....................
-MatplotlibFigureType = None
-'''
-Type of :mod:`matplotlib` figures if :mod:`matplotlib` is importable *or*
-``None`` otherwise.
-
-This class is a synonym of the :class:`matplotlib.figure.Figure` class,
-permitting callers to avoid importing that class.
-'''
-
 # ....................{ TUPLES : lib ~ numpy              }....................
 NumpyArrayType = None
 '''
@@ -728,13 +718,6 @@ to avoid importing that class.
 # guaranteed to raise human-readable exceptions on missing mandatory
 # dependencies, their absence here is ignorable.
 
-# If matplotlib is importable, conditionally define matplotlib-specific types.
-try:
-    from matplotlib.figure import Figure
-    MatplotlibFigureType = Figure
-except:
-    pass
-
 # If NumPy is importable, conditionally define NumPy-specific types.
 try:
     import numpy
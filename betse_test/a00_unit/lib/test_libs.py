@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+# --------------------( LICENSE                           )--------------------
+# Copyright 2014-2023 by Alexis Pietak & Cecil Curry.
+# See "LICENSE" for further details.
+
+'''
+Unit tests for the :mod:`betse.lib.libs` submodule.
+'''
+
+# ....................{ IMPORTS                           }....................
+
+# ....................{ TESTS                             }....................
+def test_libs_runtime_mandatory_cache(
+    monkeypatch: 'MonkeyPatch', betse_temp_dir: 'LocalPath') -> None:
+    '''
+    Unit test caching the validation performed by the
+    :func:`betse.lib.libs.die_unless_runtime_mandatory_all` function.
+
+    Parameters
+    ----------
+    monkeypatch : MonkeyPatch
+        Builtin fixture object permitting object attributes to be safely
+        modified for the duration of this test.
+    betse_temp_dir : LocalPath
+        Object encapsulating a temporary directory isolated to the current
+        test.
+    '''
+
+    # Defer heavyweight imports.
+    from betse.lib import libs
+    from betse.util.app.meta import appmetaone
+
+    # Requirements dictionaries validated by the mocked validator below.
+    requirements_validated = []
+
+    # Cache isolated to this test.
+    cache_filename = str(betse_temp_dir.join('libs_validated.txt'))
+    monkeypatch.setattr(
+        libs, '_get_requirements_cache_filename', lambda: cache_filename)
+    monkeypatch.setattr(
+        libs, 'die_unless_requirements_dict', requirements_validated.append)
+
+    # Validate all mandatory runtime dependencies twice, asserting only the
+    # first such validation to have been performed.
+    libs.die_unless_runtime_mandatory_all()
+    libs.die_unless_runtime_mandatory_all()
+    assert len(requirements_validated) == 1
+
+    # Assert changing these dependencies to invalidate this cache.
+    metadeps = appmetaone.get_app_meta().module_metadeps
+    requirements = dict(metadeps.RUNTIME_MANDATORY)
+    requirements['BetseTestDependency'] = '>= 1.0'
+    monkeypatch.setattr(metadeps, 'RUNTIME_MANDATORY', requirements)
+    libs.die_unless_runtime_mandatory_all()
+    assert requirements_validated[-1] is requirements
+
+    # Assert an unwritable cache to be silently ignored.
+    cache_filename = str(betse_temp_dir.join('nonexistent', 'cache.txt'))
+    requirements['BetseTestDependency'] = '>= 2.0'
+    libs.die_unless_runtime_mandatory_all()
+    libs.die_unless_runtime_mandatory_all()
+    assert len(requirements_validated) == 4
@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+# --------------------( LICENSE                           )--------------------
+# Copyright 2014-2023 by Alexis Pietak & Cecil Curry.
+# See "LICENSE" for further details.
+
+'''
+Unit tests for the :mod:`betse.science.math.cache.cachetimes` submodule.
+'''
+
+# ....................{ IMPORTS                           }....................
+import pytest
+from betse_test._fixture.simconf.simconfclser import SimConfTestInternal
+
+# ....................{ TESTS                             }....................
+@pytest.mark.parametrize('is_ecm', (False, True))
+@pytest.mark.parametrize('series_type', ('array', 'list', 'ragged'))
+def test_cache_time_series(
+    betse_sim_conf: SimConfTestInternal,
+    is_ecm: bool,
+    series_type: str,
+) -> None:
+    '''
+    Unit test the
+    :class:`betse.science.math.cache.cachetimes.SimPhaseCacheTimeSeries`
+    class against the per-sampled time step list comprehensions it supplants,
+    extracting the time series of a single cell from time series spatially
+    situated at both cell centres and cell membranes.
+
+    Parameters
+    ----------
+    betse_sim_conf : SimConfTestInternal
+        Object encapsulating a temporary simulation configuration file.
+    is_ecm : bool
+        ``True`` only if extracellular spaces are enabled, in which case the
+        Na-K-ATPase pump rates and membrane permeabilities are spatially
+        situated at cell membranes rather than cell centres.
+    series_type : str
+        Type of all time series, either:
+
+        * ``array``, a Numpy array preallocated by the simulator.
+        * ``list``, a list of arrays of the same shape.
+        * ``ragged``, a list of arrays whose shapes change after the first two
+          sampled time steps (e.g., due to cells being cut), which *cannot* be
+          stacked into a single array.
+    '''
+
+    # Defer heavyweight imports.
+    import numpy as np
+    from betse.science.enum.enumphase import SimPhaseKind
+    from betse.science.math.cache.cachetimes import SimPhaseCacheTimeSeries
+    from betse.science.phase.phasecls import SimPhase
+    from betse.science.visual.plot.plotutil import cell_ave
+    from types import SimpleNamespace
+
+    # Cell cluster of three cells of three, four, and three membranes each,
+    # exposing only the attributes inspected by this subcache.
+    mem_to_cells = np.array([0, 0, 0, 1, 1, 1, 1, 2, 2, 2])
+    cells = SimpleNamespace(
+        cell_i=np.arange(3),
+        mem_i=np.arange(10),
+        mem_to_cells=mem_to_cells,
+        cell_to_mems=[np.flatnonzero(mem_to_cells == cell_index)
+                      for cell_index in range(3)],
+    )
+
+    # Single cell to extract time series for.
+    cell_index = 1
+
+    # Number of ions and sampled time steps.
+    ions_count = 2
+    samples_count = 5
+
+    # Random number generator seeded for reproducibility.
+    rng = np.random.default_rng(seed=0xBE75E)
+
+    def make_series(*shape_last: int) -> object:
+        '''
+        Time series of random values whose arrays have the passed shape,
+        excluding the last dimension of each array, which is the passed
+        number of cells (for cell-centred time series) or membranes (for
+        membrane-situated time series).
+        '''
+
+        # Length of the last dimension of each array of this time series.
+        series_len = shape_last[-1]
+
+        # If this time series is ragged, the first two arrays are situated at
+        # the cells or membranes of the cluster *BEFORE* cells were cut (i.e.,
+        # at two more cells or membranes).
+        if series_type == 'ragged':
+            return [
+                rng.random(shape_last[:-1] + (
+                    series_len + 2 if sample_index < 2 else series_len,))
+                for sample_index in range(samples_count)
+            ]
+
+        series = [rng.random(shape_last) for _ in range(samples_count)]
+        return np.stack(series) if series_type == 'array' else series
+
+    # Number of cells or membranes at which spatially ambiguous time series
+    # are situated.
+    ecm_len = len(cells.mem_i) if is_ecm else len(cells.cell_i)
+
+    # Simulation exposing only the time series inspected by this subcache.
+    sim = SimpleNamespace(
+        vm_time=make_series(len(cells.mem_i)),
+        cc_time=make_series(ions_count, len(cells.cell_i)),
+        rate_NaKATP_time=make_series(ecm_len),
+        dd_time=make_series(ions_count, ecm_len),
+    )
+
+    # Simulation phase exposing this cell cluster and simulation.
+    p = betse_sim_conf.p
+    p.is_ecm = is_ecm
+    p.visual.single_cell_index = cell_index
+    phase = SimPhase(kind=SimPhaseKind.INIT, p=p)
+    phase.cells = cells
+    phase.sim = sim
+    times_cache = SimPhaseCacheTimeSeries(phase)
+
+    # 0-based index of the first membrane of this cell if extracellular spaces
+    # are enabled *OR* of this cell otherwise, as previously computed.
+    ecm_index = cells.cell_to_mems[cell_index][0] if is_ecm else cell_index
+
+    # Assert each time series to be stacked only if the arrays of that series
+    # share the same shape, reusing preallocated arrays as is.
+    vm_times = times_cache.get_times('vm_time')
+    if series_type in ('array', 'ragged'):
+        assert vm_times is sim.vm_time
+    else:
+        assert isinstance(vm_times, np.ndarray)
+        assert vm_times.shape == (samples_count, len(cells.mem_i))
+    assert times_cache.get_times('vm_time') is vm_times
+
+    # Assert cell-centred concentrations to be indexed by this cell.
+    cc_times = times_cache.get_cell_times('cc_time')
+    for ion_index in range(ions_count):
+        assert np.array_equal(
+            cc_times[:, ion_index],
+            [arr[ion_index][cell_index] for arr in sim.cc_time])
+
+    # Assert these spatially ambiguous time series to be indexed by the first
+    # membrane of this cell if extracellular spaces are enabled *OR* by this
+    # cell otherwise.
+    assert np.array_equal(
+        times_cache.get_cell_times('rate_NaKATP_time'),
+        [arr[ecm_index] for arr in sim.rate_NaKATP_time])
+
+    dd_times = times_cache.get_cell_times('dd_time')
+    for ion_index in range(ions_count):
+        assert np.array_equal(
+            dd_times[:, ion_index],
+            [arr[ion_index][ecm_index] for arr in sim.dd_time])
+
+    # Assert transmembrane voltages to be averaged over all membranes of this
+    # cell, regardless of whether extracellular spaces are enabled.
+    assert np.allclose(
+        times_cache.get_cell_times_mems_mean('vm_time'),
+        [cell_ave(cells, vm_at_mem)[cell_index] for vm_at_mem in sim.vm_time])
+
+    # Assert cell-centred time series to be returned as is when averaged over
+    # all membranes of this cell.
+    assert np.array_equal(
+        times_cache.get_cell_times_mems_mean('cc_time'), cc_times)
+
+    # Assert passed cell indices to override the configured cell index.
+    assert np.array_equal(
+        times_cache.get_cell_times('rate_NaKATP_time', cell_index=2),
+        [arr[cells.cell_to_mems[2][0] if is_ecm else 2]
+         for arr in sim.rate_NaKATP_time])
@@ -0,0 +1,38 @@
+#!/usr/bin/env python3
+# --------------------( LICENSE                           )--------------------
+# Copyright 2014-2023 by Alexis Pietak & Cecil Curry.
+# See "LICENSE" for further details.
+
+'''
+Unit tests for the :mod:`betse.science.math.finitediff` submodule.
+'''
+
+# ....................{ IMPORTS                           }....................
+
+# ....................{ TESTS                             }....................
+def test_finitediff_stacked() -> None:
+    '''
+    Unit test that the :func:`betse.science.math.finitediff.gradient`,
+    :func:`betse.science.math.finitediff.divergence`, and
+    :func:`betse.science.math.finitediff.integrator` functions treat each
+    two-dimensional grid of a stack of such grids independently.
+    '''
+
+    # Defer heavyweight imports.
+    import numpy as np
+    from betse.science.math import finitediff as fd
+
+    # Stack of three arbitrary grids.
+    grids = np.random.rand(3, 7, 5)
+
+    # Assert each function applied to this stack to produce exactly the same
+    # results as applied to each grid of this stack.
+    grads_x, grads_y = fd.gradient(grids, 0.5)
+    divs = fd.divergence(grids, 2*grids, 0.5, 0.25)
+    smooths = fd.integrator(grids, sharp=0.7)
+    for i, grid in enumerate(grids):
+        grad_x, grad_y = fd.gradient(grid, 0.5)
+        assert np.array_equal(grads_x[i], grad_x)
+        assert np.array_equal(grads_y[i], grad_y)
+        assert np.array_equal(divs[i], fd.divergence(grid, 2*grid, 0.5, 0.25))
+        assert np.array_equal(smooths[i], fd.integrator(grid, sharp=0.7))
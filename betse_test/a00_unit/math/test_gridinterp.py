@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+# --------------------( LICENSE                           )--------------------
+# Copyright 2014-2023 by Alexis Pietak & Cecil Curry.
+# See "LICENSE" for further details.
+
+'''
+Unit tests for the :mod:`betse.science.math.gridinterp` submodule.
+'''
+
+# ....................{ IMPORTS                           }....................
+
+# ....................{ TESTS                             }....................
+def test_gridinterp_griddata() -> None:
+    '''
+    Unit test the :func:`betse.science.math.gridinterp.griddata` function
+    against the :func:`scipy.interpolate.griddata` function it replaces for
+    all supported interpolation methods and for both one- and two-dimensional
+    data.
+    '''
+
+    # Defer heavyweight imports.
+    import numpy as np
+    import pytest
+    from betse.science.math import gridinterp
+    from scipy import interpolate
+
+    # Irregularly spaced source points and a regular grid of target points
+    # extending beyond the convex hull of these source points.
+    random = np.random.RandomState(0)
+    points = random.random_sample((200, 2))
+    points_xy = (points[:, 0], points[:, 1])
+    grid_x, grid_y = np.meshgrid(
+        np.linspace(-0.1, 1.1, 40), np.linspace(-0.1, 1.1, 30))
+
+    # One- and two-dimensional data defined at these source points.
+    values_1d = random.random_sample(200)
+    values_2d = random.random_sample((200, 3))
+
+    gridinterp.clear_plans()
+    for method in ('linear', 'nearest', 'cubic'):
+        for values in (values_1d, values_2d):
+            values_expected = interpolate.griddata(
+                points_xy, values, (grid_x, grid_y),
+                method=method, fill_value=0)
+            values_interp = gridinterp.griddata(
+                points_xy, values, (grid_x, grid_y),
+                method=method, fill_value=0)
+            assert values_interp.shape == values_expected.shape
+            assert np.allclose(
+                values_interp, values_expected, rtol=0, atol=1.0e-12)
+
+        # Assert the default fill value to be NaN, as with SciPy.
+        if method != 'nearest':
+            assert np.isnan(gridinterp.griddata(
+                points, values_1d, (grid_x, grid_y), method=method)).any()
+
+    # Assert the plan interpolating between these points to be cached and
+    # reused, regardless of the format in which these points are passed.
+    plan = gridinterp.get_plan(points_xy, (grid_x, grid_y))
+    assert gridinterp.get_plan(
+        points.copy(), np.dstack((grid_x, grid_y))) is plan
+    assert gridinterp.get_plan(
+        points_xy, (grid_x, grid_y), method='nearest') is not plan
+
+    # Assert data not defined at these source points to be rejected.
+    with pytest.raises(ValueError):
+        gridinterp.griddata(points_xy, values_1d[1:], (grid_x, grid_y))
+    with pytest.raises(ValueError):
+        gridinterp.griddata(points_xy, values_1d, (grid_x, grid_y), 'spline')
+    gridinterp.clear_plans()
@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+# --------------------( LICENSE                           )--------------------
+# Copyright 2014-2023 by Alexis Pietak & Cecil Curry.
+# See "LICENSE" for further details.
+
+'''
+Unit tests for the :mod:`betse.science.math.mesh` submodule.
+'''
+
+# ....................{ TESTS                             }....................
+def test_decmesh_search_point_cloud() -> None:
+    '''
+    Unit test the :meth:`betse.science.math.mesh.DECMesh.search_point_cloud`
+    method against a brute-force search of a point cloud containing duplicate
+    points.
+    '''
+
+    # Defer heavyweight imports.
+    import numpy as np
+    from betse.science.math.mesh import DECMesh
+
+    # Arbitrary points and a point cloud containing every third such point
+    # (with the first of these points duplicated) and additional points.
+    pts = np.random.rand(30, 2)
+    pt_cloud = np.vstack((pts[::3], pts[:1], np.random.rand(5, 2) + 2.0))
+
+    # Brute-force search for the points coincident with some cloud point,
+    # each repeated once for each such cloud point, and all other points.
+    dists = np.linalg.norm(pts[:, None, :] - pt_cloud[None, :, :], axis=2)
+    matched_inds, _ = (dists < 1.0e-15).nonzero()
+    unmatched_inds = np.setdiff1d(np.arange(len(pts)), matched_inds)
+
+    # Assert this method to produce the same search.
+    mesh = DECMesh(seed_points=pts)
+    matched_pts, unmatched_pts = mesh.search_point_cloud(pts, pt_cloud)
+    assert np.array_equal(matched_pts, pts[matched_inds])
+    assert np.array_equal(unmatched_pts, pts[unmatched_inds])
+    assert len(matched_pts) == 11
+
+
+def test_decmesh_refine_mesh_incremental() -> None:
+    '''
+    Unit test the :meth:`betse.science.math.mesh.DECMesh.refine_mesh` method
+    when incrementally optimizing a mesh against fully rebuilding that mesh on
+    each optimization step.
+    '''
+
+    # Defer heavyweight imports.
+    import numpy as np
+    from betse.science.math.mesh import DECMesh
+
+    # Perturbed hexagonal lattice of seed points.
+    xs, ys = np.meshgrid(np.arange(10), np.arange(10))
+    pts = np.column_stack((xs.ravel() + 0.5*(ys.ravel() % 2), ys.ravel()*0.866))
+    pts = 10.0e-6*(pts + 0.3*np.random.RandomState(0).rand(*pts.shape))
+
+    # Tri verts of this mesh optimized with and without incremental updates.
+    tri_verts = []
+    for incremental in (False, True):
+        mesh = DECMesh(
+            seed_points=pts, cell_radius=5.0e-6, use_alpha_shape=True)
+        mesh.pre_mesh()
+
+        # If incrementally optimizing, assert the geometry updated for the
+        # unchanged topology of this mesh to be that of this mesh.
+        if incremental:
+            vor_cents = mesh.vor_cents.copy()
+            mesh._init_lloyd_topology()
+            mesh._update_lloyd_geometry()
+            assert np.allclose(vor_cents, mesh.vor_cents, rtol=0, atol=1.0e-15)
+
+        mesh.refine_mesh(
+            max_steps=5, convergence=0.0, incremental=incremental)
+        mesh.pre_mesh()
+        tri_verts.append(mesh.tri_verts)
+
+    # Assert both optimizations to produce the same mesh.
+    assert tri_verts[0].shape == tri_verts[1].shape
+    assert np.allclose(tri_verts[0], tri_verts[1], rtol=0, atol=1.0e-15)
+
+
+def test_decmesh_cut_mesh() -> None:
+    '''
+    Unit test the :meth:`betse.science.math.mesh.DECMesh.cut_mesh` method
+    against reconstructing the indices of all retained tri-cells and tri-edges
+    by searching for the coordinates of their tri-verts.
+    '''
+
+    # Defer heavyweight imports.
+    import numpy as np
+    from betse.science.math.mesh import DECMesh
+    from scipy.spatial import cKDTree
+
+    # Perturbed hexagonal lattice of seed points.
+    xs, ys = np.meshgrid(np.arange(10), np.arange(10))
+    pts = np.column_stack((xs.ravel() + 0.5*(ys.ravel() % 2), ys.ravel()*0.866))
+    pts = 10.0e-6*(pts + 0.3*np.random.RandomState(0).rand(*pts.shape))
+
+    mesh = DECMesh(
+        seed_points=pts,
+        cell_radius=5.0e-6,
+        use_alpha_shape=True,
+        allow_merging=True,
+        merge_thresh=0.1,
+        make_all_operators=False,
+    )
+    mesh.init_mesh()
+
+    # Remove a wedge of tri-verts from this mesh.
+    tvert_targets = np.flatnonzero(
+        (mesh.tri_verts[:, 0] < 40.0e-6) & (mesh.tri_verts[:, 1] < 30.0e-6))
+    tcell_verts = mesh.tcell_verts
+    tedge_verts = mesh.tri_verts[mesh.tri_edges]
+    tedge_targets, tcell_targets = mesh.cut_mesh(tvert_targets)
+
+    # Indices of the tri-verts of all retained tri-cells and tri-edges,
+    # searched for by the coordinates of these tri-verts.
+    tri_vtree = cKDTree(mesh.tri_verts)
+    tri_cells = [
+        tri_vtree.query(tverts)[1]
+        for tverts in np.delete(tcell_verts, tcell_targets, axis=0)
+    ]
+    tri_edges = tri_vtree.query(
+        np.delete(tedge_verts, tedge_targets, axis=0))[1]
+
+    # Assert this method to produce the same indices.
+    assert len(tvert_targets)
+    assert len(mesh.tri_cells) == len(tri_cells)
+    assert all(
+        np.array_equal(np.asarray(tverts_a, dtype=int), tverts_b)
+        for tverts_a, tverts_b in zip(mesh.tri_cells, tri_cells))
+    assert np.array_equal(mesh.tri_edges, tri_edges)
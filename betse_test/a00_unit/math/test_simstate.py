@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+# --------------------( LICENSE                           )--------------------
+# Copyright 2014-2023 by Alexis Pietak & Cecil Curry.
+# See "LICENSE" for further details.
+
+'''
+Unit tests for the :mod:`betse.science.math.simstate` submodule.
+'''
+
+# ....................{ TESTS                             }....................
+def test_sim_state_snapshot() -> None:
+    '''
+    Unit test the :class:`betse.science.math.simstate.SimStateSnapshot` class
+    by repeatedly rolling back a simulation whose simulator, tissue handler,
+    gap junctions, and network channel cores are all advanced in-place.
+    '''
+
+    # Defer heavyweight imports.
+    import numpy as np
+    from betse.science.math.simstate import SimStateSnapshot
+    from types import SimpleNamespace
+
+    # Network exposing only the attributes inspected by this snapshot.
+    channel_core = SimpleNamespace(m=np.full(3, 0.1))
+    network_core = SimpleNamespace(
+        iter_state_objs=lambda: iter((channel_core,)))
+
+    # Simulation exposing only the attributes inspected by this snapshot.
+    vm_time = np.zeros((2, 3))
+    sim = SimpleNamespace(
+        vm=np.full(3, -0.05),
+        vm_time=vm_time,
+        gj_funk=SimpleNamespace(gjopen=np.ones(3)),
+        endo_retic=None,
+        molecules=SimpleNamespace(core=network_core),
+        grn=None,
+    )
+    dyna = SimpleNamespace(multiplier=np.ones(3))
+
+    snapshot = SimStateSnapshot(
+        sim=sim, dyna=dyna, names_ignored=('vm_time',))
+
+    for _ in range(2):
+        # Advance all state both in-place and by rebinding.
+        sim.vm += 0.01
+        sim.gj_funk.gjopen *= 0.5
+        channel_core.m = channel_core.m + 0.2
+        dyna.multiplier[0] = 2.0
+        sim.vm_extra = np.ones(3)
+
+        snapshot.restore()
+
+        # Assert all state to have been rolled back.
+        assert np.array_equal(sim.vm, np.full(3, -0.05))
+        assert np.array_equal(sim.gj_funk.gjopen, np.ones(3))
+        assert np.array_equal(channel_core.m, np.full(3, 0.1))
+        assert np.array_equal(dyna.multiplier, np.ones(3))
+        assert not hasattr(sim, 'vm_extra')
+
+        # Assert ignored arrays to have been referred to rather than copied.
+        assert sim.vm_time is vm_time
@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+# --------------------( LICENSE                           )--------------------
+# Copyright 2014-2023 by Alexis Pietak & Cecil Curry.
+# See "LICENSE" for further details.
+
+'''
+Unit tests for the :mod:`betse.science.math.sparsesolver` submodule.
+'''
+
+# ....................{ IMPORTS                           }....................
+import pytest
+
+# ....................{ TESTS                             }....................
+@pytest.mark.parametrize('bound_type', ('value', 'flux'))
+def test_sparse_factor_solver_grid(bound_type: str) -> None:
+    '''
+    Unit test the :class:`betse.science.math.sparsesolver.SparseFactorSolver`
+    class against the dense pseudo-inverse of the environmental grid Laplacian
+    with either Dirichlet or Neumann boundary conditions.
+
+    Parameters
+    ----------
+    bound_type : str
+        Type of boundary condition to apply to all four grid boundaries.
+    '''
+
+    # Defer heavyweight imports.
+    import numpy as np
+    from betse.science.math.finitediff import FiniteDiffSolver
+
+    # Small rectangular grid and its Laplacian with these boundaries.
+    grid = FiniteDiffSolver()
+    grid.cell_grid(1.0, 0, 11, 0, 7)
+    bound = {'N': bound_type, 'S': bound_type, 'E': bound_type, 'W': bound_type}
+    lap, lap_solver = grid.makeLaplacian(bound=bound)
+
+    # Dense pseudo-inverse previously precomputed by this method.
+    lap_pinv = np.linalg.pinv(lap.toarray())
+
+    # Assert this solver to reproduce this pseudo-inverse for both one- and
+    # two-dimensional right-hand sides.
+    rhs = np.random.rand(lap.shape[0])
+    rhs_2d = np.random.rand(lap.shape[0], 3)
+    assert np.allclose(lap_solver.solve(rhs), np.dot(lap_pinv, rhs))
+    assert np.allclose(lap_solver.solve(rhs_2d), np.dot(lap_pinv, rhs_2d))
+
+
+def test_sparse_dec_poisson_solver() -> None:
+    '''
+    Unit test the
+    :class:`betse.science.math.sparsesolver.SparseDECPoissonSolver` class
+    against the product of the dense pseudo-inverses of the factors of the
+    Discrete Exterior Calculus (DEC) Laplacian on a random triangulation.
+    '''
+
+    # Defer heavyweight imports.
+    import numpy as np
+    import pickle
+    from betse.science.math.sparsesolver import SparseDECPoissonSolver
+    from scipy.spatial import Delaunay
+
+    # Random triangulation and the sorted set of all unique edges of that
+    # triangulation.
+    points = np.random.rand(40, 2)
+    simplices = Delaunay(points).simplices
+    edges = np.sort(np.vstack((
+        simplices[:, [0, 1]], simplices[:, [1, 2]], simplices[:, [2, 0]])),
+        axis=1)
+    edges = np.unique(edges, axis=0)
+
+    # Dense incidence matrix of this triangulation.
+    delta = np.zeros((len(edges), len(points)))
+    delta[np.arange(len(edges)), edges[:, 1]] = 1.0
+    delta[np.arange(len(edges)), edges[:, 0]] = -1.0
+
+    # Arbitrary positive Hodge stars.
+    edge_ratio = np.random.rand(len(edges)) + 0.5
+    vert_area = np.random.rand(len(points)) + 0.5
+
+    # Product of dense pseudo-inverses previously precomputed for this solver.
+    delta_pinv = np.linalg.pinv(delta)
+    lap_inv = np.dot(
+        np.dot(delta_pinv, np.diag(1/edge_ratio)),
+        np.dot(-delta_pinv.T, np.diag(vert_area)))
+
+    # Assert this solver to reproduce this product both before and after
+    # being pickled.
+    solver = SparseDECPoissonSolver(delta, edge_ratio, vert_area)
+    solver_unpickled = pickle.loads(pickle.dumps(solver))
+    rhs = np.random.rand(len(points))
+    assert np.allclose(solver.solve(rhs), np.dot(lap_inv, rhs))
+    assert np.allclose(solver_unpickled.solve(rhs), np.dot(lap_inv, rhs))
+
+
+def test_sparse_pinv_solver() -> None:
+    '''
+    Unit test the :class:`betse.science.math.sparsesolver.SparsePinvSolver`
+    class against the dense pseudo-inverses of both the tall edge-vertex and
+    wide face-edge incidence matrices of a random triangulation.
+    '''
+
+    # Defer heavyweight imports.
+    import numpy as np
+    import pickle
+    from betse.science.math.sparsesolver import SparsePinvSolver
+    from scipy.spatial import Delaunay
+
+    # Random triangulation and the sorted set of all unique edges of that
+    # triangulation.
+    points = np.random.rand(40, 2)
+    simplices = Delaunay(points).simplices
+    edges = np.sort(np.vstack((
+        simplices[:, [0, 1]], simplices[:, [1, 2]], simplices[:, [2, 0]])),
+        axis=1)
+    edges = np.unique(edges, axis=0)
+    edges_list = edges.tolist()
+
+    # Dense edge-vertex incidence matrix of this triangulation.
+    delta_0 = np.zeros((len(edges), len(points)))
+    delta_0[np.arange(len(edges)), edges[:, 1]] = 1.0
+    delta_0[np.arange(len(edges)), edges[:, 0]] = -1.0
+
+    # Dense face-edge incidence matrix of this triangulation.
+    delta_1 = np.zeros((len(simplices), len(edges)))
+    for face_i, face in enumerate(simplices):
+        for vert_i, vert_j in zip(face, np.roll(face, -1)):
+            edge_i = edges_list.index(sorted([vert_i, vert_j]))
+            delta_1[face_i, edge_i] = 1.0 if vert_i < vert_j else -1.0
+
+    # Assert this solver to reproduce the pseudo-inverse of each such matrix
+    # and the transpose of that pseudo-inverse both before and after being
+    # pickled.
+    for delta in (delta_0, delta_1):
+        delta_pinv = np.linalg.pinv(delta)
+        solver = SparsePinvSolver(delta)
+        solver_unpickled = pickle.loads(pickle.dumps(solver))
+        rhs = np.random.rand(delta.shape[0])
+        rhs_t = np.random.rand(delta.shape[1])
+
+        for solver_cur in (solver, solver_unpickled):
+            assert np.allclose(solver_cur.solve(rhs), np.dot(delta_pinv, rhs))
+            assert np.allclose(
+                solver_cur.solve_transpose(rhs_t), np.dot(delta_pinv.T, rhs_t))
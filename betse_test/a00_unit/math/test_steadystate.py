@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+# --------------------( LICENSE                           )--------------------
+# Copyright 2014-2023 by Alexis Pietak & Cecil Curry.
+# See "LICENSE" for further details.
+
+'''
+Unit tests for the :mod:`betse.science.math.steadystate` submodule.
+'''
+
+# ....................{ IMPORTS                           }....................
+from betse_test._fixture.simconf.simconfclser import SimConfTestInternal
+
+# ....................{ TESTS                             }....................
+def test_steady_state_jacobian() -> None:
+    '''
+    Unit test the private :func:`betse.science.math.steadystate._get_jacobian`
+    function by approximating the tridiagonal Jacobian of a nonlinear
+    diffusion-like residual from only three column groups.
+    '''
+
+    # Defer heavyweight imports.
+    import numpy as np
+    from betse.science.math.steadystate import (
+        _get_band, _get_column_groups, _get_jacobian)
+
+    def get_residual(state: np.ndarray) -> np.ndarray:
+        residual = -2.0*state**2
+        residual[1:] += state[:-1]
+        residual[:-1] += 3.0*state[1:]
+        return residual
+
+    state = np.linspace(0.5, 2.0, 40)
+    sparsity = _get_band(size=len(state), width=1).tocsc()
+    sparsity.sort_indices()
+
+    # Assert tridiagonal columns to require exactly three groups, no two
+    # columns of the same group sharing a row.
+    groups = _get_column_groups(sparsity)
+    assert groups.max() == 2
+    assert np.all(groups[:-1] != groups[1:])
+    assert np.all(groups[:-2] != groups[2:])
+
+    jacobian = _get_jacobian(
+        get_residual=get_residual,
+        state=state,
+        residual=get_residual(state),
+        sparsity=sparsity,
+        groups=groups,
+    ).toarray()
+
+    # Assert this approximation to closely match the exact Jacobian.
+    jacobian_exact = (
+        np.diag(-4.0*state) +
+        np.diag(np.ones(len(state) - 1), k=-1) +
+        np.diag(np.full(len(state) - 1, 3.0), k=1)
+    )
+    assert np.allclose(jacobian, jacobian_exact, rtol=1.0e-5, atol=1.0e-6)
+
+
+def test_steady_state_unsupported(
+    betse_sim_conf: SimConfTestInternal) -> None:
+    '''
+    Unit test the :class:`betse.science.math.steadystate.SteadyStateSolver`
+    class by reverting to time stepping when a subsystem unsupported by that
+    solver is enabled, without taking any time steps or modifying the
+    simulation.
+
+    Parameters
+    ----------
+    betse_sim_conf : SimConfTestInternal
+        Object encapsulating a temporary simulation configuration file.
+    '''
+
+    # Defer heavyweight imports.
+    import numpy as np
+    from betse.science.math.steadystate import SteadyStateSolver
+    from types import SimpleNamespace
+
+    p = betse_sim_conf.p
+    p.steady_state_init = True
+    p.fluid_flow = True
+
+    # Simulation exposing only the attributes inspected by this solver.
+    cc_cells = np.full((2, 4), 20.0)
+    sim = SimpleNamespace(vm=np.full(4, -0.01), cc_cells=cc_cells.copy())
+
+    def step() -> None:
+        raise AssertionError('Time step taken.')
+
+    solver = SteadyStateSolver(p=p)
+    assert solver.solve(sim=sim, cells=SimpleNamespace(), step=step) is False
+    assert solver.steps_count == 0
+    assert np.array_equal(sim.cc_cells, cc_cells)
+
+
+def test_steady_state_failure(betse_sim_conf: SimConfTestInternal) -> None:
+    '''
+    Unit test the :class:`betse.science.math.steadystate.SteadyStateSolver`
+    class by reverting to time stepping when a time step taken by that solver
+    fails, restoring all state advanced by prior time steps of that solver
+    (including state *not* among the unknowns of that solver).
+
+    Parameters
+    ----------
+    betse_sim_conf : SimConfTestInternal
+        Object encapsulating a temporary simulation configuration file.
+    '''
+
+    # Defer heavyweight imports.
+    import numpy as np
+    from betse.science.math.steadystate import SteadyStateSolver
+    from types import SimpleNamespace
+
+    p = betse_sim_conf.p
+    p.dt = 1.0e-3
+    p.steady_state_init = True
+    p.is_ecm = False
+    p.v_sensitive_gj = False
+
+    # Disable all subsystems unsupported by this solver.
+    p.molecules_enabled = p.grn_enabled = p.Ca_dyn = False
+    p.deformation = p.deform_osmo = p.fluid_flow = False
+
+    # Cell cluster of two cells of two membranes each, exposing only the
+    # attributes inspected by this solver.
+    cells = SimpleNamespace(
+        mem_to_cells=np.array([0, 0, 1, 1]), nn_i=np.array([2, 3, 0, 1]))
+
+    # Simulation exposing only the attributes inspected by this solver.
+    cc_cells = np.array([[10.0, 12.0], [140.0, 130.0]])
+    gjopen = np.ones(4)
+    multiplier = np.ones(4)
+    sim = SimpleNamespace(
+        movingIons=[0, 1],
+        vm=np.full(4, -0.05),
+        cc_cells=cc_cells.copy(),
+        cc_at_mem=cc_cells[:, cells.mem_to_cells],
+        cc_env=np.array([[145.0]*4, [5.0]*4]),
+        gjopen=gjopen.copy(),
+        gj_funk=SimpleNamespace(gjopen=gjopen.copy()),
+        endo_retic=None,
+        molecules=None,
+        grn=None,
+        update_V=lambda cells, p: None,
+    )
+    dyna = SimpleNamespace(multiplier=multiplier.copy())
+
+    def step() -> None:
+        '''
+        Advance all state of this simulation in-place *before* failing on the
+        second time step (i.e., the first Jacobian perturbation).
+        '''
+
+        sim.cc_cells *= 1.1
+        sim.gj_funk.gjopen *= 0.5
+        dyna.multiplier += 1.0
+
+        if solver.steps_count > 1:
+            raise ValueError('Time step failed.')
+
+    solver = SteadyStateSolver(p=p)
+    assert solver.solve(sim=sim, cells=cells, step=step, dyna=dyna) is False
+    assert solver.steps_count == 2
+
+    # Assert all state advanced by these time steps to have been restored.
+    assert np.array_equal(sim.cc_cells, cc_cells)
+    assert np.array_equal(sim.gjopen, gjopen)
+    assert np.array_equal(sim.gj_funk.gjopen, gjopen)
+    assert np.array_equal(dyna.multiplier, multiplier)
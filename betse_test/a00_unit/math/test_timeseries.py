@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+# --------------------( LICENSE                           )--------------------
+# Copyright 2014-2023 by Alexis Pietak & Cecil Curry.
+# See "LICENSE" for further details.
+
+'''
+Unit tests for the :mod:`betse.science.math.timeseries` submodule.
+'''
+
+# ....................{ IMPORTS                           }....................
+
+# ....................{ TESTS                             }....................
+def test_sampled_time_series() -> None:
+    '''
+    Unit test the :class:`betse.science.math.timeseries.SampledTimeSeries`
+    class.
+    '''
+
+    # Defer heavyweight imports.
+    import numpy as np
+    from betse.science.math.timeseries import SampledTimeSeries
+    from types import SimpleNamespace
+
+    # Object whose attributes are stored by a store of at most four samples.
+    obj = SimpleNamespace(vm_time=[], time=[], cut_time=[])
+    time_series = SampledTimeSeries(obj=obj, samples_max=4)
+
+    # Store three samples, mutating each value in-place after storing it.
+    vm = np.zeros(5)
+    for sample in range(3):
+        vm[:] = sample
+        time_series.store('vm_time', vm)
+        time_series.store('time', sample * 0.5)
+        time_series.store('cut_time', np.arange(5 - sample))
+
+        # Assert the most recently stored sample to be accessible as before.
+        assert len(obj.vm_time) == sample + 1
+        assert np.array_equal(obj.vm_time[-1], vm)
+
+    # Assert each stored value to have been copied rather than referenced.
+    assert np.array_equal(obj.vm_time[:, 0], (0.0, 1.0, 2.0))
+    assert np.array_equal(obj.time, (0.0, 0.5, 1.0))
+
+    # Assert values whose shapes change to revert to a list of arrays.
+    assert isinstance(obj.cut_time, list)
+    assert [len(cut) for cut in obj.cut_time] == [5, 4, 3]
+
+    # Assert finalization to compact partially written arrays.
+    time_series.finalize()
+    assert obj.vm_time.base is None
+    assert obj.vm_time.shape == (3, 5)
@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+# --------------------( LICENSE                           )--------------------
+# Copyright 2014-2023 by Alexis Pietak & Cecil Curry.
+# See "LICENSE" for further details.
+
+'''
+Unit tests for the :mod:`betse.science.math.timestep` submodule.
+'''
+
+# ....................{ IMPORTS                           }....................
+from betse_test._fixture.simconf.simconfclser import SimConfTestInternal
+
+# ....................{ TESTS                             }....................
+def test_adaptive_time_stepper(betse_sim_conf: SimConfTestInternal) -> None:
+    '''
+    Unit test the :class:`betse.science.math.timestep.AdaptiveTimeStepper`
+    class by explicitly integrating an exponential relaxation of voltages and
+    concentrations towards steady state, perturbed by an abrupt change in
+    forcing *not* announced as an event window.
+
+    Parameters
+    ----------
+    betse_sim_conf : SimConfTestInternal
+        Object encapsulating a temporary simulation configuration file.
+    '''
+
+    # Defer heavyweight imports.
+    import numpy as np
+    from betse.science.math.timestep import AdaptiveTimeStepper
+    from types import SimpleNamespace
+
+    # Simulation configuration enabling adaptive time stepping.
+    dt_base = 1.0e-3
+    p = betse_sim_conf.p
+    p.dt = dt_base
+    p.adaptive_time_step = True
+    p.adaptive_dt_max_factor = 10.0
+    p.adaptive_tolerance = 1.0e-4
+    p.adaptive_vmem_change_max = 1.0e-4
+
+    # Fixed time steps and sampled time steps, as defined by the simulator.
+    time_steps = np.linspace(0, 2000*dt_base, 2000)
+    time_steps_sampled = set(time_steps[200::200])
+
+    # Single event window, throughout which the configured step-size applies.
+    event_window = (1.0, 1.1)
+
+    def make_sim() -> SimpleNamespace:
+        '''
+        Simulation exposing only the attributes inspected by this stepper.
+        '''
+
+        return SimpleNamespace(
+            vm=np.full(4, -0.01), cc_cells=np.full((2, 4), 20.0))
+
+    def step(sim: SimpleNamespace, t: float) -> None:
+        '''
+        Take one explicit Euler step of the current step-size from time ``t``.
+        '''
+
+        # Abruptly halve the concentration target at an unannounced time.
+        cc_target = 10.0 if t < 1.52 else 5.0
+        sim.vm += p.dt*(-0.07 - sim.vm)/0.05
+        sim.cc_cells += p.dt*(cc_target - sim.cc_cells)/0.2
+
+    # Concentrations sampled by fixed time stepping, keyed by sampled time.
+    sim = make_sim()
+    cc_sampled_fixed = {}
+    for t in time_steps:
+        step(sim, t)
+        if t in time_steps_sampled:
+            cc_sampled_fixed[t] = sim.cc_cells.copy()
+
+    time_stepper = AdaptiveTimeStepper(
+        p=p,
+        time_end=float(time_steps[-1]),
+        time_steps_sampled=time_steps_sampled,
+        event_windows=(event_window,),
+    )
+
+    # Times and sizes of all time steps taken and concentrations sampled.
+    times = []
+    dts = []
+    cc_sampled = {}
+
+    # Explicitly integrate this relaxation with the yielded step-sizes.
+    sim = make_sim()
+    for t in time_stepper.iter_time_steps(sim=sim):
+        times.append(t)
+        dts.append(p.dt)
+        step(sim, t)
+        if t in time_steps_sampled:
+            cc_sampled[t] = sim.cc_cells.copy()
+
+    # Assert all sampled time steps and the last time step to have been landed
+    # on exactly once, in ascending order, each starting a time step of the
+    # configured step-size. Since rejected time steps are retried, other times
+    # may repeat.
+    assert list(cc_sampled) == sorted(time_steps_sampled)
+    assert all(times.count(t) == 1 for t in time_steps_sampled)
+    assert times[-1] == time_steps[-1]
+    assert all(
+        dt == dt_base for t, dt in zip(times, dts) if t in time_steps_sampled)
+
+    # Assert substantially fewer time steps to have been taken, including
+    # step-doubled and rejected steps, none of which exceeds the maximum
+    # step-size.
+    assert time_stepper.steps_count == len(times) < len(time_steps)//2
+    assert max(dts) <= dt_base*(p.adaptive_dt_max_factor + 0.5)
+
+    # Assert the abrupt change in forcing to have rejected at least one step.
+    assert time_stepper.steps_rejected_count > 0
+
+    # Assert the configured step-size to have applied throughout this window,
+    # excluding steps stretched or truncated to land on sampled time steps.
+    dts_window = [
+        dt for t, dt in zip(times, dts)
+        if event_window[0] <= t <= event_window[1]
+    ]
+    assert dts_window
+    assert max(dts_window) < 1.5*dt_base
+
+    # Assert the configured step-size to have been restored.
+    assert p.dt == dt_base
+
+    # Assert this relaxation to have been integrated accurately and sampled at
+    # the same times as with fixed time stepping.
+    assert np.allclose(sim.vm, -0.07, atol=1.0e-4)
+    for t, cc_cells in cc_sampled.items():
+        assert np.allclose(cc_cells, cc_sampled_fixed[t], rtol=1.0e-2)
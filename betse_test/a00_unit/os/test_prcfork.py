@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+# --------------------( LICENSE                           )--------------------
+# Copyright 2014-2023 by Alexis Pietak & Cecil Curry.
+# See "LICENSE" for further details.
+
+'''
+Unit tests for the :mod:`betse.util.os.process.prcfork` submodule.
+'''
+
+# ....................{ IMPORTS                           }....................
+import multiprocessing, pytest
+
+# ....................{ TESTS                             }....................
+@pytest.mark.skipif(
+    'fork' not in multiprocessing.get_all_start_methods(),
+    reason='Process forking unsupported.')
+def test_prcfork_forking() -> None:
+    '''
+    Unit test the :func:`betse.util.os.process.prcfork.forking` context
+    manager by exposing an unpicklable object to forked worker processes whose
+    BLAS implementations are limited to their share of all processors.
+    '''
+
+    # Defer heavyweight imports.
+    from betse.exceptions import BetseProcessException
+    from betse.util.os.process import prcfork
+    from betse.util.os.shell import shellenv
+    from concurrent.futures import ProcessPoolExecutor
+
+    # Prior value of an environment variable limiting BLAS threads.
+    omp_threads_old = shellenv.get_var_or_none('OMP_NUM_THREADS')
+
+    # Unpicklable object exposed to these workers.
+    func = lambda: 'Tissue'
+
+    # Run a task in each worker inspecting this object and this environment.
+    with prcfork.forking(workers=2, func=func), ProcessPoolExecutor(
+        max_workers=2, mp_context=prcfork.get_fork_context(),
+    ) as executor:
+        results = list(executor.map(_get_forked_state, range(2)))
+
+    # Assert each worker to have inherited this object and this limit.
+    assert results == [
+        ('Tissue', str(prcfork.get_threads_per_worker(2)))] * 2
+
+    # Assert this object to have been released and this environment restored.
+    with pytest.raises(BetseProcessException):
+        prcfork.get_forked_global('func')
+    assert shellenv.get_var_or_none('OMP_NUM_THREADS') == omp_threads_old
+
+
+def test_prcfork_is_forkable_macos(monkeypatch) -> None:
+    '''
+    Unit test the :func:`betse.util.os.process.prcfork.is_forkable_else_warn`
+    tester under macOS, where forking is unsafe and tasks that would otherwise
+    be run concurrently by forked worker processes are run serially instead.
+
+    Parameters
+    ----------
+    monkeypatch : MonkeyPatch
+        Builtin fixture object permitting object attributes to be safely
+        modified for the duration of this test.
+    '''
+
+    # Defer heavyweight imports.
+    from betse.science.pipe.export import pipeexps
+    from betse.util.os.brand import macos
+    from betse.util.os.process import prcfork
+    from types import SimpleNamespace
+
+    # Pretend the current platform to be macOS.
+    monkeypatch.setattr(macos, 'is_macos', lambda: True)
+    assert not prcfork.is_forkable()
+    assert not prcfork.is_forkable_else_warn('Exports')
+
+    # Simulation phase requesting exports to be run concurrently.
+    phase = SimpleNamespace(p=SimpleNamespace(
+        export_workers=2,
+        plot=SimpleNamespace(is_after_sim_show=False),
+        anim=SimpleNamespace(is_after_sim_show=False),
+    ))
+
+    # Assert exports to be run serially regardless.
+    assert not pipeexps._is_export_concurrent(phase, [None, None])
+
+# ....................{ PRIVATE                           }....................
+def _get_forked_state(task_index: int) -> tuple:
+    '''
+    2-tuple ``(func_result, omp_threads)`` of the value returned by the
+    unpicklable callable exposed to the current forked worker process and the
+    value of the ``${OMP_NUM_THREADS}`` environment variable in this process.
+    '''
+
+    # Defer heavyweight imports.
+    from betse.util.os.process import prcfork
+    from betse.util.os.shell import shellenv
+
+    return (
+        prcfork.get_forked_global('func')(),
+        shellenv.get_var_or_none('OMP_NUM_THREADS'),
+    )
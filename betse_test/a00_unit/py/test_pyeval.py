@@ -0,0 +1,28 @@
+#!/usr/bin/env python3
+# --------------------( LICENSE                           )--------------------
+# Copyright 2014-2023 by Alexis Pietak & Cecil Curry.
+# See "LICENSE" for further details.
+
+'''
+Unit tests for the :mod:`betse.util.py.pyeval` submodule.
+'''
+
+# ....................{ IMPORTS                           }....................
+
+# ....................{ TESTS                             }....................
+def test_eval_expr() -> None:
+    '''
+    Unit test the :func:`betse.util.py.pyeval.eval_expr` function.
+    '''
+
+    # Defer heavyweight imports.
+    from betse.util.py import pyeval
+
+    # Arbitrary expression referencing both global and local variables.
+    expr = 'scale * sum(values)'
+
+    # Assert this expression to be evaluated in the passed namespaces, reusing
+    # the same compiled code object on each evaluation.
+    assert pyeval.eval_expr(expr, {}, {'scale': 2, 'values': (1, 2)}) == 6
+    assert pyeval.eval_expr(expr, {'scale': 3}, {'values': (1, 2)}) == 9
+    assert pyeval.compile_expr(expr) is pyeval.compile_expr(expr)
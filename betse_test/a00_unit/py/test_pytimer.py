@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+# --------------------( LICENSE                           )--------------------
+# Copyright 2014-2023 by Alexis Pietak & Cecil Curry.
+# See "LICENSE" for further details.
+
+'''
+Unit tests for the :mod:`betse.util.py.pytimer` submodule.
+'''
+
+# ....................{ IMPORTS                           }....................
+from py._path.local import LocalPath
+
+# ....................{ TESTS                             }....................
+def test_section_timer(betse_temp_dir: LocalPath) -> None:
+    '''
+    Unit test the :class:`betse.util.py.pytimer.SectionTimer` class.
+
+    Parameters
+    ----------
+    betse_temp_dir : LocalPath
+        Object encapsulating a temporary directory isolated to this test.
+    '''
+
+    # Defer heavyweight imports.
+    import json
+    from betse.util.py.pytimer import SectionTimer
+
+    # Time two sections, one executed twice as often as the other.
+    timer = SectionTimer()
+    for _ in range(4):
+        with timer('pumps'):
+            pass
+        with timer('gj'):
+            pass
+        with timer('gj'):
+            pass
+
+    # Assert these sections to have been counted, with all remaining time
+    # summarized as the "other" pseudo-section.
+    summary = timer.get_summary(total_seconds=1.0)
+    assert list(summary.keys()) == ['pumps', 'gj', 'other']
+    assert summary['pumps']['calls'] == 4
+    assert summary['gj']['calls'] == 8
+    assert 0.0 < summary['other']['seconds'] <= 1.0
+    assert 'pumps' in timer.get_table()
+
+    # Assert this summary to be savable as JSON.
+    timing_file = betse_temp_dir.join('timing.json')
+    timer.save_json(str(timing_file))
+    assert json.loads(timing_file.read())['gj']['calls'] == 8
+
+    # Assert a disabled timer to time nothing.
+    timer_disabled = SectionTimer(is_enabled=False)
+    with timer_disabled('pumps'):
+        pass
+    assert timer_disabled.get_summary() == {}
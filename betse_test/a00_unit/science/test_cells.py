@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+# --------------------( LICENSE                           )--------------------
+# Copyright 2014-2023 by Alexis Pietak & Cecil Curry.
+# See "LICENSE" for further details.
+
+'''
+Unit tests for the :mod:`betse.science.cells` submodule.
+'''
+
+# ....................{ IMPORTS                           }....................
+
+# ....................{ TESTS                             }....................
+def test_cells_matrices() -> None:
+    '''
+    Unit test the sparse matrices created by the
+    :meth:`betse.science.cells.Cells.cellMatrices`,
+    :meth:`betse.science.cells.Cells.memLaplacian`, and
+    :meth:`betse.science.cells.Cells.cellDivM` methods against the dense
+    matrices these methods previously created for a small cluster of cells
+    with differing numbers of membranes.
+    '''
+
+    # Defer heavyweight imports.
+    import numpy as np
+    from betse.science.cells import Cells
+    from types import SimpleNamespace
+
+    # Simulation configuration defining only the parameters used below.
+    p = SimpleNamespace(
+        scale_cell=0.9, cell_height=1.0e-6, cell_space=2.6e-8, tm=7.5e-9)
+
+    # Cells whose Voronoi polygons are a triangle, a square, and a hexagon,
+    # each with vertices sorted counter-clockwise.
+    angles = [
+        np.linspace(0, 2*np.pi, mems_count, endpoint=False)
+        for mems_count in (3, 4, 6)
+    ]
+    cells = Cells.__new__(Cells)
+    cells.cell_centres = np.array([[0.0, 0.0], [3.0e-6, 0.0], [6.0e-6, 0.0]])
+    cells.ecm_verts = np.asarray([
+        centre + 1.0e-6*np.column_stack((np.cos(angle), np.sin(angle)))
+        for centre, angle in zip(cells.cell_centres, angles)
+    ], dtype=object)
+
+    cells.cellVerts(p)
+    cells.cellMatrices(p)
+
+    # Arbitrary cell and membrane volumes.
+    mems_len = len(cells.mem_i)
+    cells.cell_vol = np.array([1.0, 2.0, 3.0])*1.0e-18
+    cells.mem_vol = np.linspace(1.0, 2.0, mems_len)*1.0e-19
+
+    cells.memLaplacian()
+    cells.cellDivM(p)
+
+    # Dense matrices as previously created by these methods.
+    gradTheta = np.zeros((mems_len, mems_len))
+    lapGJmem = np.zeros((mems_len, mems_len))
+    divCell = np.zeros((len(cells.cell_i), mems_len))
+
+    for cell_i, mem_i in enumerate(cells.cell_to_mems):
+        mem_io = np.roll(mem_i, 1)
+        li = cells.mem_mids_flat[mem_i] - cells.mem_mids_flat[mem_io]
+        lm = np.sqrt(li[:, 0] ** 2 + li[:, 1] ** 2)
+        gradTheta[mem_i, mem_i] = 1 / lm
+        gradTheta[mem_i, mem_io] = -1 / lm
+
+        num_mems = len(mem_i)
+        for nj, j in enumerate(mem_i):
+            memjj = np.roll(mem_i, -1 - nj)[0:-1]
+            lapGJmem[j, j] = ((num_mems - 1)/num_mems)*(
+                cells.mem_sa[j]/cells.mem_vol[j])
+            lapGJmem[j, memjj] = -(1/num_mems)*(
+                cells.mem_sa[memjj]/cells.mem_vol[memjj])
+
+        divCell[cell_i, mem_i] = cells.mem_sa[mem_i]/cells.cell_vol[cell_i]
+
+    # Assert these methods to create the same matrices.
+    assert list(cells.num_mems) == [3, 4, 6]
+    assert np.array_equal(cells.gradTheta.toarray(), gradTheta)
+    assert np.allclose(
+        cells.lapGJmem_inv.toarray(), np.linalg.pinv(lapGJmem),
+        rtol=1.0e-10, atol=1.0e-10*np.abs(np.linalg.pinv(lapGJmem)).max())
+    assert np.allclose(
+        cells.divCell_inv.toarray(), np.linalg.pinv(divCell),
+        rtol=1.0e-10, atol=0)
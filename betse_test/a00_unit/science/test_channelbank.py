@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+# --------------------( LICENSE                           )--------------------
+# Copyright 2014-2023 by Alexis Pietak & Cecil Curry.
+# See "LICENSE" for further details.
+
+'''
+Unit tests for the :mod:`betse.science.channels.channelbank` submodule.
+'''
+
+# ....................{ IMPORTS                           }....................
+
+# ....................{ TESTS                             }....................
+def test_channel_bank() -> None:
+    '''
+    Unit test the :class:`betse.science.channels.channelbank.ChannelBank` class
+    by advancing two channels of every concrete voltage-gated channel class on
+    overlapping membranes both individually and as one bank, asserting the
+    resulting open probabilities to be identical.
+    '''
+
+    # Defer heavyweight imports.
+    import inspect
+    import numpy as np
+    from betse.science.channels import (
+        cation, vg_ca, vg_cl, vg_funny, vg_k, vg_morrislecar, vg_na)
+    from betse.science.channels.channelbank import ChannelBank
+    from betse.science.channels.channelsabc import ChannelsABC
+    from types import SimpleNamespace
+
+    # Cell cluster and simulation configuration exposing only the attributes
+    # inspected by these channels.
+    mems_count = 60
+    cells = SimpleNamespace(mem_i=np.arange(mems_count))
+    p = SimpleNamespace(dt=1.0e-4)
+
+    # Transmembrane voltages, oscillating through the range of action
+    # potentials at each time step.
+    rng = np.random.default_rng(0)
+    vm_base = rng.uniform(-0.09, 0.03, mems_count)
+    def get_vm(time_step: int) -> np.ndarray:
+        return vm_base + 0.04*np.sin(0.3*time_step + np.arange(mems_count))
+
+    # Targets of the two channels of each channel class.
+    targets_pair = (np.arange(0, 40), np.arange(20, mems_count))
+
+    def make_channels() -> list:
+        channels = []
+        for channel_module in (
+            cation, vg_ca, vg_cl, vg_funny, vg_k, vg_morrislecar, vg_na):
+            for _, channel_type in inspect.getmembers(
+                channel_module, inspect.isclass):
+                if (
+                    issubclass(channel_type, ChannelsABC) and
+                    not inspect.isabstract(channel_type) and
+                    channel_type.__module__ == channel_module.__name__
+                ):
+                    for targets in targets_pair:
+                        channel = channel_type()
+                        channel.init(get_vm(0), cells, p, targets=targets)
+                        channels.append(channel)
+        return channels
+
+    channels_single = make_channels()
+    channels_banked = make_channels()
+    channel_bank = ChannelBank(
+        channels=channels_banked, mems_count=mems_count)
+
+    for time_step in range(1, 20):
+        vm = get_vm(time_step)
+        for channel in channels_single:
+            channel.run(vm, p)
+        channel_bank.run(vm, p)
+
+    # Assert each banked channel to be in the same state as the same channel
+    # advanced individually.
+    for channel_single, channel_banked in zip(
+        channels_single, channels_banked):
+        assert np.array_equal(
+            channel_single.P, channel_banked.P, equal_nan=True), (
+            type(channel_single).__name__)
+        assert np.array_equal(
+            channel_single.m, channel_banked.m, equal_nan=True), (
+            type(channel_single).__name__)
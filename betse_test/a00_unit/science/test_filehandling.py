@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+# --------------------( LICENSE                           )--------------------
+# Copyright 2014-2023 by Alexis Pietak & Cecil Curry.
+# See "LICENSE" for further details.
+
+'''
+Unit tests for the :mod:`betse.science.filehandling` submodule.
+'''
+
+# ....................{ IMPORTS                           }....................
+
+# ....................{ TESTS                             }....................
+def test_save_load_sim(betse_temp_dir: 'LocalPath') -> None:
+    '''
+    Unit test both the :func:`betse.science.filehandling.saveSim` and
+    :func:`betse.science.filehandling.loadSim` functions.
+
+    Parameters
+    ----------
+    betse_temp_dir : LocalPath
+        Object encapsulating a temporary directory isolated to the current
+        test.
+    '''
+
+    # Defer heavyweight imports.
+    import numpy as np
+    from betse.science import filehandling as fh
+    from types import SimpleNamespace
+
+    # Absolute filename of a pickled file in this temporary directory.
+    sim_filename = str(betse_temp_dir.join('sim.betse'))
+
+    # Arbitrary simulation-like object with time series arrays and non-arrays.
+    vm_time = np.random.rand(6, 4)
+    sim = SimpleNamespace(
+        vm=vm_time[-1].copy(),
+        vm_time=vm_time,
+        time=np.linspace(0, 1, 6),
+        cell_verts_time=[np.zeros(3), np.zeros(2)],
+    )
+
+    # Save and reload this object.
+    fh.saveSim(sim_filename, [sim, 'cells', 'p'])
+    sim_loaded, cells, p = fh.loadSim(sim_filename)
+
+    # Assert this object to be unmodified by saving.
+    assert sim.vm_time is vm_time
+    assert not hasattr(sim, fh._ARRAYS_NAMES_VAR_NAME)
+
+    # Assert all time series arrays to have been saved alongside this file and
+    # memory-mapped on loading.
+    assert (cells, p) == ('cells', 'p')
+    assert betse_temp_dir.join('sim.betse.arrays', 'vm_time.npy').check(file=1)
+    assert np.array_equal(sim_loaded.vm_time, vm_time)
+    assert np.array_equal(sim_loaded.time, sim.time)
+    assert np.array_equal(sim_loaded.vm, sim.vm)
+    assert len(sim_loaded.cell_verts_time) == 2
+    assert not hasattr(sim_loaded, fh._ARRAYS_NAMES_VAR_NAME)
+
+    # Assert these arrays to be modifiable in-memory without modifying disk.
+    sim_loaded.vm_time[0] = 0.0
+    assert np.array_equal(fh.loadSim(sim_filename)[0].vm_time, vm_time)
+
+    # Assert resaving with fewer time series to remove stale arrays.
+    del sim.time
+    fh.saveSim(sim_filename, [sim, 'cells', 'p'])
+    assert not betse_temp_dir.join('sim.betse.arrays', 'time.npy').check()
@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+# --------------------( LICENSE                           )--------------------
+# Copyright 2014-2023 by Alexis Pietak & Cecil Curry.
+# See "LICENSE" for further details.
+
+'''
+Unit tests for the :mod:`betse.science.chemistry.gene` submodule.
+'''
+
+# ....................{ IMPORTS                           }....................
+from betse_test._fixture.simconf.simconfclser import SimConfTestInternal
+
+# ....................{ TESTS                             }....................
+def test_gene_run_core_sim_unpickled(
+    betse_sim_conf: SimConfTestInternal, monkeypatch) -> None:
+    '''
+    Unit test the
+    :meth:`betse.science.chemistry.gene.MasterOfGenes.run_core_sim` method by
+    simulating a gene regulatory network isolated from a previously
+    unpickled simulation phase, whose sampled times were stored as a Numpy
+    array rather than a list.
+
+    Parameters
+    ----------
+    betse_sim_conf : SimConfTestInternal
+        Object encapsulating a temporary simulation configuration file.
+    monkeypatch : MonkeyPatch
+        Builtin fixture object permitting object attributes to be safely
+        modified for the duration of this test.
+    '''
+
+    # Defer heavyweight imports.
+    import numpy as np
+    from betse.science import filehandling as fh
+    from betse.science.chemistry.gene import MasterOfGenes
+    from betse.science.enum.enumphase import SimPhaseKind
+    from betse.science.math.timeseries import SampledTimeSeries
+    from betse.science.phase.phasecls import SimPhase
+    from types import SimpleNamespace
+
+    # Simulation configuration sampling this network every 0.1s for 1s.
+    p = betse_sim_conf.p
+    p.grn_dt = 1.0e-2
+    p.grn_total_time = 1.0
+    p.grn_tsample = 0.1
+    p.grn_runmodesim = False
+    p.grn_solver = 'explicit'
+    p.grn_pickle_filename = 'GRN.betse.gz'
+
+    # Simulation whose sampled times were stored and finalized by the prior
+    # phase, exactly as when unpickled by the "sim-grn" subcommand.
+    sim = SimpleNamespace()
+    time_series = SampledTimeSeries(obj=sim, samples_max=10)
+    for t in (0.0, 0.5, 1.0):
+        time_series.store('time', t)
+    time_series.finalize()
+    assert isinstance(sim.time, np.ndarray)
+
+    # Network core exposing only the methods called by this simulation.
+    core = SimpleNamespace(
+        clear_cache=lambda: None,
+        run_loop=lambda phase, t, reaction_solver: None,
+        write_data=lambda sim, cells, p: None,
+        report=lambda sim, p: None,
+        init_saving=lambda cells, p, plot_type, nested_folder_name: None,
+        export_eval_strings=lambda p: None,
+        export_equations=lambda p: None,
+    )
+
+    # Network exposing only the attributes inspected by this simulation.
+    network = MasterOfGenes.__new__(MasterOfGenes)
+    network.core = core
+    network.transporters = False
+    network.recalc_fluid = False
+    network.reinitialize = lambda phase: None
+
+    # Record rather than pickle this network.
+    saved = []
+    monkeypatch.setattr(
+        fh, 'saveSim', lambda savePath, datadump: saved.append(datadump))
+
+    # Simulation phase exposing this simulation.
+    phase = SimPhase(kind=SimPhaseKind.INIT, p=p)
+    phase.cells = SimpleNamespace()
+    phase.sim = sim
+    network.run_core_sim(phase)
+
+    # Assert all times sampled by this network to have been recorded both by
+    # this network and the simulation, independently of the prior phase.
+    assert network.time
+    assert sim.time == network.time
+    assert saved and saved[0][0] is network
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+# --------------------( LICENSE                           )--------------------
+# Copyright 2014-2023 by Alexis Pietak & Cecil Curry.
+# See "LICENSE" for further details.
+
+'''
+Unit tests for the :mod:`betse.science.chemistry.netopt` submodule.
+'''
+
+# ....................{ IMPORTS                           }....................
+
+# ....................{ TESTS                             }....................
+def test_netopt_basinhop_chains() -> None:
+    '''
+    Unit test the gradient of the
+    :class:`betse.science.chemistry.netopt.NetworkResidual` class against
+    finite differences of that residual *and* minimizing that residual with
+    independent basin-hopping chains run across forked worker processes by the
+    :func:`betse.science.chemistry.netopt.basinhop_chains` function.
+    '''
+
+    # Defer heavyweight imports.
+    import numpy as np
+    from betse.science.chemistry import netopt
+
+    # Network of two substances produced and consumed by four reactions, the
+    # first two of which are voltage-dependent membrane diffusions.
+    residual = netopt.NetworkResidual(
+        network_matrix=np.array([
+            [1.0, 0.0, -1.0, 0.0],
+            [0.0, 1.0, 0.0, -1.0],
+            [0.5, -0.5, 0.0, 0.0],
+        ]),
+        rates_getter=lambda vm: np.array([
+            np.exp(20*vm), np.exp(-20*vm), 2.0, 0.5]),
+        vm_numer=np.array([5.0, 0.1, 0.0, 0.0]),
+        vm_denom=np.array([0.5, 1.0, 0.0, 0.0]),
+        vm_factor=0.0267,
+        vm_target=-0.05,
+    )
+
+    # Assert this gradient to agree with central finite differences.
+    factors = np.array([1.3, 0.7, 1.1, -0.9])
+    chi_sqr, gradient = residual.get_value_and_gradient(factors)
+    assert chi_sqr == residual(factors)
+    gradient_fd = np.array([
+        (residual(factors + delta) - residual(factors - delta)) / 2e-7
+        for delta in np.eye(len(factors))*1e-7
+    ])
+    assert np.allclose(gradient, gradient_fd, rtol=1e-5, atol=1e-6)
+
+    # Minimize this residual across more chains than processes, stopping
+    # early on finding a sufficiently low minimum.
+    solution, alt_solutions = netopt.basinhop_chains(
+        residual=residual,
+        factors_init=np.ones(4),
+        method='L-BFGS-B',
+        niter=20,
+        T=1.0,
+        stepsize=0.5,
+        chains=3,
+        workers=2,
+        tolerance=1e-8,
+    )
+
+    # Assert the best solution to be a sufficiently low minimum of this
+    # residual found by some chain.
+    assert solution.chain in range(3)
+    assert solution.nit < 20
+    assert np.isclose(solution.fun, residual(solution.x))
+    assert solution.fun <= 1e-8
+    assert alt_solutions
+    assert all(
+        residual(alt_solution) <= 0.015 for alt_solution in alt_solutions)
+
+    # Assert minimizing serially with a gradient-free method to also succeed.
+    solution_serial, _ = netopt.basinhop_chains(
+        residual=residual,
+        factors_init=np.ones(4),
+        method='Nelder-Mead',
+        niter=2,
+        T=1.0,
+        stepsize=0.5,
+        chains=2,
+    )
+    assert np.isclose(solution_serial.fun, residual(solution_serial.x))
@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+# --------------------( LICENSE                           )--------------------
+# Copyright 2014-2023 by Alexis Pietak & Cecil Curry.
+# See "LICENSE" for further details.
+
+'''
+Unit tests for the :mod:`betse.science.chemistry.networks` submodule.
+'''
+
+# ....................{ IMPORTS                           }....................
+
+# ....................{ TESTS                             }....................
+def test_networks_reaction_solver() -> None:
+    '''
+    Unit test integrating a stiff first-order reaction network in cells with
+    the stiff implicit methods of the
+    :meth:`betse.science.chemistry.networks.MasterOfNetworks.get_delta_conc_implicit`
+    method against the analytic solution of that network.
+    '''
+
+    # Defer heavyweight imports.
+    import numpy as np
+    from betse.science.chemistry.networks import MasterOfNetworks
+    from collections import OrderedDict
+    from types import SimpleNamespace
+
+    # Network of two substances "A" and "B" in two cells, where "A" decays
+    # quickly and is quickly converted into "B", which neither grows nor
+    # decays. The explicit forward Euler method is unstable at this time step.
+    network = MasterOfNetworks.__new__(MasterOfNetworks)
+    network.molecules = OrderedDict((
+        ('A', SimpleNamespace(
+            gad_eval_string="-10.0*self.cell_concs['A']",
+            growth_targets_cell=[0, 1])),
+        ('B', SimpleNamespace(
+            gad_eval_string="0.0*self.cell_concs['B']",
+            growth_targets_cell=[0, 1])),
+    ))
+    network.reactions = OrderedDict((
+        ('A_to_B', SimpleNamespace(
+            reaction_eval_string="1.0e3*self.cell_concs['A']")),
+    ))
+    network.reaction_matrix = np.array([
+        [1.0, 0.0, -1.0],
+        [0.0, 1.0,  1.0],
+    ])
+    network.cell_concs = OrderedDict((
+        ('A', np.array([1.0, 2.0])),
+        ('B', np.array([0.0, 0.5])),
+    ))
+    conc_a_o = network.cell_concs['A'].copy()
+    conc_b_o = network.cell_concs['B'].copy()
+
+    phase = SimpleNamespace(
+        p=SimpleNamespace(dt=0.1), sim=SimpleNamespace(cdl=2))
+    localo = {'self': network}
+
+    # Assert "A" and "B" to depend only on "A" in the same cell.
+    assert np.array_equal(
+        network.get_reaction_jac_sparsity(2).toarray(),
+        np.kron([[1, 0], [1, 1]], np.eye(2)))
+
+    # Analytic concentrations at the end of this time step.
+    conc_a = conc_a_o*np.exp(-1010.0*phase.p.dt)
+    conc_b = conc_b_o + (1.0e3/1010.0)*(conc_a_o - conc_a)
+
+    for reaction_solver in ('BDF', 'Radau', 'LSODA'):
+        delta_conc = network.get_delta_conc_implicit(
+            phase, reaction_solver, localo)
+
+        # Assert the mean rates of change to reproduce these concentrations.
+        assert np.allclose(
+            conc_a_o + delta_conc[0]*phase.p.dt, conc_a, atol=1.0e-6)
+        assert np.allclose(
+            conc_b_o + delta_conc[1]*phase.p.dt, conc_b, atol=1.0e-6)
+
+        # Assert the concentrations at the start of this time step to have
+        # been restored.
+        assert np.array_equal(network.cell_concs['A'], conc_a_o)
+        assert np.array_equal(network.cell_concs['B'], conc_b_o)
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+# --------------------( LICENSE                           )--------------------
+# Copyright 2014-2023 by Alexis Pietak & Cecil Curry.
+# See "LICENSE" for further details.
+
+'''
+Unit tests for the :mod:`betse.science.pipe.export.pipeexps` submodule.
+'''
+
+# ....................{ IMPORTS                           }....................
+
+# ....................{ TESTS                             }....................
+def test_pipes_export_concurrent(betse_temp_dir: 'LocalPath') -> None:
+    '''
+    Unit test running export pipeline runners concurrently across forked
+    worker processes, including runners whose requirements are unsatisfied
+    and runners failing with an exception.
+
+    Parameters
+    ----------
+    betse_temp_dir : LocalPath
+        Object encapsulating a temporary directory isolated to the current
+        test.
+    '''
+
+    # Defer heavyweight imports.
+    import pytest
+    from betse.exceptions import (
+        BetseSimPipeException, BetseSimPipeRunnerUnsatisfiedException)
+    from betse.science.pipe.export import pipeexps
+    from types import SimpleNamespace
+
+    # Statuses reported on the completion of each runner.
+    statuses = []
+
+    # Simulation phase exposing only the attributes inspected by exporting.
+    phase = SimpleNamespace(
+        p=SimpleNamespace(
+            export_workers=3,
+            plot=SimpleNamespace(is_after_sim_show=False),
+            anim=SimpleNamespace(is_after_sim_show=False),
+        ),
+        callbacks=SimpleNamespace(
+            progressed_next=lambda status=None: statuses.append(status)),
+    )
+
+    def make_runner(kind: str, exception: Exception = None) -> tuple:
+        '''
+        Create a runner writing a file of the passed name to the temporary
+        directory *or* raising the passed exception if non-``None``.
+        '''
+
+        def runner_method(phase, runner_conf) -> None:
+            if exception is not None:
+                raise exception
+            betse_temp_dir.join(kind).write(runner_conf)
+
+        runner_method.metadata = SimpleNamespace(
+            kind=kind, noun_singular_lowercase='export')
+        return runner_method, kind
+
+    # Runners to be run, including one unsatisfied runner and two failing
+    # runners.
+    runners_enabled = [
+        make_runner('Vmem'),
+        make_runner('Pol', BetseSimPipeRunnerUnsatisfiedException(
+            result='Polarity not exportable',
+            reason='extracellular spaces disabled')),
+        make_runner('Flux', ValueError('Flux undefined')),
+        make_runner('Ca'),
+        make_runner('Pressure', ValueError('Pressure undefined')),
+    ]
+
+    # Run these runners concurrently, asserting all failures to be aggregated
+    # into a single exception in the order of these runners.
+    assert pipeexps._is_export_concurrent(phase, runners_enabled)
+    with pytest.raises(BetseSimPipeException) as exception_info:
+        pipeexps._export_concurrent(phase, runners_enabled)
+    exception_message = str(exception_info.value)
+    assert exception_message.startswith('2 of 5 exports failed:')
+    assert exception_message.index('Flux undefined') < (
+        exception_message.index('Pressure undefined'))
+
+    # Assert all successful runners to have been run.
+    assert betse_temp_dir.join('Vmem').read() == 'Vmem'
+    assert betse_temp_dir.join('Ca').read() == 'Ca'
+    assert not betse_temp_dir.join('Pol').check()
+
+    # Assert each runner to have been reported exactly once.
+    assert len(statuses) == len(runners_enabled)
+    assert 'Exported export "Vmem".' in statuses
+    assert (
+        'Excluding export "Pol", as extracellular spaces disabled.' in
+        statuses)
+
+    # Assert these runners to be run serially when displaying plots.
+    phase.p.plot.is_after_sim_show = True
+    assert not pipeexps._is_export_concurrent(phase, runners_enabled)
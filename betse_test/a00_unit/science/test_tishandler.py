@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+# --------------------( LICENSE                           )--------------------
+# Copyright 2014-2023 by Alexis Pietak & Cecil Curry.
+# See "LICENSE" for further details.
+
+'''
+Unit tests for the :mod:`betse.science.tissue.tishandler` submodule.
+'''
+
+# ....................{ IMPORTS                           }....................
+
+# ....................{ TESTS                             }....................
+def test_tishandler_cut_data() -> None:
+    '''
+    Unit test compacting simulation data defined on cells and cell membranes
+    in the wake of a cutting event with the private
+    :func:`betse.science.tissue.tishandler._cut_data` and
+    :func:`betse.science.tissue.tishandler._cut_nested_data` functions
+    against deleting the indices of all removed cells and cell membranes.
+    '''
+
+    # Defer heavyweight imports.
+    import numpy as np
+    from betse.science.tissue.tishandler import _cut_data, _cut_nested_data
+
+    # Indices of all removed cells and cell membranes.
+    target_inds_cell = np.array([0, 3, 4])
+    target_inds_mem = np.array([1, 2, 7, 8, 9])
+
+    # Boolean arrays flagging each retained cell and cell membrane.
+    is_cell_kept = np.ones(6, dtype=bool)
+    is_cell_kept[target_inds_cell] = False
+    is_mem_kept = np.ones(11, dtype=bool)
+    is_mem_kept[target_inds_mem] = False
+
+    # Data defined on cells and cell membranes.
+    data_cells = np.arange(6.0)
+    data_mems = np.arange(11.0)
+    data_cells_nested = np.arange(24.0).reshape((4, 6))
+
+    # Assert arrays and lists defined on cells or cell membranes to be
+    # compacted.
+    assert np.array_equal(
+        _cut_data(data_cells, is_cell_kept, is_mem_kept),
+        np.delete(data_cells, target_inds_cell))
+    assert np.array_equal(
+        _cut_data(data_mems, is_cell_kept, is_mem_kept),
+        np.delete(data_mems, target_inds_mem))
+    assert _cut_data(list(data_cells), is_cell_kept, is_mem_kept) == (
+        list(np.delete(data_cells, target_inds_cell)))
+
+    # Assert all other data to be returned as is.
+    data_other = np.arange(5.0)
+    assert _cut_data(data_other, is_cell_kept, is_mem_kept) is data_other
+    assert _cut_data(2.0, is_cell_kept, is_mem_kept) == 2.0
+
+    # Assert nested arrays to be compacted row-wise *WITHOUT* changing their
+    # memory layout.
+    data_cells_nested_cut = _cut_nested_data(
+        data_cells_nested, is_cell_kept, is_mem_kept)
+    assert np.array_equal(
+        data_cells_nested_cut,
+        np.asarray([np.delete(row, target_inds_cell)
+                    for row in data_cells_nested]))
+    assert data_cells_nested_cut.flags['C_CONTIGUOUS']
+
+    # Assert nested lists to be compacted item-wise.
+    data_nested_cut = _cut_nested_data(
+        [data_cells, data_mems, data_other], is_cell_kept, is_mem_kept)
+    assert isinstance(data_nested_cut, list)
+    assert np.array_equal(
+        data_nested_cut[0], np.delete(data_cells, target_inds_cell))
+    assert np.array_equal(
+        data_nested_cut[1], np.delete(data_mems, target_inds_mem))
+    assert data_nested_cut[2] is data_other
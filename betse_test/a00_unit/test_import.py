@@ -36,3 +36,144 @@ def test_import_logs() -> None:
     # Import this API and call all functionality containing these statements.
     from betse.util.io.log import logs
     logs.get_logger()
+
+
+def test_import_cold_start() -> None:
+    '''
+    Test the cold-start time of BETSE's CLI, guarding against regressions
+    importing heavyweight dependencies at application startup.
+
+    This test imports the ``betse.__main__`` submodule run by the ``betse``
+    command in an isolated Python subprocess profiling imports (i.e., under the
+    ``-X importtime`` option) and asserts that:
+
+    * No heavyweight dependency only required by subcommands (e.g.,
+      :mod:`matplotlib`, :mod:`scipy`) is imported.
+    * The cumulative time of this import does *not* exceed a generous ceiling.
+    '''
+
+    # Defer heavyweight imports.
+    import subprocess, sys
+
+    # Fully-qualified names of all modules prohibited at startup.
+    MODULE_NAMES_PROHIBITED = {'distutils', 'matplotlib', 'scipy'}
+
+    # Maximum cumulative time in seconds to import the "betse.__main__"
+    # submodule, as profiled by Python itself. Since this is typically an
+    # order of magnitude less than this ceiling on modern hardware, this test
+    # only fails on egregious regressions rather than noisy platforms.
+    IMPORT_TIME_MAX = 5.0
+
+    # Profile the importation of the "betse.__main__" submodule.
+    import_profile = subprocess.run(
+        (sys.executable, '-X', 'importtime', '-c', 'import betse.__main__'),
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        universal_newlines=True,
+        check=True,
+    ).stderr
+
+    # Dictionary mapping from the name of each imported module to the
+    # cumulative time in microseconds to import that module, parsed from lines
+    # resembling "import time:       412 |       4519 |   betse.__main__".
+    module_name_to_time = {}
+    for import_line in import_profile.splitlines():
+        import_fields = import_line.split('|')
+        if len(import_fields) != 3 or not import_fields[1].strip().isdigit():
+            continue
+        module_name_to_time[import_fields[2].strip()] = int(import_fields[1])
+
+    # Assert no prohibited module (or submodule thereof) to have been imported.
+    module_names_root = {
+        module_name.partition('.')[0] for module_name in module_name_to_time}
+    assert not (module_names_root & MODULE_NAMES_PROHIBITED)
+
+    # Assert this importation to have been sufficiently fast.
+    assert module_name_to_time['betse.__main__'] < IMPORT_TIME_MAX*1.0e6
+
+
+def test_cli_cold_start(betse_temp_dir: 'LocalPath') -> None:
+    '''
+    Test the end-to-end cold-start time of BETSE subcommands neither
+    simulating nor plotting (i.e., ``betse info`` and ``betse config``),
+    guarding against regressions initializing heavyweight dependencies only
+    required by subcommands simulating or plotting.
+
+    This test runs each such subcommand in an isolated Python subprocess and
+    asserts that:
+
+    * That subcommand succeeds *without* initializing all mandatory runtime
+      dependencies (i.e., calling the
+      :meth:`betse.util.app.meta.appmetaabc.AppMetaABC.init_libs` method).
+    * The wall-clock time of that subcommand does *not* exceed a ceiling
+      relative to the measured costs of both running the ``betse --help``
+      subcommand and initializing these dependencies in the same environment.
+
+    Parameters
+    ----------
+    betse_temp_dir : LocalPath
+        Object encapsulating a temporary directory isolated to this test.
+    '''
+
+    # Defer heavyweight imports.
+    import subprocess, sys, time
+
+    # Message logged by the AppMetaABC.init_libs() method.
+    INIT_LIBS_MESSAGE = 'Loading third-party dependencies...'
+
+    # Maximum multiple of the measured cost of initializing these dependencies
+    # each subcommand may take in excess of the "betse --help" subcommand.
+    # Since each subcommand performs non-trivial work of its own (e.g.,
+    # probing all matplotlib backends), this test only fails on egregious
+    # regressions rather than noisy platforms.
+    INIT_LIBS_TIME_FACTOR_MAX = 4.0
+
+    def run_betse(*args: str) -> float:
+        '''
+        Run the ``betse`` command with the passed arguments in an isolated
+        Python subprocess, assert this command to have succeeded *without*
+        initializing all mandatory runtime dependencies, and return the
+        wall-clock time in seconds of this command.
+        '''
+
+        time_start = time.perf_counter()
+        betse_output = subprocess.run(
+            (sys.executable, '-m', 'betse', '--matplotlib-backend=agg') + args,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            universal_newlines=True,
+            check=True,
+        ).stdout
+        betse_time = time.perf_counter() - time_start
+
+        assert INIT_LIBS_MESSAGE not in betse_output
+        return betse_time
+
+    # Minimum time of the "betse --help" subcommand over several runs.
+    help_time = min(run_betse('--help') for _ in range(3))
+
+    # Time to initialize all mandatory runtime dependencies with the same
+    # matplotlib backend in a fresh subprocess.
+    init_libs_time = float(subprocess.run(
+        (sys.executable, '-c', (
+            'import time\n'
+            'from betse.util.app.meta import appmetaone\n'
+            'app_meta = appmetaone.set_app_meta_betse_if_unset()\n'
+            'time_start = time.perf_counter()\n'
+            'app_meta.init_libs(matplotlib_backend_name="agg")\n'
+            'print(time.perf_counter() - time_start)\n'
+        )),
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+        universal_newlines=True,
+        check=True,
+    ).stdout.splitlines()[-1])
+
+    # Maximum time of each such subcommand.
+    subcommand_time_max = help_time + INIT_LIBS_TIME_FACTOR_MAX*init_libs_time
+
+    # Assert each such subcommand to have been sufficiently fast.
+    assert run_betse('info') < subcommand_time_max
+    assert run_betse(
+        'config', str(betse_temp_dir.join('sim_config.yaml'))) < (
+        subcommand_time_max)
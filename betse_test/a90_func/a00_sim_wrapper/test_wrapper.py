@@ -80,3 +80,51 @@ def test_wrapper_logging(
 
     # Assert this logfile to be non-empty.
     assert log_file.size() > 100
+
+
+def test_wrapper_sweep(
+    betse_sim_conf: SimConfTestInternal,
+    betse_temp_dir: LocalPath,
+) -> None:
+    '''
+    Integration test exercising the
+    :meth:`betse.science.wrapper.BetseWrapper.run_sweep` method.
+
+    Parameters
+    ----------
+    betse_sim_conf : SimConfTestInternal
+        Object encapsulating a temporary simulation configuration file.
+    betse_temp_dir : LocalPath
+        Object encapsulating a temporary directory isolated to this test.
+    '''
+
+    # Defer test-specific imports.
+    import math
+    from betse.science.wrapper import BetseWrapper
+
+    # Directory to which all sweep results are written.
+    sweep_dir = betse_temp_dir.join('sweep')
+
+    # BETSE wrapper configured by this file.
+    wrapper = BetseWrapper(config_filename=betse_sim_conf.p.conf_filename)
+
+    # Sweep the initialization phase over two pump rates across two processes.
+    runs_summary = wrapper.run_sweep(
+        grid={'internal parameters/alpha_NaK': (1.0e-7, 5.0e-8)},
+        run_sim=False,
+        sweep_dirname=str(sweep_dir),
+        processes=2,
+    )
+
+    # Assert one successful run to have been summarized for each pump rate.
+    assert [run_summary['run'] for run_summary in runs_summary] == [
+        'run_0000', 'run_0001']
+    assert all(
+        math.isfinite(run_summary['Vmem (mV)'])
+        for run_summary in runs_summary)
+
+    # Assert each run to have been saved to its own directory *AND* these runs
+    # to have been summarized to a CSV file.
+    assert sweep_dir.join('run_0000', 'INITS').check(dir=1)
+    assert sweep_dir.join('run_0001', 'INITS').check(dir=1)
+    assert sweep_dir.join('sweep_summary.csv').check(file=1)
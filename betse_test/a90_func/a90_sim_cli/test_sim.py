@@ -160,3 +160,151 @@ def test_cli_sim_video(
     # subcommand requiring the "seed" subcommand satisfies this constraint, all
     # subsequent subcommands (e.g., "sim", "plot init") are omitted.
     betse_cli_sim.run_subcommands(('seed',), ('init',),)
+
+
+def test_cli_sim_anim_workers(betse_cli_sim: 'CLISimTester') -> None:
+    '''
+    Functional test saving all post-initialization animations (and all
+    simulation features required by these animations) as images rendered
+    across multiple worker processes.
+
+    Parameters
+    ----------
+    betse_cli_sim : CLISimTester
+        Object running BETSE CLI simulation subcommands.
+    '''
+
+    # Defer heavyweight imports.
+    from betse.util.path import pathnames
+    from glob import glob
+
+    # Simulation configuration wrapper localized for convenience.
+    sim_config = betse_cli_sim.sim_state.config
+
+    # Save all animations, rendering the frames of each across two workers.
+    sim_config.enable_visuals_save()
+    sim_config.p.anim.frame_workers = 2
+
+    # Test the minimum number of simulation-specific subcommands required to
+    # export post-initialization animations with this configuration.
+    betse_cli_sim.run_subcommands(('seed',), ('init',), ('plot', 'init'),)
+
+    # Absolute filenames of all frames saved for these animations.
+    frame_filenames = glob(pathnames.join(
+        betse_cli_sim.sim_state.conf_dirname,
+        sim_config.p.init_export_dirname_relative, 'anim', '*', '*.png'))
+
+    # Assert these animations to have been saved as images.
+    assert frame_filenames
+
+
+def test_cli_sim_csv_layouts(betse_cli_sim: 'CLISimTester') -> None:
+    '''
+    Functional test exporting all post-initialization all-cells time series
+    CSV exports in both the NPZ and long layouts.
+
+    Parameters
+    ----------
+    betse_cli_sim : CLISimTester
+        Object running BETSE CLI simulation subcommands.
+    '''
+
+    # Defer heavyweight imports.
+    import numpy as np
+    from betse.science.enum.enumconf import CsvLayoutType
+    from betse.util.path import pathnames
+
+    # Simulation configuration wrapper localized for convenience.
+    sim_config = betse_cli_sim.sim_state.config
+
+    # Export all-cells time series to one NPZ archive at low precision.
+    sim_config.p.csv.layout = CsvLayoutType.NPZ
+    sim_config.p.csv.precision = 6
+
+    # Test the minimum number of simulation-specific subcommands required to
+    # export post-initialization CSV files with this configuration.
+    betse_cli_sim.run_subcommands(('seed',), ('init',), ('plot', 'init'),)
+
+    # Absolute pathname of the directory containing these exports.
+    export_dirname = pathnames.join(
+        betse_cli_sim.sim_state.conf_dirname,
+        sim_config.p.init_export_dirname_relative)
+
+    # Assert this archive to contain one row of single-precision transmembrane
+    # voltages for each sampled time step.
+    with np.load(pathnames.join(
+        export_dirname, 'Vmem2D_TextExport.npz')) as vmem_npz:
+        vmem_times = vmem_npz['time [s]']
+        vmem_cells_times = vmem_npz['Vmem [mV]']
+        assert vmem_cells_times.dtype == np.float32
+        assert vmem_cells_times.shape == (
+            len(vmem_times), len(vmem_npz['x [um]']))
+
+    # Re-export these time series to one long-format CSV file.
+    sim_config.p.csv.layout = CsvLayoutType.LONG
+    betse_cli_sim.run_subcommands(('plot', 'init'),)
+
+    # Assert this file to contain the same data as this archive.
+    vmem_long = np.loadtxt(
+        pathnames.join(export_dirname, 'Vmem2D_TextExport.csv'),
+        delimiter=',', skiprows=1)
+    assert np.allclose(
+        vmem_long[:,3], vmem_cells_times.ravel(), rtol=1.0e-5, atol=1.0e-3)
+
+
+def test_cli_sim_csv_cell_noecm(betse_cli_sim: 'CLISimTester') -> None:
+    '''
+    Functional test exporting the post-initialization single-cell time series
+    and transmembrane voltage FFT CSV exports with extracellular spaces (and
+    hence extracellular voltages) disabled.
+
+    Parameters
+    ----------
+    betse_cli_sim : CLISimTester
+        Object running BETSE CLI simulation subcommands.
+    '''
+
+    # Defer heavyweight imports.
+    import numpy as np
+    from betse.util.path import pathnames
+
+    # Simulation configuration wrapper localized for convenience.
+    sim_config = betse_cli_sim.sim_state.config
+
+    # Disable extracellular spaces.
+    sim_config.p.is_ecm = False
+
+    # Export only these single-cell CSV files.
+    csvs_conf = sim_config.p.csv.csvs_after_sim
+    csvs_conf.clear()
+    for csv_kind in ('cell_series', 'cell_vmem_fft'):
+        csvs_conf.append_default().kind = csv_kind
+
+    # Test the minimum number of simulation-specific subcommands required to
+    # export post-initialization CSV files with this configuration.
+    betse_cli_sim.run_subcommands(('seed',), ('init',), ('plot', 'init'),)
+
+    # Absolute pathname of the directory containing these exports.
+    export_dirname = pathnames.join(
+        betse_cli_sim.sim_state.conf_dirname,
+        sim_config.p.init_export_dirname_relative)
+
+    # Single-cell time series and FFT of transmembrane voltages.
+    cell_series = np.genfromtxt(
+        pathnames.join(export_dirname, 'ExportedData.csv'),
+        delimiter=',', names=True)
+    cell_vmem_fft = np.genfromtxt(
+        pathnames.join(export_dirname, 'ExportedData_FFT.csv'),
+        delimiter=',', names=True)
+
+    # Assert the transmembrane voltages of this cell to be one column of one
+    # finite value for each sampled time step.
+    vmem = cell_series['Vmem_mV']
+    assert vmem.shape == cell_series['time_s'].shape
+    assert np.all(np.isfinite(vmem))
+
+    # Assert this FFT to be that of these transmembrane voltages.
+    assert np.allclose(
+        cell_vmem_fft['FFT_Vmem'],
+        np.absolute(np.fft.rfft((vmem - np.mean(vmem))/len(vmem))),
+        rtol=1.0e-4, atol=1.0e-8)